@@ -32,7 +32,7 @@ import sys
 import subprocess
 
 # Append the internal modules into the system paths to avoid Blender importing conflicts
-import_paths = ['nmv/interface/cli', 'nmv/file/ops', 'nmv/slurm']
+import_paths = ['nmv/interface/cli', 'nmv/file/ops', 'nmv/slurm', 'nmv/local']
 for import_path in import_paths:
     sys.path.append(('%s/%s' %(os.path.dirname(os.path.realpath(__file__)), import_path)))
     
@@ -40,6 +40,8 @@ for import_path in import_paths:
 import arguments_parser
 import file_ops
 import slurm
+import local_scheduler
+import resume_manifest
 
 
 ####################################################################################################
@@ -69,61 +71,9 @@ def create_shell_commands_for_local_execution(arguments,
         A list of commands to be appended to the SLURM scripts or directly executed on a local node.
     """
 
-    shell_commands = list()
-
-    # Retrieve the path to the CLIs
-    cli_interface_path = os.path.dirname(os.path.realpath(__file__)) + '/nmv/interface/cli'
-    cli_soma_reconstruction = '%s/soma_reconstruction.py' % cli_interface_path
-    cli_morphology_reconstruction = '%s/neuron_morphology_reconstruction.py' % cli_interface_path
-    cli_morphology_analysis = '%s/morphology_analysis.py' % cli_interface_path
-    cli_mesh_reconstruction = '%s/neuron_mesh_reconstruction.py' % cli_interface_path
-
-    # Morphology analysis task
-    if arguments.analyze_morphology:
-        
-        # Add this command to the list
-        shell_commands.append('%s -b --verbose 0 --python %s -- %s' %
-                              (arguments.blender, cli_morphology_analysis, arguments_string))
-                              
-    # Morphology reconstruction task: call the @cli_morphology_reconstruction interface
-    if arguments.render_neuron_morphology or                \
-       arguments.render_neuron_morphology_360 or            \
-       arguments.render_neuron_morphology_progressive or    \
-       arguments.export_morphology_swc or                   \
-       arguments.export_morphology_segments or              \
-       arguments.export_morphology_blend:
-
-        # Add this command to the list
-        shell_commands.append('%s -b --verbose 0 --python %s -- %s' %
-                              (arguments.blender, cli_morphology_reconstruction, arguments_string))
-
-    # Soma-related task: call the @cli_soma_reconstruction interface
-    if arguments.render_soma_mesh or                        \
-       arguments.render_soma_mesh_360 or                    \
-       arguments.render_soma_mesh_progressive or            \
-       arguments.export_soma_mesh_ply or                    \
-       arguments.export_soma_mesh_obj or                    \
-       arguments.export_soma_mesh_stl or                    \
-       arguments.export_soma_mesh_blend:
-
-        # Add this command to the list
-        shell_commands.append('%s -b --verbose 0 --python %s -- %s' %
-                              (arguments.blender, cli_soma_reconstruction, arguments_string))
-
-    # Neuron mesh reconstruction related task: call the @cli_mesh_reconstruction interface
-    if arguments.render_neuron_mesh or                      \
-       arguments.render_neuron_mesh_360 or                  \
-       arguments.export_neuron_mesh_ply or                  \
-       arguments.export_neuron_mesh_obj or                  \
-       arguments.export_neuron_mesh_stl or                  \
-       arguments.export_neuron_mesh_blend:
-
-        # Add this command to the list
-        shell_commands.append('%s -b --verbose 0 --python %s -- %s' %
-                              (arguments.blender, cli_mesh_reconstruction, arguments_string))
-
-    # Return a list of commands
-    return shell_commands
+    # The same commands are used for the local and the cluster execution
+    return arguments_parser.create_shell_commands(arguments=arguments,
+                                                  arguments_string=arguments_string)
 
 
 ####################################################################################################
@@ -144,6 +94,14 @@ def run_local_neuromorphovis(arguments):
     # Load morphology files (.H5 or .SWC)
     elif arguments.input == 'file':
 
+        # Only run the tasks that are not up to date
+        if arguments.resume:
+            arguments = resume_manifest.get_arguments_for_stale_tasks(
+                arguments=arguments, morphology_file=arguments.morphology_file)
+            if arguments is None:
+                print('All the tasks are up to date, nothing to do')
+                return
+
         # Get the arguments string list
         arguments_string = arguments_parser.get_arguments_string(arguments=arguments)
 
@@ -171,24 +129,44 @@ def run_local_neuromorphovis(arguments):
             print('ERROR: The directory [%s] does NOT contain any morphology files' %
                   arguments.morphology_directory)
 
-        # A list of all the commands to be executed
-        shell_commands = list()
+        # A list of all the commands to be executed, each labeled with its morphology
+        labeled_shell_commands = list()
+
+        # The number of the morphologies whose tasks are all up to date
+        number_skipped_files = 0
 
         # Construct the commands for every individual morphology file
         for morphology_file in morphology_files:
 
+            # Only run the tasks that are not up to date
+            file_arguments = arguments
+            if arguments.resume:
+                file_arguments = resume_manifest.get_arguments_for_stale_tasks(
+                    arguments=arguments, morphology_file='%s/%s' % (
+                        arguments.morphology_directory, morphology_file))
+                if file_arguments is None:
+                    number_skipped_files += 1
+                    continue
+
             # Get the argument string for an individual file
             arguments_string = arguments_parser.get_arguments_string_for_individual_file(
-                arguments=arguments, morphology_file=morphology_file)
+                arguments=file_arguments, morphology_file=morphology_file)
 
             # Construct the shell command to run the workflow
-            shell_commands.extend(
-                create_shell_commands_for_local_execution(arguments, arguments_string))
+            morphology_label = os.path.splitext(os.path.basename(morphology_file))[0]
+            for shell_command in create_shell_commands_for_local_execution(
+                    file_arguments, arguments_string):
+                labeled_shell_commands.append([morphology_label, shell_command])
 
-        # Run NeuroMorphoVis from Blender in the background mode
-        for shell_command in shell_commands:
-            # print('RUNNING: ' + shell_command)
-            subprocess.call(shell_command, shell=True)
+        if arguments.resume:
+            print('Skipping [%d] morphologies whose tasks are up to date' % number_skipped_files)
+
+        # Run NeuroMorphoVis from Blender in the background mode, in a bounded pool of workers
+        jobs = local_scheduler.create_local_jobs(
+            output_directory=arguments.output_directory,
+            labeled_shell_commands=labeled_shell_commands)
+        local_scheduler.run_local_jobs(
+            jobs=jobs, number_workers=arguments.local_workers, retries=arguments.local_retries)
 
     else:
         print('ERROR: Input data source, use \'file, gid, target or directory\'')
@@ -229,8 +207,22 @@ def run_cluster_neuromorphovis(arguments):
         # Create a GID-set and load the morphologies from these GIDs
         gids = bbp_circuit.gids(arguments.target)
 
+        # Only submit the GIDs that have tasks that are not up to date, with their stale tasks
+        gids_arguments = None
+        if arguments.resume:
+            stale_gids = list()
+            gids_arguments = list()
+            for gid in gids:
+                gid_arguments = resume_manifest.get_arguments_for_stale_tasks(
+                    arguments=arguments, gid=gid)
+                if gid_arguments is not None:
+                    stale_gids.append(gid)
+                    gids_arguments.append(gid_arguments)
+            gids = stale_gids
+
         # Run the jobs on the cluster
-        slurm.run_gid_jobs_on_cluster(arguments=arguments, gids=gids)
+        slurm.run_gid_jobs_on_cluster(
+            arguments=arguments, gids=gids, gids_arguments=gids_arguments)
 
     # Use a single GID
     elif arguments.input == 'gid':
@@ -261,9 +253,25 @@ def run_cluster_neuromorphovis(arguments):
         # Get all the morphology files in this directory
         morphology_files = file_ops.get_files_in_directory(arguments.morphology_directory, '.h5')
 
+        # Only submit the morphologies that have tasks that are not up to date, with their stale
+        # tasks
+        morphology_files_arguments = None
+        if arguments.resume:
+            stale_morphology_files = list()
+            morphology_files_arguments = list()
+            for morphology_file in morphology_files:
+                file_arguments = resume_manifest.get_arguments_for_stale_tasks(
+                    arguments=arguments, morphology_file='%s/%s' % (
+                        arguments.morphology_directory, morphology_file))
+                if file_arguments is not None:
+                    stale_morphology_files.append(morphology_file)
+                    morphology_files_arguments.append(file_arguments)
+            morphology_files = stale_morphology_files
+
         # Run the jobs on the cluster
         slurm.run_morphology_files_jobs_on_cluster(
-            arguments=arguments, morphology_files=morphology_files)
+            arguments=arguments, morphology_files=morphology_files,
+            morphology_files_arguments=morphology_files_arguments)
 
     else:
         print('ERROR: Input data source, use [file, gid, target or directory]')
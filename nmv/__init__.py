@@ -18,6 +18,14 @@
 # System imports
 import sys
 
+# Blender is not available when NeuroMorphoVis is imported from a plain Python interpreter, e.g. to
+# analyze morphologies headlessly, then only the modules that do not depend on bpy are loaded
+try:
+    import bpy
+    BLENDER_AVAILABLE = True
+except ImportError:
+    BLENDER_AVAILABLE = False
+
 # Internal imports
 import nmv.file
 
@@ -15,8 +15,15 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
+# Internal imports
+import nmv
+
 from .kernels import *
 from .structs import *
-from .plotting import *
 from .analysis_items import *
 from .analysis_distributions import *
+from .analysis_table import *
+
+# The plotting of the distributions requires Blender
+if nmv.BLENDER_AVAILABLE:
+    from .plotting import *
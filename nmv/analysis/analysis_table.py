@@ -0,0 +1,213 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import csv
+
+# Internal imports
+import nmv.analysis
+import nmv.file
+import nmv.options
+
+
+# The columns that identify every row of the analysis table
+ANALYSIS_TABLE_KEY_COLUMNS = ['morphology', 'component']
+
+
+####################################################################################################
+# @get_analysis_table_columns
+####################################################################################################
+def get_analysis_table_columns():
+    """Gets the columns of the analysis table, the key columns followed by a column per global
+    analysis item and a column per per-arbor analysis item.
+
+    :return:
+        A list of the names of the columns.
+    """
+
+    columns = list(ANALYSIS_TABLE_KEY_COLUMNS)
+    columns.extend([item.variable for item in nmv.analysis.ui_global_analysis_items])
+    columns.extend([item.variable for item in nmv.analysis.ui_per_arbor_analysis_items])
+    return columns
+
+
+####################################################################################################
+# @get_morphology_analysis_rows
+####################################################################################################
+def get_morphology_analysis_rows(morphology,
+                                 per_arbor=False):
+    """Applies all the analysis kernels to a morphology and returns the results as rows of the
+    analysis table. The kernels are applied without updating the user interface, therefore this
+    function does not require Blender.
+
+    :param morphology:
+        A given morphology to analyze.
+    :param per_arbor:
+        If True, a row is added for every arbor after the row of the morphology.
+    :return:
+        A list of rows, where every row is a dictionary that maps the column to its value. The
+        global analysis items are only reported in the row of the morphology.
+    """
+
+    # The row of the entire morphology
+    morphology_row = {'morphology': morphology.label, 'component': 'Morphology'}
+
+    # Apply the global analysis kernels
+    for item in nmv.analysis.ui_global_analysis_items:
+        item.apply_global_analysis_kernel(morphology=morphology, context=None)
+        morphology_row[item.variable] = item.result
+
+    # The arbors in the same order of the analysis results
+    arbors = list()
+    if morphology.has_apical_dendrites():
+        arbors.extend(morphology.apical_dendrites)
+    if morphology.has_basal_dendrites():
+        arbors.extend(morphology.basal_dendrites)
+    if morphology.has_axons():
+        arbors.extend(morphology.axons)
+    arbors_rows = [{'morphology': morphology.label, 'component': arbor.tag} for arbor in arbors]
+
+    # Apply the per-arbor analysis kernels, all the kernels use the profiles of the arbors that
+    # are created in a single traversal
+    nmv.analysis.create_arbors_analysis_profiles(morphology)
+    try:
+        for item in nmv.analysis.ui_per_arbor_analysis_items:
+            item.apply_per_arbor_analysis_kernel(morphology=morphology, context=None)
+            morphology_row[item.variable] = item.result.morphology_result
+
+            if per_arbor:
+                arbors_results = list()
+                if morphology.has_apical_dendrites():
+                    arbors_results.extend(item.result.apical_dendrites_result)
+                if morphology.has_basal_dendrites():
+                    arbors_results.extend(item.result.basal_dendrites_result)
+                if morphology.has_axons():
+                    arbors_results.extend(item.result.axons_result)
+                for arbor_row, result in zip(arbors_rows, arbors_results):
+                    arbor_row[item.variable] = result
+    finally:
+        nmv.analysis.release_arbors_analysis_profiles(morphology)
+
+    # Return the rows
+    if per_arbor:
+        return [morphology_row] + arbors_rows
+    return [morphology_row]
+
+
+####################################################################################################
+# @analyze_morphology_file_to_rows
+####################################################################################################
+def analyze_morphology_file_to_rows(morphology_file,
+                                    per_arbor=False,
+                                    cache_directory=None):
+    """Reads a morphology file and analyzes it.
+
+    :param morphology_file:
+        The path to the .h5 or the .swc morphology file.
+    :param per_arbor:
+        If True, a row is added for every arbor after the row of the morphology.
+    :param cache_directory:
+        The directory of the cached morphologies, or None to parse the morphology file directly.
+    :return:
+        The rows of the morphology in the analysis table.
+    """
+
+    # Read the morphology, from the cache if it is given, the samples of the .h5 files are only
+    # created on demand, since the morphology is only analyzed
+    if cache_directory is not None:
+        options = nmv.options.NeuroMorphoVisOptions()
+        options.morphology.morphology_file_path = morphology_file
+        options.morphology.use_cache = True
+        options.morphology.cache_directory = cache_directory
+        options.morphology.lazy_samples = True
+        loading_flag, morphology = nmv.file.read_morphology_from_file(options=options)
+    else:
+        loading_flag, morphology = nmv.file.read_morphology_from_file_naively(
+            morphology_file_path=morphology_file, lazy_samples=True)
+
+    if not loading_flag:
+        raise IOError('Cannot load the morphology file')
+
+    # Analyze it
+    return get_morphology_analysis_rows(morphology=morphology, per_arbor=per_arbor)
+
+
+####################################################################################################
+# @write_analysis_table_to_csv
+####################################################################################################
+def write_analysis_table_to_csv(rows,
+                                output_file):
+    """Writes the rows of the analysis table to a .csv file, with a column per analysis item.
+
+    :param rows:
+        A list of rows, where every row is a dictionary that maps the column to its value.
+    :param output_file:
+        The path to the output .csv file.
+    """
+
+    with open(output_file, 'w', newline='') as file_handle:
+        writer = csv.DictWriter(file_handle, fieldnames=get_analysis_table_columns(),
+                                restval='', extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+####################################################################################################
+# @analyze_morphologies_directory
+####################################################################################################
+def analyze_morphologies_directory(input_directory,
+                                   output_file,
+                                   per_arbor=False,
+                                   number_processes=None,
+                                   cache_directory=None):
+    """Analyzes all the .h5 and .swc morphologies in a directory in a pool of processes, and writes
+    the results to a single .csv table with a row per morphology, or per morphology and arbor.
+
+    The morphologies that cannot be analyzed are reported and skipped.
+
+    :param input_directory:
+        The directory that contains the morphology files.
+    :param output_file:
+        The path to the output .csv file.
+    :param per_arbor:
+        If True, a row is added for every arbor after the row of its morphology.
+    :param number_processes:
+        The number of the worker processes, by default the number of the cores.
+    :param cache_directory:
+        The directory of the cached morphologies, or None to parse the morphology files directly.
+    :return:
+        The number of the analyzed morphologies and a list of the files that failed with their
+        error messages.
+    """
+
+    # Analyze the morphologies in the workers
+    results = nmv.file.run_function_on_morphology_files_in_directory(
+        function=analyze_morphology_file_to_rows, input_directory=input_directory,
+        arguments=(per_arbor, cache_directory), number_processes=number_processes)
+
+    rows = list()
+    failed_files = list()
+    for morphology_file, morphology_rows, error in results:
+        if error is not None:
+            failed_files.append((morphology_file, error))
+        else:
+            rows.extend(morphology_rows)
+
+    # Write the table
+    write_analysis_table_to_csv(rows=rows, output_file=output_file)
+
+    return len(results) - len(failed_files), failed_files
@@ -0,0 +1,341 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# Internal imports
+import nmv
+import nmv.analysis
+
+
+####################################################################################################
+# @get_minimum
+####################################################################################################
+def get_minimum(values,
+                default=0.0):
+    """Returns the minimum of an array of values, or a default value if the array is empty.
+
+    :param values:
+        An array of values.
+    :param default:
+        The value returned if the array is empty.
+    :return:
+        The minimum value.
+    """
+
+    return values.min().item() if len(values) > 0 else default
+
+
+####################################################################################################
+# @get_maximum
+####################################################################################################
+def get_maximum(values,
+                default=0.0):
+    """Returns the maximum of an array of values, or a default value if the array is empty.
+
+    :param values:
+        An array of values.
+    :param default:
+        The value returned if the array is empty.
+    :return:
+        The maximum value.
+    """
+
+    return values.max().item() if len(values) > 0 else default
+
+
+####################################################################################################
+# @get_average
+####################################################################################################
+def get_average(values,
+                default=0.0):
+    """Returns the average of an array of values, or a default value if the array is empty.
+
+    :param values:
+        An array of values.
+    :param default:
+        The value returned if the array is empty.
+    :return:
+        The average value.
+    """
+
+    return values.sum().item() / len(values) if len(values) > 0 else default
+
+
+####################################################################################################
+# @get_average_section_volume
+####################################################################################################
+def get_average_section_volume(profile):
+    """Returns the average section volume of an arbor, ignoring one zero-volume section, similar
+    to @compute_average_section_volume.
+
+    :param profile:
+        The analysis profile of the arbor.
+    :return:
+        The average section volume.
+    """
+
+    volumes = profile.sections_volumes
+    if len(volumes) == 0:
+        return 0.0
+    return volumes.sum().item() / (len(volumes) - (1 if (volumes == 0).any() else 0))
+
+
+####################################################################################################
+# Per-arbor kernels, with the names of the kernels they replace, computed from the arbors profiles
+####################################################################################################
+FUSED_ARBOR_KERNELS = {
+
+    # Samples
+    'compute_number_of_samples_of_arbor':
+        lambda p: int((p.sections_number_samples - 1).sum()) + 1,
+    'compute_total_number_of_zero_radii_samples_of_arbor':
+        lambda p: int(p.sections_zero_radius_samples.sum()),
+    'compute_number_of_zero_radius_samples_per_section_of_arbor':
+        lambda p: int(p.sections_zero_radius_samples.sum()),
+    'compute_minimum_samples_count_of_arbor':
+        lambda p: get_minimum(p.sections_number_samples, 0),
+    'compute_maximum_samples_count_of_arbor':
+        lambda p: get_maximum(p.sections_number_samples, 0),
+    'compute_average_number_samples_per_section_of_arbor':
+        lambda p: int(get_average(p.sections_number_samples, 0)),
+    'compute_first_sample_distance_to_soma':
+        lambda p: float((p.points[0] ** 2).sum() ** 0.5)
+        if len(p.sections) > 0 and p.sections_number_samples[0] > 0 else 0,
+    'compute_minimum_sample_radius_of_arbor':
+        lambda p: get_minimum(p.sections_minimum_radii),
+    'compute_maximum_sample_radius_of_arbor':
+        lambda p: get_maximum(p.sections_maximum_radii),
+    'compute_average_sample_radius_of_arbor':
+        lambda p: get_average(p.sections_average_radii),
+    'compute_minimum_daughter_ratio_of_arbor':
+        lambda p: get_minimum(p.daughter_ratios),
+    'compute_maximum_daughter_ratio_of_arbor':
+        lambda p: get_maximum(p.daughter_ratios),
+    'compute_average_daughter_ratio_of_arbor':
+        lambda p: get_average(p.daughter_ratios),
+    'compute_minimum_parent_daughter_ratio_of_arbor':
+        lambda p: get_minimum(p.parent_daughter_ratios),
+    'compute_maximum_parent_daughter_ratio_of_arbor':
+        lambda p: get_maximum(p.parent_daughter_ratios),
+    'compute_average_parent_daughter_ratio_of_arbor':
+        lambda p: get_average(p.parent_daughter_ratios),
+
+    # Structure
+    'compute_total_number_of_sections_of_arbor':
+        lambda p: len(p.sections),
+    'compute_total_number_of_bifurcations_of_arbor':
+        lambda p: int((p.sections_number_children == 2).sum()),
+    'compute_total_number_of_trifurcations_of_arbor':
+        lambda p: int((p.sections_number_children == 3).sum()),
+    'compute_total_number_of_terminal_tips_of_arbor':
+        lambda p: int((p.sections_number_children == 0).sum()),
+    'compute_total_number_of_terminal_segments_of_arbor':
+        lambda p: int((p.sections_number_samples - 1)[p.sections_number_children == 0].sum()),
+    'compute_maximum_branching_order_of_arbor':
+        lambda p: get_maximum(p.sections_branching_orders[p.sections_number_children == 0], 0),
+    'compute_maximum_path_distance_of_arbor':
+        lambda p: get_maximum(p.sections_path_lengths, 0),
+
+    # Lengths
+    'compute_total_length_of_arbor':
+        lambda p: p.sections_lengths.sum().item(),
+    'compute_minimum_segment_length_of_arbor':
+        lambda p: get_minimum(p.segments_lengths),
+    'compute_maximum_segment_length_of_arbor':
+        lambda p: get_maximum(p.segments_lengths),
+    'compute_average_segment_length_of_arbor':
+        lambda p: get_average(p.segments_lengths),
+    'compute_number_zero_length_segments_of_arbor':
+        lambda p: int((p.segments_lengths < 1e-5).sum()),
+    'compute_minimum_section_length_of_arbor':
+        lambda p: get_minimum(p.sections_lengths),
+    'compute_maximum_section_length_of_arbor':
+        lambda p: get_maximum(p.sections_lengths),
+    'compute_average_section_length_of_arbor':
+        lambda p: get_average(p.sections_lengths),
+    'compute_number_of_short_sections_of_arbor':
+        lambda p: int(p.sections_short.sum()),
+    'compute_minimum_section_contraction_of_arbor':
+        lambda p: get_minimum(get_sections_contractions(p)),
+    'compute_maximum_section_contraction_of_arbor':
+        lambda p: get_maximum(get_sections_contractions(p)),
+    'compute_average_section_contraction_of_arbor':
+        lambda p: get_average(get_sections_contractions(p)),
+    'compute_minimum_burke_taper_of_arbor':
+        lambda p: p.sections_burke_tapers.min().item(),
+    'compute_maximum_burke_taper_of_arbor':
+        lambda p: p.sections_burke_tapers.max().item(),
+    'compute_average_burke_taper_of_arbor':
+        lambda p: p.sections_burke_tapers.sum().item() / len(p.sections_burke_tapers),
+    'compute_minimum_hillman_taper_of_arbor':
+        lambda p: p.sections_hillman_tapers.min().item(),
+    'compute_maximum_hillman_taper_of_arbor':
+        lambda p: p.sections_hillman_tapers.max().item(),
+    'compute_average_hillman_taper_of_arbor':
+        lambda p: p.sections_hillman_tapers.sum().item() / len(p.sections_hillman_tapers),
+
+    # Areas
+    'compute_arbor_total_surface_area':
+        lambda p: p.sections_surface_areas.sum().item(),
+    'compute_minimum_section_surface_area':
+        lambda p: get_minimum(p.sections_surface_areas),
+    'compute_maximum_section_surface_area':
+        lambda p: get_maximum(p.sections_surface_areas),
+    'compute_average_section_surface_area':
+        lambda p: get_average(p.sections_surface_areas),
+    'compute_minimum_segment_surface_area':
+        lambda p: get_minimum(p.segments_surface_areas),
+    'compute_maximum_segment_surface_area':
+        lambda p: get_maximum(p.segments_surface_areas),
+    'compute_average_segment_surface_area':
+        lambda p: get_average(p.segments_surface_areas),
+
+    # Volumes
+    'compute_arbor_total_volume':
+        lambda p: p.sections_volumes.sum().item(),
+    'compute_minimum_section_volume':
+        lambda p: get_minimum(p.sections_volumes),
+    'compute_maximum_section_volume':
+        lambda p: get_maximum(p.sections_volumes),
+    'compute_average_section_volume':
+        get_average_section_volume,
+    'compute_minimum_segment_volume':
+        lambda p: get_minimum(p.segments_volumes),
+    'compute_maximum_segment_volume':
+        lambda p: get_maximum(p.segments_volumes),
+    'compute_average_segment_volume':
+        lambda p: get_average(p.segments_volumes),
+
+    # Angles
+    'compute_minimum_local_bifurcation_angle_of_arbor':
+        lambda p: get_minimum(p.local_bifurcation_angles),
+    'compute_maximum_local_bifurcation_angle_of_arbor':
+        lambda p: get_maximum(p.local_bifurcation_angles),
+    'compute_average_local_bifurcation_angle_of_arbor':
+        lambda p: get_average(p.local_bifurcation_angles),
+    'compute_minimum_global_bifurcation_angle_of_arbor':
+        lambda p: get_minimum(p.global_bifurcation_angles),
+    'compute_maximum_global_bifurcation_angle_of_arbor':
+        lambda p: get_maximum(p.global_bifurcation_angles),
+    'compute_average_global_bifurcation_angle_of_arbor':
+        lambda p: get_average(p.global_bifurcation_angles),
+}
+
+
+####################################################################################################
+# @get_sections_contractions
+####################################################################################################
+def get_sections_contractions(profile):
+    """Returns the contraction ratios of the sections that have non-zero lengths.
+
+    :param profile:
+        The analysis profile of the arbor.
+    :return:
+        An array of the contraction ratios.
+    """
+
+    valid = profile.sections_lengths > 0.0
+    return profile.sections_euclidean_distances[valid] / profile.sections_lengths[valid]
+
+
+####################################################################################################
+# @get_fused_arbor_kernel
+####################################################################################################
+def get_fused_arbor_kernel(kernel):
+    """Returns the function that computes the result of a given per-arbor kernel from the analysis
+    profile of the arbor, or None if the kernel cannot be computed from the profile.
+
+    :param kernel:
+        A per-arbor analysis kernel, for example @compute_total_length_of_arbor.
+    :return:
+        A function that takes an @ArborAnalysisProfile and returns the result of the kernel.
+    """
+
+    return FUSED_ARBOR_KERNELS.get(getattr(kernel, '__name__', None), None)
+
+
+####################################################################################################
+# @create_arbors_analysis_profiles
+####################################################################################################
+def create_arbors_analysis_profiles(morphology):
+    """Profiles all the arbors of the morphology, where each arbor is traversed only once.
+
+    While the profiles exist, @invoke_kernel derives the results of the per-arbor kernels from them
+    instead of traversing the arbors. They must be released with @release_arbors_analysis_profiles
+    once the analysis is done, since they are not updated if the morphology is modified.
+
+    :param morphology:
+        A given morphology skeleton to analyze.
+    """
+
+    morphology.analysis_profiles = dict()
+    for arbors in [morphology.apical_dendrites, morphology.basal_dendrites, morphology.axons]:
+        if arbors is not None:
+            for arbor in arbors:
+                morphology.analysis_profiles[arbor] = nmv.analysis.ArborAnalysisProfile(arbor)
+
+
+####################################################################################################
+# @release_arbors_analysis_profiles
+####################################################################################################
+def release_arbors_analysis_profiles(morphology):
+    """Releases the profiles of the arbors of the morphology after the analysis.
+
+    :param morphology:
+        A given morphology skeleton.
+    """
+
+    morphology.analysis_profiles = None
+
+
+####################################################################################################
+# @apply_fused_kernel_to_morphology
+####################################################################################################
+def apply_fused_kernel_to_morphology(morphology,
+                                     fused_kernel):
+    """Applies a fused kernel to the profiles of all the arbors of the morphology.
+
+    :param morphology:
+        A given morphology skeleton that has its arbors profiled.
+    :param fused_kernel:
+        A function that takes an @ArborAnalysisProfile and returns the result of the kernel.
+    :return:
+        The analysis results as an @MorphologyAnalysisResult structure.
+    """
+
+    # A structure to contain the analysis results of the entire morphology
+    analysis_result = nmv.analysis.MorphologyAnalysisResult()
+
+    # Apical dendrites
+    if morphology.has_apical_dendrites():
+        analysis_result.apical_dendrites_result = [
+            fused_kernel(morphology.analysis_profiles[arbor])
+            for arbor in morphology.apical_dendrites]
+
+    # Basal dendrites
+    if morphology.has_basal_dendrites():
+        analysis_result.basal_dendrites_result = [
+            fused_kernel(morphology.analysis_profiles[arbor])
+            for arbor in morphology.basal_dendrites]
+
+    # Axons
+    if morphology.has_axons():
+        analysis_result.axons_result = [
+            fused_kernel(morphology.analysis_profiles[arbor])
+            for arbor in morphology.axons]
+
+    # Return the analysis result
+    return analysis_result
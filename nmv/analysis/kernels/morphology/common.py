@@ -334,8 +334,17 @@ def invoke_kernel(morphology,
         The analysis results as an @MorphologyAnalysisResult structure.
     """
 
+    # If the arbors are profiled, compute the result from the profiles without any traversal
+    fused_kernel = None
+    if getattr(morphology, 'analysis_profiles', None) is not None:
+        fused_kernel = nmv.analysis.get_fused_arbor_kernel(kernel)
+
     # Apply the analysis operation to the morphology
-    analysis_result = nmv.analysis.apply_analysis_operation_to_morphology(*[morphology, kernel])
+    if fused_kernel is not None:
+        analysis_result = nmv.analysis.apply_fused_kernel_to_morphology(morphology, fused_kernel)
+    else:
+        analysis_result = nmv.analysis.apply_analysis_operation_to_morphology(
+            *[morphology, kernel])
 
     # Update the aggregate morphology result from the arbors
     aggregation_function(analysis_result)
@@ -433,8 +433,8 @@ def compute_path_distance(section,
         A list to collect the analysis data.
     """
 
-    # Computes the path distance if not computed for the parents
-    analysis_data.append(section.compute_path_length())
+    # The path distances of all the sections of the arbor are cached
+    analysis_data.append(section.get_path_length())
 
 
 ####################################################################################################
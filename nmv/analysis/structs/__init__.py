@@ -19,3 +19,4 @@ from .analysis_item import *
 from .analysis_data import *
 from .analysis_distribution import *
 from .morphology_analysis_result import *
+from .arbor_analysis_profile import *
@@ -15,18 +15,15 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-# Blender imports
-import bpy
-from bpy.props import IntProperty
-from bpy.props import FloatProperty
-
-
 ####################################################################################################
 # AnalysisItem
 ####################################################################################################
 class AnalysisItem:
     """Each analysis item will appear in the UI and will be registered into Blender with a specific
     variable name. This class encapsulates the parameters of each entry.
+
+    The item does not depend on Blender, the variables are registered in the analysis panel, see
+    @register_per_arbor_analysis_item_variables, so that the kernels can be applied headlessly.
     """
 
     ################################################################################################
@@ -79,103 +76,6 @@ class AnalysisItem:
         # Analysis result for the entire morphology of type @MorphologyAnalysisResult
         self.result = None
 
-    ################################################################################################
-    # @register_variable
-    ################################################################################################
-    def register_variable(self,
-                          variable_prefix):
-        """Registers this entry for this analysis item in Blender and add it to the UI.
-
-        :param variable_prefix:
-             The prefix 'in string format' that is used to tag or identify the analysis component.
-        """
-
-        # Append a little detail to the description to indicate if this is morphology or arbor
-        if 'Morphology' in variable_prefix:
-            description = '%s %s' % (self.description, '. This value is reported for the morphology')
-        elif 'Dendrite' in variable_prefix:
-            description = '%s %s' % (self.description, '. This value is reported for this dendrite')
-        elif 'Axon' in variable_prefix:
-            description = '%s %s' % (self.description, '. This value is reported for the axon')
-        else:
-            description = 'None'
-
-        # Float entry
-        if self.data_format == 'FLOAT':
-            setattr(bpy.types.Scene, '%s%s' % (variable_prefix, self.variable),
-                    FloatProperty(name=self.name, description=description, subtype='FACTOR',
-                                  min=0, max=1e32, precision=5))
-
-        elif self.data_format == 'NEGATIVE_FLOAT':
-            setattr(bpy.types.Scene, '%s%s' % (variable_prefix, self.variable),
-                    FloatProperty(name=self.name, description=description, subtype='FACTOR',
-                                  min=-1e5, max=1e32, precision=5))
-
-        # Int entry
-        elif self.data_format == 'INT':
-            setattr(bpy.types.Scene, '%s%s' % (variable_prefix, self.variable),
-                    IntProperty(name=self.name, description=description, subtype='FACTOR'))
-
-        # Otherwise, ignore
-        else:
-            pass
-
-    ################################################################################################
-    # @register_global_analysis_variables
-    ################################################################################################
-    def register_global_analysis_variables(self,
-                                           morphology):
-        """Registers each global analysis variable in the group.
-
-        :param morphology:
-            A given morphology to analyze.
-        """
-
-        # Float entry
-        if self.data_format == 'FLOAT':
-            setattr(bpy.types.Scene, '%s' % self.variable,
-                    FloatProperty(name=self.name, description=self.description, subtype='FACTOR',
-                                  min=0, max=1e32, precision=5))
-
-        elif self.data_format == 'NEGATIVE_FLOAT':
-            setattr(bpy.types.Scene, '%s' % self.variable,
-                    FloatProperty(name=self.name, description=self.description, subtype='FACTOR',
-                                  min=-1e5, max=1e32, precision=5))
-
-        # Int entry
-        elif self.data_format == 'INT':
-            setattr(bpy.types.Scene, '%s' % self.variable,
-                    IntProperty(name=self.name, description=self.description, subtype='FACTOR'))
-
-    ################################################################################################
-    # @register_per_arbor_analysis_variables
-    ################################################################################################
-    def register_per_arbor_analysis_variables(self,
-                                              morphology):
-        """Registers each per-arbor analysis variable in the group.
-
-        :param morphology:
-            A given morphology to analyze.
-        """
-
-        # Morphology
-        self.register_variable(variable_prefix='Morphology')
-
-        # Apical dendrites
-        if morphology.has_apical_dendrites():
-            for arbor in morphology.apical_dendrites:
-                self.register_variable(variable_prefix=arbor.tag)
-
-        # Basal dendrites
-        if morphology.has_basal_dendrites():
-            for arbor in morphology.basal_dendrites:
-                self.register_variable(variable_prefix=arbor.tag)
-
-        # Axons
-        if morphology.has_axons():
-            for arbor in morphology.axons:
-                self.register_variable(variable_prefix=arbor.tag)
-
     ################################################################################################
     # @update_analysis_variable
     ################################################################################################
@@ -0,0 +1,326 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import math
+
+# Internal imports
+import nmv.skeleton
+
+
+####################################################################################################
+# @ArborAnalysisProfile
+####################################################################################################
+class ArborAnalysisProfile:
+    """The per-segment and per-section measures of a single arbor, collected in a single traversal.
+
+    All the per-arbor analysis kernels are reductions of these arrays, and therefore the whole list
+    of the analysis items can be evaluated without traversing the arbor again. The values follow
+    the conventions of the section kernels in nmv.analysis.kernels.section.
+    """
+
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 arbor):
+        """Constructor
+
+        :param arbor:
+            The root section of the arbor to be profiled.
+        """
+
+        import numpy
+
+        # The sections of the arbor in the same order the arbor operations visit them
+        self.sections = nmv.skeleton.ops.get_arbor_sections_in_pre_order(arbor)
+        number_sections = len(self.sections)
+
+        # Index every section to link the parents and the children with the arrays
+        sections_indices = {section: i for i, section in enumerate(self.sections)}
+
+        # The indices of the parent and the children of every section
+        self.sections_parents = numpy.full(number_sections, -1, dtype=int)
+        self.sections_children = list()
+
+        # The branching order and the number of samples of every section
+        self.sections_branching_orders = numpy.zeros(number_sections, dtype=int)
+        self.sections_number_samples = numpy.zeros(number_sections, dtype=int)
+
+        # The samples of all the sections concatenated
+        points_list = list()
+        radii_list = list()
+
+        # The single traversal
+        for i, section in enumerate(self.sections):
+            points, radii = section.get_samples_arrays()
+            points_list.append(numpy.asarray(points, dtype=numpy.float64).reshape(-1, 3))
+            radii_list.append(numpy.asarray(radii, dtype=numpy.float64).reshape(-1))
+
+            self.sections_number_samples[i] = len(radii_list[-1])
+            self.sections_branching_orders[i] = section.branching_order
+            if section.parent is not None and section.parent in sections_indices:
+                self.sections_parents[i] = sections_indices[section.parent]
+
+            children = section.children if section.children is not None else list()
+            self.sections_children.append([sections_indices[child] for child in children])
+
+        # All the samples of the arbor
+        if number_sections > 0:
+            self.points = numpy.concatenate(points_list)
+            self.radii = numpy.concatenate(radii_list)
+        else:
+            self.points = numpy.zeros((0, 3))
+            self.radii = numpy.zeros(0)
+
+        # The first and last samples of every section
+        counts = self.sections_number_samples
+        self.sections_first_samples = numpy.cumsum(counts) - counts
+        self.sections_last_samples = self.sections_first_samples + counts - 1
+        self.sections_number_children = numpy.array(
+            [len(children) for children in self.sections_children], dtype=int)
+
+        # The sections that have at least one segment
+        self.valid_sections = counts > 1
+
+        # The segments, ignoring the pairs of samples that join two successive sections
+        segments_vectors = numpy.diff(self.points, axis=0)
+        segments_mask = numpy.ones(len(segments_vectors), dtype=bool)
+        segments_mask[self.sections_last_samples[:-1][counts[:-1] > 0]] = False
+        segments_starts = numpy.flatnonzero(segments_mask)
+        self.segments_sections = numpy.repeat(numpy.arange(number_sections),
+                                              numpy.maximum(counts - 1, 0))
+
+        # Per-segment measures
+        r0 = self.radii[segments_starts]
+        r1 = self.radii[segments_starts + 1]
+        self.segments_lengths = numpy.linalg.norm(segments_vectors[segments_mask], axis=1)
+        self.segments_surface_areas = \
+            math.pi * (r0 + r1) * numpy.sqrt((r0 - r1) * (r0 - r1) + self.segments_lengths) + \
+            math.pi * (r0 * r0 + r1 * r1)
+        self.segments_volumes = \
+            (1.0 / 3.0) * math.pi * self.segments_lengths * (r0 * r0 + r0 * r1 + r1 * r1)
+
+        # Per-section measures
+        self.sections_lengths = self.sum_per_section(self.segments_lengths)
+        self.sections_surface_areas = self.sum_per_section(self.segments_surface_areas)
+        self.sections_volumes = self.sum_per_section(self.segments_volumes)
+
+        # Euclidean distances between the first and last samples of every section
+        first = self.sections_first_samples[self.valid_sections]
+        last = self.sections_last_samples[self.valid_sections]
+        self.sections_euclidean_distances = numpy.zeros(number_sections)
+        self.sections_euclidean_distances[self.valid_sections] = numpy.linalg.norm(
+            self.points[last] - self.points[first], axis=1)
+
+        # Radii per section
+        samples_sections = numpy.repeat(numpy.arange(number_sections), counts)
+        starts = self.sections_first_samples[counts > 0]
+        self.sections_minimum_radii = numpy.minimum.reduceat(self.radii, starts) \
+            if len(starts) > 0 else numpy.zeros(0)
+        self.sections_maximum_radii = numpy.maximum.reduceat(self.radii, starts) \
+            if len(starts) > 0 else numpy.zeros(0)
+        self.sections_average_radii = numpy.add.reduceat(self.radii, starts) / counts[counts > 0] \
+            if len(starts) > 0 else numpy.zeros(0)
+        self.sections_zero_radius_samples = numpy.bincount(
+            samples_sections[self.radii < 0.000001], minlength=number_sections)
+
+        # Path lengths from the root of the arbor, the parents are always visited before
+        self.sections_path_lengths = numpy.array(self.sections_lengths)
+        for i in range(number_sections):
+            if self.sections_parents[i] >= 0:
+                self.sections_path_lengths[i] += self.sections_path_lengths[
+                    self.sections_parents[i]]
+
+        # Keep the lengths of the sections updated, as Section.compute_path_length() does
+        for i, section in enumerate(self.sections):
+            section.length = float(self.sections_lengths[i])
+            section.path_length = float(self.sections_path_lengths[i])
+
+        # Short sections, their lengths are smaller than the sums of their terminal diameters
+        diameters_sums = numpy.zeros(number_sections)
+        diameters_sums[self.valid_sections] = 2 * (self.radii[first] + self.radii[last])
+        self.sections_short = self.valid_sections & (self.sections_lengths < diameters_sums)
+
+        # The measures at the branching points
+        self.compute_tapers()
+        self.compute_ratios()
+        self.compute_bifurcation_angles()
+
+    ################################################################################################
+    # @sum_per_section
+    ################################################################################################
+    def sum_per_section(self,
+                        segments_values):
+        """Sums up the values of the segments of every section.
+
+        :param segments_values:
+            An array of per-segment values.
+        :return:
+            An array of per-section values.
+        """
+
+        import numpy
+
+        return numpy.bincount(self.segments_sections, weights=segments_values,
+                              minlength=len(self.sections))
+
+    ################################################################################################
+    # @compute_tapers
+    ################################################################################################
+    def compute_tapers(self):
+        """Computes the Burke and Hillman tapers of the sections, zeros for roots and leaves.
+        """
+
+        import numpy
+
+        self.sections_burke_tapers = numpy.zeros(len(self.sections))
+        self.sections_hillman_tapers = numpy.zeros(len(self.sections))
+
+        # Only the intermediate sections
+        intermediate = numpy.flatnonzero(
+            (self.sections_parents >= 0) & (self.sections_number_children > 0))
+        if len(intermediate) == 0:
+            return
+
+        parents_radii = self.radii[self.sections_last_samples[self.sections_parents[intermediate]]]
+        radii = self.radii[self.sections_last_samples[intermediate]]
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            self.sections_burke_tapers[intermediate] = \
+                (parents_radii - radii) * 2.0 / self.sections_lengths[intermediate]
+            self.sections_hillman_tapers[intermediate] = (parents_radii - radii) / parents_radii
+
+    ################################################################################################
+    # @compute_ratios
+    ################################################################################################
+    def compute_ratios(self):
+        """Computes the daughter and the parent-daughter ratios at the branching points.
+        """
+
+        import numpy
+
+        # The radius of the first segment of every section
+        valid = self.valid_sections
+        first = self.sections_first_samples
+        first_segments_radii = numpy.zeros(len(self.sections))
+        first_segments_radii[valid] = 0.5 * (self.radii[first[valid]] + self.radii[first[valid] + 1])
+
+        # The radius of the last segment of every section
+        last = self.sections_last_samples
+        last_segments_radii = numpy.zeros(len(self.sections))
+        last_segments_radii[valid] = 0.5 * (self.radii[last[valid]] + self.radii[last[valid] - 1])
+
+        daughter_ratios = list()
+        parent_daughter_ratios = list()
+        for i, children in enumerate(self.sections_children):
+
+            # Daughter ratios between the first two children at every branching point
+            if len(children) > 1 and valid[children[0]] and valid[children[1]]:
+                ratio = first_segments_radii[children[0]] / first_segments_radii[children[1]]
+                daughter_ratios.append(1.0 / ratio if ratio < 1.0 else ratio)
+
+            # Parent-daughter ratios between the section and each of its children
+            if len(children) > 0 and valid[i]:
+                for child in children:
+                    if valid[child]:
+                        parent_daughter_ratios.append(
+                            first_segments_radii[child] / last_segments_radii[i])
+
+        self.daughter_ratios = numpy.array(daughter_ratios, dtype=numpy.float64)
+        self.parent_daughter_ratios = numpy.array(parent_daughter_ratios, dtype=numpy.float64)
+
+    ################################################################################################
+    # @compute_bifurcation_angles
+    ################################################################################################
+    def compute_bifurcation_angles(self):
+        """Computes the local and global bifurcation angles in degrees.
+
+        The local angle uses the first segments of the two children (or the second sample after
+        the first one if the first segment has zero length), and the global angle uses the first
+        and last samples of the children.
+        """
+
+        import numpy
+
+        number_sections = len(self.sections)
+        counts = self.sections_number_samples
+        first = self.sections_first_samples
+
+        # The local direction of every section
+        local_directions = numpy.zeros((number_sections, 3))
+        local_valid = self.valid_sections.copy()
+        local_directions[local_valid] = \
+            self.points[first[local_valid] + 1] - self.points[first[local_valid]]
+        degenerate = local_valid & (numpy.linalg.norm(local_directions, axis=1) < 1e-6)
+        local_valid[degenerate & (counts < 3)] = False
+        degenerate &= counts >= 3
+        local_directions[degenerate] = self.points[first[degenerate] + 2] - \
+            self.points[first[degenerate]]
+        local_valid[degenerate & (numpy.linalg.norm(local_directions, axis=1) < 1e-6)] = False
+
+        # The global direction of every section
+        global_directions = numpy.zeros((number_sections, 3))
+        global_valid = self.valid_sections.copy()
+        global_directions[global_valid] = self.points[self.sections_last_samples[global_valid]] - \
+            self.points[first[global_valid]]
+        global_valid &= numpy.linalg.norm(global_directions, axis=1) >= 1e-6
+
+        # Only the bifurcations
+        bifurcations = [children for children in self.sections_children if len(children) == 2]
+        children_1 = numpy.array([children[0] for children in bifurcations], dtype=int)
+        children_2 = numpy.array([children[1] for children in bifurcations], dtype=int)
+
+        self.local_bifurcation_angles = self.compute_angles(
+            local_directions, local_valid, children_1, children_2)
+        self.global_bifurcation_angles = self.compute_angles(
+            global_directions, global_valid, children_1, children_2)
+
+    ################################################################################################
+    # @compute_angles
+    ################################################################################################
+    @staticmethod
+    def compute_angles(directions,
+                       valid,
+                       children_1,
+                       children_2):
+        """Computes the angles between the directions of the pairs of children.
+
+        :param directions:
+            The directions of all the sections.
+        :param valid:
+            A mask of the sections that have valid directions.
+        :param children_1:
+            The indices of the first children.
+        :param children_2:
+            The indices of the second children.
+        :return:
+            An array of the angles of the valid pairs in degrees.
+        """
+
+        import numpy
+
+        # Ignore the pairs that have a degenerate direction
+        pairs = valid[children_1] & valid[children_2]
+        vectors_1 = directions[children_1[pairs]]
+        vectors_2 = directions[children_2[pairs]]
+
+        # Normalize and compute the angles
+        vectors_1 /= numpy.linalg.norm(vectors_1, axis=1)[:, None]
+        vectors_2 /= numpy.linalg.norm(vectors_2, axis=1)[:, None]
+        cosines = numpy.clip(numpy.einsum('ij,ij->i', vectors_1, vectors_2), -1.0, 1.0)
+        return numpy.arccos(cosines) * 180.0 / 3.14
@@ -15,6 +15,13 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
+# Internal imports
+import nmv
+
 from .bounding_box import *
-from .ops import *
+from .bounding_box_ops import *
+
+# The scene operations require Blender
+if nmv.BLENDER_AVAILABLE:
+    from .ops import *
 
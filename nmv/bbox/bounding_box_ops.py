@@ -0,0 +1,168 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import math
+
+# Blender imports
+from mathutils import Vector
+
+# Internal imports
+import nmv.bbox
+
+
+####################################################################################################
+# @extend_bounding_boxes
+####################################################################################################
+def extend_bounding_boxes(bounding_boxes_list):
+    """Return the largest bounding box that is composed of smaller ones.
+
+    :param bounding_boxes_list:
+        A list of bounding boxes given to get the union of them.
+    :return:
+        The union bounding box of all the given bounding boxes.
+    """
+
+    # Initialize the min and max points
+    p_min = Vector((1e10, 1e10, 1e10))
+    p_max = Vector((-1e10, -1e10, -1e10))
+
+    for bounding_box in bounding_boxes_list:
+        if bounding_box.p_min[0] < p_min[0]:
+            p_min[0] = bounding_box.p_min[0]
+        if bounding_box.p_min[1] < p_min[1]:
+            p_min[1] = bounding_box.p_min[1]
+        if bounding_box.p_min[2] < p_min[2]:
+            p_min[2] = bounding_box.p_min[2]
+
+        if bounding_box.p_max[0] > p_max[0]:
+            p_max[0] = bounding_box.p_max[0]
+        if bounding_box.p_max[1] > p_max[1]:
+            p_max[1] = bounding_box.p_max[1]
+        if bounding_box.p_max[2] > p_max[2]:
+            p_max[2] = bounding_box.p_max[2]
+
+    # Build bounding box object
+    bounding_box = nmv.bbox.BoundingBox(p_min, p_max)
+
+    # Return a reference to it
+    return bounding_box
+
+
+####################################################################################################
+# @compute_unified_extent_bounding_box
+####################################################################################################
+def compute_unified_extent_bounding_box(extent):
+    """Compute the bounding box for a given extent in microns.
+
+    :param extent:
+        The bounding box extent.
+    :return:
+        The bounding box.
+    """
+
+    # Setup a unified scale bounding box based on the close up dimension
+    p_min = Vector((-extent, -extent, -extent))
+    p_max = Vector((extent, extent, extent))
+
+    # Compute a symmetric bounding box that fits the given extent
+    unified_bounding_box = nmv.bbox.BoundingBox(p_min=p_min, p_max=p_max)
+
+    # Return a reference to the bounding box
+    return unified_bounding_box
+
+
+####################################################################################################
+# @compute_unified_bounding_box
+####################################################################################################
+def compute_unified_bounding_box(non_unified_bounding_box):
+    """Compute a unified bounding box from a non unified one, where all the dimensions are set to
+    the largest dimension of the non-unified one. This bounding box will be used for rendering.
+
+    :param non_unified_bounding_box:
+        Input non-unified bounding box.
+    :return:
+        Unified bounding box.
+    """
+
+    # Get the largest dimension of the non-unified bounding box
+    x = non_unified_bounding_box.bounds[0]
+    y = non_unified_bounding_box.bounds[1]
+    z = non_unified_bounding_box.bounds[2]
+
+    largest_dimension = x
+    if y > largest_dimension:
+        largest_dimension = y
+    if z > largest_dimension:
+        largest_dimension = z
+
+    largest_bounds = Vector((largest_dimension, largest_dimension, largest_dimension))
+    unified_bounding_box = nmv.bbox.BoundingBox(center=non_unified_bounding_box.center,
+                                       bounds=largest_bounds)
+
+    return unified_bounding_box
+
+
+####################################################################################################
+# @compute_360_bounding_box
+####################################################################################################
+def compute_360_bounding_box(non_unified_bounding_box,
+                             soma_center=Vector((0.0, 0.0, 0.0))):
+    """Compute a specific bounding box from a non unified one, where all the XZ dimensions are set
+    to the largest dimension of the two to render 360 sequences.
+    NOTE: This bounding box will be used for rendering movies.
+
+    :param non_unified_bounding_box:
+        Input non-unified bounding box.
+    :param soma_center:
+        The center of the soma.
+    :return:
+        XZ origin-centred bounding box with the same Y bounds.
+    """
+
+    # Get the largest dimension of the non-unified bounding box along X and Z
+    x_min_distance = soma_center[0] - non_unified_bounding_box.p_min[0]
+    x_max_distance = non_unified_bounding_box.p_max[0] - soma_center[0]
+    x_bounds = x_min_distance
+    if x_bounds < x_max_distance:
+        x_bounds = x_max_distance
+
+    z_min_distance = soma_center[2] - non_unified_bounding_box.p_min[2]
+    z_max_distance = non_unified_bounding_box.p_max[2] - soma_center[2]
+    z_bounds = z_min_distance
+    if z_bounds < z_max_distance:
+        z_bounds = z_max_distance
+
+    # Compute the diagonal
+    diagonal = math.sqrt((x_bounds * x_bounds) + (z_bounds * z_bounds))
+
+    # Compute p_min and p_max
+    x_max = soma_center[0] + diagonal
+    y_max = non_unified_bounding_box.p_max[1]
+    z_max = soma_center[2] + diagonal
+    x_min = soma_center[0] - diagonal
+    y_min = non_unified_bounding_box.p_min[1]
+    z_min = soma_center[2] - diagonal
+
+    p_min = Vector((x_min, y_min, z_min))
+    p_max = Vector((x_max, y_max, z_max))
+
+    # Compute new the bounding box
+    bounding_box = nmv.bbox.BoundingBox(p_min=p_min, p_max=p_max)
+
+    # Return a reference to the bounding box
+    return bounding_box
@@ -15,6 +15,11 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .objects import *
-from .ops import *
+# Internal imports
+import nmv
+
+# The bmesh operations require Blender
+if nmv.BLENDER_AVAILABLE:
+    from .objects import *
+    from .ops import *
 
@@ -16,7 +16,9 @@
 ####################################################################################################
 
 from .common import *
+from .arbors_workers import *
 from .meta_builder import *
 from .piecewise_builder import *
 from .union_builder import *
 from .skinning_builder import *
+from .tubes_builder import *
@@ -0,0 +1,439 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import os
+import sys
+import copyreg
+import pickle
+import shutil
+import tempfile
+import subprocess
+import concurrent.futures
+
+# Blender imports
+import bpy
+from mathutils import Vector
+
+# Internal imports
+import nmv.builders
+import nmv.mesh
+import nmv.scene
+import nmv.shading
+
+
+# The arbors of the morphology, with the option that ignores them
+ARBORS_WORKERS_ARBORS = [('apical_dendrites', 'ignore_apical_dendrites'),
+                         ('basal_dendrites', 'ignore_basal_dendrites'),
+                         ('axons', 'ignore_axons')]
+
+# The materials of the builder that can be assigned to the meshes of the arbors
+ARBORS_WORKERS_MATERIALS = ['soma_materials', 'apical_dendrites_materials',
+                            'basal_dendrites_materials', 'axons_materials', 'spines_materials']
+
+# The file of the builder that is given to the workers
+ARBORS_WORKERS_INPUT_FILE = 'builder.pickle'
+
+# The recursion limit to pickle the builder, since the sections are pickled recursively
+ARBORS_WORKERS_RECURSION_LIMIT = 10000
+
+# The command line interface of the workers
+ARBORS_WORKERS_SCRIPT = '%s/../../interface/cli/arbors_mesh_reconstruction.py' % \
+                        os.path.dirname(os.path.realpath(__file__))
+
+
+####################################################################################################
+# @ArborsPickler
+####################################################################################################
+class ArborsPickler(pickle.Pickler):
+    """Pickles a builder for the workers. The vectors are pickled by value, and the references to
+    Blender data, for example the materials, are dropped since they cannot leave the process."""
+
+    # Pickle the vectors as tuples
+    dispatch_table = copyreg.dispatch_table.copy()
+    dispatch_table[Vector] = lambda vector: (Vector, (tuple(vector),))
+
+    ################################################################################################
+    # @persistent_id
+    ################################################################################################
+    def persistent_id(self, obj):
+        """Replaces the Blender data with an empty reference.
+
+        :param obj:
+            A given object to pickle.
+        :return:
+            An empty reference for the Blender data, or None to pickle the object as usual.
+        """
+
+        if isinstance(obj, bpy.types.bpy_struct):
+            return 'blender'
+        return None
+
+
+####################################################################################################
+# @ArborsUnpickler
+####################################################################################################
+class ArborsUnpickler(pickle.Unpickler):
+    """Unpickles a builder that is pickled with @ArborsPickler."""
+
+    ################################################################################################
+    # @persistent_load
+    ################################################################################################
+    def persistent_load(self, pid):
+        """The Blender data are loaded as None.
+
+        :param pid:
+            The reference of the Blender data.
+        :return:
+            None
+        """
+
+        return None
+
+
+####################################################################################################
+# @get_arbors_workers_jobs
+####################################################################################################
+def get_arbors_workers_jobs(builder):
+    """Gets the arbors that will be built, every arbor is a job for a worker.
+
+    :param builder:
+        An object of the builder that is used to reconstruct the neuron mesh.
+    :return:
+        A list of the jobs, where every job is the name of the arbors list in the morphology and
+        the index of the arbor in it.
+    """
+
+    jobs = list()
+    for arbors_name, ignore_option in ARBORS_WORKERS_ARBORS:
+        if getattr(builder.options.morphology, ignore_option):
+            continue
+        arbors = getattr(builder.morphology, arbors_name)
+        if arbors is not None:
+            jobs.extend([(arbors_name, i) for i in range(len(arbors))])
+    return jobs
+
+
+####################################################################################################
+# @get_builder_materials
+####################################################################################################
+def get_builder_materials(builder):
+    """Gets all the materials of a builder in a single list, in the same order in the main process
+    and in the workers, such that a material is exchanged as its index in this list.
+
+    :param builder:
+        An object of the builder that is used to reconstruct the neuron mesh.
+    :return:
+        A list of the materials of the builder.
+    """
+
+    materials = list()
+    for materials_name in ARBORS_WORKERS_MATERIALS:
+        builder_materials = getattr(builder, materials_name, None)
+        if builder_materials is not None:
+            materials.extend(builder_materials)
+    return materials
+
+
+####################################################################################################
+# @get_builder_timings
+####################################################################################################
+def get_builder_timings(builder):
+    """Gets the timings of a builder, i.e. its attributes that accumulate the time of every step of
+    the reconstruction of the arbors, for example extrusion_time in the skinning builder.
+
+    :param builder:
+        An object of the builder that is used to reconstruct the neuron mesh.
+    :return:
+        A dictionary of the timings of the builder.
+    """
+
+    return {name: value for name, value in vars(builder).items()
+            if name.endswith('_time') and isinstance(value, (int, float))}
+
+
+####################################################################################################
+# @get_arbor_worker_output_file
+####################################################################################################
+def get_arbor_worker_output_file(jobs_directory,
+                                 job):
+    """Gets the file where a worker writes the meshes of its arbor.
+
+    :param jobs_directory:
+        The directory of the jobs.
+    :param job:
+        The name of the arbors list and the index of the arbor.
+    :return:
+        The path to the output file of the job.
+    """
+
+    return '%s/%s_%d.npz' % (jobs_directory, job[0], job[1])
+
+
+####################################################################################################
+# @write_arbors_workers_input
+####################################################################################################
+def write_arbors_workers_input(builder,
+                               jobs_directory):
+    """Writes the builder, with its morphology and options, to the input file of the workers.
+
+    :param builder:
+        An object of the builder that is used to reconstruct the neuron mesh.
+    :param jobs_directory:
+        The directory of the jobs.
+    :return:
+        True if the builder is written, or False if it cannot be given to the workers.
+    """
+
+    recursion_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(recursion_limit, ARBORS_WORKERS_RECURSION_LIMIT))
+    try:
+        with open('%s/%s' % (jobs_directory, ARBORS_WORKERS_INPUT_FILE), 'wb') as file_handle:
+            ArborsPickler(file_handle, protocol=pickle.HIGHEST_PROTOCOL).dump(builder)
+    except (pickle.PicklingError, TypeError, AttributeError, RecursionError) as error:
+        nmv.logger.info('The builder cannot be given to the workers: %s' % str(error))
+        return False
+    finally:
+        sys.setrecursionlimit(recursion_limit)
+    return True
+
+
+####################################################################################################
+# @run_arbor_worker
+####################################################################################################
+def run_arbor_worker(jobs_directory,
+                     job):
+    """Runs a background Blender process that builds the meshes of a single arbor.
+
+    :param jobs_directory:
+        The directory of the jobs.
+    :param job:
+        The name of the arbors list and the index of the arbor.
+    :return:
+        True if the meshes of the arbor are written, otherwise False.
+    """
+
+    command = [bpy.app.binary_path, '-b', '--factory-startup', '--python-exit-code', '1',
+               '--python', ARBORS_WORKERS_SCRIPT, '--', jobs_directory, job[0], str(job[1])]
+    process = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if process.returncode != 0:
+        nmv.logger.detail('Worker of [%s %d] failed: %s' % (
+            job[0], job[1], process.stderr.decode(errors='replace').strip()))
+    return os.path.isfile(get_arbor_worker_output_file(jobs_directory, job))
+
+
+####################################################################################################
+# @build_arbor_meshes_in_worker
+####################################################################################################
+def build_arbor_meshes_in_worker(jobs_directory,
+                                 job):
+    """Builds the meshes of a single arbor in a worker process and writes them as arrays.
+
+    The worker loads the builder of the main process, keeps only the arbor of the job and calls
+    the same arbor reconstruction of the builder, therefore the meshes are identical to the meshes
+    that are built in the main process.
+
+    :param jobs_directory:
+        The directory of the jobs.
+    :param job:
+        The name of the arbors list and the index of the arbor.
+    """
+
+    import numpy
+
+    with open('%s/%s' % (jobs_directory, ARBORS_WORKERS_INPUT_FILE), 'rb') as file_handle:
+        builder = ArborsUnpickler(file_handle).load()
+
+    # Start from an empty scene, with the materials of the builder
+    nmv.scene.ops.clear_scene()
+    nmv.builders.create_skeleton_materials(builder=builder)
+
+    # Keep only the arbor of the job
+    arbors_name, arbor_index = job
+    arbor = getattr(builder.morphology, arbors_name)[arbor_index]
+    for name, _ in ARBORS_WORKERS_ARBORS:
+        setattr(builder.morphology, name, [arbor] if name == arbors_name else [])
+
+    # Build the arbor, and keep the time that is spent in every step by this worker
+    timings = get_builder_timings(builder)
+    builder.reconstruct_arbors_meshes()
+    timings = {name: value - timings[name] for name, value in get_builder_timings(builder).items()
+               if name in timings}
+
+    # The materials of the builder, to find the materials of the slots of every object
+    materials = get_builder_materials(builder)
+
+    # Write all the meshes in the scene, the arbor is the only neuron object in it
+    arrays = dict()
+    names = list()
+    mesh_index = -1
+    for scene_object in list(bpy.context.scene.objects):
+        if scene_object.type != 'MESH':
+            continue
+
+        # Apply the modifiers, if any
+        nmv.scene.ops.convert_object_to_mesh(scene_object)
+
+        i = len(names)
+        if arbor.mesh is not None and scene_object.name == arbor.mesh.name:
+            mesh_index = i
+        names.append(scene_object.name)
+        arrays['vertices_%d' % i] = nmv.mesh.ops.get_vertices_positions(scene_object)
+        arrays['polygons_vertices_%d' % i], arrays['polygons_sizes_%d' % i], \
+            arrays['polygons_smooth_%d' % i] = nmv.mesh.ops.get_polygons_arrays(scene_object)
+
+        # The material slots of the object, -1 for an empty slot, and the slot of every polygon
+        arrays['slots_%d' % i] = numpy.array(
+            [materials.index(slot.material) if slot.material in materials else -1
+             for slot in scene_object.material_slots], dtype=numpy.int32)
+        polygons_materials = numpy.empty(len(scene_object.data.polygons), dtype=numpy.int32)
+        scene_object.data.polygons.foreach_get('material_index', polygons_materials)
+        arrays['polygons_materials_%d' % i] = polygons_materials
+
+    arrays['names'] = numpy.array(names, dtype=str)
+    arrays['mesh_index'] = numpy.array(mesh_index)
+    arrays['timings_names'] = numpy.array(list(timings.keys()), dtype=str)
+    arrays['timings'] = numpy.array(list(timings.values()), dtype=numpy.float64)
+
+    # Write to a temporary file and then rename it, such that a failed worker never leaves a
+    # partial output
+    output_file = get_arbor_worker_output_file(jobs_directory, job)
+    temporary_file = '%s.tmp' % output_file
+    with open(temporary_file, 'wb') as file_handle:
+        numpy.savez(file_handle, **arrays)
+    os.replace(temporary_file, output_file)
+
+
+####################################################################################################
+# @import_arbor_meshes
+####################################################################################################
+def import_arbor_meshes(builder,
+                        jobs_directory,
+                        job):
+    """Creates the meshes of an arbor that is built by a worker, and adds them to the builder as
+    if the arbor is built in this process.
+
+    NOTE: The timings of the workers are added up, so they report the total time of every step
+    over all the arbors, as in this process, and not the elapsed time.
+
+    :param builder:
+        An object of the builder that is used to reconstruct the neuron mesh.
+    :param jobs_directory:
+        The directory of the jobs.
+    :param job:
+        The name of the arbors list and the index of the arbor.
+    """
+
+    import numpy
+
+    arbors_name, arbor_index = job
+    arbor = getattr(builder.morphology, arbors_name)[arbor_index]
+    materials = get_builder_materials(builder)
+
+    with numpy.load(get_arbor_worker_output_file(jobs_directory, job)) as data:
+        arbor_objects = list()
+        for i, name in enumerate(data['names'].tolist()):
+            mesh_object = nmv.mesh.create_mesh_from_vertices_and_polygons(
+                vertices=data['vertices_%d' % i],
+                polygons_vertices=data['polygons_vertices_%d' % i],
+                polygons_sizes=data['polygons_sizes_%d' % i],
+                polygons_smooth=data['polygons_smooth_%d' % i], name=name)
+
+            # The same material slots of the object in the worker, and the slots of the polygons
+            mesh_object.data.materials.clear()
+            for material_index in data['slots_%d' % i].tolist():
+                mesh_object.data.materials.append(
+                    materials[material_index] if material_index >= 0 else None)
+            mesh_object.data.polygons.foreach_set(
+                'material_index', data['polygons_materials_%d' % i])
+            mesh_object.data.update()
+            nmv.shading.adjust_material_uv(mesh_object)
+            arbor_objects.append(mesh_object)
+        mesh_index = int(data['mesh_index'])
+
+        # Add the timings of the worker to the builder, as if the arbor is built in this process
+        for name, value in zip(data['timings_names'].tolist(), data['timings'].tolist()):
+            setattr(builder, name, getattr(builder, name) + value)
+
+    # Add a reference to the mesh object
+    if mesh_index >= 0:
+        arbor.mesh = arbor_objects[mesh_index]
+
+    # The piecewise builder keeps all the objects of the arbors
+    if hasattr(builder, '%s_meshes' % arbors_name):
+        getattr(builder, '%s_meshes' % arbors_name).extend(arbor_objects)
+
+
+####################################################################################################
+# @build_arbors_meshes_in_workers
+####################################################################################################
+def build_arbors_meshes_in_workers(builder):
+    """Builds the meshes of the arbors in parallel, where every arbor is built in a background
+    Blender process and its meshes are exchanged as arrays of vertices and polygons.
+
+    :param builder:
+        An object of the builder that is used to reconstruct the neuron mesh.
+    :return:
+        True if all the arbors are built, or False if they must be built in this process.
+    """
+
+    jobs = get_arbors_workers_jobs(builder)
+    if len(jobs) < 2:
+        return False
+
+    jobs_directory = tempfile.mkdtemp(prefix='nmv_arbors_')
+    try:
+        if not write_arbors_workers_input(builder=builder, jobs_directory=jobs_directory):
+            return False
+
+        nmv.logger.info('Building [%d] arbors in [%d] processes' % (
+            len(jobs), min(builder.options.mesh.arbors_processes, len(jobs))))
+
+        # The workers are separate processes, the threads only wait for them
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=builder.options.mesh.arbors_processes) as executor:
+            results = list(executor.map(run_arbor_worker, [jobs_directory] * len(jobs), jobs))
+        if not all(results):
+            nmv.logger.info('[%d] arbors could not be built in the workers' %
+                            results.count(False))
+            return False
+
+        for job in jobs:
+            import_arbor_meshes(builder=builder, jobs_directory=jobs_directory, job=job)
+        return True
+
+    finally:
+        shutil.rmtree(jobs_directory, ignore_errors=True)
+
+
+####################################################################################################
+# @build_arbors_meshes
+####################################################################################################
+def build_arbors_meshes(builder):
+    """Builds the meshes of the arbors with a given builder, in parallel worker processes if
+    requested in the options, or one after another in this process.
+
+    :param builder:
+        An object of the builder that is used to reconstruct the neuron mesh.
+    """
+
+    if builder.options.mesh.arbors_processes > 1:
+        if build_arbors_meshes_in_workers(builder=builder):
+            return
+        nmv.logger.info('Building the arbors in this process')
+
+    builder.reconstruct_arbors_meshes()
@@ -99,7 +99,7 @@ def update_morphology_skeleton(builder):
     # section and each arbor
     nmv.logger.info('Removing Internal Samples')
     nmv.skeleton.ops.apply_operation_to_morphology(
-        *[builder.morphology, nmv.skeleton.ops.remove_samples_inside_soma])
+        *[builder.morphology, nmv.skeleton.ops.remove_samples_inside_soma], mutates=True)
 
     # Resample the sections of the morphology skeleton
     nmv.builders.morphology.resample_skeleton_sections(builder=builder)
@@ -132,13 +132,13 @@ def modify_morphology_skeleton(builder):
     if builder.options.morphology.arbor_style == nmv.enums.Skeleton.Style.TAPERED or \
        builder.options.morphology.arbor_style == nmv.enums.Skeleton.Style.TAPERED_ZIGZAG:
         nmv.skeleton.ops.apply_operation_to_morphology(
-            *[builder.morphology, nmv.skeleton.ops.taper_section])
+            *[builder.morphology, nmv.skeleton.ops.taper_section], mutates=True)
 
     # Zigzag the sections if required
     if builder.options.morphology.arbor_style == nmv.enums.Skeleton.Style.ZIGZAG or \
        builder.options.morphology.arbor_style == nmv.enums.Skeleton.Style.TAPERED_ZIGZAG:
         nmv.skeleton.ops.apply_operation_to_morphology(
-            *[builder.morphology, nmv.skeleton.ops.zigzag_section])
+            *[builder.morphology, nmv.skeleton.ops.zigzag_section], mutates=True)
 
 
 ####################################################################################################
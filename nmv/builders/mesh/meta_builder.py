@@ -15,9 +15,6 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-# Syetsm imports
-import copy
-
 # Blender imports
 import bpy, mathutils
 from mathutils import Vector
@@ -53,7 +50,7 @@ class MetaBuilder:
         """
 
         # Morphology
-        self.morphology = copy.deepcopy(morphology)
+        self.morphology = morphology.create_working_copy()
 
         # Loaded options from NeuroMorphoVis
         self.options = options
@@ -79,6 +76,10 @@ class MetaBuilder:
         # Meta object mesh, used to build the mesh of the morphology
         self.meta_mesh = None
 
+        # The centers and the radii of the meta balls of the soma segments and the arbors, they are
+        # added to the meta skeleton at once, see @add_meta_balls_to_skeleton
+        self.meta_balls = list()
+
         # A scale factor that was figured out by trial and error to correct the scaling of the radii
         self.magic_scale_factor = 1.575
 
@@ -111,7 +112,7 @@ class MetaBuilder:
         # Remove the internal samples, or the samples that intersect the soma at the first
         # section and each arbor
         nmv.skeleton.ops.apply_operation_to_morphology(
-            *[self.morphology, nmv.skeleton.ops.remove_samples_inside_soma])
+            *[self.morphology, nmv.skeleton.ops.remove_samples_inside_soma], mutates=True)
 
         # Verify the connectivity of the arbors to the soma to filter the disconnected arbors,
         # for example, an axon that is emanating from a dendrite or two intersecting dendrites
@@ -120,7 +121,7 @@ class MetaBuilder:
         # Label the primary and secondary sections based on angles
         nmv.skeleton.ops.apply_operation_to_morphology(
             *[self.morphology,
-              nmv.skeleton.ops.label_primary_and_secondary_sections_based_on_angles])
+              nmv.skeleton.ops.label_primary_and_secondary_sections_based_on_angles], mutates=True)
 
     ################################################################################################
     # @create_meta_segment
@@ -138,99 +139,45 @@ class MetaBuilder:
             Second point radius.
         """
 
-        # Segment vector
-        segment = p2 - p1
-        segment_length = segment.length
-
-        # Make sure that the segment length is not zero
-        if segment_length < 0.001:
-            return
-
-        # Verify the radii, or fix them
-        if r1 < 0.001 * segment_length:
-            r1 = 0.001 * segment_length
-        if r2 < 0.001 * segment_length:
-            r2 = 0.001 * segment_length
-
-        # Compute the deltas between the first and last points along the segments
-        dr = r2 - r1
-        dx = p2[0] - p1[0]
-        dy = p2[1] - p1[1]
-        dz = p2[2] - p1[2]
-
-        # Keep track on the distance traveled along the segment while building, initially 0
-        travelled_distance = 0.0
-
-        # Local points, initially at the first point
-        r = r1
-        x = p1[0]
-        y = p1[1]
-        z = p1[2]
-
-        # Construct the meta elements along the segment
-        while travelled_distance < segment_length:
-            # Make a meta ball (or sphere) at this point
-            meta_element = self.meta_skeleton.elements.new()
-
-            # Set its radius
-            meta_element.radius = r
-
-            # Update its coordinates
-            meta_element.co = (x, y, z)
-
-            # Proceed to the second point
-            travelled_distance += r / 2
-
-            r = r1 + (travelled_distance * dr / segment_length)
-
-            # Get the next point
-            x = p1[0] + (travelled_distance * dx / segment_length)
-            y = p1[1] + (travelled_distance * dy / segment_length)
-            z = p1[2] + (travelled_distance * dz / segment_length)
+        # Compute the meta elements along the segment, they are added to the meta skeleton later
+        self.meta_balls.append(nmv.mesh.ops.compute_meta_balls_along_segments(
+            starts=[tuple(p1)], ends=[tuple(p2)], starts_radii=[r1], ends_radii=[r2],
+            density=self.options.mesh.meta_balls_density))
 
     ################################################################################################
-    # @create_meta_section
+    # @get_meta_section_segments
     ################################################################################################
-    def create_meta_section(self,
-                            section):
-        """Create a section with meta objects.
+    def get_meta_section_segments(self,
+                                  section):
+        """Gets the segments of a section that are created with meta objects.
 
         :param section:
             A given section to extrude a mesh around it.
+        :return:
+            The first points, the second points, the first radii and the second radii of the
+            segments of the section as NumPy arrays, or None if the section has less than two
+            samples.
         """
 
-        # Get the list of samples
-        samples = section.samples
-
-        # Ensure that the section has at least two samples, otherwise it will give an error
-        if len(samples) < 2:
-            return
-
-        # Proceed segment by segment
-        for i in range(len(samples) - 1):
+        import numpy
 
-            radius_0 = samples[i].radius
-            radius_1 = samples[i + 1].radius
+        # Get the samples of the section
+        points, radii = section.get_samples_arrays()
 
-            if radius_0 < 0.1:
-                self.radii_error.append(1.0 - radius_0)
-                radius_0 = 0.1
+        # Ensure that the section has at least two samples, otherwise it will give an error
+        if len(radii) < 2:
+            return None
 
-            if radius_1 < 0.1:
-                radius_1 = 0.1
+        # Report the thin samples at the start of every segment and fix them
+        thin_radii = radii[:-1][radii[:-1] < 0.1]
+        self.radii_error.extend((1.0 - thin_radii).tolist())
+        radii = numpy.maximum(radii, 0.1)
 
-            if radius_0 < self.smallest_radius:
-                self.smallest_radius = radius_0
+        # The smallest radius is used for the resolution of the meta object
+        self.smallest_radius = min(self.smallest_radius, float(radii.min()))
 
-            if radius_1 < self.smallest_radius:
-                self.smallest_radius = radius_1
-
-            # Create the meta segment
-            self.create_meta_segment(
-                p1=samples[i].point,
-                p2=samples[i + 1].point,
-                r1=radius_0 * self.magic_scale_factor,
-                r2=radius_1 * self.magic_scale_factor)
+        return points[:-1], points[1:], \
+            radii[:-1] * self.magic_scale_factor, radii[1:] * self.magic_scale_factor
 
     ################################################################################################
     # @create_meta_arbor
@@ -238,24 +185,61 @@ class MetaBuilder:
     def create_meta_arbor(self,
                           root,
                           max_branching_order):
-        """Extrude the given arbor section by section recursively using meta objects.
+        """Extrude the given arbor with meta objects. The meta elements of all the sections of the
+        arbor are computed at once, the elements that are fully contained in their neighbours are
+        removed, and the rest are added to the meta skeleton later with those of the other arbors.
 
         :param root:
             The root of a given section.
         :param max_branching_order:
-            The maximum branching order set by the user to terminate the recursive call.
+            The maximum branching order set by the user to terminate the traversal.
         """
 
-        # Do not proceed if the branching order limit is hit
-        if root.branching_order > max_branching_order:
+        import numpy
+
+        # Gather the segments of the sections in a depth-first order
+        segments = list()
+        sections = [root]
+        while len(sections) > 0:
+            section = sections.pop()
+
+            # Do not proceed if the branching order limit is hit
+            if section.branching_order > max_branching_order:
+                continue
+
+            section_segments = self.get_meta_section_segments(section)
+            if section_segments is not None:
+                segments.append(section_segments)
+            sections.extend(reversed(section.children))
+
+        if len(segments) == 0:
             return
 
-        # Create the section
-        self.create_meta_section(root)
+        # Compute the meta elements along all the segments
+        starts, ends, starts_radii, ends_radii = \
+            [numpy.concatenate(arrays) for arrays in zip(*segments)]
+        centers, radii = nmv.mesh.ops.compute_meta_balls_along_segments(
+            starts=starts, ends=ends, starts_radii=starts_radii, ends_radii=ends_radii,
+            density=self.options.mesh.meta_balls_density)
+        self.meta_balls.append(
+            nmv.mesh.ops.remove_contained_meta_balls(centers=centers, radii=radii))
 
-        # Create the children sections recursively
-        for child in root.children:
-            self.create_meta_arbor(child, max_branching_order)
+    ################################################################################################
+    # @add_meta_balls_to_skeleton
+    ################################################################################################
+    def add_meta_balls_to_skeleton(self):
+        """Adds the meta balls of the soma segments and all the arbors to the meta skeleton in a
+        single bulk operation.
+        """
+
+        import numpy
+
+        if len(self.meta_balls) == 0:
+            return
+
+        centers, radii = [numpy.concatenate(arrays) for arrays in zip(*self.meta_balls)]
+        nmv.mesh.ops.create_meta_balls(meta_data=self.meta_skeleton, centers=centers, radii=radii)
+        self.meta_balls = list()
 
     ################################################################################################
     # @build_arbors
@@ -446,6 +430,7 @@ class MetaBuilder:
     ################################################################################################
     # @reconstruct_mesh
     ################################################################################################
+    @nmv.utilities.profiled(category='builder')
     def reconstruct_mesh(self):
         """Reconstructs the neuronal mesh using meta objects.
         """
@@ -476,6 +461,10 @@ class MetaBuilder:
         result, stats = nmv.utilities.profile_function(self.build_arbors)
         self.profiling_statistics += stats
 
+        # Add the meta balls of the soma and the arbors to the meta object
+        result, stats = nmv.utilities.profile_function(self.add_meta_balls_to_skeleton)
+        self.profiling_statistics += stats
+
         # Finalize the meta object and construct a solid object
         result, stats = nmv.utilities.profile_function(self.finalize_meta_object)
         self.profiling_statistics += stats
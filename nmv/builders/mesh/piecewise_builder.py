@@ -16,7 +16,7 @@
 ####################################################################################################
 
 # System imports
-import random, os, copy
+import random, os
 
 # Blender imports
 import bpy
@@ -56,7 +56,7 @@ class PiecewiseBuilder:
         """
 
         # Morphology
-        self.morphology = copy.deepcopy(morphology)
+        self.morphology = morphology.create_working_copy()
 
         # Loaded options from NeuroMorphoVis
         self.options = options
@@ -329,6 +329,7 @@ class PiecewiseBuilder:
     ################################################################################################
     # @reconstruct_mesh
     ################################################################################################
+    @nmv.utilities.profiled(category='builder')
     def reconstruct_mesh(self):
         """Reconstructs the neuronal mesh as a set of piecewise-watertight meshes.
 
@@ -354,9 +355,8 @@ class PiecewiseBuilder:
             nmv.builders.mesh.reconstruct_soma_mesh, self)
         self.profiling_statistics += stats
 
-        # Build the arbors
-        result, stats = nmv.utilities.profile_function(
-            self.reconstruct_arbors_meshes)
+        # Build the arbors, in parallel worker processes if requested
+        result, stats = nmv.utilities.profile_function(nmv.builders.build_arbors_meshes, self)
         self.profiling_statistics += stats
 
         # Connect to the soma
@@ -16,15 +16,14 @@
 ####################################################################################################
 
 # System imports
-import copy
 import time
 
 # Blender imports
 import bpy
+from mathutils import Vector
 
 # Internal modules
 import nmv.builders
-import nmv.bmeshi
 import nmv.consts
 import nmv.enums
 import nmv.geometry
@@ -57,7 +56,7 @@ class SkinningBuilder:
         """
 
         # Morphology
-        self.morphology = copy.deepcopy(morphology)
+        self.morphology = morphology.create_working_copy()
 
         # Loaded options from NeuroMorphoVis
         self.options = options
@@ -133,104 +132,59 @@ class SkinningBuilder:
         # Verify and repair the morphology, if required
         nmv.builders.mesh.update_morphology_skeleton(builder=self)
 
-    ################################################################################################
-    # @update_section_samples_radii
-    ################################################################################################
-    @staticmethod
-    def update_section_samples_radii(arbor_mesh,
-                                     section):
-        """Update the radii of the samples along a given section.
-
-        :param arbor_mesh:
-            The mesh of the arbor.
-        :param section:
-            A given section to update the radii of its samples.
-        """
-
-        # Make sure to include the first sample of the root section
-        if section.is_root():
-            starting_index = 0
-        else:
-            starting_index = 1
-
-        # Sample by sample along the section
-        for i in range(starting_index, len(section.samples)):
-
-            # Get the sample radius
-            radius = section.samples[i].radius
-
-            # Get a reference to the vertex
-            vertex = arbor_mesh.data.skin_vertices[0].data[section.samples[i].arbor_idx]
-
-            # Update the radius of the vertex
-            vertex.radius = radius, radius
-
-    ################################################################################################
-    # @update_arbor_samples_radii
-    ################################################################################################
-    def update_arbor_samples_radii(self,
-                                   arbor_mesh,
-                                   root,
-                                   max_branching_order):
-        """Updates the radii of the samples of the entire arbor to match reality from the
-        temporary ones that were given before.
-
-        :param arbor_mesh:
-            The mesh of the arbor that will be updated.
-        :param root:
-            The root section of the arbor.
-        :param max_branching_order:
-            The maximum branching order set by the user to terminate the recursive call.
-        """
-
-        # Do not proceed if the branching order limit is hit
-        if root.branching_order > max_branching_order:
-            return
-
-        # Set the radius of a given section
-        self.update_section_samples_radii(arbor_mesh, root)
-
-        # Update the radii of the samples of the children recursively
-        for child in root.children:
-            self.update_arbor_samples_radii(arbor_mesh, child, max_branching_order)
-
     ################################################################################################
     # @extrude_section
     ################################################################################################
     @staticmethod
-    def extrude_section(arbor_bmesh_object,
-                        section):
-        """Extrudes the section along its samples starting from the first one to the last one.
+    def extrude_section(section,
+                        vertices,
+                        edges,
+                        radii):
+        """Extrudes the section along its samples starting from the first one to the last one by
+        adding them to the skeleton graph of the arbor. Every sample, except the first one that
+        is already added, becomes a vertex that is connected to the previous sample.
 
-        Note that the mesh to be extruded is already selected and there is no need to pass it.
+        The vertices are added in the order of the indices of the samples along the arbor, i.e.
+        the index of the vertex of every sample is its arbor_idx.
 
-        :param arbor_bmesh_object:
-            The bmesh object of the given arbor.
         :param section:
             A given section to extrude a mesh around it.
+        :param vertices:
+            The list of the positions of the vertices of the skeleton graph.
+        :param edges:
+            The list of the edges of the skeleton graph.
+        :param radii:
+            The list of the radii of the vertices of the skeleton graph.
         """
 
         # Extrude segment by segment
-        for i in range(len(section.samples) - 1):
-
-            nmv.bmeshi.ops.extrude_vertex_towards_point(
-                arbor_bmesh_object, section.samples[i].arbor_idx, section.samples[i + 1].point)
+        samples = section.samples
+        for i in range(len(samples) - 1):
+            vertices.append(samples[i + 1].point)
+            edges.append((samples[i].arbor_idx, samples[i + 1].arbor_idx))
+            radii.append(samples[i + 1].radius)
 
     ################################################################################################
-    # @create_root_point_mesh
+    # @extrude_arbor
     ################################################################################################
     def extrude_arbor(self,
-                      arbor_bmesh_object,
                       root,
-                      max_branching_order):
+                      max_branching_order,
+                      vertices,
+                      edges,
+                      radii):
         """Extrude the given arbor section by section recursively.
 
-        :param arbor_bmesh_object:
-            The bmesh object of the arbor.
         :param root:
             The root of a given section.
         :param max_branching_order:
             The maximum branching order set by the user to terminate the recursive call.
+        :param vertices:
+            The list of the positions of the vertices of the skeleton graph.
+        :param edges:
+            The list of the edges of the skeleton graph.
+        :param radii:
+            The list of the radii of the vertices of the skeleton graph.
         """
 
         # Do not proceed if the branching order limit is hit
@@ -238,11 +192,11 @@ class SkinningBuilder:
             return
 
         # Extrude the section
-        self.extrude_section(arbor_bmesh_object, root)
+        self.extrude_section(root, vertices, edges, radii)
 
         # Extrude the children sections recursively
         for child in root.children:
-            self.extrude_arbor(arbor_bmesh_object, child, max_branching_order)
+            self.extrude_arbor(child, max_branching_order, vertices, edges, radii)
 
     ################################################################################################
     # @create_arbor_mesh
@@ -269,6 +223,10 @@ class SkinningBuilder:
             A reference to the created mesh object.
         """
 
+        # The first sample of the arbor, its radius is used for the auxiliary samples as well
+        first_point = arbor.samples[0].point
+        first_radius = arbor.samples[0].radius
+
         # If the arbor is connected to soma, then start at the initial segment of the arbor
         if connected_to_soma:
 
@@ -280,14 +238,12 @@ class SkinningBuilder:
                 arbor, samples_global_arbor_index, max_branching_order)
 
             # Add an auxiliary sample just before the arbor starts
-            auxiliary_point = arbor.samples[0].point - 0.01 * arbor.samples[0].point.normalized()
-
-            # Create the initial vertex of the arbor skeleton at the auxiliary point
-            arbor_bmesh_object = nmv.bmeshi.create_vertex(location=auxiliary_point)
+            auxiliary_point = first_point - 0.01 * first_point.normalized()
 
-            # Extrude towards the first sample from the auxiliary point
-            nmv.bmeshi.ops.extrude_vertex_towards_point(
-                arbor_bmesh_object, 0, arbor.samples[0].point)
+            # Start the arbor skeleton at the auxiliary point, and connect it to the first sample
+            vertices = [auxiliary_point, first_point]
+            edges = [(0, 1)]
+            radii = [first_radius, first_radius]
 
         # Otherwise, add a little auxiliary sample and start from it
         else:
@@ -303,34 +259,31 @@ class SkinningBuilder:
 
             # If the arbor is not far from soma, then connect it to the origin
             if not arbor.far_from_soma:
-                arbor_bmesh_object = nmv.bmeshi.create_vertex()
+                initial_point = Vector((0.0, 0.0, 0.0))
 
                 # Add an auxiliary sample just before the arbor starts
-                auxiliary_point = arbor.samples[0].point - 0.01 * arbor.samples[
-                    0].point.normalized()
+                auxiliary_point = first_point - 0.01 * first_point.normalized()
 
             else:
-                arbor_bmesh_object = nmv.bmeshi.create_vertex(location=arbor.samples[0].point)
+                initial_point = first_point
 
                 # Add an auxiliary sample just after the arbor starts
-                auxiliary_point = arbor.samples[0].point + 0.01 * arbor.samples[
-                    0].point.normalized()
+                auxiliary_point = first_point + 0.01 * first_point.normalized()
 
-            # Extrude to the auxiliary sample
-            nmv.bmeshi.ops.extrude_vertex_towards_point(arbor_bmesh_object, 0, auxiliary_point)
+            # Connect the initial point to the auxiliary sample, and then to the first sample
+            vertices = [initial_point, auxiliary_point, first_point]
+            edges = [(0, 1), (1, 2)]
+            radii = [first_radius, first_radius, first_radius]
 
-            # Extrude towards the first sample
-            nmv.bmeshi.ops.extrude_vertex_towards_point(
-                arbor_bmesh_object, 1, arbor.samples[0].point)
-
-        # Extrude arbor mesh using the skinning method using a temporary radius with a bmesh
+        # Build the skeleton graph of the arbor, with a temporary radius per vertex
         extrusion_time = time.time()
-        self.extrude_arbor(arbor_bmesh_object, arbor, max_branching_order)
+        self.extrude_arbor(arbor, max_branching_order, vertices, edges, radii)
         self.extrusion_time += time.time() - extrusion_time
 
-        # Convert the bmesh to a mesh object
+        # Create the skeleton mesh in a single step
         mesh_conversion_time = time.time()
-        arbor_mesh = nmv.bmeshi.convert_bmesh_to_mesh(arbor_bmesh_object, arbor_name)
+        arbor_mesh = nmv.mesh.create_mesh_from_vertices_and_edges(
+            vertices=vertices, edges=edges, name=arbor_name)
         self.mesh_conversion_time += time.time() - mesh_conversion_time
 
         # Apply a skin modifier create the membrane of the skeleton
@@ -341,22 +294,9 @@ class SkinningBuilder:
         # Activate the arbor mesh
         nmv.scene.set_active_object(arbor_mesh)
 
-        # Get a reference to the vertex
-        vertex = arbor_mesh.data.skin_vertices[0].data[0]
-
-        # Update the radius of the vertex
-        vertex.radius = arbor.samples[0].radius, arbor.samples[0].radius
-
-        # Get a reference to the vertex
-        vertex = arbor_mesh.data.skin_vertices[0].data[1]
-
-        # Update the radius of the vertex
-        vertex.radius = arbor.samples[0].radius, arbor.samples[0].radius
-
-        # Update the radii of the arbor using the fast method before applying the skinning modifier
+        # Update the radii of all the vertices at once before applying the skinning modifier
         update_radii_time = time.time()
-        self.update_arbor_samples_radii(
-            arbor_mesh=arbor_mesh, root=arbor, max_branching_order=max_branching_order)
+        nmv.mesh.set_skin_vertices_radii(mesh_object=arbor_mesh, radii=radii)
         self.update_radii_time += time.time() - update_radii_time
 
         # Apply the modifier
@@ -467,9 +407,21 @@ class SkinningBuilder:
                     # Add a reference to the mesh object
                     self.morphology.axons[i].mesh = arbor_mesh
 
+    ################################################################################################
+    # @reconstruct_arbors_meshes
+    ################################################################################################
+    def reconstruct_arbors_meshes(self):
+        """Reconstructs the meshes of the arbors, starting at their initial segments if they are
+        connected to the soma.
+        """
+
+        self.build_arbors(connected_to_soma=self.options.mesh.soma_connection ==
+                          nmv.enums.Meshing.SomaConnection.CONNECTED)
+
     ################################################################################################
     # @reconstruct_mesh
     ################################################################################################
+    @nmv.utilities.profiled(category='builder')
     def reconstruct_mesh(self):
         """Reconstructs the neuronal mesh using the skinning modifiers in Blender.
         """
@@ -489,24 +441,16 @@ class SkinningBuilder:
         result, stats = nmv.utilities.profile_function(nmv.builders.reconstruct_soma_mesh, self)
         self.profiling_statistics += stats
 
-        # Build the arbors and connect them to the soma
-        if self.options.mesh.soma_connection == nmv.enums.Meshing.SomaConnection.CONNECTED:
-
-            # Build the arbors
-            result, stats = nmv.utilities.profile_function(self.build_arbors, True)
-            self.profiling_statistics += stats
+        # Build the arbors, in parallel worker processes if requested
+        result, stats = nmv.utilities.profile_function(nmv.builders.build_arbors_meshes, self)
+        self.profiling_statistics += stats
 
-            # Connect to the soma
+        # Connect the arbors to the soma, if required
+        if self.options.mesh.soma_connection == nmv.enums.Meshing.SomaConnection.CONNECTED:
             result, stats = nmv.utilities.profile_function(
                 nmv.builders.connect_arbors_to_soma, self)
             self.profiling_statistics += stats
 
-        # Build the arbors only without any connection to the soma
-        else:
-            # Build the arbors
-            result, stats = nmv.utilities.profile_function(self.build_arbors, False)
-            self.profiling_statistics += stats
-
         # Details about the arbors building
         self.profiling_statistics += '\t* Stats. @%s: [%.3f]\n' % ('extrusion',
                                                                    self.extrusion_time)
@@ -0,0 +1,214 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# Internal imports
+import nmv.builders
+import nmv.consts
+import nmv.enums
+import nmv.mesh
+import nmv.shading
+import nmv.skeleton
+import nmv.scene
+import nmv.utilities
+
+
+####################################################################################################
+# @TubesBuilder
+####################################################################################################
+class TubesBuilder:
+    """Mesh builder that creates the arbors as tubes swept along their skeletons with NumPy.
+    The tubes are created without any bevel objects or boolean operators, where every tube is a
+    closed mesh and the arbors are extended into the soma to hide the connections.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 morphology,
+                 options):
+        """Constructor
+
+        :param morphology:
+            A given morphology skeleton to reconstruct its mesh.
+        :param options:
+            Loaded options from NeuroMorphoVis.
+        """
+
+        # Morphology
+        self.morphology = morphology.create_working_copy()
+
+        # Loaded options from NeuroMorphoVis
+        self.options = options
+
+        # A list of the materials of the soma
+        self.soma_materials = None
+
+        # A list of the materials of the axon
+        self.axons_materials = None
+
+        # A list of the materials of the basal dendrites
+        self.basal_dendrites_materials = None
+
+        # A list of the materials of the apical dendrite
+        self.apical_dendrites_materials = None
+
+        # A reference to the reconstructed soma mesh
+        self.soma_mesh = None
+
+        # Statistics
+        self.profiling_statistics = ''
+
+        # Stats. about the morphology
+        self.morphology_statistics = 'Morphology: \n'
+
+        # Stats. about the mesh
+        self.mesh_statistics = 'TubesBuilder Mesh: \n'
+
+    ################################################################################################
+    # @build_arbor
+    ################################################################################################
+    def build_arbor(self,
+                    arbor,
+                    max_branching_order,
+                    name,
+                    material):
+        """Builds the mesh of an arbor from its tubes.
+
+        :param arbor:
+            The root section of the arbor.
+        :param max_branching_order:
+            Maximum branching order.
+        :param name:
+            Arbor name.
+        :param material:
+            The material that will be applied to the arbor mesh.
+        """
+
+        # Create the tubes of the arbor, extended to the center of the soma if it is close to it
+        vertices, faces = nmv.mesh.create_arbor_tubes_mesh(
+            arbor=arbor, max_branching_order=max_branching_order,
+            origin=nmv.mesh.get_arbor_origin_at_soma(arbor=arbor, soma=self.morphology.soma),
+            ring_resolution=self.options.mesh.tubes_ring_resolution)
+
+        # Create the mesh object in a single step
+        arbor.mesh = nmv.mesh.create_mesh_from_vertices_and_faces(
+            vertices=vertices, faces=faces, name=name)
+
+        # Assign the material to the reconstructed arbor mesh
+        nmv.shading.set_material_to_object(arbor.mesh, material)
+
+        # Update the UV mapping
+        nmv.shading.adjust_material_uv(arbor.mesh)
+
+    ################################################################################################
+    # @build_arbors
+    ################################################################################################
+    def build_arbors(self):
+        """Reconstructs the meshes of the arbors.
+        """
+
+        nmv.logger.header('Reconstructing arbors')
+
+        # Axons
+        if self.morphology.has_axons():
+            if not self.options.morphology.ignore_axons:
+                for arbor in self.morphology.axons:
+                    nmv.logger.detail(arbor.label)
+                    self.build_arbor(
+                        arbor=arbor,
+                        max_branching_order=self.options.morphology.axon_branch_order,
+                        name=arbor.label, material=self.axons_materials[0])
+
+        # Apical dendrites
+        if self.morphology.has_apical_dendrites():
+            if not self.options.morphology.ignore_apical_dendrites:
+                for arbor in self.morphology.apical_dendrites:
+                    nmv.logger.detail(arbor.label)
+                    self.build_arbor(
+                        arbor=arbor,
+                        max_branching_order=self.options.morphology.apical_dendrite_branch_order,
+                        name=arbor.label, material=self.apical_dendrites_materials[0])
+
+        # Basal dendrites
+        if self.morphology.has_basal_dendrites():
+            if not self.options.morphology.ignore_basal_dendrites:
+                for arbor in self.morphology.basal_dendrites:
+                    nmv.logger.detail(arbor.label)
+                    self.build_arbor(
+                        arbor=arbor,
+                        max_branching_order=self.options.morphology.basal_dendrites_branch_order,
+                        name=arbor.label, material=self.basal_dendrites_materials[0])
+
+    ################################################################################################
+    # @reconstruct_mesh
+    ################################################################################################
+    @nmv.utilities.profiled(category='builder')
+    def reconstruct_mesh(self):
+        """Reconstructs the mesh.
+        """
+
+        nmv.logger.header('Building Mesh: TubesBuilder')
+
+        # NOTE: Before drawing the skeleton, create the materials once and for all to improve the
+        # performance since this is way better than creating a new material per section or segment
+        nmv.builders.create_skeleton_materials(builder=self)
+
+        # Apply skeleton - based operation, if required, to slightly modify the skeleton
+        result, stats = nmv.utilities.profile_function(
+            nmv.builders.modify_morphology_skeleton, self)
+        self.profiling_statistics += stats
+
+        # Resample the sections of the morphology skeleton
+        nmv.builders.morphology.resample_skeleton_sections(builder=self)
+
+        # Build the soma, with the default parameters
+        result, stats = nmv.utilities.profile_function(nmv.builders.reconstruct_soma_mesh, self)
+        self.profiling_statistics += stats
+
+        # Build the arbors
+        result, stats = nmv.utilities.profile_function(self.build_arbors)
+        self.profiling_statistics += stats
+
+        # Tessellation
+        result, stats = nmv.utilities.profile_function(nmv.builders.decimate_neuron_mesh, self)
+        self.profiling_statistics += stats
+
+        # Add the spines
+        result, stats = nmv.utilities.profile_function(nmv.builders.add_spines_to_surface, self)
+        self.profiling_statistics += stats
+
+        # Join all the objects into a single object
+        result, stats = nmv.utilities.profile_function(
+            nmv.builders.join_mesh_object_into_single_object, self)
+        self.profiling_statistics += stats
+
+        # Transform to the global coordinates, if required
+        result, stats = nmv.utilities.profile_function(
+            nmv.builders.transform_to_global_coordinates, self)
+        self.profiling_statistics += stats
+
+        # Collect the stats. of the mesh
+        result, stats = nmv.utilities.profile_function(nmv.builders.collect_mesh_stats, self)
+        self.profiling_statistics += stats
+
+        # Report
+        nmv.logger.header('Mesh Reconstruction Done!')
+        nmv.logger.log(self.profiling_statistics)
+
+        # Write the stats to file
+        nmv.builders.write_statistics_to_file(builder=self, tag='tubes')
@@ -15,9 +15,6 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-# System imports
-import copy
-
 # Internal imports
 import nmv.builders
 import nmv.consts
@@ -51,7 +48,7 @@ class UnionBuilder:
         """
 
         # Morphology
-        self.morphology = copy.deepcopy(morphology)
+        self.morphology = morphology.create_working_copy()
 
         # Loaded options from NeuroMorphoVis
         self.options = options
@@ -97,7 +94,7 @@ class UnionBuilder:
         # Remove the internal samples, or the samples that intersect the soma at the first
         # section and each arbor
         nmv.skeleton.ops.apply_operation_to_morphology(
-            *[self.morphology, nmv.skeleton.ops.remove_samples_inside_soma])
+            *[self.morphology, nmv.skeleton.ops.remove_samples_inside_soma], mutates=True)
 
         # The arbors can be selected to be reconstructed with sharp edges or smooth ones. For the
         # sharp edges, we do NOT need to re-sample the morphology skeleton. However, if the smooth
@@ -109,7 +106,7 @@ class UnionBuilder:
 
             # Apply the re-sampling filter on the whole morphology skeleton
             nmv.skeleton.ops.apply_operation_to_morphology(
-                *[self.morphology, nmv.skeleton.ops.resample_section_at_fixed_step])
+                *[self.morphology, nmv.skeleton.ops.resample_section_at_fixed_step], mutates=True)
 
         # Verify the connectivity of the arbors to the soma to filter the disconnected arbors,
         # for example, an axon that is emanating from a dendrite or two intersecting dendrites
@@ -120,12 +117,14 @@ class UnionBuilder:
         try:
             nmv.skeleton.ops.apply_operation_to_morphology(
                 *[self.morphology,
-                  nmv.skeleton.ops.label_primary_and_secondary_sections_based_on_angles])
+                  nmv.skeleton.ops.label_primary_and_secondary_sections_based_on_angles],
+                mutates=True)
         except ValueError:
             nmv.logger.info('Labeling branches based on radii as a fallback')
             nmv.skeleton.ops.apply_operation_to_morphology(
                 *[self.morphology,
-                  nmv.skeleton.ops.label_primary_and_secondary_sections_based_on_radii])
+                  nmv.skeleton.ops.label_primary_and_secondary_sections_based_on_radii],
+                mutates=True)
 
     ################################################################################################
     # @build_arbor
@@ -334,7 +333,7 @@ class UnionBuilder:
     ################################################################################################
     # @reconstruct_arbors_meshes
     ################################################################################################
-    def build_arbors(self):
+    def reconstruct_arbors_meshes(self):
         """Reconstruct the arbors.
 
         # There are two techniques for reconstructing the mesh. The first uses sharp edges without
@@ -360,6 +359,7 @@ class UnionBuilder:
     ################################################################################################
     # @reconstruct_mesh
     ################################################################################################
+    @nmv.utilities.profiled(category='builder')
     def reconstruct_mesh(self):
         """Reconstructs the mesh.
         """
@@ -386,8 +386,8 @@ class UnionBuilder:
         result, stats = nmv.utilities.profile_function(nmv.builders.reconstruct_soma_mesh, self)
         self.profiling_statistics += stats
 
-        # Build the arbors
-        result, stats = nmv.utilities.profile_function(self.build_arbors)
+        # Build the arbors, in parallel worker processes if requested
+        result, stats = nmv.utilities.profile_function(nmv.builders.build_arbors_meshes, self)
         self.profiling_statistics += stats
 
         # Connect to the soma
@@ -23,6 +23,7 @@ import nmv.enums
 import nmv.shading
 import nmv.skeleton
 import nmv.mesh
+import nmv.utilities
 
 
 ####################################################################################################
@@ -84,6 +85,7 @@ def create_skeleton_materials_and_illumination(builder):
 ####################################################################################################
 # @update_sections_branching
 ####################################################################################################
+@nmv.utilities.profiled(category='skeleton')
 def update_sections_branching(builder):
     """Updates the sections at the branching points and label them to primary or secondary based
     on their angles and radii.
@@ -98,18 +100,19 @@ def update_sections_branching(builder):
     if builder.options.morphology.branching == nmv.enums.Skeleton.Branching.ANGLES:
         nmv.skeleton.ops.apply_operation_to_morphology(
             *[builder.morphology,
-              nmv.skeleton.ops.label_primary_and_secondary_sections_based_on_angles])
+              nmv.skeleton.ops.label_primary_and_secondary_sections_based_on_angles], mutates=True)
 
     # Label the primary and secondary sections based on radii
     else:
         nmv.skeleton.ops.apply_operation_to_morphology(
             *[builder.morphology,
-              nmv.skeleton.ops.label_primary_and_secondary_sections_based_on_radii])
+              nmv.skeleton.ops.label_primary_and_secondary_sections_based_on_radii], mutates=True)
 
 
 ####################################################################################################
 # @resample_skeleton_sections
 ####################################################################################################
+@nmv.utilities.profiled(category='skeleton')
 def resample_skeleton_sections(builder):
     """Re-samples the sections of the morphology skeleton before drawing it.
 
@@ -127,19 +130,20 @@ def resample_skeleton_sections(builder):
             nmv.enums.Skeleton.Resampling.ADAPTIVE_RELAXED:
         nmv.logger.detail('Relaxed Adaptive Resampling')
         nmv.skeleton.ops.apply_operation_to_morphology(
-            *[builder.morphology, nmv.skeleton.ops.resample_section_adaptively_relaxed])
+            *[builder.morphology, nmv.skeleton.ops.resample_section_adaptively_relaxed],
+            mutates=True)
     elif builder.options.morphology.resampling_method == \
             nmv.enums.Skeleton.Resampling.ADAPTIVE_PACKED:
         nmv.logger.detail('Packed (or Overlapping) Adaptive Resampling')
         nmv.skeleton.ops.apply_operation_to_morphology(
-            *[builder.morphology, nmv.skeleton.ops.resample_section_adaptively])
+            *[builder.morphology, nmv.skeleton.ops.resample_section_adaptively], mutates=True)
     elif builder.options.morphology.resampling_method == \
             nmv.enums.Skeleton.Resampling.FIXED_STEP:
         nmv.logger.detail('Fixed Step Resampling with step of [%f] um' %
                           builder.options.morphology.resampling_step)
         nmv.skeleton.ops.apply_operation_to_morphology(
             *[builder.morphology, nmv.skeleton.ops.resample_section_at_fixed_step,
-              builder.options.morphology.resampling_step])
+              builder.options.morphology.resampling_step], mutates=True)
     else:
         pass
 
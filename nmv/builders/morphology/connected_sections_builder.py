@@ -49,7 +49,7 @@ class ConnectedSectionsBuilder:
         """
 
         # Morphology
-        self.morphology = copy.deepcopy(morphology)
+        self.morphology = morphology.create_working_copy()
 
         # System options
         self.options = copy.deepcopy(options)
@@ -615,6 +615,7 @@ class ConnectedSectionsBuilder:
     ################################################################################################
     # @draw_morphology_skeleton
     ################################################################################################
+    @nmv.utilities.profiled(category='builder')
     def draw_morphology_skeleton(self):
         """Reconstruct and draw the morphological skeleton.
 
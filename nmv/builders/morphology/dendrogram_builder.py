@@ -57,7 +57,7 @@ class DendrogramBuilder:
         """
 
         # Morphology
-        self.morphology = copy.deepcopy(morphology)
+        self.morphology = morphology.create_working_copy()
 
         # System options
         self.options = copy.deepcopy(options)
@@ -167,6 +167,7 @@ class DendrogramBuilder:
     ################################################################################################
     # @draw_morphology_skeleton
     ################################################################################################
+    @nmv.utilities.profiled(category='builder')
     def draw_morphology_skeleton(self):
         """Reconstruct and draw the morphological skeleton.
 
@@ -32,6 +32,7 @@ import nmv.scene
 import nmv.bmeshi
 import nmv.shading
 import nmv.rendering
+import nmv.utilities
 
 
 ####################################################################################################
@@ -55,7 +56,7 @@ class DisconnectedSectionsBuilder:
         """
 
         # Morphology
-        self.morphology = copy.deepcopy(morphology)
+        self.morphology = morphology.create_working_copy()
 
         # System options
         self.options = copy.deepcopy(options)
@@ -487,6 +488,7 @@ class DisconnectedSectionsBuilder:
     ################################################################################################
     # @draw_morphology_skeleton
     ################################################################################################
+    @nmv.utilities.profiled(category='builder')
     def draw_morphology_skeleton(self):
         """Reconstruct and draw the morphological skeleton.
 
@@ -26,6 +26,7 @@ import nmv.consts
 import nmv.geometry
 import nmv.scene
 import nmv.shading
+import nmv.utilities
 
 
 ####################################################################################################
@@ -48,7 +49,7 @@ class DisconnectedSegmentsBuilder:
         """
 
         # Morphology
-        self.morphology = copy.deepcopy(morphology)
+        self.morphology = morphology.create_working_copy()
 
         # System options
         self.options = copy.deepcopy(options)
@@ -300,6 +301,7 @@ class DisconnectedSegmentsBuilder:
     ################################################################################################
     # @draw_morphology_skeleton
     ################################################################################################
+    @nmv.utilities.profiled(category='builder')
     def draw_morphology_skeleton(self):
         """Reconstruct and draw the morphological skeleton.
 
@@ -32,6 +32,7 @@ import nmv.scene
 import nmv.bmeshi
 import nmv.shading
 import nmv.analysis
+import nmv.utilities
 
 
 ####################################################################################################
@@ -55,7 +56,7 @@ class ProgressiveBuilder:
         """
 
         # Morphology
-        self.morphology = copy.deepcopy(morphology)
+        self.morphology = morphology.create_working_copy()
 
         # System options
         self.options = copy.deepcopy(options)
@@ -374,6 +375,7 @@ class ProgressiveBuilder:
     ################################################################################################
     # @draw_morphology_skeleton
     ################################################################################################
+    @nmv.utilities.profiled(category='builder')
     def draw_morphology_skeleton(self):
         """Reconstruct and draw the morphological skeleton.
 
@@ -27,6 +27,7 @@ import nmv.geometry
 import nmv.scene
 import nmv.bmeshi
 import nmv.shading
+import nmv.utilities
 
 
 ####################################################################################################
@@ -52,7 +53,7 @@ class SamplesBuilder:
         """
 
         # Morphology
-        self.morphology = copy.deepcopy(morphology)
+        self.morphology = morphology.create_working_copy()
 
         # System options
         self.options = copy.deepcopy(options)
@@ -216,6 +217,7 @@ class SamplesBuilder:
     ################################################################################################
     # @draw_morphology_skeleton
     ################################################################################################
+    @nmv.utilities.profiled(category='builder')
     def draw_morphology_skeleton(self):
         """Reconstruct and draw the morphological skeleton.
 
@@ -69,6 +69,10 @@ class SomaMetaBuilder:
         # Meta object mesh, used to build the mesh of the soma
         self.meta_mesh = None
 
+        # The centers and the radii of the meta balls of the segments towards the arbors, they are
+        # added to the meta skeleton at once after emanating towards all the arbors
+        self.meta_balls = list()
+
         # A scale factor that was figured out by trial and error to correct the scaling of the radii
         self.magic_scale_factor = 1.575
 
@@ -235,55 +239,10 @@ class SomaMetaBuilder:
             Second point radius.
         """
 
-        # Segment vector
-        segment = p2 - p1
-        segment_length = segment.length
-
-        # Make sure that the segment length is not zero
-        if segment_length < 0.001:
-            return
-
-        # Verify the radii, or fix them
-        if r1 < 0.001 * segment_length:
-            r1 = 0.001 * segment_length
-        if r2 < 0.001 * segment_length:
-            r2 = 0.001 * segment_length
-
-        # Compute the deltas between the first and last points along the segments
-        dr = r2 - r1
-        dx = p2[0] - p1[0]
-        dy = p2[1] - p1[1]
-        dz = p2[2] - p1[2]
-
-        # Keep track on the distance traveled along the segment while building, initially 0
-        travelled_distance = 0.0
-
-        # Local points, initially at the first point
-        r = r1
-        x = p1[0]
-        y = p1[1]
-        z = p1[2]
-
-        # Construct the meta elements along the segment
-        while travelled_distance < segment_length:
-            # Make a meta ball (or sphere) at this point
-            meta_element = self.meta_skeleton.elements.new()
-
-            # Set its radius
-            meta_element.radius = r
-
-            # Update its coordinates
-            meta_element.co = (x, y, z)
-
-            # Proceed to the second point
-            travelled_distance += r / 2
-
-            r = r1 + (travelled_distance * dr / segment_length)
-
-            # Get the next point
-            x = p1[0] + (travelled_distance * dx / segment_length)
-            y = p1[1] + (travelled_distance * dy / segment_length)
-            z = p1[2] + (travelled_distance * dz / segment_length)
+        # Compute the meta elements along the segment, they are added to the meta skeleton later
+        self.meta_balls.append(nmv.mesh.ops.compute_meta_balls_along_segments(
+            starts=[tuple(p1)], ends=[tuple(p2)], starts_radii=[r1], ends_radii=[r2],
+            density=self.options.mesh.meta_balls_density))
 
     ################################################################################################
     # @emanate_soma_towards_arbor
@@ -322,6 +281,8 @@ class SomaMetaBuilder:
         """Emanates the soma towards the branches.
         """
 
+        import numpy
+
         # Header
         nmv.logger.info('Extruding towards arbors')
 
@@ -366,6 +327,13 @@ class SomaMetaBuilder:
                     nmv.logger.detail(arbor.label)
                     self.emanate_soma_towards_arbor(arbor=arbor)
 
+        # Add the meta balls towards all the arbors to the meta skeleton at once
+        if len(self.meta_balls) > 0:
+            centers, radii = [numpy.concatenate(arrays) for arrays in zip(*self.meta_balls)]
+            nmv.mesh.ops.create_meta_balls(
+                meta_data=self.meta_skeleton, centers=centers, radii=radii)
+            self.meta_balls = list()
+
     ################################################################################################
     # @reconstruct_soma_mesh
     ################################################################################################
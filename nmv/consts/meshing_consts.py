@@ -38,6 +38,26 @@ class Meshing:
     # Default sides of a bevel object
     BEVEL_OBJECT_SIDES = 16
 
+    # Default number of the vertices of the rings of the tubes meshes
+    TUBES_RING_RESOLUTION = 16
+
+    # The range of the number of the vertices of the rings of the tubes meshes, where a ring has at
+    # least three vertices
+    MIN_TUBES_RING_RESOLUTION = 3
+    MAX_TUBES_RING_RESOLUTION = 128
+
+    # Default number of the worker processes that build the meshes of the arbors, where a single
+    # process builds them in the running Blender process
+    ARBORS_PROCESSES = 1
+
+    # Default density of the meta balls along the segments of the meta objects meshes, where the
+    # stride between two balls is half the radius
+    META_BALLS_DENSITY = 1.0
+
+    # The range of the density of the meta balls
+    MIN_META_BALLS_DENSITY = 0.25
+    MAX_META_BALLS_DENSITY = 4.0
+
     # The percentages of random spines added to the neuron
     RANDOM_SPINES_PERCENTAGE = 50.0
 
@@ -62,6 +62,24 @@ class Paths:
     # The folder where SLURM log files will be generated
     SLURM_LOGS_FOLDER = '%s/logs' % SLURM_FOLDER
 
+    # The folder where the records of the completed tasks will be generated
+    MANIFEST_FOLDER = 'manifest'
+
+    # The folder where the profiling results will be generated
+    PROFILING_FOLDER = 'profiling'
+
+    # The folder where the files of the local jobs will be generated
+    LOCAL_FOLDER = 'local'
+
+    # The folder where the log files of the local jobs will be generated
+    LOCAL_LOGS_FOLDER = '%s/logs' % LOCAL_FOLDER
+
+    # The directory of the cache of the parsed morphology files
+    MORPHOLOGY_CACHE_DIRECTORY = os.path.expanduser('~/.cache/neuromorphovis/morphologies')
+
+    # The maximum size of the cache of the parsed morphology files in MB
+    MORPHOLOGY_CACHE_SIZE = 1024
+
     # Keep a reference to the current directory
     current_directory = os.path.dirname(os.path.realpath(__file__))
 
@@ -129,6 +129,9 @@ class Skeleton:
     # The index of the radius of a sample in an H5 file
     H5_SAMPLE_RADIUS_IDX = 3
 
+    # The identifier of the soma section in an H5 file
+    H5_SOMA_SECTION_TYPE = 1
+
     # The identifier of a section of type axon in an H5 file
     H5_AXON_SECTION_TYPE = 2
 
@@ -15,11 +15,10 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-# System imports
-import copy
+# Blender imports
+from mathutils import Vector
 
 # Internal modules
-import nmv.bmeshi
 import nmv.mesh
 import nmv.scene
 
@@ -31,8 +30,9 @@ class MorphologyEditor:
     """Morphology Global Editor
     This editor edits the morphology as a single object, rather than representing the skeleton
     with multiple arbor objects. This is quite convenient when you need to edit all the arbors in
-    a single step. The implementation uses bmeshes instead of meshes to make it extremely fast to
-    toggle and switch between the morphology and the skeleton in case of long axons.
+    a single step. The skeleton mesh is created in a single step from the vertices and the edges
+    of all the samples to make it extremely fast to toggle and switch between the morphology and
+    the skeleton in case of long axons.
     """
 
     ################################################################################################
@@ -156,64 +156,90 @@ class MorphologyEditor:
     # @add_soma_to_arbor_segment
     ################################################################################################
     def add_soma_to_arbor_segment(self,
-                                  arbor):
+                                  arbor,
+                                  vertices,
+                                  edges):
         """Adds a little segment from the soma center (or the origin) to the first sample along the
         arbor.
         :param arbor:
             A given arbor of the morphology.
+        :param vertices:
+            The list of the positions of the vertices of the skeleton.
+        :param edges:
+            The list of the edges of the skeleton.
         """
 
-        nmv.bmeshi.ops.extrude_vertex_towards_point(self.skeleton_mesh, 0, arbor.samples[0].point)
+        vertices.append(arbor.samples[0].point)
+        edges.append((0, arbor.samples[0].morphology_idx))
 
     ################################################################################################
     # @extrude_section
     ################################################################################################
     def extrude_section(self,
-                        section):
+                        section,
+                        vertices,
+                        edges):
         """Extrudes the section along its samples starting from the first one to the last one.
+        Every sample, except the first one that is already added, becomes a vertex of the skeleton
+        at the index morphology_idx, which is connected to the previous sample.
         :param section:
             A given section to extrude a mesh around it.
+        :param vertices:
+            The list of the positions of the vertices of the skeleton.
+        :param edges:
+            The list of the edges of the skeleton.
         """
 
         # Iterate over all the samples and extrude vertex by vertex
-        for i in range(len(section.samples) - 1):
-            nmv.bmeshi.ops.extrude_vertex_towards_point(
-                self.skeleton_mesh, section.samples[i].morphology_idx, section.samples[i + 1].point)
+        samples = section.samples
+        for i in range(len(samples) - 1):
+            vertices.append(samples[i + 1].point)
+            edges.append((samples[i].morphology_idx, samples[i + 1].morphology_idx))
 
     ################################################################################################
     # @extrude_branch
     ################################################################################################
     def extrude_branch(self,
-                       root):
+                       root,
+                       vertices,
+                       edges):
         """Extrude the given branch section by section recursively.
         :param root:
             The root of a given section.
+        :param vertices:
+            The list of the positions of the vertices of the skeleton.
+        :param edges:
+            The list of the edges of the skeleton.
         """
 
         # Extrude the section
-        self.extrude_section(root)
+        self.extrude_section(root, vertices, edges)
 
         # Extrude the children sections recursively
         for child in root.children:
-            self.extrude_branch(child)
+            self.extrude_branch(child, vertices, edges)
 
     ################################################################################################
     # @extrude_arbor
     ################################################################################################
     def extrude_arbor(self,
-                      arbor):
-        """Creates a skeleton mesh of the given arbor recursively.
+                      arbor,
+                      vertices,
+                      edges):
+        """Adds the skeleton of the given arbor to the skeleton of the morphology recursively.
         :param arbor:
             A given arbor.
-        :return:
-            A reference to the created skeleton mesh object.
+        :param vertices:
+            The list of the positions of the vertices of the skeleton.
+        :param edges:
+            The list of the edges of the skeleton.
         """
 
         # First of all, add an auxiliary segment from the soma center to the first sample
-        self.add_soma_to_arbor_segment(arbor=arbor)
+        self.add_soma_to_arbor_segment(arbor=arbor, vertices=vertices, edges=edges)
 
         # Extrude branch mesh
-        self.extrude_branch(root=arbor)
+        self.extrude_branch(root=arbor, vertices=vertices, edges=edges)
 
     ################################################################################################
     # @extrude_morphology_skeleton
@@ -222,28 +248,37 @@ class MorphologyEditor:
         """Creates the skeleton of the morphology as a single object such that we can control it
         and update it during the repair operation.
         NOTE: All the created objects are linked after their creation to the morphology itself.
+        :return:
+            The positions of the vertices and the edges of the skeleton, where the first vertex is
+            the origin (reflecting the soma) and the vertex of every sample is its morphology_idx.
         """
 
         # Header
         nmv.logger.header('Creating Morphology Skeleton for Repair')
 
+        # An initial vertex at the origin (reflecting the soma)
+        vertices = [(0.0, 0.0, 0.0)]
+        edges = list()
+
         # Apical dendrite
         if self.morphology.has_apical_dendrites():
             for arbor in self.morphology.apical_dendrites:
                 nmv.logger.detail(arbor.label)
-                self.extrude_arbor(arbor=arbor)
+                self.extrude_arbor(arbor=arbor, vertices=vertices, edges=edges)
 
         # Basal dendrites
         if self.morphology.has_basal_dendrites():
             for arbor in self.morphology.basal_dendrites:
                 nmv.logger.detail(arbor.label)
-                self.extrude_arbor(arbor=arbor)
+                self.extrude_arbor(arbor=arbor, vertices=vertices, edges=edges)
 
         # Axons
         if self.morphology.has_axons():
             for arbor in self.morphology.axons:
                 nmv.logger.detail(arbor.label)
-                self.extrude_arbor(arbor=arbor)
+                self.extrude_arbor(arbor=arbor, vertices=vertices, edges=edges)
+
+        return vertices, edges
 
     ################################################################################################
     # @sketch_morphology_skeleton
@@ -257,15 +292,12 @@ class MorphologyEditor:
         # Updating the samples indices along the entire morphology
         self.update_samples_indices_per_morphology_of_morphology()
 
-        # Create an initial proxy mesh at the origin (reflecting the soma)
-        # self.skeleton_mesh = nmv.geometry.create_vertex_mesh(name=self.morphology.label)
-        self.skeleton_mesh = nmv.bmeshi.create_vertex()
-
         # Extrude the morphology skeleton
-        self.extrude_morphology_skeleton()
+        vertices, edges = self.extrude_morphology_skeleton()
 
-        # Convert the skeleton to a mesh
-        self.skeleton_mesh = nmv.bmeshi.convert_bmesh_to_mesh(self.skeleton_mesh, 'Skeleton')
+        # Create the skeleton mesh in a single step
+        self.skeleton_mesh = nmv.mesh.create_mesh_from_vertices_and_edges(
+            vertices=vertices, edges=edges, name='Skeleton')
 
         # Select the skeleton mesh for the edit
         nmv.scene.set_active_object(self.skeleton_mesh)
@@ -274,35 +306,56 @@ class MorphologyEditor:
     # @update_section_coordinates
     ################################################################################################
     def update_section_coordinates(self,
-                                   section):
+                                   section,
+                                   positions):
         """Updates the coordinates of the samples of the given section from the skeleton object.
         :param section:
             A given section to update the positions of its samples.
+        :param positions:
+            An (N, 3) array of the positions of the vertices of the skeleton object.
         """
 
-        # On all the samples of the section
-        for i in range(0, len(section.samples)):
+        # Gather the positions of all the samples of the section at once
+        samples = section.samples
+        points = positions[[sample.morphology_idx for sample in samples]]
 
-            # Update the position
-            section.samples[i].point = copy.deepcopy(nmv.mesh.ops.get_vertex_position(
-                mesh_object=self.skeleton_mesh, vertex_index=section.samples[i].morphology_idx))
+        # If the samples are packed, write the positions to the storage in a single step
+        samples_storage = self.morphology.samples_storage
+        if samples_storage is not None and \
+                all(sample.storage is samples_storage for sample in samples):
+            samples_storage.points[[sample.storage_index for sample in samples]] = points
+
+            # The length of the section has changed
+            section.invalidate_derived_quantities()
+
+        # Otherwise, update the positions sample by sample
+        else:
+            for sample, point in zip(samples, points.tolist()):
+                sample.point = Vector(point)
 
     ################################################################################################
     # @update_arbor_coordinates
     ################################################################################################
     def update_arbor_coordinates(self,
-                                 root):
+                                 root,
+                                 positions):
         """"Updates the coordinates of the samples of the given arbor from the skeleton object.
         :param root:
             The root of a given section.
+        :param positions:
+            An (N, 3) array of the positions of the vertices of the skeleton object.
         """
 
+        # Keep the original arbor before it is modified for the first time
+        if root.is_root():
+            self.morphology.snapshot_arbor(root)
+
         # Update for the current section
-        self.update_section_coordinates(root)
+        self.update_section_coordinates(root, positions)
 
         # Update the children sections recursively
         for child in root.children:
-            self.update_arbor_coordinates(child)
+            self.update_arbor_coordinates(child, positions)
 
     ################################################################################################
     # @update_arbor_coordinates
@@ -314,19 +367,22 @@ class MorphologyEditor:
         # Header
         nmv.logger.header('Updating Morphology Skeleton Coordinates')
 
+        # Read the positions of all the vertices of the skeleton in a single step
+        positions = nmv.mesh.ops.get_vertices_positions(self.skeleton_mesh)
+
         # Apical dendrite
         if self.morphology.has_apical_dendrites():
             for arbor in self.morphology.apical_dendrites:
                 nmv.logger.info(arbor.label)
-                self.update_arbor_coordinates(root=arbor)
+                self.update_arbor_coordinates(root=arbor, positions=positions)
 
         if self.morphology.has_basal_dendrites():
             for arbor in self.morphology.basal_dendrites:
                 nmv.logger.info(arbor.label)
-                self.update_arbor_coordinates(root=arbor)
+                self.update_arbor_coordinates(root=arbor, positions=positions)
 
         # Create the apical dendrite mesh
         if self.morphology.has_axons():
             for arbor in self.morphology.axons:
                 nmv.logger.info(arbor.label)
-                self.update_arbor_coordinates(root=arbor)
+                self.update_arbor_coordinates(root=arbor, positions=positions)
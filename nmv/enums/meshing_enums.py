@@ -48,6 +48,9 @@ class Meshing:
         # Meta objects-based meshing
         META_OBJECTS = 'MESHING_TECHNIQUE_META_OBJECTS'
 
+        # Tubes swept along the arbors with NumPy
+        TUBES = 'MESHING_TECHNIQUE_TUBES'
+
         ############################################################################################
         # @__init__
         ############################################################################################
@@ -76,6 +79,10 @@ class Meshing:
             elif argument == 'meta-balls':
                 return Meshing.Technique.META_OBJECTS
 
+            # Tubes
+            elif argument == 'tubes':
+                return Meshing.Technique.TUBES
+
             # By default use piecewise-watertight
             else:
                 return Meshing.Technique.PIECEWISE_WATERTIGHT
@@ -17,12 +17,17 @@
 
 # System imports
 import sys, os, shutil
+import concurrent.futures
 
 # Internal imports
 sys.path.append('%s/../../consts' % os.path.dirname(os.path.realpath(__file__)))
 from paths_consts import *
 
 
+# The extensions of the morphology files that are processed in a directory
+DIRECTORY_MORPHOLOGY_EXTENSIONS = ('.h5', '.swc')
+
+
 ####################################################################################################
 # @clean_and_create_directory
 ####################################################################################################
@@ -149,6 +154,22 @@ def create_output_tree(output_directory):
     slurm_logs_directory = '%s/%s' % (output_directory, Paths.SLURM_LOGS_FOLDER)
     create_directory(slurm_logs_directory)
 
+    # Manifest directory
+    manifest_directory = '%s/%s' % (output_directory, Paths.MANIFEST_FOLDER)
+    create_directory(manifest_directory)
+
+    # Profiling directory
+    profiling_directory = '%s/%s' % (output_directory, Paths.PROFILING_FOLDER)
+    create_directory(profiling_directory)
+
+    # Local jobs directory
+    local_directory = '%s/%s' % (output_directory, Paths.LOCAL_FOLDER)
+    create_directory(local_directory)
+
+    # Local jobs logs directory
+    local_logs_directory = '%s/%s' % (output_directory, Paths.LOCAL_LOGS_FOLDER)
+    create_directory(local_logs_directory)
+
     # Analysis directory
     analysis_directory = '%s/%s' % (output_directory, Paths.ANALYSIS_FOLDER)
     create_directory(analysis_directory)
@@ -212,3 +233,76 @@ def get_file_name_from_path(path):
 
     # Otherwise, return the file name
     return file_name
+
+
+####################################################################################################
+# @run_function_on_morphology_file
+####################################################################################################
+def run_function_on_morphology_file(function,
+                                    morphology_file,
+                                    arguments):
+    """Runs a function on a morphology file in a worker of
+    @run_function_on_morphology_files_in_directory. The error of the function is returned and not
+    raised, so a single morphology that fails does not stop the others.
+
+    :param function:
+        The function that processes the morphology file.
+    :param morphology_file:
+        The path to the morphology file.
+    :param arguments:
+        The arguments that follow the path of the morphology file in the function.
+    :return:
+        The result of the function and None, or None and an error message if the function raises.
+    """
+
+    try:
+        return function(morphology_file, *arguments), None
+    except Exception as error:
+        return None, '%s: %s' % (type(error).__name__, str(error))
+
+
+####################################################################################################
+# @run_function_on_morphology_files_in_directory
+####################################################################################################
+def run_function_on_morphology_files_in_directory(function,
+                                                  input_directory,
+                                                  arguments=(),
+                                                  number_processes=None):
+    """Runs a function on all the .h5 and .swc morphology files in a directory in a pool of
+    processes.
+
+    :param function:
+        A module-level function that takes the path of a morphology file followed by the given
+        arguments, and raises if the morphology cannot be processed.
+    :param input_directory:
+        The directory that contains the morphology files.
+    :param arguments:
+        The arguments that follow the path of the morphology file in the function.
+    :param number_processes:
+        The number of the worker processes, by default the number of the cores.
+    :return:
+        A list of the morphology files, sorted by their names, with the result of the function and
+        None, or None and the error message of the function.
+    """
+
+    # The morphology files, sorted to get the same results for the same directory
+    morphology_files = list()
+    for file_name in sorted(os.listdir(input_directory)):
+        if os.path.splitext(file_name)[1].lower() in DIRECTORY_MORPHOLOGY_EXTENSIONS:
+            morphology_files.append(os.path.join(input_directory, file_name))
+
+    if number_processes is None:
+        number_processes = os.cpu_count() or 1
+    number_processes = max(1, min(number_processes, len(morphology_files)))
+
+    # A few tasks per chunk to reduce the communication with the workers for small morphologies
+    chunk_size = max(1, len(morphology_files) // (number_processes * 4))
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=number_processes) as executor:
+        results = executor.map(run_function_on_morphology_file,
+                               [function] * len(morphology_files),
+                               morphology_files,
+                               [tuple(arguments)] * len(morphology_files),
+                               chunksize=chunk_size)
+        return [(morphology_file, result, error)
+                for morphology_file, (result, error) in zip(morphology_files, results)]
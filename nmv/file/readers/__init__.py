@@ -15,8 +15,14 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .mesh import *
+# Internal imports
+import nmv
+
 from .morphology import *
 from .nuclei import *
 from .spines import *
-from .configs import *
\ No newline at end of file
+
+# The mesh importers and the configuration readers require Blender
+if nmv.BLENDER_AVAILABLE:
+    from .mesh import *
+    from .configs import *
\ No newline at end of file
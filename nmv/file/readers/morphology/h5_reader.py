@@ -36,22 +36,36 @@ class H5Reader:
     # @__init__
     ################################################################################################
     def __init__(self,
-                 h5_file):
+                 h5_file,
+                 lazy_samples=False):
         """Constructor
 
         :param h5_file:
             A given .H5 morphology file.
+        :param lazy_samples:
+            If True, the sections only keep views into the points and radii arrays of the file,
+            and their samples are created on demand when they are accessed for the first time.
+            This mode is recommended for analysis-only runs.
         """
 
         # Set the path to the given h5 file
         self.morphology_file = h5_file
 
-        # A list of all the points in the morphology file
+        # Create the samples on demand
+        self.lazy_samples = lazy_samples
+
+        # An array of all the points in the morphology file, [x, y, z, diameter] per point
         self.points_list = list()
 
-        # A list of all the connectivity data in the morphology file
+        # An array of all the connectivity data in the morphology file
         self.structure_list = list()
 
+        # A contiguous (N, 3) array of the positions of all the points in the morphology file
+        self.points = None
+
+        # A contiguous (N) array of the radii of all the points in the morphology file
+        self.radii = None
+
         # A list of all the perimeters that are specific to astrocyte morphologies
         self.perimeters_list = list()
 
@@ -66,32 +80,24 @@ class H5Reader:
             A linear list of sections of a specific type to be converted to a tree.
         """
 
+        # Index the sections by their IDs to find the children and the parents directly
+        sections_by_index = {section.index: section for section in sections_list}
+
         # For each section, get the IDs of the children nodes, then find and append them to the
         # children lists.
         # Also find the ID of the parent node and update the parent accordingly.
-        branching_order = 0
         for i_section in sections_list:
 
-            # First round
+            # Children
             for child_id in i_section.children_ids:
+                child = sections_by_index.get(child_id)
+                if child is not None:
+                    i_section.children.append(child)
 
-                # For each section
-                for j_section in sections_list:
-
-                    # Is it a child
-                    if child_id == j_section.index:
-
-                        # Append it to the list
-                        i_section.children.append(j_section)
-
-            # Second round
-            for k_section in sections_list:
-
-                # Is it parent
-                if i_section.parent_index == k_section.index:
-
-                    # Set it to be a parent
-                    i_section.parent = k_section
+            # Parent
+            parent = sections_by_index.get(i_section.parent_index)
+            if parent is not None:
+                i_section.parent = parent
 
     ################################################################################################
     # @get_arbors_profile_points
@@ -215,9 +221,6 @@ class H5Reader:
             Returns None in case of invalid directories.
         """
 
-        # A list of data
-        data = None
-
         # Import h5py and install it if it does not exist
         try:
             import h5py
@@ -228,32 +231,46 @@ class H5Reader:
         # Import the h5py module
         import h5py
 
-        # Read the h5 file using the python module into a data array
-        data = h5py.File(self.morphology_file, 'r')
-
-        # Read the point list from the points directory
-        try:
-            nmv.utilities.disable_std_output()
-            self.points_list = data[nmv.consts.Skeleton.H5_POINTS_DIRECTORY].value
-            nmv.utilities.enable_std_output()
-
-        except ValueError:
-            nmv.logger.log('ERROR: Cannot load the data points from [%s]' % self.morphology_file)
-
-            # Return None
-            return None
-
-        # Get the structure list from the structures directory
-        try:
-            nmv.utilities.disable_std_output()
-            self.structure_list = data[nmv.consts.Skeleton.H5_STRUCTURE_DIRECTORY].value
-            nmv.utilities.enable_std_output()
-
-        except ImportError:
-            nmv.logger.log('ERROR: Cannot load the data structure from [%s]' % self.morphology_file)
-
-            # Return None
-            return None
+        # Read the h5 file using the python module into a data array, the file is closed once the
+        # arrays are read, or if they cannot be read
+        with h5py.File(self.morphology_file, 'r') as data:
+
+            # Read the point list from the points directory
+            try:
+                nmv.utilities.disable_std_output()
+                self.points_list = data[nmv.consts.Skeleton.H5_POINTS_DIRECTORY][()]
+                nmv.utilities.enable_std_output()
+
+            except (KeyError, ValueError):
+                nmv.utilities.enable_std_output()
+                nmv.logger.log('ERROR: Cannot load the data points from [%s]' %
+                               self.morphology_file)
+
+                # Return None
+                return None
+
+            # Get the structure list from the structures directory
+            try:
+                nmv.utilities.disable_std_output()
+                self.structure_list = data[nmv.consts.Skeleton.H5_STRUCTURE_DIRECTORY][()]
+                nmv.utilities.enable_std_output()
+
+            except (KeyError, ValueError):
+                nmv.utilities.enable_std_output()
+                nmv.logger.log('ERROR: Cannot load the data structure from [%s]' %
+                               self.morphology_file)
+
+                # Return None
+                return None
+
+        # Split the points into contiguous positions and radii arrays, where all the sections
+        # get their views from
+        # NOTE: What is reported in our .H5 files is the diameter unlike the .SWC files
+        import numpy
+        self.points = numpy.ascontiguousarray(
+            self.points_list[:, nmv.consts.Skeleton.H5_SAMPLE_X_COORDINATES_IDX:
+                                nmv.consts.Skeleton.H5_SAMPLE_Z_COORDINATES_IDX + 1])
+        self.radii = self.points_list[:, nmv.consts.Skeleton.H5_SAMPLE_RADIUS_IDX] / 2.0
 
         # The file has been read successfully
         return True
@@ -264,63 +281,66 @@ class H5Reader:
     def build_sections_from_points_and_structures(self):
         """Builds a list of sections from the data obtained from the .H5 files
 
+        NOTE: The last section of the file goes till the end of the points array, so it is built
+        as the other sections, it used to be skipped before.
+
         :return:
             A linear list of sections of the entire morphology.
         """
 
-        # Parse the sections and add them to a linear list [index, parent, type, samples]
+        # Parse the sections and add them to a linear list [index, parent, type, samples, points,
+        # radii], where the points and radii are views into the arrays of the file
         sections_list = list()
 
-        for i_section in range(1, len(self.structure_list) - 1):
+        # The index of the first point of every section, the last one goes till the end of the
+        # points array
+        sections_offsets = [int(offset) for offset in self.structure_list[:, 0]]
+        sections_offsets.append(len(self.points))
+
+        # Skip the soma section
+        for i_section in range(1, len(self.structure_list)):
 
             # Get the index of the starting point of the section
-            section_first_point_index = self.structure_list[i_section][0]
+            section_first_point_index = sections_offsets[i_section]
 
             # Get the index of the last point of the section
-            section_last_point_index = self.structure_list[i_section + 1][0]
+            section_last_point_index = sections_offsets[i_section + 1]
 
             # Section index
             section_index = i_section
 
             # Get section type
             # 1: soma, 2: axon, 3: basal dendrite, 4: apical dendrite.
-            section_type = self.structure_list[i_section][1]
+            section_type = int(self.structure_list[i_section][1])
 
             # Get the section parent index
             section_parent_index = int(self.structure_list[i_section][2])
 
-            # Get the positions and radii of each sample along the section
-            samples = list()
+            # Get views to the positions and radii of the samples along the section
+            points = self.points[section_first_point_index:section_last_point_index]
+            radii = self.radii[section_first_point_index:section_last_point_index]
 
-            # Sample index
-            sample_index = 0
+            # The samples will be created later on demand
+            if self.lazy_samples:
+                samples = None
 
             # Reconstruct the samples
-            for i_sample in range(section_first_point_index, section_last_point_index):
-
-                # Position
-                x = self.points_list[i_sample][nmv.consts.Skeleton.H5_SAMPLE_X_COORDINATES_IDX]
-                y = self.points_list[i_sample][nmv.consts.Skeleton.H5_SAMPLE_Y_COORDINATES_IDX]
-                z = self.points_list[i_sample][nmv.consts.Skeleton.H5_SAMPLE_Z_COORDINATES_IDX]
-                point = Vector((x, y, z))
-
-                # Radius
-                # NOTE: What is reported in our .H5 files is the diameter unlike the .SWC files
-                radius = self.points_list[i_sample][nmv.consts.Skeleton.H5_SAMPLE_RADIUS_IDX] / 2.0
-
-                # Build a NeuroMorphoVis sample
-                nmv_sample = nmv.skeleton.Sample(
-                    point=point, radius=radius, index=sample_index, morphology_id=sample_index,
-                    type=section_type)
+            else:
+                samples = list()
+                for sample_index, (point, radius) in enumerate(zip(points.tolist(),
+                                                                   radii.tolist())):
 
-                # Add the sample to the list
-                samples.append(nmv_sample)
+                    # Build a NeuroMorphoVis sample
+                    samples.append(nmv.skeleton.Sample(
+                        point=Vector(point), radius=radius, index=sample_index,
+                        morphology_id=sample_index, type=section_type))
 
-                # Next sample
-                sample_index += 1
+                # The arrays are not needed
+                points = None
+                radii = None
 
             # Build a section list until all the sections are parsed
-            section = [section_index, section_parent_index, section_type, samples]
+            section = [section_index, section_parent_index, section_type, samples, points, radii]
 
             # Add this section to the parsed sections list
             sections_list.append(section)
@@ -329,21 +349,20 @@ class H5Reader:
         return sections_list
 
     ################################################################################################
-    # @read_file
+    # @build_sections_by_type
     ################################################################################################
-    def read_file(self):
-        """Read a morphology skeleton given in .H5 file into a NeuroMorphoVis morphology structure.
+    @staticmethod
+    def build_sections_by_type(sections_list):
+        """Constructs the skeleton sections from the parsed sections list and filters them based
+        on their type.
 
+        :param sections_list:
+            A linear list of the parsed sections, each is
+            [index, parent, type, samples, points, radii].
         :return:
-            Returns a reference to a NeuroMorphoVis morphology as read from the file.
+            Three linear lists of the sections of the axons, basal dendrites and apical dendrites.
         """
 
-        # Read the content of the .H5 file
-        self.read_points_and_structures()
-
-        # Build sections from the parsed points and structures from the morphology file
-        sections_list = self.build_sections_from_points_and_structures()
-
         # A linear list of the sections of the axons
         axons_sections = list()
 
@@ -353,6 +372,12 @@ class H5Reader:
         # A linear list of the apical dendrites sections
         apical_dendrites_sections = list()
 
+        # Collect the IDs of the children of every section in a single pass, if the parent ID of
+        # a section is equivalent to the ID of another section, then it is a child
+        children_ids = dict()
+        for i_section in sections_list:
+            children_ids.setdefault(i_section[1], list()).append(i_section[0])
+
         # Construct a tree of sections and filter them based on their type
         for i_section in sections_list:
 
@@ -363,16 +388,7 @@ class H5Reader:
             section_parent_id = i_section[1]
 
             # Section children IDs, if exist
-            section_children_ids = list()
-
-            for j_section in sections_list:
-
-                # If the parent ID of another section is equivalent to the ID of this section, then
-                # it is a child
-                if section_id == j_section[1]:
-
-                    # Append it
-                    section_children_ids.append(j_section[0])
+            section_children_ids = children_ids.get(section_id, list())
 
             # Section type
             section_type = i_section[2]
@@ -383,7 +399,8 @@ class H5Reader:
             # Construct a skeleton section
             nmv_section = nmv.skeleton.Section(
                 index=section_id, parent_index=section_parent_id, children_ids=section_children_ids,
-                samples=section_samples, type=section_type)
+                samples=section_samples, type=section_type,
+                points_array=i_section[4], radii_array=i_section[5])
 
             # Axon
             if section_type == nmv.consts.Skeleton.H5_AXON_SECTION_TYPE:
@@ -409,6 +426,29 @@ class H5Reader:
                 # Report an error
                 nmv.logger.log('ERROR: Unknown section type [%s] !' % str(section_type))
 
+        # Return the sections lists
+        return axons_sections, basal_dendrites_sections, apical_dendrites_sections
+
+    ################################################################################################
+    # @read_file
+    ################################################################################################
+    def read_file(self):
+        """Read a morphology skeleton given in .H5 file into a NeuroMorphoVis morphology structure.
+
+        :return:
+            Returns a reference to a NeuroMorphoVis morphology as read from the file.
+        """
+
+        # Read the content of the .H5 file
+        self.read_points_and_structures()
+
+        # Build sections from the parsed points and structures from the morphology file
+        sections_list = self.build_sections_from_points_and_structures()
+
+        # Construct the skeleton sections and filter them based on their type
+        axons_sections, basal_dendrites_sections, apical_dendrites_sections = \
+            self.build_sections_by_type(sections_list)
+
         # Build the axon tree
         self.build_tree(axons_sections)
 
@@ -0,0 +1,366 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import os
+import hashlib
+
+# Blender imports
+from mathutils import Vector
+
+# Internal imports
+import nmv.skeleton
+import nmv.utilities
+
+
+# The version of the readers and the layout of the cache, it must be incremented whenever the
+# readers or the layout are changed to invalidate the existing cache entries
+MORPHOLOGY_CACHE_VERSION = 1
+
+# The arbors of the morphology in the order they are stored in the cache
+MORPHOLOGY_CACHE_ARBORS = ['apical_dendrites', 'basal_dendrites', 'axons']
+
+
+####################################################################################################
+# @get_morphology_cache_file
+####################################################################################################
+def get_morphology_cache_file(morphology_file,
+                              cache_directory,
+                              lazy_samples=False):
+    """Gets the path to the cache file of a given morphology file.
+
+    The name of the cache file is a hash of the absolute path, the modification time and the size
+    of the morphology file, the options of the readers and the cache version, therefore a modified
+    morphology file or a new version of the readers never hit an old entry, and the old entries
+    are evicted later. The options of the readers are part of the key, since the cached sections
+    are either created with their samples or lazily, as loaded by the readers.
+
+    :param morphology_file:
+        The path to the morphology file.
+    :param cache_directory:
+        The directory of the cache.
+    :param lazy_samples:
+        If True, the samples of the .h5 morphologies are created on demand by the readers.
+    :return:
+        The path to the cache file.
+    """
+
+    stat = os.stat(morphology_file)
+    key = '%s:%d:%d:%d:%d' % (os.path.abspath(morphology_file), stat.st_mtime_ns, stat.st_size,
+                              int(lazy_samples), MORPHOLOGY_CACHE_VERSION)
+    return '%s/%s.npz' % (cache_directory, hashlib.sha1(key.encode()).hexdigest())
+
+
+####################################################################################################
+# @write_morphology_to_cache
+####################################################################################################
+@nmv.utilities.profiled(category='reader')
+def write_morphology_to_cache(morphology,
+                              cache_file):
+    """Writes a loaded morphology to a cache file, where the sections of every arbor are stored in
+    pre-order as flat arrays.
+
+    :param morphology:
+        A morphology as loaded by the readers, i.e. before being modified.
+    :param cache_file:
+        The path to the cache file.
+    :return:
+        True if the morphology is written, or False if it cannot be cached.
+    """
+
+    import numpy
+
+    # Per sample
+    points = list()
+    radii = list()
+    samples_indices = list()
+    samples_morphology_indices = list()
+    samples_types = list()
+    samples_parent_indices = list()
+
+    # Per section
+    sections_offsets = [0]
+    sections_lazy = list()
+    sections_parents = list()
+    sections_indices = list()
+    sections_parent_indices = list()
+    sections_types = list()
+    sections_labels = list()
+    sections_tags = list()
+    sections_children_ids_offsets = [0]
+    sections_children_ids = list()
+
+    # Per arbor, the position of the root section and the arbor list where it belongs
+    arbors_roots = list()
+    arbors_lists = list()
+
+    for i_list, arbors_name in enumerate(MORPHOLOGY_CACHE_ARBORS):
+        arbors = getattr(morphology, arbors_name)
+        if arbors is None:
+            continue
+
+        for arbor in arbors:
+            arbors_roots.append(len(sections_indices))
+            arbors_lists.append(i_list)
+
+            # Pre-order traversal, keeping the position of the parent of every section
+            stack = [(arbor, -1)]
+            while len(stack) > 0:
+                section, parent = stack.pop()
+                position = len(sections_indices)
+
+                # The sections that are only backed by arrays are kept as they are, their samples
+                # are created on demand after loading
+                section_points, section_radii = section.get_samples_arrays()
+                points.append(section_points)
+                radii.append(section_radii)
+                sections_offsets.append(sections_offsets[-1] + len(section_radii))
+                sections_lazy.append(section._samples is None)
+                if section._samples is not None:
+                    for sample in section.samples:
+                        samples_indices.append(sample.index)
+                        samples_morphology_indices.append(sample.morphology_index)
+                        samples_types.append(sample.type)
+                        samples_parent_indices.append(sample.parent_index)
+
+                # A None parent index (SWC roots) is stored as a mask
+                sections_parents.append(parent)
+                sections_indices.append(section.index)
+                sections_parent_indices.append(section.parent_index)
+                sections_types.append(section.type)
+                sections_labels.append(section.label)
+                sections_tags.append(section.tag)
+                sections_children_ids.extend(section.children_ids)
+                sections_children_ids_offsets.append(len(sections_children_ids))
+
+                for child in reversed(section.children):
+                    stack.append((child, position))
+
+    # Only integer identifiers and types can be stored in the arrays
+    for values in [samples_indices, samples_morphology_indices, samples_types,
+                   samples_parent_indices, sections_indices, sections_types,
+                   sections_children_ids]:
+        for value in values:
+            if not isinstance(value, int):
+                return False
+    for value in sections_parent_indices:
+        if value is not None and not isinstance(value, int):
+            return False
+
+    soma = morphology.soma
+    arrays = {
+        'version': numpy.array(MORPHOLOGY_CACHE_VERSION),
+        'label': numpy.array(str(morphology.label)),
+        'number_stems': numpy.array(morphology.number_stems),
+        'soma_centroid': numpy.array(tuple(soma.centroid), dtype=numpy.float64),
+        'soma_mean_radius': numpy.array(soma.mean_radius, dtype=numpy.float64),
+        'soma_profile_points': numpy.array(
+            [tuple(point) for point in soma.profile_points], dtype=numpy.float64).reshape(-1, 3),
+        'soma_arbors_profile_points': numpy.array(
+            [tuple(point) for point in (soma.arbors_profile_points or [])],
+            dtype=numpy.float64).reshape(-1, 3),
+        'points': numpy.concatenate(points).astype(numpy.float64).reshape(-1, 3)
+        if len(points) > 0 else numpy.zeros((0, 3)),
+        'radii': numpy.concatenate(radii).astype(numpy.float64)
+        if len(radii) > 0 else numpy.zeros(0),
+        'samples_indices': numpy.array(samples_indices, dtype=numpy.int64),
+        'samples_morphology_indices': numpy.array(samples_morphology_indices, dtype=numpy.int64),
+        'samples_types': numpy.array(samples_types, dtype=numpy.int64),
+        'samples_parent_indices': numpy.array(samples_parent_indices, dtype=numpy.int64),
+        'sections_offsets': numpy.array(sections_offsets, dtype=numpy.int64),
+        'sections_lazy': numpy.array(sections_lazy, dtype=bool),
+        'sections_parents': numpy.array(sections_parents, dtype=numpy.int64),
+        'sections_indices': numpy.array(sections_indices, dtype=numpy.int64),
+        'sections_parent_indices': numpy.array(
+            [-1 if value is None else value for value in sections_parent_indices],
+            dtype=numpy.int64),
+        'sections_parent_indices_none': numpy.array(
+            [value is None for value in sections_parent_indices], dtype=bool),
+        'sections_types': numpy.array(sections_types, dtype=numpy.int64),
+        'sections_labels': numpy.array(sections_labels, dtype=str),
+        'sections_tags': numpy.array(sections_tags, dtype=str),
+        'sections_children_ids_offsets': numpy.array(sections_children_ids_offsets,
+                                                     dtype=numpy.int64),
+        'sections_children_ids': numpy.array(sections_children_ids, dtype=numpy.int64),
+        'arbors_roots': numpy.array(arbors_roots, dtype=numpy.int64),
+        'arbors_lists': numpy.array(arbors_lists, dtype=numpy.int64)}
+
+    # Write to a temporary file and then rename it, such that concurrent processes never read a
+    # partial entry
+    if not os.path.exists(os.path.dirname(cache_file)):
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    temporary_file = '%s.%d.tmp' % (cache_file, os.getpid())
+    with open(temporary_file, 'wb') as file_handle:
+        numpy.savez(file_handle, **arrays)
+    os.replace(temporary_file, cache_file)
+    return True
+
+
+####################################################################################################
+# @read_morphology_from_cache
+####################################################################################################
+@nmv.utilities.profiled(category='reader')
+def read_morphology_from_cache(cache_file):
+    """Reads a morphology from a cache file, without parsing the morphology file or resolving its
+    topology again.
+
+    :param cache_file:
+        The path to the cache file.
+    :return:
+        A morphology object, or None if the cache file is missing or invalid.
+    """
+
+    import numpy
+
+    if not os.path.isfile(cache_file):
+        return None
+
+    try:
+        with numpy.load(cache_file, allow_pickle=False) as data:
+            arrays = {name: data[name] for name in data.files}
+    except (OSError, ValueError, KeyError):
+        return None
+    if int(arrays['version']) != MORPHOLOGY_CACHE_VERSION:
+        return None
+
+    # Keep the entry fresh for the eviction
+    os.utime(cache_file, None)
+
+    points = arrays['points']
+    radii = arrays['radii']
+    samples_indices = arrays['samples_indices'].tolist()
+    samples_morphology_indices = arrays['samples_morphology_indices'].tolist()
+    samples_types = arrays['samples_types'].tolist()
+    samples_parent_indices = arrays['samples_parent_indices'].tolist()
+    sections_offsets = arrays['sections_offsets'].tolist()
+    sections_lazy = arrays['sections_lazy'].tolist()
+    sections_parents = arrays['sections_parents'].tolist()
+    sections_indices = arrays['sections_indices'].tolist()
+    sections_parent_indices = arrays['sections_parent_indices'].tolist()
+    sections_parent_indices_none = arrays['sections_parent_indices_none'].tolist()
+    sections_types = arrays['sections_types'].tolist()
+    sections_labels = arrays['sections_labels'].tolist()
+    sections_tags = arrays['sections_tags'].tolist()
+    children_ids_offsets = arrays['sections_children_ids_offsets'].tolist()
+    children_ids = arrays['sections_children_ids'].tolist()
+
+    # Build the sections in pre-order, then link them to their parents in the same order to keep
+    # the order of the children
+    sections = list()
+    i_sample = 0
+    for i_section in range(len(sections_indices)):
+        start, end = sections_offsets[i_section], sections_offsets[i_section + 1]
+
+        # Either keep the section backed by its arrays, or create its samples
+        samples = None
+        points_array = None
+        radii_array = None
+        if sections_lazy[i_section]:
+            points_array = points[start:end]
+            radii_array = radii[start:end]
+        else:
+            samples = list()
+            for point, radius in zip(points[start:end].tolist(), radii[start:end].tolist()):
+                samples.append(nmv.skeleton.Sample(
+                    point=Vector(point), radius=radius,
+                    index=samples_indices[i_sample], type=samples_types[i_sample],
+                    morphology_id=samples_morphology_indices[i_sample],
+                    parent_index=samples_parent_indices[i_sample]))
+                i_sample += 1
+
+        section = nmv.skeleton.Section(
+            index=sections_indices[i_section],
+            parent_index=None if sections_parent_indices_none[i_section] else
+            sections_parent_indices[i_section],
+            children_ids=children_ids[children_ids_offsets[i_section]:
+                                      children_ids_offsets[i_section + 1]],
+            samples=samples, type=sections_types[i_section],
+            label=sections_labels[i_section], tag=sections_tags[i_section],
+            points_array=points_array, radii_array=radii_array)
+
+        parent = sections_parents[i_section]
+        if parent >= 0:
+            section.parent = sections[parent]
+            sections[parent].children.append(section)
+        sections.append(section)
+
+    # Group the arbors
+    arbors = [None] * len(MORPHOLOGY_CACHE_ARBORS)
+    for root, i_list in zip(arrays['arbors_roots'].tolist(), arrays['arbors_lists'].tolist()):
+        if arbors[i_list] is None:
+            arbors[i_list] = list()
+        arbors[i_list].append(sections[root])
+    arbors = dict(zip(MORPHOLOGY_CACHE_ARBORS, arbors))
+
+    # Build the soma
+    soma = nmv.skeleton.Soma(
+        centroid=Vector(arrays['soma_centroid'].tolist()),
+        mean_radius=float(arrays['soma_mean_radius']),
+        profile_points=[Vector(point) for point in arrays['soma_profile_points'].tolist()],
+        arbors_profile_points=[
+            Vector(point) for point in arrays['soma_arbors_profile_points'].tolist()])
+
+    # Construct the morphology skeleton
+    morphology = nmv.skeleton.Morphology(soma=soma,
+                                         axons=arbors['axons'],
+                                         basal_dendrites=arbors['basal_dendrites'],
+                                         apical_dendrites=arbors['apical_dendrites'],
+                                         label=str(arrays['label']))
+    morphology.number_stems = int(arrays['number_stems'])
+
+    # Return a reference to the morphology
+    return morphology
+
+
+####################################################################################################
+# @evict_morphology_cache
+####################################################################################################
+def evict_morphology_cache(cache_directory,
+                           maximum_size):
+    """Removes the least recently used entries of the cache until its size fits the maximum size.
+
+    :param cache_directory:
+        The directory of the cache.
+    :param maximum_size:
+        The maximum size of the cache in bytes.
+    """
+
+    if not os.path.isdir(cache_directory):
+        return
+
+    # The entries, least recently used first
+    entries = list()
+    for file_name in os.listdir(cache_directory):
+        if not file_name.endswith('.npz'):
+            continue
+        path = '%s/%s' % (cache_directory, file_name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    entries.sort()
+
+    total_size = sum(entry[1] for entry in entries)
+    for _, size, path in entries:
+        if total_size <= maximum_size:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        total_size -= size
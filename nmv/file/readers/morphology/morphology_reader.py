@@ -20,17 +20,22 @@ import os
 
 # Internal imports
 import nmv.file
+import nmv.utilities
 
 
 ####################################################################################################
 # @read_h5_morphology
 ####################################################################################################
-def read_h5_morphology(h5_file):
+@nmv.utilities.profiled(category='reader')
+def read_h5_morphology(h5_file,
+                       lazy_samples=False):
     """Verifies if the given path is valid or not and then loads a .h5 morphology file.
 
     If the path is not valid, this function returns None.
 
     :param h5_file: Path to the H5 morphology file.
+    :param lazy_samples: Keep the sections backed by the arrays of the file and create their
+    samples on demand.
     :return: A morphology object or None if the path is not valid.
     """
 
@@ -38,7 +43,7 @@ def read_h5_morphology(h5_file):
     if os.path.isfile(h5_file):
 
         # Load the .h5 morphology
-        reader = nmv.file.readers.H5Reader(h5_file=h5_file)
+        reader = nmv.file.readers.H5Reader(h5_file=h5_file, lazy_samples=lazy_samples)
         morphology_object = reader.read_file()
 
         # Return a reference to this morphology object
@@ -54,6 +59,7 @@ def read_h5_morphology(h5_file):
 ####################################################################################################
 # @read_swc_morphology
 ####################################################################################################
+@nmv.utilities.profiled(category='reader')
 def read_swc_morphology(swc_file):
     """Verifies if the given path is valid or not and then loads a .swc morphology file.
 
@@ -86,6 +92,7 @@ def read_swc_morphology(swc_file):
 ####################################################################################################
 # @read_morphology_from_file
 ####################################################################################################
+@nmv.utilities.profiled(category='reader')
 def read_morphology_from_file(options):
     """Loads a morphology object from file. This loader mainly supports .h5 or .swc file formats.
 
@@ -102,11 +109,25 @@ def read_morphology_from_file(options):
     # Get the extension from the file path
     morphology_prefix, morphology_extension = os.path.splitext(morphology_file_path)
 
+    # Load the morphology from the cache, if it was parsed before
+    cache_file = None
+    if options.morphology.use_cache and os.path.isfile(morphology_file_path) and \
+            ('.h5' in morphology_extension or '.swc' in morphology_extension):
+        cache_file = nmv.file.get_morphology_cache_file(
+            morphology_file_path, options.morphology.cache_directory,
+            lazy_samples=options.morphology.lazy_samples)
+        morphology_object = nmv.file.read_morphology_from_cache(cache_file)
+        if morphology_object is not None:
+            if not options.morphology.lazy_samples:
+                morphology_object.pack_samples()
+            return True, morphology_object
+
     # If it is a .h5 file, use the h5 loader
     if '.h5' in morphology_extension:
 
         # Load the .h5 file
-        morphology_object = read_h5_morphology(morphology_file_path)
+        morphology_object = read_h5_morphology(
+            morphology_file_path, lazy_samples=options.morphology.lazy_samples)
 
     elif '.swc' in morphology_extension:
 
@@ -124,6 +145,20 @@ def read_morphology_from_file(options):
     if morphology_object is None:
         return False, None
 
+    # Add the parsed morphology to the cache, a failure to write the cache is not an error
+    if cache_file is not None:
+        try:
+            nmv.file.write_morphology_to_cache(morphology_object, cache_file)
+            nmv.file.evict_morphology_cache(options.morphology.cache_directory,
+                                            options.morphology.cache_size * 1024 * 1024)
+        except OSError as error:
+            nmv.logger.log('WARNING: Cannot cache the morphology [%s]: %s' %
+                           (morphology_file_path, str(error)))
+
+    # Keep the samples in a compact storage, unless they are created on demand
+    if not options.morphology.lazy_samples:
+        morphology_object.pack_samples()
+
     # The morphology file was loaded successfully
     return True, morphology_object
 
@@ -131,11 +166,15 @@ def read_morphology_from_file(options):
 ####################################################################################################
 # @read_morphology_from_file_naively
 ####################################################################################################
-def read_morphology_from_file_naively(morphology_file_path):
+def read_morphology_from_file_naively(morphology_file_path,
+                                      lazy_samples=False):
     """Loads a morphology object from file. This loader mainly supports .h5 or .swc file formats.
 
     :param morphology_file_path:
         The path where the morphology is.
+    :param lazy_samples:
+        If True, the samples of the .h5 morphologies are created on demand, recommended for
+        analysis-only runs.
     :return:
         Morphology object and True (if the morphology is loaded) or False (if the something is
         wrong).
@@ -148,7 +187,7 @@ def read_morphology_from_file_naively(morphology_file_path):
     if '.h5' in morphology_extension:
 
         # Load the .h5 file
-        morphology_object = read_h5_morphology(morphology_file_path)
+        morphology_object = read_h5_morphology(morphology_file_path, lazy_samples=lazy_samples)
 
     elif '.swc' in morphology_extension:
 
@@ -166,6 +205,10 @@ def read_morphology_from_file_naively(morphology_file_path):
     if morphology_object is None:
         return False, None
 
+    # Keep the samples in a compact storage, unless they are created on demand
+    if not lazy_samples:
+        morphology_object.pack_samples()
+
     # The morphology file was loaded successfully
     return True, morphology_object
 
@@ -15,9 +15,6 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-# System imports
-import copy
-
 # Blender imports
 from mathutils import Vector
 
@@ -62,151 +59,102 @@ class SWCReader:
         #       [6] The index of the parent sample
         self.samples_list = list()
 
-        # A list of the indices of the terminals of the sections
-        # This list is only updated once during the morphology loading, and then used to build the
-        # sections later in an accelerated way
-        self.sections_terminal_samples_indices = list()
-
         # A list of the indices of each 'disconnected' section in the morphology
         self.sections_samples_indices_list = list()
 
-        # A list of continuous paths extracted from the morphology file
-        self.paths = list()
-
     ################################################################################################
-    # @build_connected_paths_from_samples
+    # @build_sections_from_samples
     ################################################################################################
-    def build_connected_paths_from_samples(self):
-        """Construct a list of connected paths from the samples.
-        """
-
-        # Since we have the soma index equal to 1, then start from index number 2
-        index = 2
-
-        # A temporary list to append the indices of each path
-        path = list()
-
-        # Process the entire samples list
-        while True:
-
-            # Iterate over two samples to verify their connectivity
-            sample_i = self.samples_list[index]
-            sample_j = self.samples_list[index + 1]
-
-            if sample_i is None or sample_j is None:
-                index = index + 1
-                continue
-
-            # Ensure that this is not a soma profile point
-            if sample_i[nmv.consts.Skeleton.SWC_SAMPLE_TYPE_IDX] == \
-                    nmv.consts.Skeleton.SWC_SOMA_SAMPLE_TYPE:
-                index = index + 1
-                continue
-
-            # If the two samples are connected
-            if sample_j[-1] == sample_i[0]:
-
-                # Add the first sample to the path
-                path.append(sample_i[0])
-
-                # Append the last sample in the morphology file
-                if index + 1 == self.samples_list[-1][0]:
-                    path.append(sample_j[0])
-
-            # Otherwise
-            else:
+    def build_sections_from_samples(self):
+        """Builds the list of sections directly from the topology of the samples in a single pass.
 
-                # Append the last sample to the path
-                # path.append(sample_j[-1])
-                path.append(sample_i[0])
-
-                # Append the path to the paths list
-                if len(path) > 0:
-                    self.paths.append(path)
-
-                # Clear the path list to search for a new path
-                path = list()
-
-            # Increment the path
-            index = index + 1
-
-            # If processing the list is break
-            if index > len(self.samples_list) - 2:
-
-                # Append the last path
-                if len(path) > 0:
-                    self.paths.append(path)
-
-                # Then break
-                break
-
-        # Add the starting points and mark the terminals
-        for path in self.paths:
-
-            # Get the index of the first sample along the path
-            first_sample_index = path[0]
-
-            # Then add the parent sample index at the beginning of the path
-            path.insert(0, self.samples_list[first_sample_index][-1])
-
-            # Marking the terminals by adding the indices of the first and last samples
-            self.sections_terminal_samples_indices.append(path[0])
-            self.sections_terminal_samples_indices.append(path[-1])
-
-        # Sort the sections_terminal_samples_indices list
-        self.sections_terminal_samples_indices = sorted(self.sections_terminal_samples_indices)
+        The number of children of every sample is computed from the parent indices. A sample is
+        a terminal of a section if it belongs to the soma, if it does not have exactly one child,
+        or if its only child is not the next sample in the file. Every section starts from a
+        terminal and follows the consecutive samples until the next terminal, in O(N).
+        """
 
-        # Filter the repeated entries in the sections_terminal_samples_indices list
-        self.sections_terminal_samples_indices = list(set(self.sections_terminal_samples_indices))
+        import numpy
+
+        # The total number of entries in the samples list, including the empty ones
+        number_samples = len(self.samples_list)
+
+        # The parent indices and the types of all the samples, the missing samples have no parent
+        present = numpy.zeros(number_samples, dtype=bool)
+        parents = numpy.full(number_samples, nmv.consts.Skeleton.SWC_NO_PARENT_SAMPLE_TYPE,
+                             dtype=numpy.int64)
+        types = numpy.full(number_samples, nmv.consts.Skeleton.SWC_UNDEFINED_SAMPLE_TYPE,
+                           dtype=numpy.int64)
+        for i, sample in enumerate(self.samples_list):
+            if sample is not None:
+                present[i] = True
+                parents[i] = sample[nmv.consts.Skeleton.SWC_SAMPLE_PARENT_INDEX_IDX]
+                types[i] = sample[nmv.consts.Skeleton.SWC_SAMPLE_TYPE_IDX]
+
+        # Count the children of each sample
+        has_parent = (parents >= 0) & (parents < number_samples)
+        children_count = numpy.bincount(parents[has_parent], minlength=number_samples)
+
+        # Is the following sample in the file a child of this sample
+        next_is_child = numpy.zeros(number_samples, dtype=bool)
+        next_is_child[:-1] = parents[1:] == numpy.arange(number_samples - 1)
+
+        # Mark the terminals of the sections
+        terminals = (children_count != 1) | ~next_is_child | \
+                    (types == nmv.consts.Skeleton.SWC_SOMA_SAMPLE_TYPE)
+
+        # Mark the first samples of the sections, i.e. the samples that have terminal parents.
+        # Since the soma index is equal to 1, then start from index number 2
+        starts = numpy.zeros(number_samples, dtype=bool)
+        starts[has_parent] = terminals[parents[has_parent]]
+        starts |= ~has_parent
+        starts &= present & (types != nmv.consts.Skeleton.SWC_SOMA_SAMPLE_TYPE)
+        starts[:2] = False
+
+        # Build the sections, each starts with the parent of its first sample
+        terminals = terminals.tolist()
+        self.sections_samples_indices_list = list()
+        for first_sample_index in numpy.flatnonzero(starts).tolist():
+            section_indices = [self.samples_list[first_sample_index][-1], first_sample_index]
+            sample_index = first_sample_index
+            while not terminals[sample_index]:
+                sample_index += 1
+                section_indices.append(sample_index)
+            self.sections_samples_indices_list.append(section_indices)
 
     ################################################################################################
-    # @build_sections_from_paths
+    # @parse_samples_array
     ################################################################################################
-    def build_sections_from_paths(self):
-        """Builds a list of sections from the paths reconstructed during the reading of the
-        morphology.
-        """
-
-        for path in self.paths:
-
-            # A list of all the samples located along the path
-            samples_located_along_path = list()
+    @staticmethod
+    def parse_samples_array(lines):
+        """Parses the data lines of an SWC file in bulk into an (N, 7) array of samples. A line with
+        less than seven columns raises a ValueError.
 
-            # Get the list
-            for sample_index in self.sections_terminal_samples_indices:
-
-                # If the sample index exists in the path
-                if sample_index in path:
-
-                    # Append it to the list
-                    samples_located_along_path.append(sample_index)
-
-            # Order the list
-            samples_located_along_path = sorted(samples_located_along_path)
-
-            # Build the sections
-            for i in range(0, len(samples_located_along_path) - 1):
-
-                # A list of the section indices
-                section_indices = list()
-
-                # Get the first index along the section
-                first_sample = samples_located_along_path[i]
-
-                # Get the last index along the section
-                last_sample = samples_located_along_path[i + 1]
+        :param lines:
+            A list of the data lines of the file, without any comments or empty lines.
+        :return:
+            An (N, 7) float64 array, where each row is [index, type, x, y, z, radius, parent].
+        """
 
-                # Get the index of the first sample
-                first_sample_index = path.index(first_sample)
+        import numpy
 
-                # Get the index of the last sample
-                last_sample_index = path.index(last_sample)
+        # Number of columns per sample in an SWC file
+        number_columns = nmv.consts.Skeleton.SWC_SAMPLE_PARENT_INDEX_IDX + 1
 
-                for j in range(first_sample_index, last_sample_index + 1):
+        # The number of columns of every line, a line with missing columns is invalid
+        lines_columns = [len(line.split()) for line in lines]
+        for i, line_columns in enumerate(lines_columns):
+            if line_columns < number_columns:
+                raise ValueError('The sample [%s] has [%d] columns instead of [%d]' %
+                                 (lines[i].strip(), line_columns, number_columns))
 
-                    section_indices.append(path[j])
+        # Fast path, the whole block is converted at once if every line has exactly seven columns
+        if all(line_columns == number_columns for line_columns in lines_columns):
+            return numpy.fromstring('\n'.join(lines), dtype=numpy.float64, sep=' ').reshape(
+                len(lines), number_columns)
 
-                self.sections_samples_indices_list.append(section_indices)
+        # Otherwise, some lines have extra columns, so use only the first seven columns
+        return numpy.loadtxt(lines, dtype=numpy.float64, usecols=range(number_columns), ndmin=2)
 
     ################################################################################################
     # @read_samples
@@ -214,103 +162,67 @@ class SWCReader:
     def read_samples(self):
         """Reads an SWC files and returns a list of all the samples in the file"""
 
-        # Open the file, read it line by line and store the result in list.
-        morphology_file = open(self.morphology_file, 'r')
+        import numpy
+
+        # Read the whole file at once, and ignore the empty lines and the lines with comments
+        # that have '#'
+        # TODO: Possibly a bug, a line that has a sample followed by a comment is ignored
+        with open(self.morphology_file, 'r') as morphology_file:
+            lines = [line for line in morphology_file.read().splitlines()
+                     if '#' not in line and line.strip()]
+
+        # Parse all the samples in bulk
+        data = self.parse_samples_array(lines)
+
+        # Get the indices, the types and the parent indices of all the samples
+        indices = data[:, nmv.consts.Skeleton.SWC_SAMPLE_INDEX_IDX].astype(numpy.int64)
+        types = data[:, nmv.consts.Skeleton.SWC_SAMPLE_TYPE_IDX].astype(numpy.int64)
+        parents = data[:, nmv.consts.Skeleton.SWC_SAMPLE_PARENT_INDEX_IDX].astype(numpy.int64)
+
+        # If the sample type doesn't match a soma, an axon, a basal dendrite or an apical
+        # dendrite, just consider it a basal dendrite
+        types[types > 4] = nmv.consts.Skeleton.SWC_BASAL_DENDRITE_SAMPLE_TYPE
+
+        # Get the coordinates and the radii of all the samples
+        points = data[:, nmv.consts.Skeleton.SWC_SAMPLE_X_COORDINATES_IDX:
+                         nmv.consts.Skeleton.SWC_SAMPLE_Z_COORDINATES_IDX + 1]
+        radii = data[:, nmv.consts.Skeleton.SWC_SAMPLE_RADIUS_IDX]
+
+        # The soma sample (with no parent) defines the translation vector in case the file is not
+        # centered at the origin. This translation applies to the soma sample and all the samples
+        # following it in the file until another sample with no parent is found
+        roots = numpy.flatnonzero(parents == nmv.consts.Skeleton.SWC_NO_PARENT_SAMPLE_TYPE)
+        if roots.size > 0:
+            last_root = numpy.full(len(parents), -1, dtype=numpy.int64)
+            last_root[roots] = roots
+            last_root = numpy.maximum.accumulate(last_root)
+            translated = last_root >= 0
+            points = points.copy()
+            points[translated] -= data[last_root[translated],
+                                       nmv.consts.Skeleton.SWC_SAMPLE_X_COORDINATES_IDX:
+                                       nmv.consts.Skeleton.SWC_SAMPLE_Z_COORDINATES_IDX + 1]
 
         # Add a dummy sample to the list at index 0 to match the indices
         # The zeroth sample always defines the soma parameters, and it is parsed independently
-        self.parsed_samples_list.append([0, 0, 0.0, 0.0, 0.0, 0.0, 0])
-
-        # Translation vector in case the file is not centered at the origin
-        translation = Vector((0.0, 0.0, 0.0))
-
-        # Construct a string from each line in the morphology file
-        string_list = list()
-        for line in morphology_file:
-            string_list.append(line)
-
-        # For each line in the string list
-        for line in string_list:
-
-            # Ignore lines with comments that have '#'
-            # TODO: Possibly a bug
-            if '#' in line:
-                continue
-
-            # Ignore empty lines
-            if not line.strip():
-                continue
-
-            # Extract the data from the line
-            data = ' '.join(line.split())
-            data = data.strip('\n').split(' ')
+        self.parsed_samples_list = [[0, 0, 0.0, 0.0, 0.0, 0.0, 0]]
 
-            # If unwanted characters exit, remove them
-            for i in data:
-
-                # Unwanted spaces
-                if i == '':
-                    data.remove(i)
-
-                # Unwanted new lines
-                if '\n' in i:
-                    i.replace('\n', '')
-
-            # Get the index
-            index = int(data[nmv.consts.Skeleton.SWC_SAMPLE_INDEX_IDX])
-
-            # Get the branch type
-            sample_type = int(data[nmv.consts.Skeleton.SWC_SAMPLE_TYPE_IDX])
-
-            # If the sample type doesn't match a soma, an axon, a basal dendrite or an apical
-            # dendrite, just consider it a basal dendrite
-            if sample_type > 4:
-                sample_type = nmv.consts.Skeleton.SWC_BASAL_DENDRITE_SAMPLE_TYPE
-
-                # Get the X-coordinate
-            x = float(data[nmv.consts.Skeleton.SWC_SAMPLE_X_COORDINATES_IDX])
-
-            # Get the Y-coordinate
-            y = float(data[nmv.consts.Skeleton.SWC_SAMPLE_Y_COORDINATES_IDX])
-
-            # Get the Z-coordinate
-            z = float(data[nmv.consts.Skeleton.SWC_SAMPLE_Z_COORDINATES_IDX])
-
-            # Get the sample radius
-            radius = float(data[nmv.consts.Skeleton.SWC_SAMPLE_RADIUS_IDX])
-
-            # Get the sample parent index
-            parent_index = int(data[nmv.consts.Skeleton.SWC_SAMPLE_PARENT_INDEX_IDX])
-
-            # If this is the soma sample, get the translation vector
-            if parent_index == -1:
-
-                translation[0] = x
-                translation[1] = y
-                translation[2] = z
-
-            # Update the coordinates if the morphology is transformed
-            x = x - translation[0]
-            y = y - translation[1]
-            z = z - translation[2]
-
-            # Add the sample to the list
-            self.parsed_samples_list.append([index, sample_type, x, y, z, radius, parent_index])
+        # Add the samples to the list, as [index, sample_type, x, y, z, radius, parent_index]
+        self.parsed_samples_list.extend(map(list, zip(
+            indices.tolist(), types.tolist(),
+            points[:, 0].tolist(), points[:, 1].tolist(), points[:, 2].tolist(),
+            radii.tolist(), parents.tolist())))
 
         # Search for the largest index of the samples
-        largest_index = 0
-        for i_sample in self.parsed_samples_list:
-            if i_sample[0] > largest_index:
-                largest_index = i_sample[0]
-
-        # Create the actual samples list, and take into consideration the added soma sample
-        for i in range(largest_index + 1):
-            self.samples_list.append(None)
+        largest_index = max(int(indices.max()) if indices.size > 0 else 0, 0)
 
         # Set the samples at their corresponding indices to make it easy to index them, and keep
-        # the rest to Null and double check them later
-        for i_sample in self.parsed_samples_list:
-            self.samples_list[i_sample[0]] = i_sample
+        # the rest to Null and double check them later. The lookup table maps every index to the
+        # position of its sample in the parsed list, and the last sample wins for duplicates
+        lookup = numpy.full(largest_index + 1, -1, dtype=numpy.int64)
+        lookup[0] = 0
+        lookup[indices] = numpy.arange(1, len(indices) + 1)
+        self.samples_list = [self.parsed_samples_list[i] if i >= 0 else None
+                             for i in lookup.tolist()]
 
     ################################################################################################
     # @get_number_stems_from_samples_list
@@ -613,11 +525,8 @@ class SWCReader:
         # Read all the samples from the morphology file an store them into a list
         self.read_samples()
 
-        # Construct the connected paths from the samples list
-        self.build_connected_paths_from_samples()
-
-        # Construct the individual sections from the paths
-        self.build_sections_from_paths()
+        # Construct the individual sections from the topology of the samples
+        self.build_sections_from_samples()
 
         # Build the apical dendrites
         apical_dendrites = self.build_arbors_from_samples(
@@ -15,5 +15,12 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .exporters import *
+# Internal imports
+import nmv
+
+from .mesh_arrays_writer import *
+
+# The exporters export the objects in the scene and require Blender
+if nmv.BLENDER_AVAILABLE:
+    from .exporters import *
 
@@ -29,6 +29,7 @@ import nmv.utilities
 ####################################################################################################
 # @export_scene_to_blend_file
 ####################################################################################################
+@nmv.utilities.profiled(category='exporter')
 def export_scene_to_blend_file(output_directory,
                                output_file_name):
     """Exports the current scene to a binary .blend file.
@@ -59,6 +60,7 @@ def export_scene_to_blend_file(output_directory,
 ####################################################################################################
 # @export_mesh_object_to_file
 ####################################################################################################
+@nmv.utilities.profiled(category='exporter')
 def export_mesh_object_to_file(mesh_object,
                                output_directory,
                                output_file_name,
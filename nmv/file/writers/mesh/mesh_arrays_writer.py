@@ -0,0 +1,151 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# Internal modules
+import nmv.consts
+import nmv.enums
+
+
+# The number of the rows that are formatted at once when writing text mesh files
+MESH_ARRAYS_WRITER_CHUNK_SIZE = 100000
+
+
+####################################################################################################
+# @write_formatted_rows
+####################################################################################################
+def write_formatted_rows(file_handle,
+                         row_format,
+                         rows):
+    """Writes the rows of an array to a text file, formatting a chunk of rows at once, which is
+    much faster than formatting them one by one.
+
+    :param file_handle:
+        A handle to the output file.
+    :param row_format:
+        The format of a single row, including the new line.
+    :param rows:
+        A 2D array of the rows.
+    """
+
+    for i in range(0, len(rows), MESH_ARRAYS_WRITER_CHUNK_SIZE):
+        chunk = rows[i:i + MESH_ARRAYS_WRITER_CHUNK_SIZE]
+        file_handle.write((row_format * len(chunk)) % tuple(chunk.ravel().tolist()))
+
+
+####################################################################################################
+# @write_mesh_arrays_to_ply_file
+####################################################################################################
+def write_mesh_arrays_to_ply_file(vertices,
+                                  faces,
+                                  file_path):
+    """Writes a triangular mesh given by its arrays to a binary .ply file, without Blender.
+
+    :param vertices:
+        An (V, 3) array of the vertices of the mesh.
+    :param faces:
+        An (F, 3) array of the indices of the vertices of the triangles of the mesh.
+    :param file_path:
+        The path to the output file.
+    """
+
+    import numpy
+
+    # Every face is the number of its vertices followed by their indices
+    face_type = numpy.dtype([('count', 'u1'), ('indices', '<i4', (3,))])
+    faces_data = numpy.empty(len(faces), dtype=face_type)
+    faces_data['count'] = 3
+    faces_data['indices'] = faces
+
+    header = 'ply\n' \
+             'format binary_little_endian 1.0\n' \
+             'comment Created by NeuroMorphoVis\n' \
+             'element vertex %d\n' \
+             'property float x\n' \
+             'property float y\n' \
+             'property float z\n' \
+             'element face %d\n' \
+             'property list uchar int vertex_indices\n' \
+             'end_header\n' % (len(vertices), len(faces))
+
+    with open(file_path, 'wb') as file_handle:
+        file_handle.write(header.encode('ascii'))
+        file_handle.write(numpy.asarray(vertices, dtype='<f4').tobytes())
+        file_handle.write(faces_data.tobytes())
+
+
+####################################################################################################
+# @write_mesh_arrays_to_obj_file
+####################################################################################################
+def write_mesh_arrays_to_obj_file(vertices,
+                                  faces,
+                                  file_path):
+    """Writes a triangular mesh given by its arrays to an .obj file, without Blender.
+
+    :param vertices:
+        An (V, 3) array of the vertices of the mesh.
+    :param faces:
+        An (F, 3) array of the indices of the vertices of the triangles of the mesh.
+    :param file_path:
+        The path to the output file.
+    """
+
+    import numpy
+
+    with open(file_path, 'w') as file_handle:
+        file_handle.write('# Created by NeuroMorphoVis\n')
+        write_formatted_rows(file_handle, 'v %f %f %f\n', numpy.asarray(vertices))
+
+        # The indices in the .obj files start from 1
+        write_formatted_rows(file_handle, 'f %d %d %d\n', numpy.asarray(faces) + 1)
+
+
+####################################################################################################
+# @write_mesh_arrays_to_file
+####################################################################################################
+def write_mesh_arrays_to_file(vertices,
+                              faces,
+                              output_directory,
+                              file_name,
+                              file_format=nmv.enums.Meshing.ExportFormat.PLY):
+    """Writes a triangular mesh given by its arrays to a .ply or an .obj file, without Blender.
+
+    :param vertices:
+        An (V, 3) array of the vertices of the mesh.
+    :param faces:
+        An (F, 3) array of the indices of the vertices of the triangles of the mesh.
+    :param output_directory:
+        The output directory where the mesh will be written.
+    :param file_name:
+        The name of the output file, without the extension.
+    :param file_format:
+        The format of the output file, PLY or OBJ.
+    :return:
+        The path to the written file.
+    """
+
+    if file_format == nmv.enums.Meshing.ExportFormat.PLY:
+        file_path = '%s/%s%s' % (output_directory, file_name, nmv.consts.Meshing.PLY_EXTENSION)
+        write_mesh_arrays_to_ply_file(vertices=vertices, faces=faces, file_path=file_path)
+
+    elif file_format == nmv.enums.Meshing.ExportFormat.OBJ:
+        file_path = '%s/%s%s' % (output_directory, file_name, nmv.consts.Meshing.OBJ_EXTENSION)
+        write_mesh_arrays_to_obj_file(vertices=vertices, faces=faces, file_path=file_path)
+
+    else:
+        raise ValueError('Unsupported mesh arrays format [%s]' % file_format)
+
+    return file_path
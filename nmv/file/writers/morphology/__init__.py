@@ -16,4 +16,5 @@
 ####################################################################################################
 
 from .swc_writer import *
+from .h5_writer import *
 from .segments_writer import *
@@ -0,0 +1,152 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# Internal imports
+import nmv.consts
+import nmv.utilities
+
+
+####################################################################################################
+# @get_h5_soma_points
+####################################################################################################
+def get_h5_soma_points(soma):
+    """Gets the points of the soma section of an .H5 file, [x, y, z, diameter] per point.
+
+    The soma is written by its profile points. If the soma has no profile points, for example if
+    it is loaded from an .SWC file with a single soma sample, four points are written around the
+    centroid at the mean radius, so that the .H5 reader gets the same centroid and mean radius.
+
+    :param soma:
+        The soma of a given morphology.
+    :return:
+        An (N, 4) array of the points of the soma.
+    """
+
+    import numpy
+
+    # The profile points, the diameters are not used for the soma
+    if len(soma.profile_points) > 0:
+        points = numpy.zeros((len(soma.profile_points), 4))
+        points[:, :3] = [tuple(point) for point in soma.profile_points]
+        return points
+
+    # A contour around the centroid in the XY plane
+    points = numpy.zeros((4, 4))
+    points[:, :3] = tuple(soma.centroid)
+    points[:, :2] += soma.mean_radius * numpy.array([[1, 0], [0, 1], [-1, 0], [0, -1]])
+    return points
+
+
+####################################################################################################
+# @get_h5_points_and_structure
+####################################################################################################
+def get_h5_points_and_structure(morphology_object):
+    """Gets the points and the structure arrays of a morphology, in the layout of the .H5 files.
+
+    The soma is the first section, then the sections of the apical dendrites, the basal dendrites
+    and the axons follow in depth-first order, so that every section comes after its parent. Every
+    section has all its samples, including the first sample of the sections that are not roots,
+    that is the last sample of the parent. The samples are not created if the sections are backed
+    by their arrays.
+
+    :param morphology_object:
+        A given morphology object.
+    :return:
+        An (N, 4) array of the points, [x, y, z, diameter] per point, and an (M, 3) array of the
+        structure, [index of the first point, type, index of the parent section] per section.
+    """
+
+    import numpy
+
+    # The soma section
+    if morphology_object.soma is not None:
+        points = [get_h5_soma_points(morphology_object.soma)]
+    else:
+        points = [numpy.zeros((0, 4))]
+    structure = [(0, nmv.consts.Skeleton.H5_SOMA_SECTION_TYPE, -1)]
+    number_points = len(points[0])
+
+    # The arbors, in the order of the apical dendrites, the basal dendrites and the axons
+    for arbors in [morphology_object.apical_dendrites,
+                   morphology_object.basal_dendrites,
+                   morphology_object.axons]:
+        if arbors is None:
+            continue
+
+        for arbor in arbors:
+
+            # Every section is stacked with the index of its parent section, the roots are always
+            # connected to the soma, i.e. the first section
+            stack = [(arbor, 0)]
+            while len(stack) > 0:
+                section, parent_index = stack.pop()
+
+                # The diameters are reported in the .H5 files, unlike the .SWC files
+                section_points, section_radii = section.get_samples_arrays()
+                section_data = numpy.empty((len(section_radii), 4))
+                section_data[:, :3] = section_points
+                section_data[:, 3] = 2.0 * section_radii
+
+                section_index = len(structure)
+                structure.append((number_points, int(section.type), parent_index))
+                points.append(section_data)
+                number_points += len(section_data)
+
+                # Visit the children in order
+                for child in reversed(section.children):
+                    stack.append((child, section_index))
+
+    return numpy.vstack(points), numpy.array(structure, dtype=numpy.int32)
+
+
+####################################################################################################
+# @write_morphology_to_h5_file
+####################################################################################################
+@nmv.utilities.profiled(category='exporter')
+def write_morphology_to_h5_file(morphology_object,
+                                file_path):
+    """Write the morphology skeleton to an .H5 file, with the points and the structure datasets
+    that are loaded by the H5Reader.
+
+    :param morphology_object:
+        A given morphology object to be written to .H5 file.
+    :param file_path:
+        The path where to write the file to.
+    """
+
+    import numpy
+
+    # Import h5py and install it if it does not exist
+    try:
+        import h5py
+    except ImportError:
+        print('Package *h5py* is not installed. Installing it.')
+        nmv.utilities.pip_install_wheel(package_name='h5py')
+
+    # Import the h5py module
+    import h5py
+
+    # Get the arrays of the morphology
+    points, structure = get_h5_points_and_structure(morphology_object)
+
+    # Write the arrays to a file labeled with the same name of the morphology
+    h5_file = '%s/%s.h5' % (file_path, morphology_object.label)
+    with h5py.File(h5_file, 'w') as data:
+        data.create_dataset(nmv.consts.Skeleton.H5_POINTS_DIRECTORY,
+                            data=points.astype(numpy.float32))
+        data.create_dataset(nmv.consts.Skeleton.H5_STRUCTURE_DIRECTORY,
+                            data=structure)
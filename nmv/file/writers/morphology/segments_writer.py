@@ -17,6 +17,7 @@
 
 # Internal imports
 import nmv.file
+import nmv.utilities
 
 
 ####################################################################################################
@@ -103,6 +104,7 @@ def construct_samples_list_from_morphology_tree(morphology_object):
 ####################################################################################################
 # @write_morphology_to_segments_file
 ####################################################################################################
+@nmv.utilities.profiled(category='exporter')
 def write_morphology_to_segments_file(morphology_object,
                                       file_path):
     """Write the morphology skeleton to a file (.segments) that is composed of segments only.
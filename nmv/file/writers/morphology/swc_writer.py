@@ -16,202 +16,142 @@
 ####################################################################################################
 
 # Internal imports
-import nmv.skeleton
+import nmv.utilities
 
 
-####################################################################################################
-# @construct_swc_samples_list_from_section
-####################################################################################################
-def construct_swc_samples_list_from_section(section,
-                                            samples_list):
-    """Constructs a list of samples retrieved from the given section compliant with SWC format.
-
-    # A list of all the samples parsed from the morphology file, to be used as a lookup table
-    # to construct the morphology skeleton directly
-    # http://www.neuronland.org/NLMorphologyConverter/MorphologyFormats/SWC/Spec.html
-    # Each sample in this list has the following structure:
-    #       [0] The index of the sample or sample number
-    #       [1] The type of the sample or structure identifier
-    #       [2] Sample x-coordinates
-    #       [3] Sample y-coordinates
-    #       [4] Sample z-coordinates
-    #       [5] Sample radius
-    #       [6] The index of the parent sample
-
-    :param section:
-        A given morphological section.
-    :param samples_list:
-        The container where the samples will get appended to.
-    """
+# The format of a sample in the .SWC file, [index, type, x, y, z, radius, parent index]
+SWC_SAMPLE_FORMAT = '%d %d %f %f %f %f %d\n'
 
-    # Root sections are always connected to the soma, i.e. parent index is 1
-    if section.is_root():
-
-        # Add the first sample along the root
-        sample_string = '%d %d %f %f %f %f 1' % (section.samples[0].morphology_idx,
-                                                 section.samples[0].type,
-                                                 section.samples[0].point[0],
-                                                 section.samples[0].point[1],
-                                                 section.samples[0].point[2],
-                                                 section.samples[0].radius)
-        samples_list.append(sample_string)
-
-        # Update the indices of the rest of the samples along the section
-        for i in range(1, len(section.samples)):
-            sample_string = '%d %d %f %f %f %f %d' % (section.samples[i].morphology_idx,
-                                                      section.samples[i].type,
-                                                      section.samples[i].point[0],
-                                                      section.samples[i].point[1],
-                                                      section.samples[i].point[2],
-                                                      section.samples[i].radius,
-                                                      section.samples[i].morphology_idx - 1)
-            samples_list.append(sample_string)
-
-    # Non root sections start from the samples of the branching points
-    else:
-
-        # Add the first sample along the branching point
-        sample_string = '%d %d %f %f %f %f %d' % (section.samples[1].morphology_idx,
-                                                  section.samples[1].type,
-                                                  section.samples[1].point[0],
-                                                  section.samples[1].point[1],
-                                                  section.samples[1].point[2],
-                                                  section.samples[1].radius,
-                                                  section.parent.samples[-1].morphology_idx)
-        samples_list.append(sample_string)
-
-        # Update the indices of the rest of the samples along the section
-        for i in range(2, len(section.samples)):
-            sample_string = '%d %d %f %f %f %f %d' % (section.samples[i].morphology_idx,
-                                                      section.samples[i].type,
-                                                      section.samples[i].point[0],
-                                                      section.samples[i].point[1],
-                                                      section.samples[i].point[2],
-                                                      section.samples[i].radius,
-                                                      section.samples[i].morphology_idx - 1)
-            samples_list.append(sample_string)
+# The size of the buffer of the output file, in bytes
+SWC_WRITER_BUFFER_SIZE = 1024 * 1024
 
 
 ####################################################################################################
-# @construct_swc_samples_list_from_arbor
+# @write_swc_samples_of_soma
 ####################################################################################################
-def construct_swc_samples_list_from_arbor(arbor,
-                                          samples_list):
-    """Constructs a list of samples retrieved from the given arbor compliant with SWC format.
-
-    :param arbor:
-        A given morphological arbor.
-    :param samples_list:
-        The container where the samples will get appended to.
-    """
-
-    # Construct the root section
-    construct_swc_samples_list_from_section(arbor, samples_list)
-
-    # Update the children sections recursively
-    for child in arbor.children:
-        construct_swc_samples_list_from_arbor(child, samples_list)
-
-
-####################################################################################################
-# @construct_swc_samples_list_from_soma
-####################################################################################################
-def construct_swc_samples_list_from_soma(soma,
-                                         samples_list):
-    """Constructs a list of samples retrieved from the soma, compliant with SWC format.
+def write_swc_samples_of_soma(soma,
+                              file_handle):
+    """Writes the samples of the soma, compliant with the SWC format. The soma is written as a
+    single sample at its centroid, followed by its profile points.
 
     :param soma:
         The soma of a given morphology.
-    :param samples_list:
-        The container where the samples will get appended to.
+    :param file_handle:
+        The handle of the output file.
     """
 
     # Soma centroid and radius
-    sample_string = '1 1 %f %f %f %f -1' % (soma.centroid[0],
-                                            soma.centroid[1],
-                                            soma.centroid[2],
-                                            soma.smallest_radius)
-    samples_list.append(sample_string)
+    file_handle.write(SWC_SAMPLE_FORMAT % (1, 1, soma.centroid[0], soma.centroid[1],
+                                           soma.centroid[2], soma.smallest_radius, -1))
 
     # Soma profile points
-    for i, profile_point in enumerate(soma.profile_points):
-        sample_string = '%d 1 %f %f %f %f 1' % (i + 2,
-                                                profile_point[0],
-                                                profile_point[1],
-                                                profile_point[2],
-                                                1.0)
-        samples_list.append(sample_string)
+    file_handle.write(''.join([SWC_SAMPLE_FORMAT % (i + 2, 1, point[0], point[1], point[2], 1.0, 1)
+                               for i, point in enumerate(soma.profile_points)]))
 
 
 ####################################################################################################
-# @construct_swc_samples_list_from_morphology_tree
+# @write_swc_samples_of_arbor
 ####################################################################################################
-def construct_swc_samples_list_from_morphology_tree(morphology_object):
-    """Constructs a list of samples retrieved from the given morphology skeleton compliant with
-    SWC format.
+def write_swc_samples_of_arbor(arbor,
+                               first_index,
+                               file_handle):
+    """Writes the samples of a given arbor, compliant with the SWC format.
 
-    :param morphology_object:
-        A given morphology object.
+    The sections are written in depth-first order, a section at a time, where the rows of all the
+    samples of the section are formatted at once. The first sample of a section
+    that is not a root is the last sample of its parent and therefore it is not written. The sample
+    objects are not modified, and are not created if the section is only backed by its arrays.
+
+    :param arbor:
+        A given morphological arbor.
+    :param first_index:
+        The SWC index of the first sample of the arbor.
+    :param file_handle:
+        The handle of the output file.
     :return:
-        A list of samples compliant with the SWC format.
+        The SWC index of the first sample after the arbor.
     """
 
-    # A list that contains all the samples in the morphology file
-    swc_samples_list = list()
-
-    # Soma
-    if morphology_object.soma is not None:
-        construct_swc_samples_list_from_soma(morphology_object.soma, swc_samples_list)
-
-    # Apical dendrite
-    if morphology_object.apical_dendrites is not None:
-        for arbor in morphology_object.apical_dendrites:
-            construct_swc_samples_list_from_arbor(arbor, swc_samples_list)
-
-    # basal dendrites
-    if morphology_object.basal_dendrites is not None:
-        for arbor in morphology_object.basal_dendrites:
-            construct_swc_samples_list_from_arbor(arbor, swc_samples_list)
-
-    # Axon
-    if morphology_object.axons is not None:
-        for arbor in morphology_object.axons:
-            construct_swc_samples_list_from_arbor(arbor, swc_samples_list)
-
-    # Return the SWC-complaint  list of samples
-    return swc_samples_list
+    next_index = first_index
+
+    # Every section is stacked with the SWC index of the last sample of its parent, the roots are
+    # always connected to the soma, i.e. parent index is 1
+    stack = [(arbor, 1)]
+    while len(stack) > 0:
+        section, parent_index = stack.pop()
+
+        # The samples of a section that is backed by its arrays have the type of the section
+        if section.points_array is not None:
+            points = section.points_array.tolist()
+            radii = section.radii_array.tolist()
+            types = [section.type] * len(radii)
+        else:
+            points = [sample.point for sample in section.samples]
+            radii = [sample.radius for sample in section.samples]
+            types = [sample.type for sample in section.samples]
+
+        # Skip the branching point of the sections that are not roots
+        if not section.is_root():
+            points = points[1:]
+            radii = radii[1:]
+            types = types[1:]
+
+        # Every sample is connected to the previous one, and the first to the parent
+        number_samples = len(radii)
+        indices = range(next_index, next_index + number_samples)
+        parents = [parent_index]
+        parents.extend(range(next_index, next_index + number_samples - 1))
+        file_handle.write(''.join([
+            SWC_SAMPLE_FORMAT % (index, sample_type, point[0], point[1], point[2], radius, parent)
+            for index, sample_type, point, radius, parent in zip(
+                indices, types, points, radii, parents)]))
+
+        # The SWC index of the last sample of the section, for its children
+        last_index = next_index + number_samples - 1 if number_samples > 0 else parent_index
+        next_index += number_samples
+
+        # Visit the children in order
+        for child in reversed(section.children):
+            stack.append((child, last_index))
+
+    return next_index
 
 
 ####################################################################################################
 # @write_morphology_to_swc_file
 ####################################################################################################
+@nmv.utilities.profiled(category='exporter')
 def write_morphology_to_swc_file(morphology_object,
                                  file_path):
     """Write the morphology skeleton to an SWC file.
 
+    The samples are streamed to a buffered file, a section at a time, therefore the memory does
+    not grow with the size of the morphology.
+
     :param morphology_object:
         A given morphology object to be written to SWC file.
     :param file_path:
         The path where to write the file to.
     """
 
-    # Before writing, we must update the indices of the samples along the entire morphology
+    # The soma counts as a single sample, and its profile points count as samples as well
     number_soma_samples = 0
-
-    # The soma counts as a single sample
     if morphology_object.soma is not None:
-        number_soma_samples += 1
-
-        # The profile points along the soma count as well as samples
-        number_soma_samples += len(morphology_object.soma.profile_points)
-
-    # Update the global indices of the samples of the arbors then
-    nmv.skeleton.ops.update_samples_indices_per_morphology(
-        morphology_object, number_soma_samples + 1)
-
-    # Build the samples list
-    swc_samples_list = construct_swc_samples_list_from_morphology_tree(morphology_object)
-
-    # Write the list to a file labeled with the same name of the morphology
-    nmv.file.write_list_string_to_file(
-        swc_samples_list, '%s/%s.swc' % (file_path, morphology_object.label))
+        number_soma_samples += 1 + len(morphology_object.soma.profile_points)
+
+    # Write the samples to a file labeled with the same name of the morphology
+    swc_file = '%s/%s.swc' % (file_path, morphology_object.label)
+    with open(swc_file, 'w', buffering=SWC_WRITER_BUFFER_SIZE) as file_handle:
+
+        # Soma
+        if morphology_object.soma is not None:
+            write_swc_samples_of_soma(morphology_object.soma, file_handle)
+
+        # The arbors, in the order of the apical dendrites, the basal dendrites and the axons
+        next_index = number_soma_samples + 1
+        for arbors in [morphology_object.apical_dendrites,
+                       morphology_object.basal_dendrites,
+                       morphology_object.axons]:
+            if arbors is not None:
+                for arbor in arbors:
+                    next_index = write_swc_samples_of_arbor(arbor, next_index, file_handle)
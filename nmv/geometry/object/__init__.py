@@ -15,8 +15,14 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .curve import *
-from .line import *
-from .sphere import *
-from .vertex import *
+# Internal imports
+import nmv
+
 from .poly_line import *
+
+# The objects that are drawn in the scene require Blender
+if nmv.BLENDER_AVAILABLE:
+    from .curve import *
+    from .line import *
+    from .sphere import *
+    from .vertex import *
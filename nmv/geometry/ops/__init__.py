@@ -16,7 +16,13 @@
 # MA 02110-1301 USA.
 ####################################################################################################
 
+# Internal imports
+import nmv
+
 from .intersection import *
-from .line_ops import *
 from .sphere_ops import *
-from .poly_line_ops import *
+
+# The line and the poly-line operations draw in the scene and require Blender
+if nmv.BLENDER_AVAILABLE:
+    from .line_ops import *
+    from .poly_line_ops import *
@@ -149,13 +149,7 @@ def append_poly_line_to_base_object(base_object,
     poly_line_object.material_index = poly_line.material_index
 
     # Add the points (or the samples) and their radii to the poly-line curve object
-    for i, poly_line_sample in enumerate(poly_line.samples):
-
-        # Sample coordinates
-        poly_line_object.points[i].co = poly_line_sample[0]
-
-        # Sample radius
-        poly_line_object.points[i].radius = poly_line_sample[1]
+    nmv.geometry.set_poly_line_points(spline=poly_line_object, samples=poly_line.samples)
 
 
 ####################################################################################################
@@ -395,10 +389,7 @@ def draw_poly_lines_as_single_object(poly_lines_data,
         poly_line_strip.points.add(len(poly_line_data) - 1)
 
         # Add the points (or the samples) and their radii to the poly-line curve
-        for i, point in enumerate(poly_line_data):
-
-            poly_line_strip.points[i].co = point[0]
-            poly_line_strip.points[i].radius = point[1]
+        nmv.geometry.set_poly_line_points(spline=poly_line_strip, samples=poly_line_data)
 
     # Create a curve that uses the curve_data.
     line_strip = bpy.data.objects.new(str(name), line_data)
@@ -113,6 +113,31 @@ def compute_poly_line_length(poly_line):
     return poly_line_length
 
 
+####################################################################################################
+# @set_poly_line_points
+####################################################################################################
+def set_poly_line_points(spline,
+                         samples):
+    """Sets the coordinates and the radii of all the points of a spline from the samples of a
+    poly-line in a single step, instead of setting every point individually.
+
+    :param spline:
+        A given spline that has as many points as the samples.
+    :param samples:
+        A list of the poly-line samples, where every sample is [(x, y, z, w), radius].
+    """
+
+    import numpy
+
+    # Flatten the samples into contiguous arrays
+    coordinates = numpy.array([sample[0] for sample in samples], dtype=numpy.float32)
+    radii = numpy.array([sample[1] for sample in samples], dtype=numpy.float32)
+
+    # Upload them to the spline
+    spline.points.foreach_set('co', coordinates.ravel())
+    spline.points.foreach_set('radius', radii)
+
+
 ####################################################################################################
 # @append_poly_line_to_base_object
 ####################################################################################################
@@ -144,12 +169,7 @@ def append_poly_line_to_base_object(base_object,
     poly_line_object.material_index = poly_line.material_index
 
     # Add the points (or the samples) and their radii to the poly-line curve object
-    for i, poly_line_sample in enumerate(poly_line.samples):
-        # Sample coordinates
-        poly_line_object.points[i].co = poly_line_sample[0]
-
-        # Sample radius
-        poly_line_object.points[i].radius = poly_line_sample[1]
+    set_poly_line_points(spline=poly_line_object, samples=poly_line.samples)
 
 
 ####################################################################################################
@@ -243,9 +263,7 @@ def draw_poly_line(poly_line_data,
     poly_line_strip.points.add(len(poly_line_data) - 1)
 
     # Add the points (or the samples) and their radii to the poly-line curve
-    for i, point in enumerate(poly_line_data):
-        poly_line_strip.points[i].co = point[0]
-        poly_line_strip.points[i].radius = point[1]
+    set_poly_line_points(spline=poly_line_strip, samples=poly_line_data)
 
     # Create a curve that uses the curve_data.
     line_strip = bpy.data.objects.new(str(name), line_data)
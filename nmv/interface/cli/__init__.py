@@ -23,3 +23,5 @@ from .neuron_mesh_reconstruction import *
 from .neuron_morphology_reconstruction import *
 from .soma_reconstruction import *
 from .options_parser import *
+from .neuron_tasks import *
+from .resume_manifest import *
@@ -56,6 +56,15 @@ class Args:
     # A path to a blue config or circuit file
     BLUE_CONFIG = '--blue-config'
 
+    # Do not use the cache of the parsed morphology files
+    NO_MORPHOLOGY_CACHE = '--no-morphology-cache'
+
+    # The directory of the cache of the parsed morphology files
+    MORPHOLOGY_CACHE_DIRECTORY = '--morphology-cache-directory'
+
+    # The maximum size of the cache of the parsed morphology files in MB
+    MORPHOLOGY_CACHE_SIZE = '--morphology-cache-size'
+
     ################################################################################################
     # Output arguments
     ################################################################################################
@@ -180,6 +189,15 @@ class Args:
     # Mesh tessellation level
     MESH_TESSELLATION_LEVEL = '--tessellation-level'
 
+    # The number of the vertices of the rings of the tubes meshes
+    TUBES_RING_RESOLUTION = '--tubes-ring-resolution'
+
+    # The number of the worker processes that build the meshes of the arbors
+    ARBORS_PROCESSES = '--arbors-processes'
+
+    # The density of the meta balls of the meta objects meshes
+    META_BALLS_DENSITY = '--meta-balls-density'
+
     # Export the meshes to the global coordinates
     MESH_GLOBAL_COORDINATES = '--global-coordinates'
 
@@ -291,3 +309,30 @@ class Args:
     ################################################################################################
     # Execution node
     EXECUTION_NODE = '--execution-node'
+
+    # Number of the workers that run the jobs in parallel on the local node
+    LOCAL_WORKERS = '--local-workers'
+
+    # Number of the retries of a failing job on the local node
+    LOCAL_RETRIES = '--local-retries'
+
+    # Run all the tasks of a morphology in a single Blender process
+    SINGLE_PROCESS = '--single-process'
+
+    # Record the completed tasks and skip them when the batch is run again
+    RESUME = '--resume'
+
+    # Profile the execution and write the profiling spans to the output directory
+    PROFILE = '--profile'
+
+    # Submit the cluster jobs as a single SLURM job array
+    SLURM_ARRAY = '--slurm-array'
+
+    # The number of the morphologies processed by every task of the SLURM job array
+    SLURM_ARRAY_CHUNK_SIZE = '--slurm-array-chunk-size'
+
+    # The maximum number of the tasks of the SLURM job array running simultaneously
+    SLURM_ARRAY_THROTTLE = '--slurm-array-throttle'
+
+    # The sbatch executable
+    SLURM_SBATCH = '--slurm-sbatch'
@@ -106,6 +106,31 @@ def parse_command_line_arguments():
         action='store', default=None,
         help=arg_help)
 
+    # Morphology cache
+    arg_help = 'Parse the morphology files every time, without using the cache of the parsed \n' \
+               'morphologies.'
+    input_args.add_argument(
+        Args.NO_MORPHOLOGY_CACHE,
+        action='store_true', default=False,
+        help=arg_help)
+
+    # Morphology cache directory
+    arg_help = 'The directory of the cache of the parsed morphologies. \n' \
+               'Default: ~/.cache/neuromorphovis/morphologies'
+    input_args.add_argument(
+        Args.MORPHOLOGY_CACHE_DIRECTORY,
+        action='store', default=None,
+        help=arg_help)
+
+    # Morphology cache size
+    arg_help = 'The maximum size of the cache of the parsed morphologies in MB, the least \n' \
+               'recently used morphologies are evicted first. \n' \
+               'Default: 1024'
+    input_args.add_argument(
+        Args.MORPHOLOGY_CACHE_SIZE,
+        action='store', type=int, default=1024,
+        help=arg_help)
+
     ################################################################################################
     # Output arguments
     ################################################################################################
@@ -434,7 +459,7 @@ def parse_command_line_arguments():
         help=arg_help)
 
     # Meshing algorithm
-    arg_options = ['(piecewise-watertight)', 'union', 'skinning', 'meta-balls']
+    arg_options = ['(piecewise-watertight)', 'union', 'skinning', 'meta-balls', 'tubes']
     arg_help = 'Meshing algorithm. \n' \
                'Options: %s' % arg_options
     meshing_args.add_argument(
@@ -478,6 +503,35 @@ def parse_command_line_arguments():
         action='store', type=float, default=1.0,
         help=arg_help)
 
+    # The resolution of the rings of the tubes
+    arg_help = 'The number of the vertices of the rings of the tubes meshes \n' \
+               'between (3, 128). \n' \
+               'The values out of this range are clamped to it. \n' \
+               'Default 16.'
+    meshing_args.add_argument(
+        Args.TUBES_RING_RESOLUTION,
+        action='store', type=int, default=16,
+        help=arg_help)
+
+    # The number of the worker processes that build the meshes of the arbors
+    arg_help = 'The number of the Blender worker processes that build the meshes of the arbors \n' \
+               'in parallel, for the piecewise, skinning and union builders. \n' \
+               'Default 1, the arbors are built one after another in the same process.'
+    meshing_args.add_argument(
+        Args.ARBORS_PROCESSES,
+        action='store', type=int, default=1,
+        help=arg_help)
+
+    # The density of the meta balls of the meta objects meshes
+    arg_help = 'The density of the meta balls along the arbors of the meta objects meshes \n' \
+               'between (0.25, 4.0), higher densities are smoother and slower. \n' \
+               'The values out of this range are clamped to it. \n' \
+               'Default 1.0, the stride between two balls is half their radius.'
+    meshing_args.add_argument(
+        Args.META_BALLS_DENSITY,
+        action='store', type=float, default=1.0,
+        help=arg_help)
+
     # Export the mesh at global coordinates
     arg_help = 'Export the mesh at global coordinates. \n' \
                'Valid only for BBP circuits.'
@@ -721,6 +775,80 @@ def parse_command_line_arguments():
         action='store', default='local',
         help=arg_help)
 
+    # Number of local workers
+    arg_help = 'Number of the Blender jobs that run in parallel on the local node, \n' \
+               'only used with the directory input. \n' \
+               'Default 1'
+    execution_args.add_argument(
+        Args.LOCAL_WORKERS,
+        action='store', default=1, type=int,
+        help=arg_help)
+
+    # Number of local retries
+    arg_help = 'Number of the times a failing job is re-launched on the local node. \n' \
+               'Default 1'
+    execution_args.add_argument(
+        Args.LOCAL_RETRIES,
+        action='store', default=1, type=int,
+        help=arg_help)
+
+    # Single process
+    arg_help = 'Load the morphology once and run all the requested tasks in a single \n' \
+               'Blender process, instead of a process per task'
+    execution_args.add_argument(
+        Args.SINGLE_PROCESS,
+        action='store_true', default=False,
+        help=arg_help)
+
+    # Resume
+    arg_help = 'Record the completed tasks of every morphology in a manifest in the output \n' \
+               'directory, and skip the tasks whose morphology, options and outputs are \n' \
+               'unchanged when the batch is run again'
+    execution_args.add_argument(
+        Args.RESUME,
+        action='store_true', default=False,
+        help=arg_help)
+
+    # Profiling
+    arg_help = 'Profile the stages of every task (reading, skeleton operations, building, \n' \
+               'rendering and exporting), and write the profiling spans of every morphology \n' \
+               'to JSON and Chrome trace files in the profiling directory'
+    execution_args.add_argument(
+        Args.PROFILE,
+        action='store_true', default=False,
+        help=arg_help)
+
+    # SLURM job array
+    arg_help = 'Submit all the morphologies to the cluster as a single SLURM job array'
+    execution_args.add_argument(
+        Args.SLURM_ARRAY,
+        action='store_true', default=False,
+        help=arg_help)
+
+    # SLURM job array chunk size
+    arg_help = 'Number of the morphologies processed by every task of the SLURM job array. \n' \
+               'Default 1'
+    execution_args.add_argument(
+        Args.SLURM_ARRAY_CHUNK_SIZE,
+        action='store', default=1, type=int,
+        help=arg_help)
+
+    # SLURM job array throttle
+    arg_help = 'Maximum number of the tasks of the SLURM job array running simultaneously. \n' \
+               'Default 500, use 0 for no limit'
+    execution_args.add_argument(
+        Args.SLURM_ARRAY_THROTTLE,
+        action='store', default=500, type=int,
+        help=arg_help)
+
+    # sbatch executable
+    arg_help = 'The sbatch executable used to submit the SLURM job array. \n' \
+               'Default: sbatch'
+    execution_args.add_argument(
+        Args.SLURM_SBATCH,
+        action='store', default='sbatch',
+        help=arg_help)
+
     # Parse the arguments, and return a list of them
     return parser.parse_args()
 
@@ -750,8 +878,8 @@ def get_arguments_string_as_list(arguments):
         # Get the argument value
         arg_value = getattr(arguments, arg)
 
-        # Ignore the unset flags
-        if arg_value is False:
+        # Ignore the unset flags and values, they get their defaults again
+        if arg_value is False or arg_value is None:
             continue
 
         elif arg_value is True:
@@ -864,6 +992,119 @@ def get_arguments_string_for_individual_gid(arguments,
     return arguments_string
 
 
+####################################################################################################
+# The arguments that request each task
+####################################################################################################
+# Morphology analysis
+MORPHOLOGY_ANALYSIS_FLAGS = ['analyze_morphology']
+
+# Morphology reconstruction
+MORPHOLOGY_RECONSTRUCTION_FLAGS = ['render_neuron_morphology',
+                                   'render_neuron_morphology_360',
+                                   'render_neuron_morphology_progressive',
+                                   'export_morphology_swc',
+                                   'export_morphology_segments',
+                                   'export_morphology_blend']
+
+# Soma reconstruction
+SOMA_RECONSTRUCTION_FLAGS = ['render_soma_mesh',
+                             'render_soma_mesh_360',
+                             'render_soma_mesh_progressive',
+                             'export_soma_mesh_ply',
+                             'export_soma_mesh_obj',
+                             'export_soma_mesh_stl',
+                             'export_soma_mesh_blend']
+
+# Neuron mesh reconstruction
+NEURON_MESH_RECONSTRUCTION_FLAGS = ['render_neuron_mesh',
+                                    'render_neuron_mesh_360',
+                                    'export_neuron_mesh_ply',
+                                    'export_neuron_mesh_obj',
+                                    'export_neuron_mesh_stl',
+                                    'export_neuron_mesh_blend']
+
+
+####################################################################################################
+# @is_task_requested
+####################################################################################################
+def is_task_requested(arguments,
+                      task_flags):
+    """Checks if a task is requested, i.e. if any of its flags is set.
+
+    :param arguments:
+        Input arguments.
+    :param task_flags:
+        The arguments that request the task, for example @MORPHOLOGY_ANALYSIS_FLAGS.
+    :return:
+        True or False.
+    """
+
+    for flag in task_flags:
+        if getattr(arguments, flag):
+            return True
+    return False
+
+
+####################################################################################################
+# @is_morphology_analysis_requested
+####################################################################################################
+def is_morphology_analysis_requested(arguments):
+    """Checks if the morphology analysis task is requested.
+
+    :param arguments:
+        Input arguments.
+    :return:
+        True or False.
+    """
+
+    return is_task_requested(arguments, MORPHOLOGY_ANALYSIS_FLAGS)
+
+
+####################################################################################################
+# @is_morphology_reconstruction_requested
+####################################################################################################
+def is_morphology_reconstruction_requested(arguments):
+    """Checks if the morphology reconstruction task is requested.
+
+    :param arguments:
+        Input arguments.
+    :return:
+        True or False.
+    """
+
+    return is_task_requested(arguments, MORPHOLOGY_RECONSTRUCTION_FLAGS)
+
+
+####################################################################################################
+# @is_soma_reconstruction_requested
+####################################################################################################
+def is_soma_reconstruction_requested(arguments):
+    """Checks if the soma reconstruction task is requested.
+
+    :param arguments:
+        Input arguments.
+    :return:
+        True or False.
+    """
+
+    return is_task_requested(arguments, SOMA_RECONSTRUCTION_FLAGS)
+
+
+####################################################################################################
+# @is_neuron_mesh_reconstruction_requested
+####################################################################################################
+def is_neuron_mesh_reconstruction_requested(arguments):
+    """Checks if the neuron mesh reconstruction task is requested.
+
+    :param arguments:
+        Input arguments.
+    :return:
+        True or False.
+    """
+
+    return is_task_requested(arguments, NEURON_MESH_RECONSTRUCTION_FLAGS)
+
+
 ####################################################################################################
 # @create_shell_commands
 ####################################################################################################
@@ -872,6 +1113,11 @@ def create_shell_commands(arguments,
     """Creates a list of all the shell commands that are needed to run the different tasks set
     in the configuration file.
 
+    Notes:
+        # -b : Blender background mode
+        # --verbose : Turn off all the verbose messages
+        # --python-exit-code : Return a non-zero exit code if the CLI raises an exception
+        # -- : Separate the framework arguments from those given to Blender
     :param arguments:
         Input arguments.
     :param arguments_string:
@@ -888,49 +1134,48 @@ def create_shell_commands(arguments,
     cli_morphology_reconstruction = '%s/neuron_morphology_reconstruction.py' % cli_interface_path
     cli_morphology_analysis = '%s/morphology_analysis.py' % cli_interface_path
     cli_mesh_reconstruction = '%s/neuron_mesh_reconstruction.py' % cli_interface_path
+    cli_neuron_tasks = '%s/neuron_tasks.py' % cli_interface_path
+
+    # All the tasks in a single process: call the @cli_neuron_tasks interface
+    if arguments.single_process:
+
+        # Add a single command to the list if any task is requested
+        if is_morphology_analysis_requested(arguments) or           \
+           is_morphology_reconstruction_requested(arguments) or     \
+           is_soma_reconstruction_requested(arguments) or           \
+           is_neuron_mesh_reconstruction_requested(arguments):
+            shell_commands.append('%s -b --verbose 0 --python-exit-code 1 --python %s -- %s' %
+                                  (arguments.blender, cli_neuron_tasks, arguments_string))
+
+        # Return a list of commands
+        return shell_commands
 
     # Morphology analysis task: call the @cli_morphology_analysis interface
-    if arguments.analyze_morphology:
+    if is_morphology_analysis_requested(arguments):
 
         # Add this command to the list
-        shell_commands.append('%s -b --verbose 0 --python %s -- %s' %
+        shell_commands.append('%s -b --verbose 0 --python-exit-code 1 --python %s -- %s' %
                               (arguments.blender, cli_morphology_analysis, arguments_string))
 
     # Morphology reconstruction task: call the @cli_morphology_reconstruction interface
-    if arguments.render_neuron_morphology or                \
-       arguments.render_neuron_morphology_360 or            \
-       arguments.render_neuron_morphology_progressive or    \
-       arguments.export_morphology_swc or                   \
-       arguments.export_morphology_segments or              \
-       arguments.export_morphology_blend:
+    if is_morphology_reconstruction_requested(arguments):
 
         # Add this command to the list
-        shell_commands.append('%s -b --verbose 0 --python %s -- %s' %
+        shell_commands.append('%s -b --verbose 0 --python-exit-code 1 --python %s -- %s' %
                               (arguments.blender, cli_morphology_reconstruction, arguments_string))
 
     # Soma-related task: call the @cli_soma_reconstruction interface
-    if arguments.render_soma_mesh or                        \
-       arguments.render_soma_mesh_360 or                    \
-       arguments.render_soma_mesh_progressive or            \
-       arguments.export_soma_mesh_ply or                    \
-       arguments.export_soma_mesh_obj or                    \
-       arguments.export_soma_mesh_stl or                    \
-       arguments.export_soma_mesh_blend:
+    if is_soma_reconstruction_requested(arguments):
 
         # Add this command to the list
-        shell_commands.append('%s -b --verbose 0 --python %s -- %s' %
+        shell_commands.append('%s -b --verbose 0 --python-exit-code 1 --python %s -- %s' %
                               (arguments.blender, cli_soma_reconstruction, arguments_string))
 
     # Neuron mesh reconstruction related task: call the @cli_mesh_reconstruction interface
-    if arguments.render_neuron_mesh or                      \
-       arguments.render_neuron_mesh_360 or                  \
-       arguments.export_neuron_mesh_ply or                  \
-       arguments.export_neuron_mesh_obj or                  \
-       arguments.export_neuron_mesh_stl or                  \
-       arguments.export_neuron_mesh_blend:
+    if is_neuron_mesh_reconstruction_requested(arguments):
 
         # Add this command to the list
-        shell_commands.append('%s -b --verbose 0 --python %s -- %s' %
+        shell_commands.append('%s -b --verbose 0 --python-exit-code 1 --python %s -- %s' %
                               (arguments.blender, cli_mesh_reconstruction, arguments_string))
 
     # Return a list of commands
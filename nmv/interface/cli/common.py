@@ -18,6 +18,7 @@
 # Internal imports
 import nmv.enums
 import nmv.consts
+import nmv.utilities
 
 
 ####################################################################################################
@@ -129,3 +130,28 @@ def get_soma_image_suffixes_from_view(camera_view):
     # By default render the front view
     else:
         return [nmv.consts.Suffix.SOMA_FRONT]
+
+
+####################################################################################################
+# @write_cli_profiling_results
+####################################################################################################
+def write_cli_profiling_results(arguments,
+                                cli_options,
+                                task_name):
+    """Writes the profiling spans recorded by a command line interface (CLI) to the profiling
+    directory, if the profiling is requested.
+
+    :param arguments:
+        Command line arguments.
+    :param cli_options:
+        System options parsed from the command line interface (CLI).
+    :param task_name:
+        The name of the task, to distinguish the results of the tasks of the same morphology.
+    """
+
+    if not arguments.profile:
+        return
+
+    nmv.utilities.write_profiling_results(
+        output_directory='%s/%s' % (arguments.output_directory, nmv.consts.Paths.PROFILING_FOLDER),
+        label='%s.%s' % (cli_options.morphology.label, task_name))
@@ -18,6 +18,7 @@
 # System imports
 import sys
 import os
+import time
 
 # Append the internal modules into the system paths to avoid Blender importing conflicts
 import_paths = ['neuromorphovis']
@@ -34,6 +35,7 @@ import nmv.interface
 import nmv.options
 import nmv.rendering
 import nmv.scene
+import nmv.utilities
 
 
 ####################################################################################################
@@ -82,7 +84,7 @@ if __name__ == "__main__":
     # Verify the output directory before screwing things !
     if not nmv.file.ops.path_exists(arguments.output_directory):
         nmv.logger.log('ERROR: Please set the output directory to a valid path')
-        exit(0)
+        sys.exit(1)
     else:
         print('Output: [%s]' % arguments.output_directory)
 
@@ -92,6 +94,13 @@ if __name__ == "__main__":
     # Convert the CLI arguments to system options
     input_options.consume_arguments(arguments=arguments)
 
+    # The morphology is only analyzed, then the samples of the .h5 files are created on demand
+    input_options.morphology.lazy_samples = True
+
+    # Profile the execution, if requested
+    if arguments.profile:
+        nmv.utilities.enable_profiling()
+
     # Read the morphology
     input_morphology = None
 
@@ -106,7 +115,7 @@ if __name__ == "__main__":
         if not loading_flag:
             nmv.logger.log('ERROR: Cannot load the GID [%s] from the circuit [%s]' %
                            input_options.morphology.blue_config, str(input_options.morphology.gid))
-            exit(0)
+            sys.exit(1)
 
     # If the input is a morphology file, then use the parser to load it directly
     elif arguments.input == 'file':
@@ -117,14 +126,29 @@ if __name__ == "__main__":
         if not loading_flag:
             nmv.logger.log('ERROR: Cannot load the morphology file [%s]' %
                            str(input_options.morphology.morphology_file_path))
-            exit(0)
+            sys.exit(1)
 
     else:
         nmv.logger.log('ERROR: Invalid input option')
-        exit(0)
+        sys.exit(1)
+
+    # The starting time of the task, to find its outputs
+    starting_time = time.time()
 
     # Morphology analysis
-    analyze_morphology_skeleton(cli_morphology=input_morphology, cli_options=input_options)
+    with nmv.utilities.profiling_span(
+            'Morphology Analysis', 'task', morphology=input_options.morphology.label):
+        analyze_morphology_skeleton(cli_morphology=input_morphology, cli_options=input_options)
+
+    # Record the completed task to skip it when the batch is run again
+    if arguments.resume:
+        nmv.interface.cli.record_completed_task(
+            arguments=arguments, task_name='analysis', starting_time=starting_time)
+
+    # Write the profiling results, if requested
+    nmv.interface.cli.write_cli_profiling_results(
+        arguments=arguments, cli_options=input_options, task_name='analysis')
+
     nmv.logger.log('Analysis done')
 
 
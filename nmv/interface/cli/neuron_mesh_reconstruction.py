@@ -18,6 +18,7 @@
 # System imports
 import sys
 import os
+import time
 
 # Append the internal modules into the system paths to avoid Blender importing conflicts
 import_paths = ['neuromorphovis']
@@ -36,6 +37,7 @@ import nmv.interface
 import nmv.options
 import nmv.rendering
 import nmv.scene
+import nmv.utilities
 
 
 ####################################################################################################
@@ -73,6 +75,11 @@ def reconstruct_neuron_mesh(cli_morphology,
         nmv.logger.log('Builder: Skinning')
         neuron_mesh_builder = nmv.builders.SkinningBuilder(cli_morphology, cli_options)
 
+    # TubesBuilder
+    elif cli_options.mesh.meshing_technique == nmv.enums.Meshing.Technique.TUBES:
+        nmv.logger.log('Builder: Tubes')
+        neuron_mesh_builder = nmv.builders.TubesBuilder(cli_morphology, cli_options)
+
     # PiecewiseBuilder
     elif cli_options.mesh.meshing_technique == nmv.enums.Meshing.Technique.PIECEWISE_WATERTIGHT:
         nmv.logger.log('Builder: Piecewise Watertight')
@@ -85,7 +92,7 @@ def reconstruct_neuron_mesh(cli_morphology,
         nmv.logger.log('ERROR: INVALID meshing technique')
 
         # Kill NeuroMorphoVis
-        nmv.kill()
+        nmv.kill(1)
 
     # A single mesh object of the neuron
     reconstructed_neuron_mesh = neuron_mesh_builder.reconstruct_mesh()
@@ -313,6 +320,38 @@ def render_neuron_mesh_360(cli_options,
                     image_name=image_name)
 
 
+####################################################################################################
+# @reconstruct_export_and_render_neuron_mesh
+####################################################################################################
+def reconstruct_export_and_render_neuron_mesh(cli_morphology,
+                                              cli_options):
+    """Reconstructs the neuron mesh, and then exports and renders it as set in the options.
+
+    :param cli_morphology:
+        The morphology loaded from the command line interface (CLI).
+    :param cli_options:
+        System options parsed from the command line interface (CLI).
+    """
+
+    # Neuron mesh reconstruction and visualization
+    reconstruct_neuron_mesh(cli_morphology=cli_morphology, cli_options=cli_options)
+
+    # Saving the mesh
+    if cli_options.mesh.export_ply or cli_options.mesh.export_obj or \
+       cli_options.mesh.export_stl or cli_options.mesh.export_blend:
+
+        # Export the neuron mesh
+        export_neuron_mesh(cli_morphology=cli_morphology, cli_options=cli_options)
+
+    # Render the mesh
+    if cli_options.mesh.render:
+        render_neuron_mesh_to_static_frame(cli_options=cli_options, cli_morphology=cli_morphology)
+
+    # Render 360 of the mesh
+    if cli_options.mesh.render_360:
+        render_neuron_mesh_360(cli_options=cli_options, cli_morphology=cli_morphology)
+
+
 ####################################################################################################
 # @ Run the main function if invoked from the command line.
 ####################################################################################################
@@ -328,7 +367,7 @@ if __name__ == "__main__":
     # Verify the output directory before screwing things !
     if not nmv.file.ops.path_exists(arguments.output_directory):
         nmv.logger.log('ERROR: Please set the output directory to a valid path')
-        exit(0)
+        sys.exit(1)
     else:
         print('Output: [%s]' % arguments.output_directory)
 
@@ -338,6 +377,10 @@ if __name__ == "__main__":
     # Convert the CLI arguments to system options
     cli_options.consume_arguments(arguments=arguments)
 
+    # Profile the execution, if requested
+    if arguments.profile:
+        nmv.utilities.enable_profiling()
+
     # Read the morphology
     cli_morphology = None
 
@@ -352,7 +395,7 @@ if __name__ == "__main__":
         if not loading_flag:
             nmv.logger.log('ERROR: Cannot load the GID [%s] from the circuit [%s]' %
                            cli_options.morphology.blue_config, str(cli_options.morphology.gid))
-            exit(0)
+            sys.exit(1)
 
     # If the input is a morphology file, then use the parser to load it directly
     elif arguments.input == 'file':
@@ -363,31 +406,30 @@ if __name__ == "__main__":
         if not loading_flag:
             nmv.logger.log('ERROR: Cannot load the morphology file [%s]' %
                            str(cli_options.morphology.morphology_file_path))
-            exit(0)
+            sys.exit(1)
 
     else:
         nmv.logger.log('ERROR: Invalid input option')
-        exit(0)
+        sys.exit(1)
 
-    # Soma mesh reconstruction and visualization
-    neuron_mesh = reconstruct_neuron_mesh(cli_morphology=cli_morphology, cli_options=cli_options)
-
-    # Saving the mesh
-    if cli_options.mesh.export_ply or cli_options.mesh.export_obj or \
-       cli_options.mesh.export_stl or cli_options.mesh.export_blend:
+    # The starting time of the task, to find its outputs
+    starting_time = time.time()
 
-        # Export the neuron mesh
-        export_neuron_mesh(cli_morphology=cli_morphology, cli_options=cli_options)
+    # Neuron mesh reconstruction, exporting and rendering
+    with nmv.utilities.profiling_span(
+            'Mesh Reconstruction', 'task', morphology=cli_options.morphology.label):
+        reconstruct_export_and_render_neuron_mesh(cli_morphology=cli_morphology,
+                                                  cli_options=cli_options)
 
-    # Render the mesh
-    if cli_options.mesh.render:
-        render_neuron_mesh_to_static_frame(cli_options=cli_options, cli_morphology=cli_morphology)
+    # Record the completed task to skip it when the batch is run again
+    if arguments.resume:
+        nmv.interface.cli.record_completed_task(
+            arguments=arguments, task_name='mesh', starting_time=starting_time)
 
-    # Render 360 of the mesh
-    if cli_options.mesh.render_360:
-        render_neuron_mesh_360(cli_options=cli_options, cli_morphology=cli_morphology)
+    # Write the profiling results, if requested
+    nmv.interface.cli.write_cli_profiling_results(
+        arguments=arguments, cli_options=cli_options, task_name='mesh')
 
-    # Rendering the mesh
     nmv.logger.log('NMV Done')
 
 
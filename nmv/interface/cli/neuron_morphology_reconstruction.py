@@ -18,6 +18,7 @@
 # System imports
 import sys
 import os
+import time
 
 # Append the internal modules into the system paths to avoid Blender importing conflicts
 import_paths = ['neuromorphovis']
@@ -273,7 +274,7 @@ if __name__ == "__main__":
     # Verify the output directory before screwing things !
     if not nmv.file.ops.path_exists(arguments.output_directory):
         nmv.logger.log('ERROR: Please set the output directory to a valid path')
-        exit(0)
+        sys.exit(1)
     else:
         print('Output: [%s]' % arguments.output_directory)
 
@@ -283,6 +284,10 @@ if __name__ == "__main__":
     # Convert the CLI arguments to system options
     input_options.consume_arguments(arguments=arguments)
 
+    # Profile the execution, if requested
+    if arguments.profile:
+        nmv.utilities.enable_profiling()
+
     # Read the morphology
     input_morphology = None
 
@@ -297,7 +302,7 @@ if __name__ == "__main__":
         if not loading_flag:
             nmv.logger.log('ERROR: Cannot load the GID [%s] from the circuit [%s]' %
                            input_options.morphology.blue_config, str(input_options.morphology.gid))
-            exit(0)
+            sys.exit(1)
 
     # If the input is a morphology file, then use the parser to load it directly
     elif arguments.input == 'file':
@@ -308,14 +313,28 @@ if __name__ == "__main__":
         if not loading_flag:
             nmv.logger.log('ERROR: Cannot load the morphology file [%s]' %
                            str(input_options.morphology.morphology_file_path))
-            exit(0)
+            sys.exit(1)
 
     else:
         nmv.logger.log('ERROR: Invalid input option')
-        exit(0)
+        sys.exit(1)
+
+    # The starting time of the task, to find its outputs
+    starting_time = time.time()
 
     # Neuron morphology reconstruction and visualization
-    reconstruct_neuron_morphology(cli_morphology=input_morphology, cli_options=input_options)
+    with nmv.utilities.profiling_span(
+            'Morphology Reconstruction', 'task', morphology=input_options.morphology.label):
+        reconstruct_neuron_morphology(cli_morphology=input_morphology, cli_options=input_options)
+    # Record the completed task to skip it when the batch is run again
+    if arguments.resume:
+        nmv.interface.cli.record_completed_task(
+            arguments=arguments, task_name='morphology', starting_time=starting_time)
+
+    # Write the profiling results, if requested
+    nmv.interface.cli.write_cli_profiling_results(
+        arguments=arguments, cli_options=input_options, task_name='morphology')
+
     nmv.logger.log('NMV Done')
 
 
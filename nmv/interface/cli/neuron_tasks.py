@@ -0,0 +1,232 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import sys
+import os
+import copy
+import time
+import traceback
+
+# Append the internal modules into the system paths to avoid Blender importing conflicts
+import_paths = ['neuromorphovis']
+for import_path in import_paths:
+    sys.path.append(('%s/../../..' % (os.path.dirname(os.path.realpath(__file__)))))
+
+# Internal imports
+import nmv.file
+import nmv.interface
+import nmv.options
+import nmv.scene
+import nmv.utilities
+
+
+####################################################################################################
+# @load_cli_morphology
+####################################################################################################
+def load_cli_morphology(arguments,
+                        cli_options):
+    """Loads the morphology given to the command line interface (CLI), either from a file or from
+    a circuit.
+
+    :param arguments:
+        Command line arguments.
+    :param cli_options:
+        System options parsed from the command line interface (CLI).
+    :return:
+        The loaded morphology, or None if the morphology cannot be loaded.
+    """
+
+    # If the input is a GID, then open the circuit and read it
+    if arguments.input == 'gid':
+
+        # Load the morphology from the file
+        loading_flag, cli_morphology = nmv.file.BBPReader.load_morphology_from_circuit(
+            blue_config=cli_options.morphology.blue_config,
+            gid=cli_options.morphology.gid)
+
+        if not loading_flag:
+            nmv.logger.log('ERROR: Cannot load the GID [%s] from the circuit [%s]' %
+                           (str(cli_options.morphology.gid), cli_options.morphology.blue_config))
+            return None
+
+    # If the input is a morphology file, then use the parser to load it directly
+    elif arguments.input == 'file':
+
+        # Read the morphology file
+        loading_flag, cli_morphology = nmv.file.read_morphology_from_file(options=cli_options)
+
+        if not loading_flag:
+            nmv.logger.log('ERROR: Cannot load the morphology file [%s]' %
+                           str(cli_options.morphology.morphology_file_path))
+            return None
+
+    else:
+        nmv.logger.log('ERROR: Invalid input option')
+        return None
+
+    # Return a reference to the loaded morphology
+    return cli_morphology
+
+
+####################################################################################################
+# @get_requested_tasks
+####################################################################################################
+def get_requested_tasks(arguments):
+    """Gets a list of the tasks requested in the command line arguments, in the same order they
+    are executed when every task runs in its own process.
+
+    :param arguments:
+        Command line arguments.
+    :return:
+        A list of (task name, resumable task name, task function) triplets, where every function
+        takes the morphology and the options.
+    """
+
+    tasks = list()
+
+    # Morphology analysis
+    if nmv.interface.cli.is_morphology_analysis_requested(arguments):
+        tasks.append(['Morphology Analysis', 'analysis',
+                      nmv.interface.cli.analyze_morphology_skeleton])
+
+    # Morphology reconstruction
+    if nmv.interface.cli.is_morphology_reconstruction_requested(arguments):
+        tasks.append(['Morphology Reconstruction', 'morphology',
+                      nmv.interface.cli.reconstruct_neuron_morphology])
+
+    # Soma reconstruction
+    if nmv.interface.cli.is_soma_reconstruction_requested(arguments):
+        tasks.append(['Soma Reconstruction', 'soma',
+                      nmv.interface.cli.reconstruct_soma_three_dimensional_profile_mesh])
+
+    # Neuron mesh reconstruction
+    if nmv.interface.cli.is_neuron_mesh_reconstruction_requested(arguments):
+        tasks.append(['Mesh Reconstruction', 'mesh',
+                      nmv.interface.cli.reconstruct_export_and_render_neuron_mesh])
+
+    return tasks
+
+
+####################################################################################################
+# @run_neuron_tasks
+####################################################################################################
+def run_neuron_tasks(cli_morphology,
+                     cli_options,
+                     tasks,
+                     arguments=None):
+    """Runs a list of tasks on the same morphology, one after the other, in the current process.
+
+    Every task gets its own copy of the options and the arbors of the morphology are restored to
+    their original state before every task, such that each task starts as if the morphology was
+    loaded in a new process. A failing task does not prevent the next ones from running.
+
+    :param cli_morphology:
+        The morphology loaded from the command line interface (CLI).
+    :param cli_options:
+        System options parsed from the command line interface (CLI).
+    :param tasks:
+        A list of (task name, resumable task name, task function) triplets, see
+        @get_requested_tasks.
+    :param arguments:
+        Command line arguments, if given and resuming is enabled, the completed tasks are
+        recorded, see @record_completed_task.
+    :return:
+        A list of the names of the failed tasks.
+    """
+
+    failed_tasks = list()
+    for task_name, resumable_task_name, task_function in tasks:
+
+        nmv.logger.header('Task: %s' % task_name)
+        start_time = time.time()
+
+        # Start from the loaded morphology, and an empty scene
+        cli_morphology.restore_original_arbors()
+        nmv.scene.ops.clear_scene()
+
+        try:
+            with nmv.utilities.profiling_span(
+                    task_name, 'task', morphology=cli_options.morphology.label):
+                task_function(cli_morphology=cli_morphology,
+                              cli_options=copy.deepcopy(cli_options))
+        except Exception:
+            nmv.logger.log('ERROR: Task [%s] failed\n%s' % (task_name, traceback.format_exc()))
+            failed_tasks.append(task_name)
+            continue
+
+        nmv.logger.log('Task [%s] done in [%f] seconds' % (task_name, time.time() - start_time))
+
+        # Record the completed task to skip it when the batch is run again
+        if arguments is not None and arguments.resume:
+            nmv.interface.cli.record_completed_task(
+                arguments=arguments, task_name=resumable_task_name, starting_time=start_time)
+
+    # Leave the scene empty
+    nmv.scene.ops.clear_scene()
+
+    return failed_tasks
+
+
+####################################################################################################
+# @ Run the main function if invoked from the command line.
+####################################################################################################
+if __name__ == "__main__":
+
+    # Ignore blender extra arguments required to launch blender given to the command line interface
+    args = sys.argv
+    sys.argv = args[args.index("--") + 1:]
+
+    # Parse the command line arguments, filter them and report the errors
+    arguments = nmv.interface.cli.parse_command_line_arguments()
+
+    # Verify the output directory before screwing things !
+    if not nmv.file.ops.path_exists(arguments.output_directory):
+        nmv.logger.log('ERROR: Please set the output directory to a valid path')
+        sys.exit(1)
+    else:
+        print('Output: [%s]' % arguments.output_directory)
+
+    # Get the options from the arguments
+    cli_options = nmv.options.NeuroMorphoVisOptions()
+
+    # Convert the CLI arguments to system options
+    cli_options.consume_arguments(arguments=arguments)
+
+    # Profile the execution, if requested
+    if arguments.profile:
+        nmv.utilities.enable_profiling()
+
+    # Read the morphology only once for all the tasks
+    cli_morphology = load_cli_morphology(arguments=arguments, cli_options=cli_options)
+    if cli_morphology is None:
+        sys.exit(1)
+
+    # Run all the requested tasks
+    failed_tasks = run_neuron_tasks(cli_morphology=cli_morphology, cli_options=cli_options,
+                                    tasks=get_requested_tasks(arguments), arguments=arguments)
+
+    # Write the profiling results, if requested
+    nmv.interface.cli.write_cli_profiling_results(
+        arguments=arguments, cli_options=cli_options, task_name='tasks')
+
+    # Report the failed tasks in the exit status, to be captured by the schedulers
+    if len(failed_tasks) > 0:
+        nmv.logger.log('ERROR: Failed tasks %s' % str(failed_tasks))
+        sys.exit(1)
+
+    nmv.logger.log('NMV Done')
@@ -0,0 +1,452 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import sys, os, copy, hashlib, json, time
+
+# NOTE: This module is used by the Blender CLIs and by the neuromorphovis.py launcher as well,
+# where nmv cannot be imported, therefore it only uses the modules that have no dependencies
+sys.path.append("%s/" % os.path.dirname(os.path.realpath(__file__)))
+sys.path.append("%s/../../consts" % os.path.dirname(os.path.realpath(__file__)))
+import arguments_parser
+import paths_consts
+import suffix_consts
+
+
+####################################################################################################
+# @ResumableTask
+####################################################################################################
+class ResumableTask:
+    """A task that can be skipped when a batch is run again, if its morphology, its options and
+    its outputs are unchanged.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 name,
+                 flags,
+                 options,
+                 output_folders):
+        """Constructor
+
+        :param name:
+            The name of the task, used to name its records.
+        :param flags:
+            The arguments that request the task.
+        :param options:
+            The arguments that change the outputs of the task, in addition to the flags.
+        :param output_folders:
+            The folders, relative to the output directory, where the task writes its outputs.
+        """
+
+        # Task name
+        self.name = name
+
+        # The arguments that request the task
+        self.flags = flags
+
+        # The arguments that change the outputs of the task
+        self.options = flags + options
+
+        # The folders of the outputs
+        self.output_folders = output_folders
+
+
+# The arguments that change the rendered images and sequences
+RENDERING_OPTIONS = ['render_to_scale', 'rendering_view', 'camera_view', 'close_up_dimensions',
+                     'frame_resolution', 'resolution_scale_factor', 'image_file_format']
+
+# The arguments that change the reconstructed morphology skeleton
+SKELETON_OPTIONS = ['morphology_reconstruction_algorithm', 'morphology_skeleton_style',
+                    'soma_representation', 'ignore_axons', 'ignore_basal_dendrites',
+                    'ignore_apical_dendrites', 'axon_branching_order',
+                    'apical_dendrites_branching_order', 'basal_dendrites_branching_order',
+                    'samples_radii', 'radii_scale_factor', 'unified_morphology_radius',
+                    'axon_radius', 'apical_dendrites_radius', 'basal_dendrites_radius',
+                    'minimum_sample_radius', 'maximum_sample_radius', 'bevel_sides']
+
+# The arguments that change the materials
+MATERIALS_OPTIONS = ['soma_color', 'axons_color', 'basal_dendrites_color',
+                     'apical_dendrites_color', 'spines_color', 'nucleus_color',
+                     'articulation_color', 'shader']
+
+# The arguments that change the soma mesh
+SOMA_OPTIONS = ['soma_stiffness', 'soma_subdivision_level']
+
+# The arguments that change the neuron mesh
+MESHING_OPTIONS = ['reconstruct_neuron_mesh', 'meshing_algorithm', 'edges', 'surface',
+                   'branching', 'tessellation_level', 'global_coordinates',
+                   'connect_soma_arbors', 'spines', 'spines_quality', 'random_spines_percentage',
+                   'add_nucleus', 'export_individuals', 'tubes_ring_resolution',
+                   'meta_balls_density']
+
+# The suffixes that are appended to the label in the names of the outputs, see @Suffix
+LABEL_SUFFIXES = [value for name, value in vars(suffix_consts.Suffix).items() if name.isupper()]
+
+# The names of the outputs of a morphology without their extensions, where {label} is the label of
+# the morphology, as named by the CLIs of the tasks
+LABELLED_OUTPUT_NAMES = \
+    ['{label}'] + \
+    ['{label}%s' % suffix for suffix in LABEL_SUFFIXES] + \
+    ['MESH_{label}_%s' % suffix for suffix in LABEL_SUFFIXES] + \
+    ['SOMA_MESH_{label}', 'SOMA_MESH_FRONT_{label}', 'SOMA_MESH_360_{label}',
+     'SOMA_MESH_PROGRESSIVE_{label}']
+
+# The tasks, in the same order of the CLIs
+RESUMABLE_TASKS = [
+    ResumableTask(name='analysis',
+                  flags=arguments_parser.MORPHOLOGY_ANALYSIS_FLAGS,
+                  options=[],
+                  output_folders=[paths_consts.Paths.ANALYSIS_FOLDER]),
+    ResumableTask(name='morphology',
+                  flags=arguments_parser.MORPHOLOGY_RECONSTRUCTION_FLAGS,
+                  options=SKELETON_OPTIONS + MATERIALS_OPTIONS + RENDERING_OPTIONS,
+                  output_folders=[paths_consts.Paths.MORPHOLOGIES_FOLDER,
+                                  paths_consts.Paths.IMAGES_FOLDER,
+                                  paths_consts.Paths.SEQUENCES_FOLDER]),
+    ResumableTask(name='soma',
+                  flags=arguments_parser.SOMA_RECONSTRUCTION_FLAGS,
+                  options=SOMA_OPTIONS + MATERIALS_OPTIONS + RENDERING_OPTIONS,
+                  output_folders=[paths_consts.Paths.MESHES_FOLDER,
+                                  paths_consts.Paths.IMAGES_FOLDER,
+                                  paths_consts.Paths.SEQUENCES_FOLDER]),
+    ResumableTask(name='mesh',
+                  flags=arguments_parser.NEURON_MESH_RECONSTRUCTION_FLAGS,
+                  options=SKELETON_OPTIONS + SOMA_OPTIONS + MATERIALS_OPTIONS + MESHING_OPTIONS +
+                  RENDERING_OPTIONS,
+                  output_folders=[paths_consts.Paths.MESHES_FOLDER,
+                                  paths_consts.Paths.IMAGES_FOLDER,
+                                  paths_consts.Paths.SEQUENCES_FOLDER])]
+
+
+####################################################################################################
+# @get_resumable_task
+####################################################################################################
+def get_resumable_task(task_name):
+    """Gets a resumable task by its name.
+
+    :param task_name:
+        The name of the task.
+    :return:
+        A reference to the task, or None if the name is unknown.
+    """
+
+    for task in RESUMABLE_TASKS:
+        if task.name == task_name:
+            return task
+    return None
+
+
+####################################################################################################
+# @get_morphology_label
+####################################################################################################
+def get_morphology_label(morphology_file=None,
+                         gid=None):
+    """Gets the label of a morphology, the same one used to name its outputs, see
+    @NeuroMorphoVisOptions.consume_arguments.
+
+    :param morphology_file:
+        The path to the morphology file, if loaded from a file.
+    :param gid:
+        The GID of the morphology, if loaded from a circuit.
+    :return:
+        The morphology label.
+    """
+
+    if morphology_file is not None:
+        file_name = os.path.basename(morphology_file)
+        if '.' in file_name:
+            return os.path.splitext(file_name)[0]
+        return file_name
+    return 'neuron_' + str(gid)
+
+
+####################################################################################################
+# @compute_input_hash
+####################################################################################################
+def compute_input_hash(morphology_file=None,
+                       gid=None,
+                       blue_config=None):
+    """Computes the hash of the input morphology. The hash of a file is computed from its
+    contents, while the hash of a GID is computed from the GID and the circuit configuration.
+
+    :param morphology_file:
+        The path to the morphology file, if loaded from a file.
+    :param gid:
+        The GID of the morphology, if loaded from a circuit.
+    :param blue_config:
+        The circuit configuration, if loaded from a circuit.
+    :return:
+        The hash as a hexadecimal string.
+    """
+
+    input_hash = hashlib.sha1()
+    if morphology_file is not None:
+        with open(morphology_file, 'rb') as file_handle:
+            for chunk in iter(lambda: file_handle.read(1 << 20), b''):
+                input_hash.update(chunk)
+    else:
+        input_hash.update(('%s:%s' % (str(blue_config), str(gid))).encode())
+    return input_hash.hexdigest()
+
+
+####################################################################################################
+# @compute_options_hash
+####################################################################################################
+def compute_options_hash(arguments,
+                         task):
+    """Computes the hash of the arguments that change the outputs of a given task.
+
+    :param arguments:
+        Command line arguments.
+    :param task:
+        A resumable task.
+    :return:
+        The hash as a hexadecimal string.
+    """
+
+    options = [[option, str(getattr(arguments, option, None))] for option in task.options]
+    return hashlib.sha1(json.dumps(options).encode()).hexdigest()
+
+
+####################################################################################################
+# @get_task_record_path
+####################################################################################################
+def get_task_record_path(output_directory,
+                         label,
+                         task):
+    """Gets the path to the record of a task of a given morphology.
+
+    :param output_directory:
+        The root output directory.
+    :param label:
+        The morphology label.
+    :param task:
+        A resumable task.
+    :return:
+        The path to the record file.
+    """
+
+    return '%s/%s/%s.%s.json' % (output_directory, paths_consts.Paths.MANIFEST_FOLDER, label,
+                                 task.name)
+
+
+####################################################################################################
+# @is_labelled_entry
+####################################################################################################
+def is_labelled_entry(entry,
+                      label,
+                      is_directory=False):
+    """Checks if an entry in an output folder belongs to a given morphology. The outputs are named
+    exactly as one of the @LABELLED_OUTPUT_NAMES, for example 'label.obj', 'label_mesh_front.png'
+    or 'SOMA_MESH_label.ply', and the directories have no extensions.
+
+    NOTE: The label is not searched as a prefix, otherwise the outputs of 'n10' or 'n1_2' would be
+    considered as outputs of 'n1' as well.
+
+    :param entry:
+        The name of a file or a directory in an output folder.
+    :param label:
+        The morphology label.
+    :param is_directory:
+        If True, the entry is a directory, and its entire name is matched.
+    :return:
+        True or False.
+    """
+
+    name = entry if is_directory else os.path.splitext(entry)[0]
+    for output_name in LABELLED_OUTPUT_NAMES:
+        if name == output_name.format(label=label):
+            return True
+    return False
+
+
+####################################################################################################
+# @find_task_outputs
+####################################################################################################
+def find_task_outputs(output_directory,
+                      label,
+                      task,
+                      starting_time):
+    """Finds the outputs of a task of a given morphology, i.e. the files in the output folders of
+    the task that are named after the label of the morphology, see @is_labelled_entry, and were
+    modified after the task started.
+
+    NOTE: Only the sub-directories that are named after the label are searched, to avoid walking over the
+    outputs of all the other morphologies.
+
+    :param output_directory:
+        The root output directory.
+    :param label:
+        The morphology label.
+    :param task:
+        A resumable task.
+    :param starting_time:
+        The time when the task started.
+    :return:
+        A list of the paths of the outputs, relative to the output directory.
+    """
+
+    outputs = list()
+    for output_folder in task.output_folders:
+        directory = '%s/%s' % (output_directory, output_folder)
+        if not os.path.isdir(directory):
+            continue
+        for entry in os.listdir(directory):
+            path = '%s/%s' % (directory, entry)
+            if not is_labelled_entry(entry, label, is_directory=os.path.isdir(path)):
+                continue
+            if os.path.isdir(path):
+                paths = ['%s/%s' % (path, name) for name in os.listdir(path)]
+            else:
+                paths = [path]
+            for path in paths:
+                if os.path.isfile(path) and os.path.getmtime(path) >= starting_time - 1.0:
+                    outputs.append(os.path.relpath(path, output_directory))
+    return sorted(outputs)
+
+
+####################################################################################################
+# @record_completed_task
+####################################################################################################
+def record_completed_task(arguments,
+                          task_name,
+                          starting_time):
+    """Records a task of the morphology given in the arguments as completed, with the hashes of
+    its inputs and the list of its outputs. If the task has not written any outputs, it is
+    considered failed and nothing is recorded.
+
+    :param arguments:
+        Command line arguments of the CLI that executed the task.
+    :param task_name:
+        The name of the task, see @RESUMABLE_TASKS.
+    :param starting_time:
+        The time when the task started.
+    :return:
+        True if the task was recorded, otherwise False.
+    """
+
+    task = get_resumable_task(task_name)
+    morphology_file = arguments.morphology_file if arguments.input == 'file' else None
+    label = get_morphology_label(morphology_file=morphology_file, gid=arguments.gid)
+
+    # Nothing is written, do not record the task to run it again
+    outputs = find_task_outputs(arguments.output_directory, label, task, starting_time)
+    if len(outputs) == 0:
+        return False
+
+    record = {'task': task.name,
+              'label': label,
+              'input_hash': compute_input_hash(morphology_file=morphology_file,
+                                               gid=arguments.gid,
+                                               blue_config=arguments.blue_config),
+              'options_hash': compute_options_hash(arguments, task),
+              'outputs': outputs,
+              'time': time.time()}
+
+    # Write to a temporary file and then rename it, to never leave a partial record
+    record_path = get_task_record_path(arguments.output_directory, label, task)
+    if not os.path.exists(os.path.dirname(record_path)):
+        os.makedirs(os.path.dirname(record_path), exist_ok=True)
+    with open(record_path + '.tmp', 'w') as file_handle:
+        json.dump(record, file_handle, indent=1)
+    os.replace(record_path + '.tmp', record_path)
+    return True
+
+
+####################################################################################################
+# @is_task_up_to_date
+####################################################################################################
+def is_task_up_to_date(arguments,
+                       label,
+                       task,
+                       input_hash):
+    """Checks if a task of a given morphology was already completed with the same input and the
+    same options, and all its outputs still exist.
+
+    :param arguments:
+        Command line arguments.
+    :param label:
+        The morphology label.
+    :param task:
+        A resumable task.
+    :param input_hash:
+        The hash of the input morphology, see @compute_input_hash.
+    :return:
+        True or False.
+    """
+
+    record_path = get_task_record_path(arguments.output_directory, label, task)
+    if not os.path.exists(record_path):
+        return False
+
+    try:
+        with open(record_path, 'r') as file_handle:
+            record = json.load(file_handle)
+    except ValueError:
+        return False
+
+    if record.get('input_hash') != input_hash or \
+       record.get('options_hash') != compute_options_hash(arguments, task):
+        return False
+
+    for output in record.get('outputs', []):
+        if not os.path.exists('%s/%s' % (arguments.output_directory, output)):
+            return False
+    return True
+
+
+####################################################################################################
+# @get_arguments_for_stale_tasks
+####################################################################################################
+def get_arguments_for_stale_tasks(arguments,
+                                  morphology_file=None,
+                                  gid=None):
+    """Gets a copy of the arguments for a given morphology where the flags of the tasks that are
+    up to date are turned off, such that only the tasks whose inputs, options or outputs have
+    changed are executed.
+
+    :param arguments:
+        Command line arguments.
+    :param morphology_file:
+        The path to the morphology file, if loaded from a file.
+    :param gid:
+        The GID of the morphology, if loaded from a circuit.
+    :return:
+        The updated copy of the arguments, or None if all the requested tasks are up to date.
+    """
+
+    label = get_morphology_label(morphology_file=morphology_file, gid=gid)
+    input_hash = compute_input_hash(morphology_file=morphology_file, gid=gid,
+                                    blue_config=arguments.blue_config)
+
+    stale_arguments = copy.copy(arguments)
+    number_stale_tasks = 0
+    for task in RESUMABLE_TASKS:
+        if not arguments_parser.is_task_requested(arguments, task.flags):
+            continue
+        if is_task_up_to_date(arguments, label, task, input_hash):
+            for flag in task.flags:
+                setattr(stale_arguments, flag, False)
+        else:
+            number_stale_tasks += 1
+
+    if number_stale_tasks == 0:
+        return None
+    return stale_arguments
@@ -18,6 +18,7 @@
 # System imports
 import sys
 import os
+import time
 
 # Blender imports
 import bpy
@@ -36,6 +37,7 @@ import nmv.interface
 import nmv.options
 import nmv.rendering
 import nmv.scene
+import nmv.utilities
 
 
 ####################################################################################################
@@ -77,7 +79,7 @@ def reconstruct_soma_three_dimensional_profile_mesh(cli_morphology,
     nmv.scene.ops.clear_scene()
 
     # Create a soma builder object
-    soma_softbody_builder = nmv.builders.SomaSoftBodyBuilder(cli_morphology, cli_options)
+    soma_builder = nmv.builders.SomaSoftBodyBuilder(cli_morphology, cli_options)
 
     # Reconstruct the three-dimensional profile of the soma mesh
     soma_mesh = soma_builder.reconstruct_soma_mesh()
@@ -190,7 +192,7 @@ if __name__ == "__main__":
     # Verify the output directory before screwing things !
     if not nmv.file.ops.path_exists(arguments.output_directory):
         nmv.logger.log('ERROR: Please set the output directory to a valid path')
-        exit(0)
+        sys.exit(1)
     else:
         print('Output: [%s]' % arguments.output_directory)
 
@@ -200,6 +202,10 @@ if __name__ == "__main__":
     # Convert the CLI arguments to system options
     cli_options.consume_arguments(arguments=arguments)
 
+    # Profile the execution, if requested
+    if arguments.profile:
+        nmv.utilities.enable_profiling()
+
     # Read the morphology
     cli_morphology = None
 
@@ -214,7 +220,7 @@ if __name__ == "__main__":
         if not loading_flag:
             nmv.logger.log('ERROR: Cannot load the GID [%s] from the circuit [%s]' %
                            cli_options.morphology.blue_config, str(cli_options.morphology.gid))
-            exit(0)
+            sys.exit(1)
 
     # If the input is a morphology file, then use the parser to load it directly
     elif arguments.input == 'file':
@@ -225,18 +231,32 @@ if __name__ == "__main__":
         if not loading_flag:
             nmv.logger.log('ERROR: Cannot load the morphology file [%s]' %
                            str(cli_options.morphology.morphology_file_path))
-            exit(0)
+            sys.exit(1)
 
     else:
         nmv.logger.log('ERROR: Invalid input option')
-        exit(0)
+        sys.exit(1)
 
     # TODO: Implement the render_soma_two_dimensional_profile() function
     # render_soma_two_dimensional_profile(cli_morphology=cli_morphology, cli_options=cli_options)
 
+    # The starting time of the task, to find its outputs
+    starting_time = time.time()
+
     # Soma mesh reconstruction and visualization
-    reconstruct_soma_three_dimensional_profile_mesh(cli_morphology=cli_morphology,
-                                                    cli_options=cli_options)
+    with nmv.utilities.profiling_span(
+            'Soma Reconstruction', 'task', morphology=cli_options.morphology.label):
+        reconstruct_soma_three_dimensional_profile_mesh(cli_morphology=cli_morphology,
+                                                        cli_options=cli_options)
+    # Record the completed task to skip it when the batch is run again
+    if arguments.resume:
+        nmv.interface.cli.record_completed_task(
+            arguments=arguments, task_name='soma', starting_time=starting_time)
+
+    # Write the profiling results, if requested
+    nmv.interface.cli.write_cli_profiling_results(
+        arguments=arguments, cli_options=cli_options, task_name='soma')
+
     nmv.logger.log('NMV Done')
 
 
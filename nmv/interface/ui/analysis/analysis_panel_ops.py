@@ -21,6 +21,8 @@ import copy
 # Blender imports
 import bpy
 from bpy.props import BoolProperty
+from bpy.props import IntProperty
+from bpy.props import FloatProperty
 
 # Internal imports
 import nmv.analysis
@@ -59,6 +61,110 @@ def get_label_from_prefix(prefix):
         return 'ERROR'
 
 
+####################################################################################################
+# @register_analysis_item_variable
+####################################################################################################
+def register_analysis_item_variable(item,
+                                    variable_prefix):
+    """Registers the variable of an analysis item for a given component in Blender and adds it to
+    the UI.
+
+    :param item:
+        The analysis item, of type @AnalysisItem.
+    :param variable_prefix:
+         The prefix 'in string format' that is used to tag or identify the analysis component.
+    """
+
+    # Append a little detail to the description to indicate if this is morphology or arbor
+    if 'Morphology' in variable_prefix:
+        description = '%s %s' % (item.description, '. This value is reported for the morphology')
+    elif 'Dendrite' in variable_prefix:
+        description = '%s %s' % (item.description, '. This value is reported for this dendrite')
+    elif 'Axon' in variable_prefix:
+        description = '%s %s' % (item.description, '. This value is reported for the axon')
+    else:
+        description = 'None'
+
+    # Float entry
+    if item.data_format == 'FLOAT':
+        setattr(bpy.types.Scene, '%s%s' % (variable_prefix, item.variable),
+                FloatProperty(name=item.name, description=description, subtype='FACTOR',
+                              min=0, max=1e32, precision=5))
+
+    elif item.data_format == 'NEGATIVE_FLOAT':
+        setattr(bpy.types.Scene, '%s%s' % (variable_prefix, item.variable),
+                FloatProperty(name=item.name, description=description, subtype='FACTOR',
+                              min=-1e5, max=1e32, precision=5))
+
+    # Int entry
+    elif item.data_format == 'INT':
+        setattr(bpy.types.Scene, '%s%s' % (variable_prefix, item.variable),
+                IntProperty(name=item.name, description=description, subtype='FACTOR'))
+
+    # Otherwise, ignore
+    else:
+        pass
+
+
+####################################################################################################
+# @register_global_analysis_item_variable
+####################################################################################################
+def register_global_analysis_item_variable(item):
+    """Registers the variable of a global analysis item in Blender.
+
+    :param item:
+        The analysis item, of type @AnalysisItem.
+    """
+
+    # Float entry
+    if item.data_format == 'FLOAT':
+        setattr(bpy.types.Scene, '%s' % item.variable,
+                FloatProperty(name=item.name, description=item.description, subtype='FACTOR',
+                              min=0, max=1e32, precision=5))
+
+    elif item.data_format == 'NEGATIVE_FLOAT':
+        setattr(bpy.types.Scene, '%s' % item.variable,
+                FloatProperty(name=item.name, description=item.description, subtype='FACTOR',
+                              min=-1e5, max=1e32, precision=5))
+
+    # Int entry
+    elif item.data_format == 'INT':
+        setattr(bpy.types.Scene, '%s' % item.variable,
+                IntProperty(name=item.name, description=item.description, subtype='FACTOR'))
+
+
+####################################################################################################
+# @register_per_arbor_analysis_item_variables
+####################################################################################################
+def register_per_arbor_analysis_item_variables(item,
+                                               morphology):
+    """Registers the variables of a per-arbor analysis item for the morphology and its arbors.
+
+    :param item:
+        The analysis item, of type @AnalysisItem.
+    :param morphology:
+        A given morphology to analyze.
+    """
+
+    # Morphology
+    register_analysis_item_variable(item=item, variable_prefix='Morphology')
+
+    # Apical dendrites
+    if morphology.has_apical_dendrites():
+        for arbor in morphology.apical_dendrites:
+            register_analysis_item_variable(item=item, variable_prefix=arbor.tag)
+
+    # Basal dendrites
+    if morphology.has_basal_dendrites():
+        for arbor in morphology.basal_dendrites:
+            register_analysis_item_variable(item=item, variable_prefix=arbor.tag)
+
+    # Axons
+    if morphology.has_axons():
+        for arbor in morphology.axons:
+            register_analysis_item_variable(item=item, variable_prefix=arbor.tag)
+
+
 ####################################################################################################
 # @register_group_checkbox
 ####################################################################################################
@@ -318,19 +424,24 @@ def analyze_morphology(morphology,
 
         # Register the global morphology variables to be able to show and update them on the UI
         for item in nmv.analysis.ui_global_analysis_items:
-            item.register_global_analysis_variables(morphology=morphology)
+            register_global_analysis_item_variable(item=item)
 
         # Register the per-arbor variables to be able to show and update them on the UI
         for item in nmv.analysis.ui_per_arbor_analysis_items:
-            item.register_per_arbor_analysis_variables(morphology=morphology)
+            register_per_arbor_analysis_item_variables(item=item, morphology=morphology)
 
         # Apply the global analysis filters and update the results
         for item in nmv.analysis.ui_global_analysis_items:
             item.apply_global_analysis_kernel(morphology=morphology, context=context)
 
-        # Apply the per-arbor analysis filters and update the results
-        for item in nmv.analysis.ui_per_arbor_analysis_items:
-            item.apply_per_arbor_analysis_kernel(morphology=morphology, context=context)
+        # Apply the per-arbor analysis filters and update the results, all the filters use the
+        # profiles of the arbors that are created in a single traversal
+        nmv.analysis.create_arbors_analysis_profiles(morphology)
+        try:
+            for item in nmv.analysis.ui_per_arbor_analysis_items:
+                item.apply_per_arbor_analysis_kernel(morphology=morphology, context=context)
+        finally:
+            nmv.analysis.release_arbors_analysis_profiles(morphology)
 
         # Analyze the bounding box information
         if context is not None:
@@ -418,8 +529,12 @@ def export_analysis_results(morphology,
         analysis_results_string += '\t* Axons: 0 \n\n'
 
     # Register the morphology variables to be able to show and update them on the UI
-    for item in nmv.analysis.ui_per_arbor_analysis_items:
-        analysis_results_string += item.write_analysis_results_to_string(morphology=morphology)
+    nmv.analysis.create_arbors_analysis_profiles(morphology)
+    try:
+        for item in nmv.analysis.ui_per_arbor_analysis_items:
+            analysis_results_string += item.write_analysis_results_to_string(morphology=morphology)
+    finally:
+        nmv.analysis.release_arbors_analysis_profiles(morphology)
 
     # Write the text to file
     analysis_results_file = open('%s/%s.txt' % (morphology_analysis_directory,
@@ -189,6 +189,12 @@ class ReconstructNeuronMesh(bpy.types.Operator):
                 morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
             nmv.interface.ui_reconstructed_mesh = mesh_builder.reconstruct_mesh()
 
+        # Tubes
+        elif meshing_technique == nmv.enums.Meshing.Technique.TUBES:
+            mesh_builder = nmv.builders.TubesBuilder(
+                morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+            nmv.interface.ui_reconstructed_mesh = mesh_builder.reconstruct_mesh()
+
         else:
 
             # Invalid method
@@ -276,6 +276,11 @@ def draw_meta_objects_meshing_options(panel,
         Blender scene.
     """
 
+    # The density of the meta balls
+    meta_balls_density_row = panel.layout.row()
+    meta_balls_density_row.prop(scene, 'NMV_MetaBallsDensity')
+    nmv.interface.ui_options.mesh.meta_balls_density = scene.NMV_MetaBallsDensity
+
     # Tessellation options
     draw_tessellation_options(panel=panel, scene=scene)
 
@@ -330,6 +335,43 @@ def draw_union_meshing_options(panel,
     draw_spines_options(panel=panel, scene=scene)
 
 
+####################################################################################################
+# @draw_tubes_meshing_options
+####################################################################################################
+def draw_tubes_meshing_options(panel,
+                               scene):
+    """Draws the options when the tubes meshing technique is selected.
+
+    :param panel:
+        Blender UI panel.
+    :param scene:
+        Blender scene.
+    """
+
+    # Which technique to use to reconstruct the soma
+    soma_type_row = panel.layout.row()
+    soma_type_row.label(text='Soma:')
+    soma_type_row.prop(scene, 'NMV_MeshingSomaType', expand=True)
+    nmv.interface.ui_options.mesh.soma_type = scene.NMV_MeshingSomaType
+
+    # The resolution of the rings of the tubes
+    ring_resolution_row = panel.layout.row()
+    ring_resolution_row.prop(scene, 'NMV_TubesRingResolution')
+    nmv.interface.ui_options.mesh.tubes_ring_resolution = scene.NMV_TubesRingResolution
+
+    # The tubes are never connected to the soma, so only the objects connection is shown
+    nmv.interface.ui_options.mesh.soma_connection = nmv.enums.Meshing.SomaConnection.DISCONNECTED
+
+    # Mesh connectivity options
+    draw_mesh_connectivity_options(panel=panel, scene=scene)
+
+    # Tessellation options
+    draw_tessellation_options(panel=panel, scene=scene)
+
+    # Spine options
+    draw_spines_options(panel=panel, scene=scene)
+
+
 ####################################################################################################
 # @draw_meshing_options
 ####################################################################################################
@@ -364,6 +406,8 @@ def draw_meshing_options(panel,
         draw_skinning_meshing_options(panel=panel, scene=scene)
     elif scene.NMV_MeshingTechnique == nmv.enums.Meshing.Technique.UNION:
         draw_union_meshing_options(panel=panel, scene=scene)
+    elif scene.NMV_MeshingTechnique == nmv.enums.Meshing.Technique.TUBES:
+        draw_tubes_meshing_options(panel=panel, scene=scene)
     else:
         pass
 
@@ -399,7 +443,8 @@ def draw_color_options(panel,
         # Draw the meshing options
         if scene.NMV_MeshingTechnique == nmv.enums.Meshing.Technique.PIECEWISE_WATERTIGHT or \
            scene.NMV_MeshingTechnique == nmv.enums.Meshing.Technique.UNION or \
-           scene.NMV_MeshingTechnique == nmv.enums.Meshing.Technique.SKINNING:
+           scene.NMV_MeshingTechnique == nmv.enums.Meshing.Technique.SKINNING or \
+           scene.NMV_MeshingTechnique == nmv.enums.Meshing.Technique.TUBES:
 
             # Homogeneous mesh coloring
             homogeneous_color_row = layout.row()
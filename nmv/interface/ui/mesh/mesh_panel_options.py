@@ -46,7 +46,12 @@ bpy.types.Scene.NMV_MeshingTechnique = bpy.props.EnumProperty(
             'MetaBalls',
             'Creates watertight mesh models using MetaBalls. This approach is extremely slow if '
             'the axons are included in the meshing process, so it is always recommended to use '
-            'first order branching for the axons when using this technique')],
+            'first order branching for the axons when using this technique'),
+           (nmv.enums.Meshing.Technique.TUBES,
+            'Tubes',
+            'Creates the arbors as tubes that are swept along the skeleton without any boolean '
+            'operators. Every tube is a closed mesh and the arbors are extended into the soma. '
+            'This approach is fast and robust, but the tubes intersect at the branching points')],
     name='Method',
     description='The technique that will be used to create the mesh, by default the '
                 'Piecewise Watertight one since it is the fastest one.',
@@ -212,6 +217,22 @@ bpy.types.Scene.NMV_MeshTessellationLevel = bpy.props.FloatProperty(
     description='Mesh tessellation level (between 0.1 and 1.0)',
     default=1.0, min=0.1, max=1.0)
 
+# The resolution of the rings of the tubes
+bpy.types.Scene.NMV_TubesRingResolution = bpy.props.IntProperty(
+    name='Ring Resolution',
+    description='The number of the vertices of the rings of the tubes',
+    default=nmv.consts.Meshing.TUBES_RING_RESOLUTION,
+    min=nmv.consts.Meshing.MIN_TUBES_RING_RESOLUTION,
+    max=nmv.consts.Meshing.MAX_TUBES_RING_RESOLUTION)
+
+# The density of the meta balls
+bpy.types.Scene.NMV_MetaBallsDensity = bpy.props.FloatProperty(
+    name='Balls Density',
+    description='The density of the meta balls along the arbors, higher densities give smoother '
+                'meshes and lower densities are faster',
+    default=nmv.consts.Meshing.META_BALLS_DENSITY,
+    min=nmv.consts.Meshing.MIN_META_BALLS_DENSITY, max=nmv.consts.Meshing.MAX_META_BALLS_DENSITY)
+
 # Random spines percentage
 bpy.types.Scene.NMV_RandomSpinesPercentage = bpy.props.FloatProperty(
     name='Percentage',
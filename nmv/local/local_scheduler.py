@@ -0,0 +1,218 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import sys, os, subprocess, time
+import concurrent.futures
+import threading
+
+# Add other modules
+sys.path.append("%s/../consts" % os.path.dirname(os.path.realpath(__file__)))
+
+# Internal modules
+import paths_consts
+
+
+####################################################################################################
+# @LocalJob
+####################################################################################################
+class LocalJob:
+    """A shell command that is executed on the local node, with its own log file.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 name,
+                 shell_command,
+                 log_file):
+        """Constructor
+
+        :param name:
+            The name of the job, used to identify it in the summary.
+        :param shell_command:
+            The shell command that will be executed.
+        :param log_file:
+            The path to the file where the stdout and stderr of the job will be written.
+        """
+
+        # Job name
+        self.name = name
+
+        # Shell command
+        self.shell_command = shell_command
+
+        # Log file
+        self.log_file = log_file
+
+        # The exit status of the last attempt, None if the job has never been executed
+        self.exit_status = None
+
+        # The number of the times the job was executed
+        self.attempts = 0
+
+        # The total time spent running the job in seconds
+        self.duration = 0.0
+
+    ################################################################################################
+    # @succeeded
+    ################################################################################################
+    def succeeded(self):
+        """Returns True if the last attempt of the job has exited with a zero status.
+
+        :return:
+            True if the job succeeded, otherwise False.
+        """
+
+        return self.exit_status == 0
+
+
+####################################################################################################
+# @run_local_job
+####################################################################################################
+def run_local_job(job,
+                  retries=0):
+    """Runs a job on the local node and re-launch it as long as it fails and the retries are not
+    exhausted. The output of all the attempts is appended to the log file of the job.
+
+    :param job:
+        The job to run.
+    :param retries:
+        The number of the times the job will be re-launched if it fails.
+    :return:
+        A reference to the job, with its exit status updated.
+    """
+
+    while job.attempts <= retries:
+
+        job.attempts += 1
+        start_time = time.time()
+
+        with open(job.log_file, 'a') as log_file:
+            log_file.write('# ATTEMPT [%d]: %s\n' % (job.attempts, job.shell_command))
+            log_file.flush()
+
+            try:
+                job.exit_status = subprocess.call(
+                    job.shell_command, shell=True, stdout=log_file, stderr=subprocess.STDOUT)
+            except OSError as error:
+                log_file.write('# ERROR: %s\n' % str(error))
+                job.exit_status = -1
+
+            log_file.write('# EXIT STATUS [%d]\n' % job.exit_status)
+
+        job.duration += time.time() - start_time
+
+        if job.succeeded():
+            break
+
+    return job
+
+
+####################################################################################################
+# @create_local_jobs
+####################################################################################################
+def create_local_jobs(output_directory,
+                      labeled_shell_commands):
+    """Creates a list of local jobs from a list of shell commands, where each job has its own log
+    file in the local logs directory.
+
+    :param output_directory:
+        The root output directory.
+    :param labeled_shell_commands:
+        A list of (label, shell command) pairs, where the label is used to name the job.
+    :return:
+        A list of local jobs.
+    """
+
+    # The logs directory
+    logs_directory = '%s/%s' % (output_directory, paths_consts.Paths.LOCAL_LOGS_FOLDER)
+    if not os.path.exists(logs_directory):
+        os.makedirs(logs_directory)
+
+    jobs = list()
+    for i, (label, shell_command) in enumerate(labeled_shell_commands):
+
+        # The index guarantees unique names even if the labels are repeated
+        name = '%d_%s' % (i, label)
+        log_file = '%s/%s.log' % (logs_directory, name)
+
+        # Remove the log of a previous run
+        if os.path.exists(log_file):
+            os.remove(log_file)
+
+        jobs.append(LocalJob(name=name, shell_command=shell_command, log_file=log_file))
+
+    return jobs
+
+
+####################################################################################################
+# @run_local_jobs
+####################################################################################################
+def run_local_jobs(jobs,
+                   number_workers=1,
+                   retries=0):
+    """Runs a list of jobs on the local node with a bounded number of workers, and prints a summary
+    of the successful and failed jobs at the end.
+
+    NOTE: Each job is a separate Blender process, therefore a thread pool is sufficient to keep
+    the workers busy; the threads only wait for the processes.
+
+    :param jobs:
+        A list of local jobs.
+    :param number_workers:
+        The maximum number of the jobs that run concurrently.
+    :param retries:
+        The number of the times a failing job will be re-launched.
+    :return:
+        A list of the failed jobs.
+    """
+
+    number_workers = max(1, int(number_workers))
+    retries = max(0, int(retries))
+
+    print('Running [%d] jobs on the local node with [%d] workers' % (len(jobs), number_workers))
+
+    # Serialize the progress messages of the different workers
+    print_lock = threading.Lock()
+    number_finished_jobs = [0]
+
+    def run_job(job):
+        run_local_job(job=job, retries=retries)
+        with print_lock:
+            number_finished_jobs[0] += 1
+            print('[%d/%d] %s: %s in [%.2f] seconds, [%d] attempts, log [%s]' % (
+                number_finished_jobs[0], len(jobs), job.name,
+                'DONE' if job.succeeded() else 'FAILED (%d)' % job.exit_status,
+                job.duration, job.attempts, job.log_file))
+        return job
+
+    start_time = time.time()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=number_workers) as executor:
+        list(executor.map(run_job, jobs))
+    total_time = time.time() - start_time
+
+    # Summary
+    failed_jobs = [job for job in jobs if not job.succeeded()]
+    print('Summary: [%d] jobs succeeded, [%d] jobs failed, total time [%.2f] seconds' % (
+        len(jobs) - len(failed_jobs), len(failed_jobs), total_time))
+    for job in failed_jobs:
+        print('  FAILED: %s, exit status [%d], log [%s]' % (
+            job.name, job.exit_status, job.log_file))
+
+    return failed_jobs
@@ -15,5 +15,13 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .objects import *
-from .ops import *
+# Internal imports
+import nmv
+
+# The tubes meshes are created with NumPy and do not require Blender
+from .tubes import *
+
+# The mesh operations require Blender
+if nmv.BLENDER_AVAILABLE:
+    from .objects import *
+    from .ops import *
@@ -255,3 +255,133 @@ def create_cube(radius=1,
 
     # Return a reference to it
     return cube_mesh
+
+
+####################################################################################################
+# @create_mesh_from_vertices_and_edges
+####################################################################################################
+def create_mesh_from_vertices_and_edges(vertices,
+                                        edges,
+                                        name='mesh'):
+    """Creates a mesh object from given vertices and edges and links it to the scene. The vertices
+    and the edges are set in bulk, which is much faster than extruding the mesh vertex by vertex,
+    for example to create the skeleton graph of a morphology.
+
+    :param vertices:
+        A list of the positions of the vertices, or an (N, 3) array.
+    :param edges:
+        A list of the pairs of the indices of the vertices of every edge, or an (M, 2) array.
+    :param name:
+        The name of the created object.
+    :return:
+        A reference to the created mesh object.
+    """
+
+    import numpy
+
+    # Flat arrays, as expected by foreach_set
+    vertices = numpy.asarray(vertices, dtype=numpy.float32).reshape(-1)
+    edges = numpy.asarray(edges, dtype=numpy.int32).reshape(-1)
+
+    # Create the mesh data
+    mesh_data = bpy.data.meshes.new(name)
+    mesh_data.vertices.add(len(vertices) // 3)
+    mesh_data.vertices.foreach_set('co', vertices)
+    mesh_data.edges.add(len(edges) // 2)
+    mesh_data.edges.foreach_set('vertices', edges)
+    mesh_data.update()
+
+    # Create a blender object, link it to the scene
+    mesh_object = bpy.data.objects.new(name, mesh_data)
+    nmv.scene.link_object_to_scene(mesh_object)
+
+    # Return a reference to it
+    return mesh_object
+
+
+####################################################################################################
+# @create_mesh_from_vertices_and_faces
+####################################################################################################
+def create_mesh_from_vertices_and_faces(vertices,
+                                        faces,
+                                        name='mesh'):
+    """Creates a mesh object from given vertices and triangular faces and links it to the scene.
+    The vertices and the faces are set in bulk, for example to import a mesh that is created with
+    NumPy.
+
+    :param vertices:
+        A list of the positions of the vertices, or an (N, 3) array.
+    :param faces:
+        A list of the triplets of the indices of the vertices of every triangle, or an (M, 3)
+        array.
+    :param name:
+        The name of the created object.
+    :return:
+        A reference to the created mesh object.
+    """
+
+    import numpy
+
+    # Every face is a polygon of three vertices
+    faces = numpy.asarray(faces, dtype=numpy.int32).reshape(-1)
+    return create_mesh_from_vertices_and_polygons(
+        vertices=vertices, polygons_vertices=faces,
+        polygons_sizes=numpy.full(len(faces) // 3, 3, dtype=numpy.int32), name=name)
+
+
+####################################################################################################
+# @create_mesh_from_vertices_and_polygons
+####################################################################################################
+def create_mesh_from_vertices_and_polygons(vertices,
+                                           polygons_vertices,
+                                           polygons_sizes,
+                                           polygons_smooth=None,
+                                           name='mesh'):
+    """Creates a mesh object from given vertices and polygons of any size and links it to the
+    scene. The vertices and the polygons are set in bulk.
+
+    :param vertices:
+        A list of the positions of the vertices, or an (N, 3) array.
+    :param polygons_vertices:
+        A flat array of the indices of the vertices of all the polygons, one polygon after another.
+    :param polygons_sizes:
+        An array of the number of the vertices of every polygon.
+    :param polygons_smooth:
+        An optional array of the smooth shading flags of the polygons.
+    :param name:
+        The name of the created object.
+    :return:
+        A reference to the created mesh object.
+    """
+
+    import numpy
+
+    # Flat arrays, as expected by foreach_set
+    vertices = numpy.asarray(vertices, dtype=numpy.float32).reshape(-1)
+    polygons_vertices = numpy.asarray(polygons_vertices, dtype=numpy.int32).reshape(-1)
+    polygons_sizes = numpy.asarray(polygons_sizes, dtype=numpy.int32).reshape(-1)
+
+    # The first loop of every polygon
+    polygons_starts = numpy.zeros(len(polygons_sizes), dtype=numpy.int32)
+    numpy.cumsum(polygons_sizes[:-1], out=polygons_starts[1:])
+
+    # Create the mesh data, every polygon is a sequence of loops
+    mesh_data = bpy.data.meshes.new(name)
+    mesh_data.vertices.add(len(vertices) // 3)
+    mesh_data.vertices.foreach_set('co', vertices)
+    mesh_data.loops.add(len(polygons_vertices))
+    mesh_data.loops.foreach_set('vertex_index', polygons_vertices)
+    mesh_data.polygons.add(len(polygons_sizes))
+    mesh_data.polygons.foreach_set('loop_start', polygons_starts)
+    mesh_data.polygons.foreach_set('loop_total', polygons_sizes)
+    if polygons_smooth is not None:
+        mesh_data.polygons.foreach_set(
+            'use_smooth', numpy.asarray(polygons_smooth, dtype=bool).reshape(-1))
+    mesh_data.update(calc_edges=True)
+
+    # Create a blender object, link it to the scene
+    mesh_object = bpy.data.objects.new(name, mesh_data)
+    nmv.scene.link_object_to_scene(mesh_object)
+
+    # Return a reference to it
+    return mesh_object
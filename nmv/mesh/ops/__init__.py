@@ -17,4 +17,5 @@
 
 from .mesh_face_ops import *
 from .mesh_object_ops import *
-from .mesh_vertex_ops import *
\ No newline at end of file
+from .mesh_vertex_ops import *
+from .meta_ball_ops import *
@@ -557,3 +557,32 @@ def remove_first_face_of_quad_mesh_object(mesh_object):
 
     # Switch back to the edit more
     bpy.ops.object.editmode_toggle()
+
+
+####################################################################################################
+# @get_polygons_arrays
+####################################################################################################
+def get_polygons_arrays(mesh_object):
+    """Gets the polygons of a given mesh object in a single step, such that the mesh can be created
+    again with @create_mesh_from_vertices_and_polygons.
+
+    :param mesh_object:
+        A given mesh object.
+    :return:
+        A flat NumPy array of the indices of the vertices of all the polygons, an array of the
+        number of the vertices of every polygon and an array of the smooth shading flags of the
+        polygons.
+    """
+
+    import numpy
+
+    mesh_data = mesh_object.data
+
+    # The vertices of the polygons are the vertices of the loops, in the order of the polygons
+    polygons_vertices = numpy.empty(len(mesh_data.loops), dtype=numpy.int32)
+    mesh_data.loops.foreach_get('vertex_index', polygons_vertices)
+    polygons_sizes = numpy.empty(len(mesh_data.polygons), dtype=numpy.int32)
+    mesh_data.polygons.foreach_get('loop_total', polygons_sizes)
+    polygons_smooth = numpy.empty(len(mesh_data.polygons), dtype=bool)
+    mesh_data.polygons.foreach_get('use_smooth', polygons_smooth)
+    return polygons_vertices, polygons_sizes, polygons_smooth
@@ -687,3 +687,45 @@ def get_index_of_nearest_vertex_to_point(mesh_object,
 
     # Return the nearest vertex index
     return nearest_vertex_index
+
+
+####################################################################################################
+# @set_skin_vertices_radii
+####################################################################################################
+def set_skin_vertices_radii(mesh_object,
+                            radii):
+    """Sets the radii of all the vertices of a mesh object that has a skin modifier in a single
+    step.
+
+    :param mesh_object:
+        A given mesh object with a skin modifier.
+    :param radii:
+        A list of the radii of the vertices, in the order of the vertices of the mesh.
+    """
+
+    import numpy
+
+    # Every skin vertex has two radii, along its local X and Y axes
+    radii = numpy.repeat(numpy.asarray(radii, dtype=numpy.float32), 2)
+    mesh_object.data.skin_vertices[0].data.foreach_set('radius', radii)
+
+
+####################################################################################################
+# @get_vertices_positions
+####################################################################################################
+def get_vertices_positions(mesh_object):
+    """Gets the positions of all the vertices of a given mesh object in a single step.
+
+    :param mesh_object:
+        A given mesh object.
+    :return:
+        An (N, 3) NumPy array of the positions of the vertices, in the order of the vertices of the
+        mesh.
+    """
+
+    import numpy
+
+    vertices = mesh_object.data.vertices
+    positions = numpy.empty(len(vertices) * 3, dtype=numpy.float32)
+    vertices.foreach_get('co', positions)
+    return positions.reshape((-1, 3))
@@ -0,0 +1,167 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+
+####################################################################################################
+# @compute_meta_balls_along_segments
+####################################################################################################
+def compute_meta_balls_along_segments(starts,
+                                      ends,
+                                      starts_radii,
+                                      ends_radii,
+                                      density=1.0):
+    """Computes the meta balls along a list of segments at once.
+
+    Along every segment, the balls start at the first point and step towards the second one by a
+    stride of r / (2 * density), where r is the radius of the last ball, and the radius of every
+    ball is interpolated linearly along the segment. Therefore, the radii of the balls along a
+    segment are a geometric series and all the balls are computed without stepping.
+
+    :param starts:
+        An (N, 3) array of the first points of the segments.
+    :param ends:
+        An (N, 3) array of the second points of the segments.
+    :param starts_radii:
+        An (N) array of the radii at the first points.
+    :param ends_radii:
+        An (N) array of the radii at the second points.
+    :param density:
+        The density of the balls, where 1.0 gives a stride of half the radius. Higher densities
+        give smoother surfaces, and lower ones give less balls to mesh.
+    :return:
+        An (M, 3) array of the centers and an (M) array of the radii of the balls, in the order of
+        the segments.
+    """
+
+    import numpy
+
+    starts = numpy.asarray(starts, dtype=numpy.float64).reshape(-1, 3)
+    ends = numpy.asarray(ends, dtype=numpy.float64).reshape(-1, 3)
+    starts_radii = numpy.asarray(starts_radii, dtype=numpy.float64).reshape(-1)
+    ends_radii = numpy.asarray(ends_radii, dtype=numpy.float64).reshape(-1)
+
+    # Ignore the segments with zero length
+    segments = ends - starts
+    lengths = numpy.linalg.norm(segments, axis=1)
+    valid = lengths >= 0.001
+    starts, segments, lengths = starts[valid], segments[valid], lengths[valid]
+
+    # Verify the radii, or fix them
+    starts_radii = numpy.maximum(starts_radii[valid], 0.001 * lengths)
+    ends_radii = numpy.maximum(ends_radii[valid], 0.001 * lengths)
+
+    # Every ball is larger than the previous one by a constant ratio
+    stride = 0.5 / density
+    radii_deltas = ends_radii - starts_radii
+    ratios = 1.0 + stride * radii_deltas / lengths
+    constant = numpy.abs(ratios - 1.0) < 1e-9
+
+    # The number of the balls along every segment, over-estimated by one and trimmed later. If the
+    # ratio is not positive, the first stride already goes beyond the segment
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        counts = numpy.where(
+            constant, lengths / (stride * starts_radii),
+            numpy.log(ends_radii / starts_radii) / numpy.log(numpy.where(ratios > 0, ratios, 2.0)))
+    counts = numpy.where(ratios > 0, numpy.ceil(counts) + 1, 1).astype(numpy.int64)
+
+    # The index of every ball along its segment
+    offsets = numpy.cumsum(counts) - counts
+    indices = numpy.arange(counts.sum()) - numpy.repeat(offsets, counts)
+    segments_indices = numpy.repeat(numpy.arange(len(counts)), counts)
+
+    # The radii of the balls and their distances from the first points
+    radii = starts_radii[segments_indices] * ratios[segments_indices] ** indices
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        distances = numpy.where(
+            constant[segments_indices], indices * stride * starts_radii[segments_indices],
+            (radii - starts_radii[segments_indices]) * lengths[segments_indices] /
+            radii_deltas[segments_indices])
+
+    # Keep the balls inside the segments, the first ball is always inside
+    inside = (indices == 0) | (distances < lengths[segments_indices])
+    segments_indices, radii, distances = \
+        segments_indices[inside], radii[inside], distances[inside]
+    centers = starts[segments_indices] + segments[segments_indices] * \
+        (distances / lengths[segments_indices])[:, None]
+    return centers, radii
+
+
+####################################################################################################
+# @remove_contained_meta_balls
+####################################################################################################
+def remove_contained_meta_balls(centers,
+                                radii):
+    """Removes the balls that are fully contained in the previous or the next ball in the list.
+
+    :param centers:
+        An (N, 3) array of the centers of the balls.
+    :param radii:
+        An (N) array of the radii of the balls.
+    :return:
+        The centers and the radii of the remaining balls.
+    """
+
+    import numpy
+
+    if len(radii) < 2:
+        return centers, radii
+
+    distances = numpy.linalg.norm(centers[1:] - centers[:-1], axis=1)
+
+    # Of two identical balls, only the second one is removed
+    contained = numpy.zeros(len(radii), dtype=bool)
+    contained[:-1] |= distances + radii[:-1] < radii[1:]
+    contained[1:] |= distances + radii[1:] <= radii[:-1]
+    return centers[~contained], radii[~contained]
+
+
+####################################################################################################
+# @create_meta_balls
+####################################################################################################
+def create_meta_balls(meta_data,
+                      centers,
+                      radii):
+    """Adds balls to a given meta object, and sets their positions and radii in bulk.
+
+    NOTE: The existing balls of the meta object are read and set again, therefore the balls of an
+    entire morphology should be added with a single call.
+
+    :param meta_data:
+        The meta data of a meta object, where the balls are added.
+    :param centers:
+        An (N, 3) array of the centers of the balls.
+    :param radii:
+        An (N) array of the radii of the balls.
+    """
+
+    import numpy
+
+    elements = meta_data.elements
+    number_elements = len(elements)
+    for _ in range(len(radii)):
+        elements.new()
+
+    # The existing elements are set again with their current values
+    all_centers = numpy.empty(len(elements) * 3, dtype=numpy.float32)
+    all_radii = numpy.empty(len(elements), dtype=numpy.float32)
+    if number_elements > 0:
+        elements.foreach_get('co', all_centers)
+        elements.foreach_get('radius', all_radii)
+    all_centers[number_elements * 3:] = numpy.asarray(centers, dtype=numpy.float32).reshape(-1)
+    all_radii[number_elements:] = numpy.asarray(radii, dtype=numpy.float32).reshape(-1)
+    elements.foreach_set('co', all_centers)
+    elements.foreach_set('radius', all_radii)
@@ -0,0 +1,356 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# Internal imports
+import nmv.consts
+
+
+####################################################################################################
+# @normalize_vectors
+####################################################################################################
+def normalize_vectors(vectors):
+    """Normalizes the rows of an array of vectors. The zero vectors are kept as they are.
+
+    :param vectors:
+        An (N, 3) array of vectors.
+    :return:
+        An (N, 3) array of the normalized vectors and an (N) array of their original lengths.
+    """
+
+    import numpy
+
+    lengths = numpy.linalg.norm(vectors, axis=1)
+    safe_lengths = numpy.where(lengths > nmv.consts.Math.LITTLE_EPSILON, lengths, 1.0)
+    return vectors / safe_lengths[:, None], lengths
+
+
+####################################################################################################
+# @multiply_quaternions
+####################################################################################################
+def multiply_quaternions(q1,
+                         q2):
+    """Multiplies two arrays of quaternions row by row, in the (w, x, y, z) order.
+
+    :param q1:
+        An (N, 4) array of quaternions on the left.
+    :param q2:
+        An (N, 4) array of quaternions on the right.
+    :return:
+        An (N, 4) array of the products.
+    """
+
+    import numpy
+
+    w1, x1, y1, z1 = q1[:, 0], q1[:, 1], q1[:, 2], q1[:, 3]
+    w2, x2, y2, z2 = q2[:, 0], q2[:, 1], q2[:, 2], q2[:, 3]
+    return numpy.stack((w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+                        w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+                        w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+                        w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2), axis=1)
+
+
+####################################################################################################
+# @rotate_vectors_by_quaternions
+####################################################################################################
+def rotate_vectors_by_quaternions(quaternions,
+                                  vectors):
+    """Rotates an array of vectors by an array of unit quaternions, row by row.
+
+    :param quaternions:
+        An (N, 4) array of unit quaternions, in the (w, x, y, z) order.
+    :param vectors:
+        An (N, 3) array of vectors.
+    :return:
+        An (N, 3) array of the rotated vectors.
+    """
+
+    import numpy
+
+    w = quaternions[:, :1]
+    u = quaternions[:, 1:]
+    uv = numpy.cross(u, vectors)
+    return vectors + 2.0 * (w * uv + numpy.cross(u, uv))
+
+
+####################################################################################################
+# @get_perpendicular_vectors
+####################################################################################################
+def get_perpendicular_vectors(vectors):
+    """Gets a unit vector perpendicular to every given unit vector, by crossing it with the axis
+    that is the least aligned with it.
+
+    :param vectors:
+        An (N, 3) array of unit vectors.
+    :return:
+        An (N, 3) array of unit vectors.
+    """
+
+    import numpy
+
+    axes = numpy.eye(3)[numpy.argmin(numpy.abs(vectors), axis=1)]
+    return normalize_vectors(numpy.cross(vectors, axes))[0]
+
+
+####################################################################################################
+# @compute_tubes_frames
+####################################################################################################
+def compute_tubes_frames(points,
+                         tubes_starts):
+    """Computes the parallel-transport frames along the center lines of multiple tubes at once.
+
+    The normal of the first point of every tube is an arbitrary vector perpendicular to its tangent,
+    and it is transported along the tube by the minimal rotation between every two successive
+    tangents, so the frames do not twist. The rotations of all the tubes are accumulated together
+    with a segmented prefix product of quaternions in log2(N) vectorized steps.
+
+    :param points:
+        An (N, 3) array of the points of all the tubes, one tube after the other.
+    :param tubes_starts:
+        A sorted array of the indices of the first points of the tubes, starting with 0. Every tube
+        must have at least two distinct successive points.
+    :return:
+        Three (N, 3) arrays of the tangents, the normals and the binormals at the points.
+    """
+
+    import numpy
+
+    number_points = len(points)
+    tubes_starts = numpy.asarray(tubes_starts, dtype=numpy.int64)
+
+    # The tube of every point, and the first and the last points of every tube
+    tubes_lengths = numpy.diff(numpy.append(tubes_starts, number_points))
+    tube_of_point = numpy.repeat(numpy.arange(len(tubes_starts)), tubes_lengths)
+    is_first = numpy.zeros(number_points, dtype=bool)
+    is_first[tubes_starts] = True
+    is_last = numpy.zeros(number_points, dtype=bool)
+    is_last[tubes_starts + tubes_lengths - 1] = True
+
+    # The direction from every point to the next one in the same tube, zero for the last points
+    directions = numpy.zeros((number_points, 3))
+    directions[:-1] = points[1:] - points[:-1]
+    directions[is_last] = 0.0
+    directions = normalize_vectors(directions)[0]
+
+    # The incoming direction of every point, zero for the first points
+    incoming = numpy.zeros((number_points, 3))
+    incoming[1:] = directions[:-1]
+    incoming[is_first] = 0.0
+
+    # The tangent bisects the incoming and the outgoing directions, if the tube reverses at a point
+    # then use any of them
+    tangents, lengths = normalize_vectors(directions + incoming)
+    reversed_points = lengths < nmv.consts.Math.LITTLE_EPSILON
+    tangents[reversed_points] = numpy.where(
+        is_last[reversed_points, None], incoming[reversed_points], directions[reversed_points])
+
+    # The minimal rotation from the tangent of every point to the tangent of the next one, stored
+    # at the next point, with the identity at the first point of every tube
+    rotations = numpy.zeros((number_points, 4))
+    rotations[:, 0] = 1.0
+    rotations[1:, 0] = 1.0 + numpy.einsum('ij,ij->i', tangents[:-1], tangents[1:])
+    rotations[1:, 1:] = numpy.cross(tangents[:-1], tangents[1:])
+
+    # Opposite tangents rotate by 180 degrees around any perpendicular axis
+    opposite = numpy.flatnonzero(rotations[:, 0] < nmv.consts.Math.LITTLE_EPSILON)
+    opposite = opposite[~is_first[opposite]]
+    rotations[opposite, 0] = 0.0
+    rotations[opposite, 1:] = get_perpendicular_vectors(tangents[opposite - 1])
+    rotations[is_first] = (1.0, 0.0, 0.0, 0.0)
+    rotations /= numpy.linalg.norm(rotations, axis=1)[:, None]
+
+    # Accumulate the rotations from the first point of every tube with a segmented scan
+    shift = 1
+    while shift < number_points:
+        same_tube = tube_of_point[shift:] == tube_of_point[:-shift]
+        products = multiply_quaternions(rotations[shift:], rotations[:-shift])
+        rotations[shift:] = numpy.where(same_tube[:, None], products, rotations[shift:])
+        rotations[shift:] /= numpy.linalg.norm(rotations[shift:], axis=1)[:, None]
+        shift *= 2
+
+    # Transport the first normal of every tube along it
+    first_normals = get_perpendicular_vectors(tangents[tubes_starts])
+    normals = rotate_vectors_by_quaternions(rotations, first_normals[tube_of_point])
+
+    # Remove the accumulated numerical errors
+    normals -= numpy.einsum('ij,ij->i', normals, tangents)[:, None] * tangents
+    normals = normalize_vectors(normals)[0]
+    binormals = numpy.cross(tangents, normals)
+
+    return tangents, normals, binormals
+
+
+####################################################################################################
+# @create_tubes_mesh
+####################################################################################################
+def create_tubes_mesh(tubes,
+                      ring_resolution=nmv.consts.Meshing.TUBES_RING_RESOLUTION):
+    """Creates a triangular mesh of multiple tubes by sweeping a circle along their center lines.
+    Every tube is a closed surface with a cap at each end, and its faces point outwards.
+
+    :param tubes:
+        A list of tubes, where every tube is an (N, 3) array of the points and an (N) array of
+        the radii along its center line, with at least two distinct successive points.
+    :param ring_resolution:
+        The number of the vertices of the circle swept along the tubes, at least three.
+    :return:
+        An (V, 3) array of the vertices and an (F, 3) array of the faces of the mesh.
+    """
+
+    import numpy
+
+    # The rings with less than three vertices give degenerate meshes
+    if ring_resolution < nmv.consts.Meshing.MIN_TUBES_RING_RESOLUTION:
+        raise ValueError('The ring resolution [%d] is less than [%d]' % (
+            ring_resolution, nmv.consts.Meshing.MIN_TUBES_RING_RESOLUTION))
+
+    if not tubes:
+        return numpy.zeros((0, 3)), numpy.zeros((0, 3), dtype=numpy.int64)
+
+    # Concatenate the tubes to process them together
+    points = numpy.concatenate([numpy.asarray(tube[0], dtype=numpy.float64) for tube in tubes])
+    radii = numpy.concatenate([numpy.asarray(tube[1], dtype=numpy.float64) for tube in tubes])
+    tubes_lengths = numpy.array([len(tube[0]) for tube in tubes])
+    tubes_starts = numpy.cumsum(tubes_lengths) - tubes_lengths
+    tubes_ends = tubes_starts + tubes_lengths - 1
+    number_points = len(points)
+    number_tubes = len(tubes)
+
+    # The frames along the tubes
+    tangents, normals, binormals = compute_tubes_frames(points, tubes_starts)
+
+    # A ring of vertices around every point
+    angles = 2.0 * numpy.pi * numpy.arange(ring_resolution) / ring_resolution
+    cosines = numpy.cos(angles)[None, :, None]
+    sines = numpy.sin(angles)[None, :, None]
+    rings = points[:, None, :] + radii[:, None, None] * (
+        cosines * normals[:, None, :] + sines * binormals[:, None, :])
+
+    # The vertices are the rings, followed by the centers of the start and the end caps
+    vertices = numpy.concatenate(
+        (rings.reshape(-1, 3), points[tubes_starts], points[tubes_ends]))
+
+    # Two triangles per quad between every ring and the next one in the same tube
+    is_last = numpy.zeros(number_points, dtype=bool)
+    is_last[tubes_ends] = True
+    ring_indices = numpy.arange(ring_resolution)
+    next_ring_indices = (ring_indices + 1) % ring_resolution
+    segments = numpy.flatnonzero(~is_last)[:, None] * ring_resolution
+    a = segments + ring_indices
+    b = segments + next_ring_indices
+    c = b + ring_resolution
+    d = a + ring_resolution
+    side_faces = numpy.concatenate((numpy.stack((a, b, c), axis=-1).reshape(-1, 3),
+                                    numpy.stack((a, c, d), axis=-1).reshape(-1, 3)))
+
+    # The caps are triangle fans around the centers
+    first_center = number_points * ring_resolution
+    start_centers = numpy.repeat(first_center + numpy.arange(number_tubes), ring_resolution)
+    end_centers = start_centers + number_tubes
+    start_rings = tubes_starts[:, None] * ring_resolution
+    end_rings = tubes_ends[:, None] * ring_resolution
+    start_caps = numpy.stack((start_centers,
+                              (start_rings + next_ring_indices).reshape(-1),
+                              (start_rings + ring_indices).reshape(-1)), axis=-1)
+    end_caps = numpy.stack((end_centers,
+                            (end_rings + ring_indices).reshape(-1),
+                            (end_rings + next_ring_indices).reshape(-1)), axis=-1)
+
+    faces = numpy.concatenate((side_faces, start_caps, end_caps))
+    return vertices, faces
+
+
+####################################################################################################
+# @create_sphere_mesh
+####################################################################################################
+def create_sphere_mesh(center,
+                       radius,
+                       resolution=nmv.consts.Meshing.TUBES_RING_RESOLUTION):
+    """Creates a triangular mesh of a UV sphere, with its faces pointing outwards.
+
+    :param center:
+        The center of the sphere.
+    :param radius:
+        The radius of the sphere.
+    :param resolution:
+        The number of the vertices around the equator, the sphere has half as many rings.
+    :return:
+        An (V, 3) array of the vertices and an (F, 3) array of the faces of the mesh.
+    """
+
+    import numpy
+
+    number_rings = max(2, resolution // 2)
+
+    # The rings between the two poles, from the top to the bottom
+    polar_angles = numpy.pi * numpy.arange(1, number_rings) / number_rings
+    azimuthal_angles = 2.0 * numpy.pi * numpy.arange(resolution) / resolution
+    rings = numpy.stack(
+        (numpy.outer(numpy.sin(polar_angles), numpy.cos(azimuthal_angles)),
+         numpy.outer(numpy.sin(polar_angles), numpy.sin(azimuthal_angles)),
+         numpy.repeat(numpy.cos(polar_angles)[:, None], resolution, axis=1)), axis=-1)
+
+    # The rings, followed by the top and the bottom poles
+    vertices = numpy.concatenate((rings.reshape(-1, 3), [(0.0, 0.0, 1.0), (0.0, 0.0, -1.0)]))
+    vertices = vertices * radius + numpy.asarray(center, dtype=numpy.float64)
+    top_pole = len(vertices) - 2
+    bottom_pole = len(vertices) - 1
+
+    # Two triangles per quad between every ring and the ring below it
+    ring_indices = numpy.arange(resolution)
+    next_ring_indices = (ring_indices + 1) % resolution
+    upper_rings = numpy.arange(number_rings - 2)[:, None] * resolution
+    a = upper_rings + ring_indices
+    b = upper_rings + next_ring_indices
+    c = b + resolution
+    d = a + resolution
+    quads_faces = numpy.concatenate((numpy.stack((a, c, b), axis=-1).reshape(-1, 3),
+                                     numpy.stack((a, d, c), axis=-1).reshape(-1, 3)))
+
+    # Triangle fans around the poles
+    last_ring = (number_rings - 2) * resolution
+    top_faces = numpy.stack((numpy.full(resolution, top_pole),
+                             ring_indices, next_ring_indices), axis=-1)
+    bottom_faces = numpy.stack((numpy.full(resolution, bottom_pole),
+                                last_ring + next_ring_indices, last_ring + ring_indices), axis=-1)
+
+    faces = numpy.concatenate((quads_faces, top_faces, bottom_faces))
+    return vertices, faces
+
+
+####################################################################################################
+# @merge_meshes_arrays
+####################################################################################################
+def merge_meshes_arrays(meshes):
+    """Merges multiple meshes into a single one, without connecting them.
+
+    :param meshes:
+        A list of meshes, where every mesh is an array of the vertices and an array of the faces.
+    :return:
+        An (V, 3) array of the vertices and an (F, 3) array of the faces of the merged mesh.
+    """
+
+    import numpy
+
+    if not meshes:
+        return numpy.zeros((0, 3)), numpy.zeros((0, 3), dtype=numpy.int64)
+
+    # Offset the faces of every mesh by the number of the vertices of the preceding meshes
+    offsets = numpy.cumsum([0] + [len(vertices) for vertices, _ in meshes[:-1]])
+    vertices = numpy.concatenate([mesh_vertices for mesh_vertices, _ in meshes])
+    faces = numpy.concatenate([mesh_faces + offset for (_, mesh_faces), offset in
+                               zip(meshes, offsets)])
+    return vertices, faces
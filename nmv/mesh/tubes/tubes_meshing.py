@@ -0,0 +1,277 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# Internal imports
+import nmv.consts
+import nmv.enums
+import nmv.file
+import nmv.mesh
+import nmv.options
+
+
+####################################################################################################
+# @get_arbor_tubes
+####################################################################################################
+def get_arbor_tubes(arbor,
+                    max_branching_order=nmv.consts.Math.INFINITY,
+                    origin=None):
+    """Gets the center lines of the tubes that reconstruct an arbor. Like the connected sections,
+    every tube follows a path that continues from every section into its first child, and the
+    other children start new tubes at the branching point.
+
+    :param arbor:
+        The root section of the arbor.
+    :param max_branching_order:
+        The maximum branching order of the sections of the arbor.
+    :param origin:
+        If given, the first tube is extended from this point, for example the center of the soma.
+    :return:
+        A list of tubes, where every tube is an (N, 3) array of the points and an (N) array of
+        the radii along its center line.
+    """
+
+    import numpy
+
+    tubes = list()
+
+    # The sections that start new tubes, with their branching orders
+    tubes_sections = [(arbor, 1)]
+    while tubes_sections:
+        section, branching_order = tubes_sections.pop()
+
+        # Follow the path of the tube
+        tube_points = list()
+        tube_radii = list()
+        while True:
+            points, radii = section.get_samples_arrays()
+
+            # The first sample of a section is the last sample of its parent
+            if tube_points:
+                points, radii = points[1:], radii[1:]
+            tube_points.append(points)
+            tube_radii.append(radii)
+
+            if not section.children or branching_order >= max_branching_order:
+                break
+            for child in reversed(section.children[1:]):
+                tubes_sections.append((child, branching_order + 1))
+            section = section.children[0]
+            branching_order += 1
+
+        # Extend the first tube of the arbor to the origin
+        if origin is not None and not tubes:
+            tube_points.insert(0, numpy.asarray(origin, dtype=numpy.float64).reshape(1, 3))
+            tube_radii.insert(0, tube_radii[0][:1])
+
+        points = numpy.concatenate(tube_points)
+        radii = numpy.concatenate(tube_radii)
+
+        # Remove the duplicate successive points, they have no direction
+        distances = numpy.linalg.norm(numpy.diff(points, axis=0), axis=1)
+        keep = numpy.concatenate(([True], distances > nmv.consts.Math.LITTLE_EPSILON))
+        if numpy.count_nonzero(keep) < 2:
+            continue
+        tubes.append((points[keep], radii[keep]))
+
+    return tubes
+
+
+####################################################################################################
+# @create_arbor_tubes_mesh
+####################################################################################################
+def create_arbor_tubes_mesh(arbor,
+                            max_branching_order=nmv.consts.Math.INFINITY,
+                            origin=None,
+                            ring_resolution=nmv.consts.Meshing.TUBES_RING_RESOLUTION):
+    """Creates the tubes mesh of an arbor.
+
+    :param arbor:
+        The root section of the arbor.
+    :param max_branching_order:
+        The maximum branching order of the sections of the arbor.
+    :param origin:
+        If given, the arbor is extended from this point, for example the center of the soma.
+    :param ring_resolution:
+        The number of the vertices of the circle swept along the tubes.
+    :return:
+        An (V, 3) array of the vertices and an (F, 3) array of the faces of the mesh.
+    """
+
+    tubes = get_arbor_tubes(arbor=arbor, max_branching_order=max_branching_order, origin=origin)
+    return nmv.mesh.create_tubes_mesh(tubes=tubes, ring_resolution=ring_resolution)
+
+
+####################################################################################################
+# @get_arbor_origin_at_soma
+####################################################################################################
+def get_arbor_origin_at_soma(arbor,
+                             soma):
+    """Gets the point from which the arbor is extended to connect it to the soma, which is the
+    center of the soma, or None if the arbor is too far from the soma to be connected to it.
+
+    :param arbor:
+        The root section of the arbor.
+    :param soma:
+        The soma of the morphology.
+    :return:
+        The center of the soma or None.
+    """
+
+    import numpy
+
+    centroid = numpy.array(tuple(soma.centroid)[:3], dtype=numpy.float64)
+    first_point = arbor.get_samples_arrays()[0][0]
+    if numpy.linalg.norm(first_point - centroid) < nmv.consts.Skeleton.MAXIMUM_SOMA_RADIUS_REPORTED:
+        return centroid
+    return None
+
+
+####################################################################################################
+# @create_morphology_tubes_meshes
+####################################################################################################
+def create_morphology_tubes_meshes(morphology,
+                                   options):
+    """Creates the tubes meshes of the soma and the arbors of a morphology. The soma is a sphere
+    with the mean radius of the soma and the arbors that are close to the soma are extended to its
+    center, so the mesh has no gaps without any boolean operations.
+
+    :param morphology:
+        A given morphology.
+    :param options:
+        NeuroMorphoVis options, the morphology options select the arbors and their branching orders
+        and the mesh options set the resolution of the rings.
+    :return:
+        A list of the meshes of the soma and the arbors, where every mesh is its name, an (V, 3)
+        array of its vertices and an (F, 3) array of its faces.
+    """
+
+    ring_resolution = options.mesh.tubes_ring_resolution
+
+    # The soma
+    soma_vertices, soma_faces = nmv.mesh.create_sphere_mesh(
+        center=tuple(morphology.soma.centroid)[:3], radius=morphology.soma.mean_radius,
+        resolution=ring_resolution)
+    meshes = [(nmv.consts.Skeleton.SOMA_PREFIX, soma_vertices, soma_faces)]
+
+    # The arbors, with their maximum branching orders
+    arbors = list()
+    if morphology.has_axons() and not options.morphology.ignore_axons:
+        arbors.extend([(arbor, options.morphology.axon_branch_order)
+                       for arbor in morphology.axons])
+    if morphology.has_apical_dendrites() and not options.morphology.ignore_apical_dendrites:
+        arbors.extend([(arbor, options.morphology.apical_dendrite_branch_order)
+                       for arbor in morphology.apical_dendrites])
+    if morphology.has_basal_dendrites() and not options.morphology.ignore_basal_dendrites:
+        arbors.extend([(arbor, options.morphology.basal_dendrites_branch_order)
+                       for arbor in morphology.basal_dendrites])
+
+    for arbor, max_branching_order in arbors:
+        vertices, faces = create_arbor_tubes_mesh(
+            arbor=arbor, max_branching_order=max_branching_order,
+            origin=get_arbor_origin_at_soma(arbor=arbor, soma=morphology.soma),
+            ring_resolution=ring_resolution)
+        meshes.append((arbor.label, vertices, faces))
+
+    return meshes
+
+
+####################################################################################################
+# @mesh_morphology_file_to_tubes
+####################################################################################################
+def mesh_morphology_file_to_tubes(morphology_file,
+                                  output_directory,
+                                  file_format=nmv.enums.Meshing.ExportFormat.PLY,
+                                  ring_resolution=nmv.consts.Meshing.TUBES_RING_RESOLUTION):
+    """Reads a morphology file, creates the tubes mesh of the entire morphology and writes it to
+    a single file named after the morphology.
+
+    :param morphology_file:
+        The path to the .h5 or the .swc morphology file.
+    :param output_directory:
+        The directory where the mesh will be written.
+    :param file_format:
+        The format of the mesh file, PLY or OBJ.
+    :param ring_resolution:
+        The number of the vertices of the circle swept along the tubes.
+    :return:
+        The path to the mesh file.
+    """
+
+    # Read the morphology, the tubes are built from the arrays of the sections, therefore the
+    # samples of the .h5 files are only created on demand
+    loading_flag, morphology = nmv.file.read_morphology_from_file_naively(
+        morphology_file_path=morphology_file, lazy_samples=True)
+    if not loading_flag:
+        raise IOError('Cannot load the morphology file')
+
+    # Mesh all the arbors entirely
+    options = nmv.options.NeuroMorphoVisOptions()
+    options.morphology.axon_branch_order = nmv.consts.Skeleton.MAX_BRANCHING_ORDER
+    options.morphology.basal_dendrites_branch_order = nmv.consts.Skeleton.MAX_BRANCHING_ORDER
+    options.morphology.apical_dendrite_branch_order = nmv.consts.Skeleton.MAX_BRANCHING_ORDER
+    options.mesh.tubes_ring_resolution = ring_resolution
+    meshes = create_morphology_tubes_meshes(morphology=morphology, options=options)
+
+    # Write a single mesh
+    vertices, faces = nmv.mesh.merge_meshes_arrays(
+        [(vertices, faces) for _, vertices, faces in meshes])
+    return nmv.file.write_mesh_arrays_to_file(
+        vertices=vertices, faces=faces, output_directory=output_directory,
+        file_name=morphology.label, file_format=file_format)
+
+
+####################################################################################################
+# @mesh_morphologies_directory_to_tubes
+####################################################################################################
+def mesh_morphologies_directory_to_tubes(input_directory,
+                                         output_directory,
+                                         file_format=nmv.enums.Meshing.ExportFormat.PLY,
+                                         ring_resolution=nmv.consts.Meshing.TUBES_RING_RESOLUTION,
+                                         number_processes=None):
+    """Creates the tubes meshes of all the .h5 and .swc morphologies in a directory in a pool of
+    processes, and writes a mesh file per morphology. The morphologies that cannot be meshed are
+    reported and skipped.
+
+    :param input_directory:
+        The directory that contains the morphology files.
+    :param output_directory:
+        The directory where the meshes will be written.
+    :param file_format:
+        The format of the mesh files, PLY or OBJ.
+    :param ring_resolution:
+        The number of the vertices of the circle swept along the tubes.
+    :param number_processes:
+        The number of the worker processes, by default the number of the cores.
+    :return:
+        The number of the meshed morphologies and a list of the files that failed with their
+        error messages.
+    """
+
+    # Every morphology would fail with the rings that have less than three vertices
+    if ring_resolution < nmv.consts.Meshing.MIN_TUBES_RING_RESOLUTION:
+        raise ValueError('The ring resolution [%d] is less than [%d]' % (
+            ring_resolution, nmv.consts.Meshing.MIN_TUBES_RING_RESOLUTION))
+
+    # Mesh the morphologies in the workers
+    results = nmv.file.run_function_on_morphology_files_in_directory(
+        function=mesh_morphology_file_to_tubes, input_directory=input_directory,
+        arguments=(output_directory, file_format, ring_resolution),
+        number_processes=number_processes)
+
+    failed_files = [(morphology_file, error)
+                    for morphology_file, _, error in results if error is not None]
+    return len(results) - len(failed_files), failed_files
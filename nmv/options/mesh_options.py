@@ -47,6 +47,15 @@ class MeshOptions:
         # Meshing technique
         self.meshing_technique = nmv.enums.Meshing.Technique.PIECEWISE_WATERTIGHT
 
+        # The number of the vertices of the rings of the tubes meshes
+        self.tubes_ring_resolution = nmv.consts.Meshing.TUBES_RING_RESOLUTION
+
+        # The number of the worker processes that build the meshes of the arbors
+        self.arbors_processes = nmv.consts.Meshing.ARBORS_PROCESSES
+
+        # The density of the meta balls of the meta objects meshes
+        self.meta_balls_density = nmv.consts.Meshing.META_BALLS_DENSITY
+
         # Soma reconstruction technique
         self.soma_type = nmv.enums.Soma.Representation.SOFT_BODY
 
@@ -50,6 +50,18 @@ class MorphologyOptions:
         # Morphology label (based on the GID or the morphology file name)
         self.label = None
 
+        # Use the cache of the parsed morphology files, to avoid parsing the same file again
+        self.use_cache = True
+
+        # The directory of the cache of the parsed morphology files
+        self.cache_directory = nmv.consts.Paths.MORPHOLOGY_CACHE_DIRECTORY
+
+        # The maximum size of the cache of the parsed morphology files in MB
+        self.cache_size = nmv.consts.Paths.MORPHOLOGY_CACHE_SIZE
+
+        # Create the samples of the .H5 morphologies on demand, recommended for analysis-only runs
+        self.lazy_samples = False
+
         # RECONSTRUCTION OPTIONS ###################################################################
         # Arbor style, ORIGINAL by default
         self.arbor_style = nmv.enums.Skeleton.Style.ORIGINAL
@@ -137,6 +137,12 @@ class NeuroMorphoVisOptions:
             # Update the morphology label
             self.morphology.label = nmv.file.ops.get_file_name_from_path(arguments.morphology_file)
 
+        # Morphology cache
+        self.morphology.use_cache = not arguments.no_morphology_cache
+        if arguments.morphology_cache_directory is not None:
+            self.morphology.cache_directory = arguments.morphology_cache_directory
+        self.morphology.cache_size = arguments.morphology_cache_size
+
         # Soma reconstruction
         self.morphology.soma_representation = \
             nmv.enums.Soma.Representation.get_enum(arguments.soma_representation)
@@ -256,6 +262,27 @@ class NeuroMorphoVisOptions:
         self.mesh.meshing_technique = nmv.enums.Meshing.Technique.get_enum(
             arguments.meshing_algorithm)
 
+        # The resolution of the rings of the tubes, clamped to the same range of the UI, since the
+        # rings with less than three vertices cannot be meshed
+        self.mesh.tubes_ring_resolution = min(max(
+            arguments.tubes_ring_resolution, nmv.consts.Meshing.MIN_TUBES_RING_RESOLUTION),
+            nmv.consts.Meshing.MAX_TUBES_RING_RESOLUTION)
+        if self.mesh.tubes_ring_resolution != arguments.tubes_ring_resolution:
+            nmv.logger.log('WARNING: The tubes ring resolution [%s] is clamped to [%s]' % (
+                str(arguments.tubes_ring_resolution), str(self.mesh.tubes_ring_resolution)))
+
+        # The number of the worker processes that build the meshes of the arbors
+        self.mesh.arbors_processes = arguments.arbors_processes
+
+        # The density of the meta balls of the meta objects meshes, clamped to the same range of
+        # the UI, since zero or negative densities cannot be meshed
+        self.mesh.meta_balls_density = min(max(
+            arguments.meta_balls_density, nmv.consts.Meshing.MIN_META_BALLS_DENSITY),
+            nmv.consts.Meshing.MAX_META_BALLS_DENSITY)
+        if self.mesh.meta_balls_density != arguments.meta_balls_density:
+            nmv.logger.log('WARNING: The meta balls density [%s] is clamped to [%s]' % (
+                str(arguments.meta_balls_density), str(self.mesh.meta_balls_density)))
+
         # Spines (source)
         self.mesh.spines = nmv.enums.Meshing.Spines.Source.get_enum(arguments.spines)
 
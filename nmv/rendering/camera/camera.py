@@ -134,6 +134,7 @@ class Camera:
     ################################################################################################
     # @render_image
     ################################################################################################
+    @nmv.utilities.profiled(category='rendering')
     def render_image(self,
                      image_name='IMAGE',
                      image_format=nmv.enums.Image.Extension.PNG):
@@ -23,11 +23,13 @@ from mathutils import Vector
 import nmv.bbox
 import nmv.scene
 import nmv.camera
+import nmv.utilities
 
 
 ####################################################################################################
 # @render_scene_at_resolution
 ####################################################################################################
+@nmv.utilities.profiled(category='rendering')
 def render_scene_at_resolution(file_name='image',
                                film_base_resolution=512,
                                view='FRONT'):
@@ -102,6 +104,7 @@ def render_scene_at_resolution(file_name='image',
 ####################################################################################################
 # @render_scene_to_scale
 ####################################################################################################
+@nmv.utilities.profiled(category='rendering')
 def render_scene_to_scale(file_name='image',
                           resolution_scale_factor=1,
                           view='FRONT'):
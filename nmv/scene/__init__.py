@@ -15,4 +15,9 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .ops import *
+# Internal imports
+import nmv
+
+# The scene operations require Blender
+if nmv.BLENDER_AVAILABLE:
+    from .ops import *
@@ -346,6 +346,16 @@ def clear_scene():
     # bpy.context.space_data.clip_start = 0.01
     # bpy.context.space_data.clip_end = 10000
 
+    # Remove all the data blocks in a single call if the Blender version supports it, this avoids
+    # the operators and the per-object selection that are quite expensive for large scenes
+    if hasattr(bpy.data, 'batch_remove'):
+        data_blocks = list(bpy.data.objects) + list(bpy.data.meshes) + \
+                      list(bpy.data.curves) + list(bpy.data.materials)
+        nmv.utilities.disable_std_output()
+        bpy.data.batch_remove(ids=data_blocks)
+        nmv.utilities.enable_std_output()
+        return
+
     # Select each object in the scene
     for scene_object in bpy.context.scene.objects:
         select_object(scene_object)
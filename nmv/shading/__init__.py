@@ -16,5 +16,10 @@
 # MA 02110-1301 USA.
 ####################################################################################################
 
-from .illumination import *
-from .materials import *
+# Internal imports
+import nmv
+
+# The shading operations require Blender
+if nmv.BLENDER_AVAILABLE:
+    from .illumination import *
+    from .materials import *
@@ -15,19 +15,25 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
+# Internal imports
+import nmv
+
 from .skeleton_analysis_ops import *
 from .skeleton_branching_ops import *
 from .skeleton_coloring_ops import *
-from .skeleton_connection_ops import *
 from .skeleton_construction_ops import *
 from .skeleton_dendrogram_ops import *
-from .skeleton_drawing_ops import *
 from .skeleton_geometry_ops import *
 from .skeleton_intersection_ops import *
-from .skeleton_polylines_ops import *
 from .skeleton_repair_ops import *
 from .skeleton_resampling_ops import *
 from .skeleton_generic_ops import *
 from .skeleton_style_ops import *
 from .skeleton_verification_ops import *
 from .skeleton_soma_ops import *
+
+# The connection, drawing and poly-lines operations create objects in the scene and require Blender
+if nmv.BLENDER_AVAILABLE:
+    from .skeleton_connection_ops import *
+    from .skeleton_drawing_ops import *
+    from .skeleton_polylines_ops import *
@@ -39,12 +39,14 @@ def update_skeleton_branching(morphology,
 
         # Label the primary and secondary sections based on angles
         nmv.skeleton.ops.apply_operation_to_morphology(
-            *[morphology, nmv.skeleton.ops.label_primary_and_secondary_sections_based_on_angles])
+            *[morphology, nmv.skeleton.ops.label_primary_and_secondary_sections_based_on_angles],
+            mutates=True)
     else:
 
         # Label the primary and secondary sections based on radii
         nmv.skeleton.ops.apply_operation_to_morphology(
-            *[morphology, nmv.skeleton.ops.label_primary_and_secondary_sections_based_on_radii])
+            *[morphology, nmv.skeleton.ops.label_primary_and_secondary_sections_based_on_radii],
+            mutates=True)
 
     # Update the branching orders
     nmv.skeleton.ops.apply_operation_to_morphology(
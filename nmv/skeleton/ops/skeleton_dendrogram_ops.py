@@ -129,12 +129,13 @@ def compute_dendrogram_y_coordinates_for_children(section):
         The root section of the subtree where we are computing the Y-coordinates of the dendrogram.
     """
 
-    # The actual Y-coordinate is equivalent to the path length of the section
-    section.dendrogram_y = section.compute_path_length()
-
-    # Go recursively
-    for child in section.children:
-        compute_dendrogram_y_coordinates_for_children(section=child)
+    # The actual Y-coordinate is equivalent to the path length of the section, which is cached
+    # for all the sections of the arbor
+    sections = [section]
+    while sections:
+        section = sections.pop()
+        section.dendrogram_y = section.compute_path_length()
+        sections.extend(section.children)
 
 
 ####################################################################################################
@@ -238,7 +239,7 @@ def compute_morphology_dendrogram(morphology,
                 arbor=arbor, delta=delta, continuing_index=continuing_index)
 
             # Add the leaves count
-            continuing_index += len(get_arbor_leaves(arbor=arbor))
+            continuing_index += arbor.get_subtree_leaves_count()
 
     # Basal dendrites
     if morphology.has_basal_dendrites():
@@ -246,8 +247,8 @@ def compute_morphology_dendrogram(morphology,
             compute_arbor_dendrogram_individually(
                 arbor=arbor, delta=delta, continuing_index=continuing_index)
 
-            # Add the leaves count 
-            continuing_index += len(get_arbor_leaves(arbor=arbor))
+            # Add the leaves count
+            continuing_index += arbor.get_subtree_leaves_count()
 
     # Axon
     if morphology.has_axons():
@@ -256,7 +257,7 @@ def compute_morphology_dendrogram(morphology,
                 arbor=arbor, delta=delta, continuing_index=continuing_index)
 
             # Add the leaves count
-            continuing_index += len(get_arbor_leaves(arbor=arbor))
+            continuing_index += arbor.get_subtree_leaves_count()
 
     return continuing_index
 
@@ -15,268 +15,243 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
+# Internal imports
+import nmv.utilities
+
 
 ####################################################################################################
-# @apply_operation_to_arbor
+# @traverse_arbor
 ####################################################################################################
-def apply_operation_to_arbor(*args):
-    """Apply a given function/filter/operation to a given arbor recursively.
-
-    :param args:
-        Arguments list, where the first argument is always the root section of the arbor and the
-        second argument is the function of the operation/filter that will be applied
-        and the rest of the arguments are those that will be passed to the function itself.
+def traverse_arbor(arbor,
+                   operation,
+                   max_branching_order=None):
+    """Applies a given operation to all the sections of a given arbor in pre-order (a section then
+    its children in order) using an explicit stack, so deep arbors never hit the recursion limit.
+
+    The children of a section are only fetched after the operation is applied to the section, so
+    the operation can modify them.
+
+    :param arbor:
+        The root section of a given arbor.
+    :param operation:
+        A callable that takes the section as its only argument. Any other arguments must be bound
+        to the callable, for example in a closure.
+    :param max_branching_order:
+        If given, the sections with higher branching orders are not visited. The branching order
+        of the root section is 1, therefore no section is visited if it is less than 1.
     """
 
-    # The section is the first argument
-    section = args[0]
-
-    # If the section is None
-    if section is None:
+    # If the arbor is None, or even its root is above the max branching order
+    if arbor is None or (max_branching_order is not None and max_branching_order < 1):
 
         # Simply return
         return
 
-    # The operation is the second argument
-    operation = args[1]
+    # A stack of sections and their branching orders
+    stack = [(arbor, 1)]
 
-    # Construct the root section arguments list, add the section and ignore the operation
-    section_args = [section]
-    for i in range(2, len(args)):
-        section_args.append(args[i])
+    while len(stack) > 0:
 
-    # Apply the operation/filter to the first section of the arbor
-    operation(*section_args)
+        # Get the next section
+        section, branching_order = stack.pop()
 
-    # Ensure that the section has valid children
-    if section.children is not None:
+        # Apply the operation/filter
+        operation(section)
 
-        # Apply the operation/filter to the children of the arbors
-        for child in section.children:
+        # Cut-off
+        if max_branching_order is not None and branching_order >= max_branching_order:
+            continue
 
-            # Construct the child section arguments list, add the child and add the operation
-            section_args = [child]
-            for i in range(1, len(args)):
-                section_args.append(args[i])
-
-            # Validate the rest of the skeleton of the arbor
-            apply_operation_to_arbor(*section_args)
+        # Add the children in reverse order to visit them in order
+        if section.children is not None:
+            for child in reversed(section.children):
+                stack.append((child, branching_order + 1))
 
 
 ####################################################################################################
-# @apply_operation_to_arbor_conditionally
+# @get_arbor_sections_in_pre_order
 ####################################################################################################
-def apply_operation_to_arbor_conditionally(*args):
-    """Apply a given function/filter/operation to a given arbor recursively if the branching order
-    of this arbor is less than the max order requested by the user.
-
-    :param args:
-        Arguments list, where the first argument is always the root section of the arbor and the
-        second argument is the function of the operation/filter that will be applied
-        and the rest of the arguments are those that will be passed to the function itself.
+def get_arbor_sections_in_pre_order(arbor,
+                                    max_branching_order=None):
+    """Gets a linear list of the sections of a given arbor in pre-order. This list can be cached
+    and iterated directly instead of traversing the arbor again, as long as the topology of the
+    arbor is not changed.
+
+    :param arbor:
+        The root section of a given arbor.
+    :param max_branching_order:
+        If given, the sections with higher branching orders are ignored.
+    :return:
+        A list of the sections of the arbor in pre-order.
     """
 
-    # The current branching level is the first argument
-    current_branching_level = args[0]
+    sections = list()
+    traverse_arbor(arbor, sections.append, max_branching_order)
+    return sections
 
-    # The max branching level is the second argument
-    max_branching_order = args[1]
 
-    # The section is the third argument
-    section = args[2]
+####################################################################################################
+# @traverse_morphology
+####################################################################################################
+def traverse_morphology(morphology,
+                        operation,
+                        axons_branching_order=None,
+                        basal_dendrites_branching_order=None,
+                        apical_dendrites_branching_order=None):
+    """Applies a given operation to all the sections of all the arbors of a given morphology, the
+    apical dendrites first, then the basal dendrites and finally the axons.
+
+    :param morphology:
+        A given morphology.
+    :param operation:
+        A callable that takes the section as its only argument.
+    :param axons_branching_order:
+        If given, the axons sections with higher branching orders are not visited.
+    :param basal_dendrites_branching_order:
+        If given, the basal dendrites sections with higher branching orders are not visited.
+    :param apical_dendrites_branching_order:
+        If given, the apical dendrites sections with higher branching orders are not visited.
+    """
 
-    # The operation is the fourth argument
-    operation = args[3]
+    # Apical dendrites
+    if morphology.has_apical_dendrites():
+        for arbor in morphology.apical_dendrites:
+            traverse_arbor(arbor, operation, apical_dendrites_branching_order)
 
-    # Construct the root section arguments list, add the section and ignore the operation
-    section_args = list()
+    # Basal dendrites
+    if morphology.has_basal_dendrites():
+        for arbor in morphology.basal_dendrites:
+            traverse_arbor(arbor, operation, basal_dendrites_branching_order)
 
-    # Add the branching levels
-    section_args.append(current_branching_level)
-    section_args.append(max_branching_order)
+    # Axons
+    if morphology.has_axons():
+        for arbor in morphology.axons:
+            traverse_arbor(arbor, operation, axons_branching_order)
 
-    # Add the section root
-    section_args.append(section)
 
-    # Add the rest of the arguments
-    for i in range(4, len(args)):
-        section_args.append(args[i])
+####################################################################################################
+# @apply_operation_to_arbor
+####################################################################################################
+def apply_operation_to_arbor(*args):
+    """Apply a given function/filter/operation to a given arbor.
 
-    # Apply the operation/filter to the first section of the arbor
-    operation(*section_args)
+    :param args:
+        Arguments list, where the first argument is always the root section of the arbor and the
+        second argument is the function of the operation/filter that will be applied
+        and the rest of the arguments are those that will be passed to the function itself.
+    """
 
-    # Ensure that the section has valid children
-    if section.children is not None:
+    # The section is the first argument, the operation is the second and the rest are the
+    # arguments of the operation
+    section, operation, operation_args = args[0], args[1], args[2:]
 
-        # Apply the operation/filter to the children of the arbors
-        for child in section.children:
+    # Apply the operation/filter to all the sections of the arbor
+    traverse_arbor(section, lambda arbor_section: operation(arbor_section, *operation_args))
 
-            # Construct the child section arguments list, add the child and add the operation
-            section_args = list()
 
-            # Add the branching levels
-            section_args.append(current_branching_level)
-            section_args.append(max_branching_order)
+####################################################################################################
+# @apply_operation_to_arbor_conditionally
+####################################################################################################
+def apply_operation_to_arbor_conditionally(*args):
+    """Apply a given function/filter/operation to a given arbor if the branching order
+    of this arbor is less than the max order requested by the user.
 
-            # Add the child
-            section_args.append(child)
+    NOTE: The sections with higher branching orders than the max branching level are not visited,
+    and the operation receives the branching levels before the section as well.
 
-            # Add the operation
-            section_args.append(operation)
+    :param args:
+        Arguments list, where the first argument is the current branching level (a list of a
+        single item), the second is the max branching level, the third is the root section of the
+        arbor, the fourth argument is the function of the operation/filter that will be applied
+        and the rest of the arguments are those that will be passed to the function itself.
+    """
 
-            for i in range(4, len(args)):
-                section_args.append(args[i])
+    # Get the arguments
+    current_branching_level, max_branching_order, section, operation, operation_args = \
+        args[0], args[1], args[2], args[3], args[4:]
 
-            # Validate the rest of the skeleton of the arbor
-            apply_operation_to_arbor_conditionally(*section_args)
+    # Apply the operation/filter to the sections of the arbor up to the max branching order
+    traverse_arbor(section, lambda arbor_section: operation(
+        current_branching_level, max_branching_order, arbor_section, *operation_args),
+        max_branching_order)
 
 
 ####################################################################################################
 # @apply_operation_to_morphology
 ####################################################################################################
-def apply_operation_to_morphology(*args):
+def apply_operation_to_morphology(*args,
+                                  mutates=False):
     """Apply a given function/filter/operation to a given morphology object including all of its
-    arbors recursively.
+    arbors.
+
+    NOTE: The operations that modify the arbors in place must be flagged with mutates, then a
+    snapshot of the original arbors is taken before the first one of them is applied, see
+    @Morphology.snapshot_arbors.
 
     :param args:
         Arguments list, where the first argument is always the morphology and the second argument
         is the function of the operation/filter that will be applied and the rest of the arguments
         are those that will be passed to the function.
+    :param mutates:
+        If True, the operation modifies the samples or the structure of the arbors.
     """
 
-    # The morphology is the first argument
-    morphology = args[0]
-
-    # Apical dendrite
-    if morphology.has_apical_dendrites():
-
-        # Dendrite by dendrite
-        for arbor in morphology.apical_dendrites:
-
-            # Construct arbor arguments list
-            arbor_args = [arbor]
-            for i in range(1, len(args)):
-                arbor_args.append(args[i])
-
-            # Apply the operation/filter to the arbor
-            apply_operation_to_arbor(*arbor_args)
-
-    # Basal dendrites
-    if morphology.has_basal_dendrites():
-
-        # Dendrite by dendrite
-        for arbor in morphology.basal_dendrites:
-
-            # Construct arbor arguments list
-            arbor_args = [arbor]
-            for i in range(1, len(args)):
-                arbor_args.append(args[i])
-
-            # Apply the operation/filter to the arbor
-            apply_operation_to_arbor(*arbor_args)
+    # The morphology is the first argument, the operation is the second and the rest are the
+    # arguments of the operation
+    morphology, operation, operation_args = args[0], args[1], args[2:]
 
-    # Axon
-    if morphology.has_axons():
-
-        # Dendrite by dendrite
-        for arbor in morphology.axons:
+    # Keep the original arbors before they are modified
+    if mutates:
+        morphology.snapshot_arbors()
 
-            # Construct arbor arguments list
-            arbor_args = [arbor]
-            for i in range(1, len(args)):
-                arbor_args.append(args[i])
-
-            # Apply the operation/filter to the arbor
-            apply_operation_to_arbor(*arbor_args)
+    # Apply the operation/filter to all the arbors
+    with nmv.utilities.profiling_span(operation.__name__, 'skeleton'):
+        traverse_morphology(morphology, lambda section: operation(section, *operation_args))
 
 
 ####################################################################################################
 # @apply_operation_to_morphology_partially
 ####################################################################################################
-def apply_operation_to_morphology_partially(*args):
+def apply_operation_to_morphology_partially(*args,
+                                            mutates=False):
     """Apply a given function/filter/operation to a given morphology object including ONLY the
-    arbors that are below certain branching level recursively.
+    arbors that are below certain branching level.
+
+    NOTE: The snapshots of the original arbors are taken as in @apply_operation_to_morphology.
 
     :param args:
-        Arguments list, where the first argument is always the morphology and the second argument
-        is the function of the operation/filter that will be applied and the rest of the arguments
-        are those that will be passed to the function.
+        Arguments list, where the first argument is always the morphology, the next three
+        arguments are the maximum branching orders of the axons, basal dendrites and apical
+        dendrites, the fifth argument is the function of the operation/filter that will be applied
+        and the rest of the arguments are those that will be passed to the function.
+    :param mutates:
+        If True, the operation modifies the samples or the structure of the arbors.
     """
 
-    # The morphology is the first argument
-    morphology = args[0]
+    # Get the arguments
+    morphology, operation, operation_args = args[0], args[4], args[5:]
 
-    # Axon maximum branching order
-    axons_branching_order = args[1]
-
-    # Basal dendrites maximum branching order
-    basal_dendrites_branching_order = args[2]
-
-    # Apical dendrites maximum branching order
-    apical_dendrites_branching_order = args[3]
-
-    # Apical dendrite
-    if morphology.has_apical_dendrites():
-        for arbor in morphology.apical_dendrites:
-
-            # Construct arbor arguments list
-            arbor_args = list()
-
-            # Add the branching levels to the arguments
-            current_branching_level = [0]
-            arbor_args.append(current_branching_level)
-            arbor_args.append(apical_dendrites_branching_order)
-
-            # Add the section root
-            arbor_args.append(arbor)
-
-            # Add the other arguments
-            for i in range(4, len(args)):
-                arbor_args.append(args[i])
-
-            # Apply the operation/filter to the arbor
-            apply_operation_to_arbor_conditionally(*arbor_args)
-
-    # Basal dendrites
-    if morphology.has_basal_dendrites():
-        for arbor in morphology.basal_dendrites:
-
-            # Construct arbor arguments list
-            arbor_args = list()
-
-            # Add the branching levels to the arguments
-            current_branching_level = [0]
-            arbor_args.append(current_branching_level)
-            arbor_args.append(basal_dendrites_branching_order)
-
-            # Add the section root
-            arbor_args.append(arbor)
-
-            # Add the other arguments
-            for i in range(4, len(args)):
-                arbor_args.append(args[i])
-
-            # Apply the operation/filter to the arbor
-            apply_operation_to_arbor_conditionally(*arbor_args)
-
-    # Axon
-    if morphology.has_axons():
-        for arbor in morphology.basal_dendrites:
+    # Keep the original arbors before they are modified
+    if mutates:
+        morphology.snapshot_arbors()
 
-            # Construct arbor arguments list
-            arbor_args = list()
+    # The maximum branching orders of the axons, the basal dendrites and the apical dendrites
+    arbors_branching_orders = [[morphology.apical_dendrites, args[3]],
+                               [morphology.basal_dendrites, args[2]],
+                               [morphology.axons, args[1]]]
 
-            # Add the branching levels to the arguments
-            current_branching_level = [0]
-            arbor_args.append(current_branching_level)
-            arbor_args.append(axons_branching_order)
+    with nmv.utilities.profiling_span(operation.__name__, 'skeleton'):
+        for arbors, max_branching_order in arbors_branching_orders:
+            if arbors is None:
+                continue
 
-            # Add the section root
-            arbor_args.append(arbor)
+            for arbor in arbors:
 
-            # Add the other arguments
-            for i in range(4, len(args)):
-                arbor_args.append(args[i])
+                # The current branching level of each arbor
+                current_branching_level = [0]
 
-            # Apply the operation/filter to the arbor
-            apply_operation_to_arbor_conditionally(*arbor_args)
+                # Apply the operation/filter to the sections of the arbor up to the max branching
+                # order, the children of the sections at the max order are not visited
+                traverse_arbor(arbor, lambda section: operation(
+                    current_branching_level, max_branching_order, section, *operation_args),
+                    max_branching_order)
@@ -44,6 +44,15 @@ def compute_section_bounding_box(section,
         Return value for the p_max.
     """
 
+    # If the samples of the section are not created yet, use the points array directly
+    if section.points_array is not None and len(section.points_array) > 0:
+        section_p_min = section.points_array.min(axis=0)
+        section_p_max = section.points_array.max(axis=0)
+        for i in range(3):
+            p_min[i] = min(p_min[i], float(section_p_min[i]))
+            p_max[i] = max(p_max[i], float(section_p_max[i]))
+        return
+
     # Iterate over all the samples of the section and get the min and max ones
     for sample in section.samples:
 
@@ -388,8 +397,9 @@ def zigzag_section(section,
             # Compute the normal direction
             random_direction = Vector((random.random(), random.random(), random.random()))
 
-            # Compute the new sample position
-            section.samples[i].point += random_direction * random.uniform(-delta, delta)
+            # Compute the new sample position, and assign it to support the compact samples
+            section.samples[i].point = \
+                section.samples[i].point + random_direction * random.uniform(-delta, delta)
 
     # Non root section
     else:
@@ -403,8 +413,9 @@ def zigzag_section(section,
             # Compute the normal direction
             random_direction = Vector((random.random(), random.random(), random.random()))
 
-            # Compute the new sample position
-            section.samples[i].point += random_direction * random.uniform(-delta, delta)
+            # Compute the new sample position, and assign it to support the compact samples
+            section.samples[i].point = \
+                section.samples[i].point + random_direction * random.uniform(-delta, delta)
 
 
 ####################################################################################################
@@ -422,8 +433,9 @@ def project_to_xy_plane(section):
 
     for i in range(0, number_samples):
 
-        # Compute the new sample position
-        section.samples[i].point[2] = 0
+        # Compute the new sample position, and assign it to support the compact samples
+        point = section.samples[i].point
+        section.samples[i].point = Vector((point[0], point[1], 0.0))
 
 
 ####################################################################################################
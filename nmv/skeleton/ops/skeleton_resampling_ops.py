@@ -18,6 +18,9 @@
 # System imports
 import os, copy, math
 
+# Blender imports
+from mathutils import Vector
+
 # Internal import
 import nmv.consts
 import nmv.geometry
@@ -154,6 +157,137 @@ def update_samples_indices_per_morphology(morphology_object,
             update_samples_indices_per_arbor_globally(arbor, samples_global_morphology_index)
 
 
+####################################################################################################
+# @compute_samples_arc_lengths
+####################################################################################################
+def compute_samples_arc_lengths(points):
+    """Computes the cumulative arc length of every sample along a section.
+
+    :param points:
+        An (N, 3) array of the positions of the samples of the section.
+    :return:
+        An (N) array of the distances between the first sample and every sample along the section.
+    """
+
+    import numpy
+
+    # Segments lengths
+    segments_lengths = numpy.linalg.norm(numpy.diff(points, axis=0), axis=1)
+
+    # Cumulative distances, starting at zero
+    return numpy.concatenate(([0.0], numpy.cumsum(segments_lengths)))
+
+
+####################################################################################################
+# @rebuild_section_samples_at_arc_lengths
+####################################################################################################
+def rebuild_section_samples_at_arc_lengths(section,
+                                           points,
+                                           radii,
+                                           arc_lengths,
+                                           distances):
+    """Replaces the intermediate samples of a section with new ones located at given distances
+    along the section. The first and last samples of the section are kept.
+
+    :param section:
+        A given section to rebuild its samples.
+    :param points:
+        An (N, 3) array of the positions of the current samples of the section.
+    :param radii:
+        An (N) array of the radii of the current samples of the section.
+    :param arc_lengths:
+        The cumulative arc lengths of the current samples, see @compute_samples_arc_lengths.
+    :param distances:
+        An increasing array of the distances of the new samples from the first sample, all of
+        them are strictly between zero and the section length.
+    """
+
+    import numpy
+
+    # Interpolate the positions and the radii of the new samples
+    new_points = numpy.column_stack([numpy.interp(distances, arc_lengths, points[:, i])
+                                     for i in range(3)])
+    new_radii = numpy.interp(distances, arc_lengths, radii)
+
+    # Keep the terminal samples
+    first_sample = section.samples[0]
+    last_sample = section.samples[-1]
+
+    # The new samples are auxiliary samples, their indices are set to -1
+    samples = [first_sample]
+    for point, radius in zip(new_points.tolist(), new_radii.tolist()):
+        samples.append(nmv.skeleton.Sample(
+            point=Vector(point), radius=radius, index=-1, section=section, type=first_sample.type))
+    samples.append(last_sample)
+
+    # Update the samples list once
+    section.samples = samples
+
+    # After resampling the section, update the logical indexes of the samples
+    section.reorder_samples()
+
+
+####################################################################################################
+# @compute_adaptive_arc_lengths
+####################################################################################################
+def compute_adaptive_arc_lengths(arc_lengths,
+                                 radii,
+                                 extent_factor):
+    """Computes the distances of the samples along a section that is resampled adaptively, where
+    each sample is located at a distance equal to its extent from the previous one.
+
+    :param arc_lengths:
+        The cumulative arc lengths of the current samples, see @compute_samples_arc_lengths.
+    :param radii:
+        An (N) array of the radii of the current samples of the section.
+    :param extent_factor:
+        The extent of a sample is its radius multiplied by this factor.
+    :return:
+        A list of the distances of the intermediate samples along the section.
+    """
+
+    # The section length
+    section_length = arc_lengths[-1]
+
+    # The distances of the new samples
+    distances = list()
+
+    # Start at the first sample, the index of the current segment is only moved forward
+    distance = 0.0
+    radius = radii[0]
+    i = 0
+    while True:
+
+        # The extent of the current sample, where no other samples should be located
+        extent = radius * extent_factor
+
+        # A zero-radius sample does not have an extent, then jump to the next original sample
+        if extent <= 0.0:
+            while i < len(arc_lengths) - 1 and arc_lengths[i] <= distance:
+                i += 1
+            distance = arc_lengths[i]
+        else:
+            distance += extent
+
+        # Stop at the last sample of the section
+        if distance >= section_length:
+            break
+
+        # Locate the segment of the new sample
+        while arc_lengths[i + 1] <= distance:
+            i += 1
+
+        # Interpolate the radius of the new sample
+        segment_length = arc_lengths[i + 1] - arc_lengths[i]
+        t = (distance - arc_lengths[i]) / segment_length if segment_length > 0.0 else 0.0
+        radius = radii[i] + t * (radii[i + 1] - radii[i])
+
+        distances.append(distance)
+
+    # Return the distances
+    return distances
+
+
 ####################################################################################################
 # @resample_section_at_fixed_step
 ####################################################################################################
@@ -163,12 +297,17 @@ def resample_section_at_fixed_step(section,
     it will never get resampled. If the section length is smaller than the sampling step, a
     convenient sampling step will be computed and used.
 
+    The new samples are placed along the section at multiples of the sampling step of its
+    cumulative arc length, and their positions and radii are linearly interpolated.
+
     :param section:
         A given section to resample.
     :param sampling_step:
         User-defined sampling step, by default 1.0 micron.
     """
 
+    import numpy
+
     # If the section has no samples, report this as an error and ignore this filter
     if len(section.samples) == 0:
         nmv.logger.error('Section [%s: %d] has NO samples, cannot be re-sampled' %
@@ -181,71 +320,26 @@ def resample_section_at_fixed_step(section,
                          (section.get_type_string(), section.index))
         return
 
-    # If the section length is less than the sampling step, then adaptively resample it
-    if nmv.skeleton.compute_section_length(section=section) < sampling_step:
+    # The samples of the section and their distances along the section
+    points, radii = section.get_samples_arrays()
+    arc_lengths = compute_samples_arc_lengths(points)
+    section_length = arc_lengths[-1]
 
-        # Get a good sampling step that would match this small section
-        section_length = nmv.skeleton.compute_section_length(section=section)
-        section_number_samples = len(section.samples)
-        section_step = section_length / section_number_samples
+    # If the section length is less than the sampling step, then get a good sampling step that
+    # would match this small section
+    if section_length < sampling_step:
+        sampling_step = section_length / len(section.samples)
 
-        # Resample the section at this sampling step
-        resample_section_at_fixed_step(section=section, sampling_step=section_step)
+    # A section with zero length cannot be resampled
+    if sampling_step <= 0.0:
         return
 
-    # Sample index
-    i = 0
-
-    # Just keep moving along the section till you hit the last section
-    while True:
-
-        # Break if we reach the last sample
-        if i >= len(section.samples) - 1:
-            break
-
-        # Compute the distance between the current sample and the next one
-        distance = (section.samples[i + 1].point - section.samples[i].point).length
-
-        # If the distance is less than the resampling step, then remove this sample  at [i + 1]
-        if distance < sampling_step:
-
-            if i >= len(section.samples) - 2:
-                break
-
-            # Remove the sample
-            section.samples.remove(section.samples[i + 1])
-
-            # Proceed to the next sample
-            continue
-
-        # If the sample is at a greater step, then add a new sample exactly at the current step
-        else:
-
-            # Compute the auxiliary sample radius based on the previous and next samples
-            radius = (section.samples[i + 1].radius + section.samples[i].radius) / 2.0
-
-            # Compute the direction
-            direction = (section.samples[i + 1].point - section.samples[i].point).normalized()
-
-            # Compute the auxiliary sample point, use epsilon for floating point comparison
-            point = section.samples[i].point + (direction * sampling_step)
+    # The distances of the new samples, ignore a sample that coincides with the last one
+    distances = numpy.arange(sampling_step, section_length, sampling_step)
+    distances = distances[section_length - distances > 1e-6 * sampling_step]
 
-            # Add the auxiliary sample, the index of the sample is set to -1 (auxiliary sample)
-            auxiliary_sample = nmv.skeleton.Sample(
-                point=point, radius=radius, index=-1, section=section, type=section.samples[i].type)
-
-            # Update the samples list
-            section.samples.insert(i + 1, auxiliary_sample)
-
-            # Move to the nex sample
-            i += 1
-
-            # Break if we reach the last sample
-            if i >= len(section.samples) - 1:
-                break
-
-    # After resampling the section, update the logical indexes of the samples
-    section.reorder_samples()
+    # Rebuild the samples
+    rebuild_section_samples_at_arc_lengths(section, points, radii, arc_lengths, distances)
 
 
 ####################################################################################################
@@ -255,6 +349,9 @@ def resample_section_adaptively(section):
     """Resample the sections adaptively based on the radii of each sample and the distance between
     each two consecutive samples.
 
+    Each new sample is placed along the section at a distance equal to the radius of the previous
+    one, and its position and radius are linearly interpolated.
+
     :param section:
         A given section to resample.
     """
@@ -281,63 +378,15 @@ def resample_section_adaptively(section):
     # The section has more than two samples, can be resampled
     else:
 
-        # Sample index
-        i = 0
-
-        # Just keep moving along the section till you hit the last section
-        while True:
-
-            # Break if we reach the last sample
-            if i >= len(section.samples) - 1:
-                break
-
-            # Compute the distance between the current sample and the next one
-            distance = (section.samples[i + 1].point - section.samples[i].point).length
-
-            # Get the extent of the sample, where no other samples should be located
-            extent = section.samples[i].radius
-
-            # If the next sample is located within the extent of this sample, then remove it
-            if distance < extent:
-
-                if i >= len(section.samples) - 2:
-                    break
-
-                # Remove the sample
-                section.samples.remove(section.samples[i + 1])
-
-                # Proceed to the next sample
-                continue
-
-            # If the sample is at a greater step, then add a new sample exactly at the current step
-            else:
-
-                # Compute the auxiliary sample radius based on the previous and next samples
-                radius = (section.samples[i + 1].radius + section.samples[i].radius) / 2.0
-
-                # Compute the direction
-                direction = (section.samples[i + 1].point - section.samples[i].point).normalized()
-
-                # Compute the auxiliary sample point, use epsilon for floating point comparison
-                point = section.samples[i].point + (direction * section.samples[i].radius)
-
-                # Add the auxiliary sample, the index of the sample is set to -1 (auxiliary sample)
-                auxiliary_sample = nmv.skeleton.Sample(
-                    point=point, radius=radius, index=-1, section=section,
-                    type=section.samples[i].type)
-
-                # Update the samples list
-                section.samples.insert(i + 1, auxiliary_sample)
-
-                # Move to the nex sample
-                i += 1
+        # The samples of the section and their distances along the section
+        points, radii = section.get_samples_arrays()
+        arc_lengths = compute_samples_arc_lengths(points)
 
-                # Break if we reach the last sample
-                if i >= len(section.samples) - 1:
-                    break
+        # The distances of the new samples, every sample is located at its radius from the previous
+        distances = compute_adaptive_arc_lengths(arc_lengths, radii, extent_factor=1.0)
 
-        # After resampling the section, update the logical indexes of the samples
-        section.reorder_samples()
+        # Rebuild the samples
+        rebuild_section_samples_at_arc_lengths(section, points, radii, arc_lengths, distances)
 
 
 ####################################################################################################
@@ -347,6 +396,9 @@ def resample_section_adaptively_relaxed(section):
     """Resample the sections adaptively based on the combined sum of the radii of each two
     consecutive samples and the distance between them.
 
+    Each new sample is placed along the section at a distance equal to the diameter of the
+    previous one, and its position and radius are linearly interpolated.
+
     :param section:
         A given section to resample.
     """
@@ -373,63 +425,16 @@ def resample_section_adaptively_relaxed(section):
     # The section has more than two samples, can be resampled
     else:
 
-        # Sample index
-        i = 0
-
-        # Just keep moving along the section till you hit the last section
-        while True:
-
-            # Break if we reach the last sample
-            if i >= len(section.samples) - 1:
-                break
-
-            # Compute the distance between the current sample and the next one
-            distance = (section.samples[i + 1].point - section.samples[i].point).length
-
-            # Get the extent of the sample, where no other samples should be located
-            extent = section.samples[i].radius + section.samples[i].radius
+        # The samples of the section and their distances along the section
+        points, radii = section.get_samples_arrays()
+        arc_lengths = compute_samples_arc_lengths(points)
 
-            # If the next sample is located within the extent of this sample, then remove it
-            if distance < extent:
+        # The distances of the new samples, every sample is located at its diameter from the
+        # previous one
+        distances = compute_adaptive_arc_lengths(arc_lengths, radii, extent_factor=2.0)
 
-                if i >= len(section.samples) - 2:
-                    break
-
-                # Remove the sample
-                section.samples.remove(section.samples[i + 1])
-
-                # Proceed to the next sample
-                continue
-
-            # If the sample is at a greater step, then add a new sample exactly at the current step
-            else:
-
-                # Compute the auxiliary sample radius based on the previous and next samples
-                radius = (section.samples[i + 1].radius + section.samples[i].radius) / 2.0
-
-                # Compute the direction
-                direction = (section.samples[i + 1].point - section.samples[i].point).normalized()
-
-                # Compute the auxiliary sample point, use epsilon for floating point comparison
-                point = section.samples[i].point + (direction * extent)
-
-                # Add the auxiliary sample, the index of the sample is set to -1 (auxiliary sample)
-                auxiliary_sample = nmv.skeleton.Sample(
-                    point=point, radius=radius, index=-1, section=section,
-                    type=section.samples[i].type)
-
-                # Update the samples list
-                section.samples.insert(i + 1, auxiliary_sample)
-
-                # Move to the nex sample
-                i += 1
-
-                # Break if we reach the last sample
-                if i >= len(section.samples) - 1:
-                    break
-
-        # After resampling the section, update the logical indexes of the samples
-        section.reorder_samples()
+        # Rebuild the samples
+        rebuild_section_samples_at_arc_lengths(section, points, radii, arc_lengths, distances)
 
 
 ####################################################################################################
@@ -18,11 +18,13 @@
 # Internal imports
 import nmv.enums
 import nmv.skeleton
+import nmv.utilities
 
 
 ####################################################################################################
 # @update_arbors_style
 ####################################################################################################
+@nmv.utilities.profiled(category='skeleton')
 def update_arbors_style(morphology,
                         arbor_style):
     """Update the style of the arbors of a given morphology skeleton.
@@ -39,28 +41,29 @@ def update_arbors_style(morphology,
     if arbor_style == nmv.enums.Skeleton.Style.TAPERED or \
        arbor_style == nmv.enums.Skeleton.Style.TAPERED_ZIGZAG:
         nmv.skeleton.ops.apply_operation_to_morphology(
-            *[morphology, nmv.skeleton.ops.taper_section])
+            *[morphology, nmv.skeleton.ops.taper_section], mutates=True)
 
     # Zigzag the sections
     if arbor_style == nmv.enums.Skeleton.Style.ZIGZAG or \
        arbor_style == nmv.enums.Skeleton.Style.TAPERED_ZIGZAG:
         nmv.skeleton.ops.apply_operation_to_morphology(
-            *[morphology, nmv.skeleton.ops.zigzag_section])
+            *[morphology, nmv.skeleton.ops.zigzag_section], mutates=True)
 
     # Project it to the XY plane
     if arbor_style == nmv.enums.Skeleton.Style.PLANAR:
         nmv.skeleton.ops.apply_operation_to_morphology(
-            *[morphology, nmv.skeleton.ops.project_to_xy_plane])
+            *[morphology, nmv.skeleton.ops.project_to_xy_plane], mutates=True)
 
     # Straight
     if arbor_style == nmv.enums.Skeleton.Style.STRAIGHT:
         nmv.skeleton.ops.apply_operation_to_morphology(
-            *[morphology, nmv.skeleton.ops.simplify_section_to_straight_line])
+            *[morphology, nmv.skeleton.ops.simplify_section_to_straight_line], mutates=True)
 
 
 ####################################################################################################
 # @update_arbors_radii
 ####################################################################################################
+@nmv.utilities.profiled(category='skeleton')
 def update_arbors_radii(morphology,
                         morphology_options):
     """Update the radii of the arbors of a given morphology skeleton.
@@ -81,24 +84,24 @@ def update_arbors_radii(morphology,
         nmv.skeleton.ops.apply_operation_to_morphology(
             *[morphology, nmv.skeleton.ops.set_section_radii_between_given_range,
               morphology_options.minimum_threshold_radius,
-              morphology_options.maximum_threshold_radius])
+              morphology_options.maximum_threshold_radius], mutates=True)
 
     elif option == nmv.enums.Skeleton.Radii.UNIFIED:
         nmv.skeleton.ops.apply_operation_to_morphology(
             *[morphology, nmv.skeleton.ops.unify_section_radii,
-              morphology_options.samples_unified_radii_value])
+              morphology_options.samples_unified_radii_value], mutates=True)
 
     elif option == nmv.enums.Skeleton.Radii.UNIFIED_PER_ARBOR_TYPE:
         nmv.skeleton.ops.apply_operation_to_morphology(
             *[morphology, nmv.skeleton.ops.unify_section_radii_based_on_type,
               morphology_options.axon_samples_unified_radii_value,
               morphology_options.apical_dendrite_samples_unified_radii_value,
-              morphology_options.basal_dendrites_samples_unified_radii_value])
+              morphology_options.basal_dendrites_samples_unified_radii_value], mutates=True)
 
     elif option == nmv.enums.Skeleton.Radii.SCALED:
         nmv.skeleton.ops.apply_operation_to_morphology(
             *[morphology, nmv.skeleton.ops.scale_section_radii,
-              morphology_options.sections_radii_scale])
+              morphology_options.sections_radii_scale], mutates=True)
     else:
         return
 
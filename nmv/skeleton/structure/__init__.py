@@ -16,6 +16,7 @@
 ####################################################################################################
 
 from .sample import *
+from .samples_storage import *
 from .section import *
 from .soma import *
 from .morphology import *
@@ -78,14 +78,21 @@ class Morphology:
         # Morphology apical dendrites
         self.apical_dendrites = apical_dendrites
 
-        # A copy of the original axons list, needed for comparison
-        self.original_axons = copy.deepcopy(axons)
-
-        # A copy of the original basal dendrites list, needed for comparison
-        self.original_basal_dendrites = copy.deepcopy(basal_dendrites)
-
-        # A copy of the original apical dendrites list, needed for comparison
-        self.origin_apical_dendrites = copy.deepcopy(apical_dendrites)
+        # The lists of the arbors as they were loaded, needed for comparison.
+        # NOTE: The original copies of the arbors are only created when an arbor is modified for
+        # the first time, see @snapshot_arbor, otherwise the arbor itself is the original one
+        self.loaded_axons = list(axons) if axons is not None else None
+        self.loaded_basal_dendrites = \
+            list(basal_dendrites) if basal_dendrites is not None else None
+        self.loaded_apical_dendrites = \
+            list(apical_dendrites) if apical_dendrites is not None else None
+
+        # The copies of the original arbors that have been modified, keyed by the arbors
+        self.original_arbors_snapshots = dict()
+
+        # If False, the arbors are modified without keeping their original states, see
+        # @create_working_copy
+        self.keep_original_arbors = True
 
         # Morphology GID
         self.gid = gid
@@ -131,6 +138,13 @@ class Morphology:
         # The color of the soma, see @create_morphology_color_palette
         self.soma_color = None
 
+        # The compact storage of the samples, only created after calling @pack_samples
+        self.samples_storage = None
+
+        # The profiles of the arbors while the morphology is analyzed in a single pass, see
+        # @create_arbors_analysis_profiles
+        self.analysis_profiles = None
+
     ################################################################################################
     # @build_samples_lists_recursively
     ################################################################################################
@@ -151,6 +165,189 @@ class Morphology:
         for child in section.children:
             self.build_samples_lists_recursively(child, samples_list)
 
+    ################################################################################################
+    # @snapshot_arbor
+    ################################################################################################
+    def snapshot_arbor(self,
+                       arbor):
+        """Keeps a copy of the original state of a given arbor. This function must be called by
+        any operation that modifies the arbor before the modification. The arbor is only copied
+        the first time, later calls do nothing.
+
+        :param arbor:
+            A given arbor of the morphology.
+        """
+
+        if not self.keep_original_arbors:
+            return
+
+        if arbor not in self.original_arbors_snapshots:
+            snapshot = copy.deepcopy(arbor)
+
+            # The samples of the copy are moved to a compact storage of their own, otherwise they
+            # would keep a copy of the storage of the entire morphology
+            if self.samples_storage is not None:
+                self.pack_arbors_samples([[snapshot]])
+            self.original_arbors_snapshots[arbor] = snapshot
+
+    ################################################################################################
+    # @create_working_copy
+    ################################################################################################
+    def create_working_copy(self):
+        """Creates a deep copy of the morphology that is modified by a builder. The copy is never
+        restored, therefore its arbors are modified without taking any snapshots.
+
+        :return:
+            A copy of the morphology.
+        """
+
+        working_copy = copy.deepcopy(self)
+        working_copy.keep_original_arbors = False
+        return working_copy
+
+    ################################################################################################
+    # @snapshot_arbors
+    ################################################################################################
+    def snapshot_arbors(self):
+        """Keeps a copy of the original state of all the arbors of the morphology, before they are
+        modified by an operation that is applied to the entire morphology.
+        """
+
+        for arbors in [self.loaded_apical_dendrites, self.loaded_basal_dendrites,
+                       self.loaded_axons]:
+            if arbors is not None:
+                for arbor in arbors:
+                    self.snapshot_arbor(arbor)
+
+    ################################################################################################
+    # @get_original_arbors
+    ################################################################################################
+    def get_original_arbors(self,
+                            loaded_arbors):
+        """Gets the original state of a given list of arbors, as loaded.
+
+        :param loaded_arbors:
+            The list of the arbors as loaded.
+        :return:
+            A list of the original arbors, or None if the list is None.
+        """
+
+        if loaded_arbors is None:
+            return None
+        return [self.original_arbors_snapshots.get(arbor, arbor) for arbor in loaded_arbors]
+
+    ################################################################################################
+    # @original_axons
+    ################################################################################################
+    @property
+    def original_axons(self):
+        """The original axons of the morphology, as loaded."""
+        return self.get_original_arbors(self.loaded_axons)
+
+    ################################################################################################
+    # @original_basal_dendrites
+    ################################################################################################
+    @property
+    def original_basal_dendrites(self):
+        """The original basal dendrites of the morphology, as loaded."""
+        return self.get_original_arbors(self.loaded_basal_dendrites)
+
+    ################################################################################################
+    # @origin_apical_dendrites
+    ################################################################################################
+    @property
+    def origin_apical_dendrites(self):
+        """The original apical dendrites of the morphology, as loaded."""
+        return self.get_original_arbors(self.loaded_apical_dendrites)
+
+    ################################################################################################
+    # @restore_original_arbors
+    ################################################################################################
+    def restore_original_arbors(self):
+        """Restores the arbors of the morphology to their original state, as loaded, such that
+        several operations can be applied to the same morphology without loading it again.
+
+        The snapshots of the modified arbors become the arbors of the morphology, and they will be
+        copied again if they are modified later.
+        """
+
+        # Nothing has been modified
+        if len(self.original_arbors_snapshots) == 0:
+            return
+
+        for loaded_arbors in [self.loaded_axons, self.loaded_basal_dendrites,
+                              self.loaded_apical_dendrites]:
+            if loaded_arbors is None:
+                continue
+            for i, arbor in enumerate(loaded_arbors):
+                if arbor in self.original_arbors_snapshots:
+                    loaded_arbors[i] = self.original_arbors_snapshots.pop(arbor)
+
+        # The arbors of the morphology are the loaded ones
+        self.axons = self.get_original_arbors(self.loaded_axons)
+        self.basal_dendrites = self.get_original_arbors(self.loaded_basal_dendrites)
+        self.apical_dendrites = self.get_original_arbors(self.loaded_apical_dendrites)
+
+        # Update the bounding boxes and the branching order of the restored arbors
+        self.compute_bounding_box()
+        self.update_branching_order()
+
+    ################################################################################################
+    # @pack_arbors_samples
+    ################################################################################################
+    @staticmethod
+    def pack_arbors_samples(arbors_lists):
+        """Moves the data of all the samples of the given arbors into a single compact storage of
+        float32 and int32 arrays. The samples of every section are stored contiguously, and the
+        samples keep their attribute API through properties.
+
+        :param arbors_lists:
+            A list of the lists of the arbors.
+        :return:
+            A reference to the created SamplesStorage.
+        """
+
+        # Collect all the samples of the arbors, section by section
+        samples = list()
+        for arbors in arbors_lists:
+            if arbors is None:
+                continue
+            for arbor in arbors:
+                sections = [arbor]
+                while len(sections) > 0:
+                    section = sections.pop()
+                    samples.extend(section.samples)
+                    sections.extend(reversed(section.children))
+
+        # Move the samples to the storage, in case a sample is shared between two sections, it is
+        # only stored once
+        samples_storage = nmv.skeleton.SamplesStorage(number_samples=len(samples))
+        storage_index = 0
+        for sample in samples:
+            if sample._storage is samples_storage:
+                continue
+            sample.bind_to_storage(samples_storage, storage_index)
+            storage_index += 1
+
+        # Return a reference to the storage
+        return samples_storage
+
+    ################################################################################################
+    # @pack_samples
+    ################################################################################################
+    def pack_samples(self):
+        """Moves the data of all the samples of the morphology into a single compact storage of
+        float32 and int32 arrays, to reduce the memory footprint of the morphology. This function
+        is called by the readers after the morphology is loaded.
+
+        :return:
+            A reference to the created SamplesStorage.
+        """
+
+        self.samples_storage = self.pack_arbors_samples(
+            [self.axons, self.basal_dendrites, self.apical_dendrites])
+        return self.samples_storage
+
     ################################################################################################
     # @has_axons
     ################################################################################################
@@ -16,6 +16,10 @@
 ####################################################################################################
 
 
+# Blender imports
+from mathutils import Vector
+
+
 ####################################################################################################
 # Sample
 ####################################################################################################
@@ -28,8 +32,18 @@ class Sample:
     two indexes or IDs, the first is used to label the order of the sample along the
     morphological section, and the second represents the order of the sample in the morphology
     file.
+
+    The point, radius, type and parent index of the sample are either kept in the sample itself,
+    or in a compact SamplesStorage of the morphology after the sample is bound to it.
+    NOTE: The point of a bound sample is returned as a new frozen Vector, so it must be updated by
+    assignment, i.e. sample.point = new_point, and an in-place update, for example
+    sample.point[0] += 1.0, raises an error instead of being lost. Assigning the point also
+    invalidates the cached derived quantities of the section of the sample, i.e. its length.
     """
 
+    __slots__ = ('index', 'arbor_idx', 'morphology_idx', 'morphology_index', 'section',
+                 '_point', '_radius', '_type', '_parent_index', '_storage', '_storage_index')
+
     ################################################################################################
     # @__init__
     ################################################################################################
@@ -58,11 +72,15 @@ class Sample:
             This member is updated after re-constructing the morphology skeleton.
         """
 
+        # The compact storage of the sample data and the index of the sample in it, if bound
+        self._storage = None
+        self._storage_index = -1
+
         # Sample cartesian point
-        self.point = point
+        self._point = point
 
         # Sample radius
-        self.radius = radius
+        self._radius = radius
 
         # Sample index along the section (from 0 to N, updated after section construction)
         self.index = index
@@ -80,7 +98,130 @@ class Sample:
         self.section = section
 
         # Sample type
-        self.type = type
+        self._type = type
 
         # The index of the parent sample, required for the connectivity of SWC files
-        self.parent_index = parent_index
+        self._parent_index = parent_index
+
+    ################################################################################################
+    # @point
+    ################################################################################################
+    @property
+    def point(self):
+        """Sample cartesian point."""
+        if self._storage is not None:
+            return Vector(self._storage.points[self._storage_index]).freeze()
+        return self._point
+
+    @point.setter
+    def point(self, point):
+        if self._storage is not None:
+            self._storage.points[self._storage_index] = tuple(point)
+        else:
+            self._point = point
+
+        # The derived quantities of the section, i.e. its length, are not valid anymore
+        if self.section is not None:
+            self.section.invalidate_derived_quantities()
+
+    ################################################################################################
+    # @radius
+    ################################################################################################
+    @property
+    def radius(self):
+        """Sample radius."""
+        if self._storage is not None:
+            return float(self._storage.radii[self._storage_index])
+        return self._radius
+
+    @radius.setter
+    def radius(self, radius):
+        if self._storage is not None:
+            self._storage.radii[self._storage_index] = radius
+        else:
+            self._radius = radius
+
+    ################################################################################################
+    # @type
+    ################################################################################################
+    @property
+    def type(self):
+        """Sample type."""
+        if self._storage is not None:
+            return int(self._storage.types[self._storage_index])
+        return self._type
+
+    @type.setter
+    def type(self, type):
+        if self._storage is not None:
+            self._storage.types[self._storage_index] = type
+        else:
+            self._type = type
+
+    ################################################################################################
+    # @parent_index
+    ################################################################################################
+    @property
+    def parent_index(self):
+        """The index of the parent sample."""
+        if self._storage is not None:
+            return int(self._storage.parent_indices[self._storage_index])
+        return self._parent_index
+
+    @parent_index.setter
+    def parent_index(self, parent_index):
+        if self._storage is not None:
+            self._storage.parent_indices[self._storage_index] = parent_index
+        else:
+            self._parent_index = parent_index
+
+    ################################################################################################
+    # @storage
+    ################################################################################################
+    @property
+    def storage(self):
+        """The compact storage of the sample data, or None if the sample is not bound."""
+        return self._storage
+
+    ################################################################################################
+    # @storage_index
+    ################################################################################################
+    @property
+    def storage_index(self):
+        """The index of the sample in its compact storage, or -1 if the sample is not bound."""
+        return self._storage_index
+
+    ################################################################################################
+    # @bind_to_storage
+    ################################################################################################
+    def bind_to_storage(self,
+                        storage,
+                        storage_index):
+        """Moves the data of the sample into a given compact storage, and releases the data that
+        is kept in the sample itself.
+
+        :param storage:
+            A SamplesStorage object.
+        :param storage_index:
+            The index of the sample in the storage.
+        """
+
+        # Get the data before the binding
+        point, radius, type, parent_index = \
+            self.point, self.radius, self.type, self.parent_index
+
+        # Bind the sample
+        self._storage = storage
+        self._storage_index = storage_index
+
+        # Write the data to the storage
+        self.point = point
+        self.radius = radius
+        self.type = type if type is not None else -1
+        self.parent_index = parent_index if parent_index is not None else -1
+
+        # Release the data of the sample
+        self._point = None
+        self._radius = None
+        self._type = None
+        self._parent_index = None
@@ -0,0 +1,67 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+
+####################################################################################################
+# SamplesStorage
+####################################################################################################
+class SamplesStorage:
+    """Compact storage of the samples of a morphology.
+
+    The positions, radii, types and parent indices of all the samples of a morphology are stored
+    in contiguous float32 and int32 arrays. The samples that are bound to the storage do not
+    keep their own data, and access it through their properties instead.
+    """
+
+    __slots__ = ('points', 'radii', 'types', 'parent_indices')
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 number_samples):
+        """Constructor
+
+        :param number_samples:
+            The total number of samples in the storage.
+        """
+
+        import numpy
+
+        # The cartesian points of the samples, (N, 3)
+        self.points = numpy.zeros((number_samples, 3), dtype=numpy.float32)
+
+        # The radii of the samples, (N)
+        self.radii = numpy.zeros(number_samples, dtype=numpy.float32)
+
+        # The types of the samples, (N)
+        self.types = numpy.full(number_samples, -1, dtype=numpy.int32)
+
+        # The indices of the parent samples, (N)
+        self.parent_indices = numpy.full(number_samples, -1, dtype=numpy.int32)
+
+    ################################################################################################
+    # @__len__
+    ################################################################################################
+    def __len__(self):
+        """Returns the number of samples in the storage.
+
+        :return:
+            The number of samples in the storage.
+        """
+
+        return len(self.radii)
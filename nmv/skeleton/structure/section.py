@@ -20,6 +20,28 @@ from mathutils import Vector
 
 # Internal imports
 import nmv.enums
+import nmv.skeleton
+
+
+####################################################################################################
+# DerivedQuantities
+####################################################################################################
+class DerivedQuantities:
+    """A flag that is shared between all the sections of an arbor to indicate if their cached
+    derived quantities are still valid or not.
+    """
+
+    __slots__ = ('valid',)
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self):
+        """Constructor
+        """
+
+        # The cache is valid once created
+        self.valid = True
 
 
 ####################################################################################################
@@ -28,6 +50,13 @@ import nmv.enums
 class Section:
     """ A morphological section represents a series of morphological samples. """
 
+    __slots__ = ('index', 'parent_index', 'children_ids', '_samples', 'points_array', 'radii_array',
+                 'type', '_parent', 'label', 'tag', '_children', 'branching_order',
+                 'connected_to_soma', 'far_from_soma', 'mesh', 'soma_face_index',
+                 'soma_face_centroid', 'is_primary', 'maximum_branching_order', 'length',
+                 'path_length', 'dendrogram_x', 'dendrogram_y', 'color', '_derived',
+                 '_derived_values')
+
     ################################################################################################
     # @__init__
     ################################################################################################
@@ -38,7 +67,9 @@ class Section:
                  samples=None,
                  type=None,
                  label='Section',
-                 tag='Section'):
+                 tag='Section',
+                 points_array=None,
+                 radii_array=None):
         """Constructor
 
         :param index:
@@ -55,8 +86,19 @@ class Section:
             Arbor label to indicate which one is that.
         :param tag:
             A tag to identify the arbor when using it as a variable name.
+        :param points_array:
+            An (N, 3) NumPy array (usually a view into the arrays of the morphology file) that
+            contains the positions of the samples of the section. If given instead of the samples,
+            the samples are only created when they are accessed for the first time.
+        :param radii_array:
+            An (N) NumPy array that contains the radii of the samples of the section, given
+            with the points_array.
         """
 
+        # The cached derived quantities of the section, see @get_derived_quantities
+        self._derived = None
+        self._derived_values = None
+
         # Section index
         self.index = index
 
@@ -70,11 +112,16 @@ class Section:
             self.children_ids = list()
 
         # Segments samples (points along the section)
-        self.samples = samples
+        self._samples = samples
+
+        # The positions and radii of the samples, if the samples are not created yet.
+        # NOTE: These arrays are only valid until the samples list is created, then they are reset
+        self.points_array = points_array
+        self.radii_array = radii_array
 
         # Add a reference to the section as a member variable of the sample, for accessibility !
-        if self.samples is not None:
-            for sample in self.samples:
+        if self._samples is not None:
+            for sample in self._samples:
                 sample.section = self
 
         # Section type: AXON (2), DENDRITE (3), APICAL_DENDRITE (4), or NONE
@@ -146,6 +193,96 @@ class Section:
         # Arbor color
         self.color = Vector((1.0, 1.0, 1.0))
 
+    ################################################################################################
+    # @samples
+    ################################################################################################
+    @property
+    def samples(self):
+        """The list of the samples of the section, created on demand if the section is only
+        backed by the points and radii arrays.
+        """
+
+        if self._samples is None and self.points_array is not None:
+            self.build_samples_from_arrays()
+        return self._samples
+
+    @samples.setter
+    def samples(self, samples):
+        self._samples = samples
+
+        # The samples are given explicitly, the arrays are not valid anymore
+        self.points_array = None
+        self.radii_array = None
+
+        # The length of the section has changed
+        self.invalidate_derived_quantities()
+
+    ################################################################################################
+    # @parent
+    ################################################################################################
+    @property
+    def parent(self):
+        """A reference to the section parent, if it exists."""
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent):
+        self._parent = parent
+        self.invalidate_derived_quantities()
+
+    ################################################################################################
+    # @children
+    ################################################################################################
+    @property
+    def children(self):
+        """A list of the children sections."""
+        return self._children
+
+    @children.setter
+    def children(self, children):
+        self._children = children
+        self.invalidate_derived_quantities()
+
+    ################################################################################################
+    # @build_samples_from_arrays
+    ################################################################################################
+    def build_samples_from_arrays(self):
+        """Creates the samples of the section from its points and radii arrays.
+        """
+
+        # Construct the samples, one vector per sample
+        samples = list()
+        for i, (point, radius) in enumerate(zip(self.points_array.tolist(),
+                                                self.radii_array.tolist())):
+            samples.append(nmv.skeleton.Sample(point=Vector(point), radius=radius, index=i,
+                                               morphology_id=i, type=self.type, section=self))
+
+        # Set the samples and release the arrays
+        self.samples = samples
+
+    ################################################################################################
+    # @get_samples_arrays
+    ################################################################################################
+    def get_samples_arrays(self):
+        """Returns the positions and the radii of the samples of the section as NumPy arrays,
+        without creating the samples if they are not created yet.
+
+        :return:
+            An (N, 3) array of the points and an (N) array of the radii of the samples.
+        """
+
+        import numpy
+
+        # The section is still backed by the arrays
+        if self._samples is None and self.points_array is not None:
+            return self.points_array, self.radii_array
+
+        # Otherwise, get the data from the samples
+        points = numpy.array([tuple(sample.point) for sample in self.samples],
+                             dtype=numpy.float64).reshape(-1, 3)
+        radii = numpy.array([sample.radius for sample in self.samples], dtype=numpy.float64)
+        return points, radii
+
     ################################################################################################
     # @get_type_string
     ################################################################################################
@@ -337,6 +474,171 @@ class Section:
             # Set the sample index according to its order along the section in the samples list
             section_sample.index = i
 
+    ################################################################################################
+    # @invalidate_derived_quantities
+    ################################################################################################
+    def invalidate_derived_quantities(self):
+        """Invalidates the cached derived quantities of all the sections of the arbor, where this
+        section belongs. They are computed again on the next access.
+
+        NOTE: This is called automatically when the samples list, the parent or the children list
+        of the section is assigned, or when the point of one of its samples is assigned. It must be
+        called explicitly if these lists are modified in-place.
+        """
+
+        if self._derived is not None:
+            self._derived.valid = False
+
+    ################################################################################################
+    # @compute_arbor_derived_quantities
+    ################################################################################################
+    def compute_arbor_derived_quantities(self):
+        """Computes the derived quantities of all the sections of the arbor that starts at this
+        section in one top-down pass (lengths, path lengths and branching orders) followed by
+        one bottom-up pass (the number of leaves and the length of the subtree of each section).
+        """
+
+        import numpy
+
+        # All the sections of the arbor share the validity of the cache
+        derived = DerivedQuantities()
+
+        # Top-down, pre-order
+        sections = list()
+        stack = [self]
+        while stack:
+            section = stack.pop()
+            sections.append(section)
+
+            # The length of the section
+            points, _ = section.get_samples_arrays()
+            length = float(numpy.linalg.norm(numpy.diff(points, axis=0), axis=1).sum()) \
+                if len(points) > 1 else 0.0
+
+            # The path length and the branching order, the parent is always visited before
+            parent = section._parent
+            if section is self or parent is None or parent._derived is not derived:
+                path_length = length
+                branching_order = 1
+            else:
+                path_length = parent._derived_values[1] + length
+                branching_order = parent._derived_values[2] + 1
+
+            section._derived = derived
+            section._derived_values = [length, path_length, branching_order, 1, length,
+                                       section.get_number_samples(), len(section._children)]
+            stack.extend(reversed(section._children))
+
+        # Bottom-up, the children are always visited before their parents
+        for section in reversed(sections):
+            values = section._derived_values
+            if len(section._children) > 0:
+                values[3] = sum(child._derived_values[3] for child in section._children)
+                values[4] = values[0] + sum(child._derived_values[4]
+                                            for child in section._children)
+            section._derived_values = tuple(values)
+
+    ################################################################################################
+    # @get_derived_quantities
+    ################################################################################################
+    def get_derived_quantities(self):
+        """Returns the cached derived quantities of the section, and computes them for the whole
+        arbor if they are not valid.
+
+        :return:
+            A tuple of (length, path length, branching order, number of leaves in the subtree,
+            total length of the subtree, number of samples, number of children).
+        """
+
+        # Check if the cache is still valid, and the lists of the section are not modified in-place
+        if self._derived is None or not self._derived.valid or \
+                self._derived_values[5] != self.get_number_samples() or \
+                self._derived_values[6] != len(self._children):
+
+            # Compute the derived quantities of the whole arbor from its root
+            root = self
+            while root._parent is not None:
+                root = root._parent
+            root.compute_arbor_derived_quantities()
+
+        # Return the values
+        return self._derived_values
+
+    ################################################################################################
+    # @get_number_samples
+    ################################################################################################
+    def get_number_samples(self):
+        """Returns the number of samples of the section without creating them.
+
+        :return:
+            The number of samples of the section.
+        """
+
+        if self._samples is None:
+            return len(self.points_array) if self.points_array is not None else 0
+        return len(self._samples)
+
+    ################################################################################################
+    # @get_length
+    ################################################################################################
+    def get_length(self):
+        """Returns the cached length of the section.
+
+        :return:
+            The length of the section.
+        """
+
+        return self.get_derived_quantities()[0]
+
+    ################################################################################################
+    # @get_path_length
+    ################################################################################################
+    def get_path_length(self):
+        """Returns the cached path length of the section, i.e. the distance from the root of the
+        arbor till the end of this section.
+
+        :return:
+            The path length of the section.
+        """
+
+        return self.get_derived_quantities()[1]
+
+    ################################################################################################
+    # @get_branching_order
+    ################################################################################################
+    def get_branching_order(self):
+        """Returns the cached branching order of the section, where the root section is 1.
+
+        :return:
+            The branching order of the section.
+        """
+
+        return self.get_derived_quantities()[2]
+
+    ################################################################################################
+    # @get_subtree_leaves_count
+    ################################################################################################
+    def get_subtree_leaves_count(self):
+        """Returns the cached number of the leaves of the subtree that starts at this section.
+
+        :return:
+            The number of leaves of the subtree.
+        """
+
+        return self.get_derived_quantities()[3]
+
+    ################################################################################################
+    # @get_subtree_length
+    ################################################################################################
+    def get_subtree_length(self):
+        """Returns the cached total length of the subtree that starts at this section.
+
+        :return:
+            The total length of the subtree.
+        """
+
+        return self.get_derived_quantities()[4]
+
     ################################################################################################
     # @compute_length
     ################################################################################################
@@ -367,14 +669,15 @@ class Section:
         """Computes the path length of the parent sections recursively.
         """
 
-        # The parent must not be None
-        if self.parent is not None:
+        # Walk up to the root of the arbor, the path lengths are read from the cache
+        parent = self.parent
+        while parent is not None:
 
             # Compute the path length
-            self.parent.compute_path_length()
+            parent.compute_path_length()
 
-            # Go recursively
-            self.compute_parents_path_length()
+            # Go up
+            parent = parent.parent
 
     ################################################################################################
     # @compute_path_length
@@ -383,29 +686,15 @@ class Section:
         """Computes the path length of the section. The path length is the distance from the root
         node till the end of this section along the arbor.
 
-        Note that the result of this function is only correct if path_length is computed for all
-        the parent sections.
+        The path lengths of all the sections of the arbor are computed once and cached, see
+        @get_derived_quantities.
 
         :return:
             Returns the path length of the section in case of being called from an object.
         """
 
-        # Re-initialize to zero, in case it is still None
-        self.path_length = 0
-
-        # If this is a root section, the path length is simply the section length
-        if self.is_root():
-            self.path_length = self.compute_length()
-
-        # Otherwise, it is the sum of the path length of the parent and the length of this section
-        else:
-
-            # If the path length of the parent is still None, compute the parents please
-            if self.parent.path_length is None:
-                self.compute_parents_path_length()
-
-            # Now we can correctly
-            self.path_length = self.compute_length() + self.parent.path_length
+        # Get the cached value
+        self.path_length = self.get_path_length()
 
         # Return the result
         return self.path_length
@@ -121,9 +121,16 @@ def create_batch_job_config_string(slurm_config):
     # Reservation
     # b += "#SBATCH --reservation=%s%s" % ("viz_team", sl)
 
+    # Job array, every task of the array has its own logs
+    if slurm_config.array_range is not None:
+        b += "#SBATCH --array=%s%s" % (slurm_config.array_range, sl)
+        log_suffix = '%s_%%A_%%a' % str(slurm_config.job_number)
+    else:
+        log_suffix = str(slurm_config.job_number)
+
     """ Logs """
-    std_out = "%s/slurm-stdout_%s.log" % (slurm_config.logs_directory, str(slurm_config.job_number))
-    std_err = "%s/slurm-stderr_%s.log" % (slurm_config.logs_directory, str(slurm_config.job_number))
+    std_out = "%s/slurm-stdout_%s.log" % (slurm_config.logs_directory, log_suffix)
+    std_err = "%s/slurm-stderr_%s.log" % (slurm_config.logs_directory, log_suffix)
     b += "#SBATCH --output=%s%s" % (std_out, sl)
     b += "#SBATCH --error=%s%s" % (std_err, dl)
 
@@ -377,23 +384,290 @@ def submit_batch_jobs(user_name,
                 script_index += 1
 
 
+####################################################################################################
+# @compose_array_range
+####################################################################################################
+def compose_array_range(number_array_tasks,
+                        throttle=0):
+    """Composes the range of the indices of the tasks of a job array, with the '%' throttle that
+    limits the number of the tasks running simultaneously.
+
+    :param number_array_tasks:
+        The number of the tasks in the array.
+    :param throttle:
+        The maximum number of the tasks running simultaneously, zero for no limit.
+    :return:
+        The array range string, for example '0-99%10'.
+    """
+
+    # An array must have at least one task, otherwise the range is invalid
+    if number_array_tasks < 1:
+        raise ValueError('A job array must have at least one task')
+
+    array_range = '0-%d' % (number_array_tasks - 1)
+    if throttle > 0:
+        array_range += '%%%d' % throttle
+    return array_range
+
+
+####################################################################################################
+# @write_array_manifest
+####################################################################################################
+def write_array_manifest(manifest_file,
+                         items):
+    """Writes the items processed by a job array to a manifest file, an item per line. The array
+    task with index i processes the lines [i * chunk_size + 1, (i + 1) * chunk_size].
+
+    :param manifest_file:
+        The path to the manifest file.
+    :param items:
+        A list of items, GIDs or morphology files.
+    """
+
+    with open(manifest_file, 'w') as file_handle:
+        for item in items:
+            file_handle.write('%s\n' % str(item))
+
+
+####################################################################################################
+# @create_batch_job_array_script
+####################################################################################################
+def create_batch_job_array_script(arguments,
+                                  items,
+                                  create_executable_for_item,
+                                  array_name='array',
+                                  chunk_size=1,
+                                  throttle=0):
+    """Creates a single batch job array script that processes a list of items, where every task in
+    the array processes a chunk of consecutive items read from a manifest file.
+
+    :param arguments:
+        Command line arguments.
+    :param items:
+        A list of items, GIDs or morphology files.
+    :param create_executable_for_item:
+        A function that creates the shell commands for a single item, for example
+        @arguments_parser.create_executable_for_single_gid.
+    :param array_name:
+        The name of the job array, used to name the script and the manifest.
+    :param chunk_size:
+        The number of the items processed by every task of the array.
+    :param throttle:
+        The maximum number of the tasks running simultaneously, zero for no limit.
+    :return:
+        The path to the created script.
+    """
+
+    chunk_size = max(1, int(chunk_size))
+    number_array_tasks = (len(items) + chunk_size - 1) // chunk_size
+
+    # The manifest of the items, in the slurm jobs directory
+    slurm_jobs_directory = '%s/%s' % (arguments.output_directory,
+                                      paths_consts.Paths.SLURM_JOBS_FOLDER)
+    manifest_file = '%s/%s.manifest' % (slurm_jobs_directory, array_name)
+    write_array_manifest(manifest_file=manifest_file, items=items)
+
+    # Create slurm configuration
+    slurm_config = slurm_configuration.SlurmConfiguration()
+
+    # The job number is replaced by the name of the array
+    slurm_config.job_number = array_name
+
+    # The indices of the tasks of the array
+    slurm_config.array_range = compose_array_range(number_array_tasks, throttle)
+
+    # Execution directory, same as output directory
+    slurm_config.execution_directory = '%s' % arguments.output_directory
+
+    # Log directory
+    slurm_config.logs_directory = '%s/%s' % (arguments.output_directory,
+                                             paths_consts.Paths.SLURM_LOGS_FOLDER)
+
+    # Generate the batch job configuration string
+    batch_job_config_string = create_batch_job_config_string(slurm_config)
+
+    # The shell commands of a single item, where the item is set at runtime from the manifest.
+    # The item is quoted to keep the items that contain spaces as a single argument
+    shell_commands = create_executable_for_item(arguments, '"${ITEM}"')
+
+    # Every task processes its chunk of the manifest, a line per item, and fails if any of its
+    # items fails. The loop reads the lines from a process substitution rather than a pipe, to
+    # run in the current shell and keep the exit status
+    batch_job_config_string += 'CHUNK_SIZE=%d\n' % chunk_size
+    batch_job_config_string += 'FIRST_ITEM=$((SLURM_ARRAY_TASK_ID * CHUNK_SIZE + 1))\n'
+    batch_job_config_string += 'LAST_ITEM=$((FIRST_ITEM + CHUNK_SIZE - 1))\n'
+    batch_job_config_string += 'EXIT_STATUS=0\n'
+    batch_job_config_string += 'while IFS= read -r ITEM; do\n'
+    batch_job_config_string += '    echo "Processing [${ITEM}]"\n'
+    for command in shell_commands:
+        batch_job_config_string += '    %s < /dev/null || EXIT_STATUS=1\n' % command
+    batch_job_config_string += 'done < <(sed -n "${FIRST_ITEM},${LAST_ITEM}p" "%s")\n' % \
+                               manifest_file
+    batch_job_config_string += 'exit ${EXIT_STATUS}\n'
+
+    # Write the batch job script to file in the slurm jobs directory
+    file_ops.write_batch_job_string_to_file(
+        slurm_jobs_directory, array_name, batch_job_config_string)
+
+    # Return the path to the script
+    return '%s/%s.sh' % (slurm_jobs_directory, array_name)
+
+
+####################################################################################################
+# @submit_batch_job_array
+####################################################################################################
+def submit_batch_job_array(script_full_path,
+                           sbatch='sbatch'):
+    """Submits a batch job array with a single call to sbatch. The number of the tasks running
+    simultaneously is limited by SLURM itself using the throttle of the array, and therefore there
+    is no need to poll squeue.
+
+    :param script_full_path:
+        The path to the batch job array script.
+    :param sbatch:
+        The sbatch executable, it can be replaced by a stand-in for testing.
+    :return:
+        The ID of the submitted job array.
+    """
+
+    print('Submitting [%s %s]' % (sbatch, script_full_path))
+    output = subprocess.check_output([sbatch, '--parsable', script_full_path])
+
+    # The output of --parsable is 'job_id' or 'job_id;cluster_name'
+    return output.decode().strip().split(';')[0]
+
+
+####################################################################################################
+# @run_jobs_array_on_cluster
+####################################################################################################
+def run_jobs_array_on_cluster(arguments,
+                              items,
+                              create_executable_for_item,
+                              array_name='array'):
+    """Runs a list of items on the cluster as a single job array.
+
+    :param arguments:
+        Input arguments.
+    :param items:
+        A list of items, GIDs or morphology files.
+    :param create_executable_for_item:
+        A function that creates the shell commands for a single item.
+    :param array_name:
+        The name of the job array, used to name the script and the manifest.
+    :return:
+        The ID of the submitted job array, or None if there are no items to submit.
+    """
+
+    # Nothing to submit
+    if len(items) == 0:
+        print('No items to submit to the cluster')
+        return None
+
+    # Create the script of the array
+    script_full_path = create_batch_job_array_script(
+        arguments=arguments, items=items, create_executable_for_item=create_executable_for_item,
+        array_name=array_name, chunk_size=arguments.slurm_array_chunk_size, throttle=arguments.slurm_array_throttle)
+
+    # Submit it
+    job_id = submit_batch_job_array(script_full_path=script_full_path,
+                                    sbatch=arguments.slurm_sbatch)
+    print('Submitted job array [%s] with [%d] items' % (job_id, len(items)))
+    return job_id
+
+
+####################################################################################################
+# @group_items_by_arguments
+####################################################################################################
+def group_items_by_arguments(items,
+                             items_arguments):
+    """Groups the items that are processed with the same arguments, such that every group is
+    submitted in a single job array.
+
+    :param items:
+        A list of items, GIDs or morphology files.
+    :param items_arguments:
+        A list of the arguments of every item.
+    :return:
+        A list of the groups in the order of their first items, where every group is the arguments
+        and the list of its items.
+    """
+
+    groups = list()
+    for item, item_arguments in zip(items, items_arguments):
+        for group_arguments, group_items in groups:
+            if group_arguments == item_arguments:
+                group_items.append(item)
+                break
+        else:
+            groups.append((item_arguments, [item]))
+    return groups
+
+
+####################################################################################################
+# @run_items_jobs_arrays_on_cluster
+####################################################################################################
+def run_items_jobs_arrays_on_cluster(items,
+                                     items_arguments,
+                                     create_executable_for_item):
+    """Runs a list of items on the cluster as a job array per group of the items that are processed
+    with the same arguments.
+
+    :param items:
+        A list of items, GIDs or morphology files.
+    :param items_arguments:
+        A list of the arguments of every item.
+    :param create_executable_for_item:
+        A function that creates the shell commands for a single item.
+    :return:
+        A list of the IDs of the submitted job arrays.
+    """
+
+    groups = group_items_by_arguments(items=items, items_arguments=items_arguments)
+
+    jobs_ids = list()
+    for i, (group_arguments, group_items) in enumerate(groups):
+        job_id = run_jobs_array_on_cluster(
+            arguments=group_arguments, items=group_items,
+            create_executable_for_item=create_executable_for_item,
+            array_name='array' if len(groups) == 1 else 'array_%d' % i)
+        jobs_ids.append(job_id)
+    return jobs_ids
+
+
 ####################################################################################################
 # @run_gid_jobs_on_cluster
 ####################################################################################################
 def run_gid_jobs_on_cluster(arguments,
-                            gids):
+                            gids,
+                            gids_arguments=None):
     """Runs the batch jobs on the cluster.
 
     :param arguments:
         Input arguments.
     :param gids:
         GID list for all the neurons.
+    :param gids_arguments:
+        A list of the arguments of every GID, for example where the tasks that are up to date are
+        turned off. If None, all the GIDs are processed with the given arguments.
     """
 
-    for gid in gids:
+    if gids_arguments is None:
+        gids_arguments = [arguments] * len(gids)
+
+    # Submit the GIDs in a job array per group of the GIDs with the same arguments
+    if arguments.slurm_array:
+        if len(gids) == 0:
+            print('No items to submit to the cluster')
+            return
+        run_items_jobs_arrays_on_cluster(
+            items=gids, items_arguments=gids_arguments,
+            create_executable_for_item=arguments_parser.create_executable_for_single_gid)
+        return
+
+    for gid, gid_arguments in zip(gids, gids_arguments):
 
         # Create the batch jobs for the all the GIDs in the target
-        create_batch_job_script_for_gid(arguments=arguments, gid=gid)
+        create_batch_job_script_for_gid(arguments=gid_arguments, gid=gid)
 
     # Submit the jobs
     # TODO: Add an option for the user
@@ -406,19 +680,38 @@ def run_gid_jobs_on_cluster(arguments,
 # @run_morphology_files_jobs_on_cluster
 ####################################################################################################
 def run_morphology_files_jobs_on_cluster(arguments,
-                                         morphology_files):
+                                         morphology_files,
+                                         morphology_files_arguments=None):
     """Runs the batch jobs on the cluster.
 
     :param arguments:
         Input arguments.
     :param morphology_files:
         A list of morphology files.
+    :param morphology_files_arguments:
+        A list of the arguments of every morphology file, for example where the tasks that are up
+        to date are turned off. If None, all the files are processed with the given arguments.
     """
 
-    for morphology_file in morphology_files:
+    if morphology_files_arguments is None:
+        morphology_files_arguments = [arguments] * len(morphology_files)
+
+    # Submit the morphology files in a job array per group of the files with the same arguments
+    if arguments.slurm_array:
+        if len(morphology_files) == 0:
+            print('No items to submit to the cluster')
+            return
+        run_items_jobs_arrays_on_cluster(
+            items=morphology_files, items_arguments=morphology_files_arguments,
+            create_executable_for_item=
+            arguments_parser.create_executable_for_single_morphology_file)
+        return
+
+    for morphology_file, morphology_file_arguments in zip(morphology_files,
+                                                          morphology_files_arguments):
         # Create the batch jobs for the all the GIDs in the target
         create_batch_job_script_for_morphology_file(
-            arguments=arguments, morphology_file=morphology_file)
+            arguments=morphology_file_arguments, morphology_file=morphology_file)
 
     # Submit the jobs
     # TODO: Add an option for the user
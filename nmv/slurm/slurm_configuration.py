@@ -63,3 +63,7 @@ class SlurmConfiguration:
 
         # Logs directory, where the logs will be written
         self.logs_directory = ''
+
+        # The range of the indices of the tasks of a job array, for example '0-99%10', or None if
+        # the job is not an array
+        self.array_range = None
@@ -15,13 +15,20 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
+# Internal imports
+import nmv
+
 from .colors import *
 from .parser import *
 from .parser import *
 from .installation import *
 from .std_output import *
-from .time_line import *
 from .timer import *
-from .version import *
+from .profiling import *
 from .system import *
 
+# The time line and the version utilities require Blender
+if nmv.BLENDER_AVAILABLE:
+    from .time_line import *
+    from .version import *
+
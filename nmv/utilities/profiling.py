@@ -0,0 +1,399 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import os
+import sys
+import time
+import json
+import threading
+import functools
+
+# The resource module is only available on Unix, the peak RSS is not reported otherwise
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+# The profiling state, disabled by default. The spans are only created when it is enabled, otherwise
+# every span costs a single check
+_profiling_enabled = False
+
+# The completed top-level spans, in the order they are started
+_profiling_root_spans = list()
+
+# The stacks of the open spans, one per thread
+_profiling_stacks = threading.local()
+
+# The reference of the timestamps of the spans
+_profiling_origin = time.perf_counter()
+
+# A lock to add the top-level spans from multiple threads
+_profiling_lock = threading.Lock()
+
+
+####################################################################################################
+# @get_peak_rss
+####################################################################################################
+def get_peak_rss():
+    """Gets the peak resident set size (RSS) of the process so far.
+
+    :return:
+        The peak RSS in MB, or None if it cannot be measured on this platform.
+    """
+
+    if resource is None:
+        return None
+
+    # The peak RSS is reported in bytes on macOS and in KB otherwise
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        return peak_rss / (1024.0 * 1024.0)
+    return peak_rss / 1024.0
+
+
+####################################################################################################
+# @ProfilingSpan
+####################################################################################################
+class ProfilingSpan:
+    """A named span of the execution, with the wall time, the CPU time and the peak RSS of the
+    process measured at its end, and the spans that are nested in it.
+    """
+
+    __slots__ = ('name', 'category', 'arguments', 'thread_id', 'starting_time', 'wall_time',
+                 'starting_cpu_time', 'cpu_time', 'peak_rss', 'children')
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 name,
+                 category='nmv',
+                 arguments=None):
+        """Constructor
+
+        :param name:
+            The name of the span.
+        :param category:
+            The category of the span, for example 'reader', 'builder' or 'rendering'.
+        :param arguments:
+            A dictionary of extra values to be reported with the span, or None.
+        """
+
+        # The name of the span
+        self.name = name
+
+        # The category of the span
+        self.category = category
+
+        # Extra values of the span
+        self.arguments = arguments
+
+        # The thread where the span is running
+        self.thread_id = threading.get_ident()
+
+        # The starting time in seconds, relative to the profiling origin
+        self.starting_time = 0.0
+
+        # The wall time of the span in seconds
+        self.wall_time = 0.0
+
+        # The starting process CPU time
+        self.starting_cpu_time = 0.0
+
+        # The CPU time of the span in seconds
+        self.cpu_time = 0.0
+
+        # The peak RSS of the process in MB at the end of the span
+        self.peak_rss = None
+
+        # The nested spans
+        self.children = list()
+
+    ################################################################################################
+    # @__enter__
+    ################################################################################################
+    def __enter__(self):
+
+        # Nest the span into the current one
+        stack = getattr(_profiling_stacks, 'spans', None)
+        if stack is None:
+            stack = _profiling_stacks.spans = list()
+        stack.append(self)
+
+        self.starting_cpu_time = time.process_time()
+        self.starting_time = time.perf_counter() - _profiling_origin
+        return self
+
+    ################################################################################################
+    # @__exit__
+    ################################################################################################
+    def __exit__(self, exception_type, exception_value, traceback):
+
+        self.wall_time = time.perf_counter() - _profiling_origin - self.starting_time
+        self.cpu_time = time.process_time() - self.starting_cpu_time
+        self.peak_rss = get_peak_rss()
+
+        # Close the span and add it to its parent, or to the top-level spans
+        stack = _profiling_stacks.spans
+        stack.pop()
+        if len(stack) > 0:
+            stack[-1].children.append(self)
+        else:
+            with _profiling_lock:
+                _profiling_root_spans.append(self)
+
+        # Never suppress the exceptions
+        return False
+
+    ################################################################################################
+    # @as_dict
+    ################################################################################################
+    def as_dict(self):
+        """Gets the span and its nested spans as a dictionary.
+
+        :return:
+            A dictionary that can be written to a JSON file.
+        """
+
+        return {'name': self.name,
+                'category': self.category,
+                'arguments': self.arguments,
+                'thread': self.thread_id,
+                'start': self.starting_time,
+                'wall_time': self.wall_time,
+                'cpu_time': self.cpu_time,
+                'peak_rss': self.peak_rss,
+                'children': [child.as_dict() for child in self.children]}
+
+
+####################################################################################################
+# @_NullSpan
+####################################################################################################
+class _NullSpan:
+    """A span that does nothing, used when the profiling is disabled.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        return False
+
+
+# A single instance is shared by all the disabled spans
+_NULL_SPAN = _NullSpan()
+
+
+####################################################################################################
+# @enable_profiling
+####################################################################################################
+def enable_profiling():
+    """Enables the profiling, the spans are recorded from now on.
+    """
+
+    global _profiling_enabled
+    _profiling_enabled = True
+
+
+####################################################################################################
+# @disable_profiling
+####################################################################################################
+def disable_profiling():
+    """Disables the profiling, the recorded spans are kept.
+    """
+
+    global _profiling_enabled
+    _profiling_enabled = False
+
+
+####################################################################################################
+# @is_profiling_enabled
+####################################################################################################
+def is_profiling_enabled():
+    """Checks if the profiling is enabled.
+
+    :return:
+        True if the profiling is enabled, otherwise False.
+    """
+
+    return _profiling_enabled
+
+
+####################################################################################################
+# @reset_profiling
+####################################################################################################
+def reset_profiling():
+    """Removes all the recorded spans.
+    """
+
+    with _profiling_lock:
+        del _profiling_root_spans[:]
+
+
+####################################################################################################
+# @get_profiling_spans
+####################################################################################################
+def get_profiling_spans():
+    """Gets the completed top-level spans, the nested spans are reachable from their parents.
+
+    :return:
+        A list of the completed top-level spans.
+    """
+
+    with _profiling_lock:
+        return list(_profiling_root_spans)
+
+
+####################################################################################################
+# @profiling_span
+####################################################################################################
+def profiling_span(name,
+                   category='nmv',
+                   **arguments):
+    """Creates a span to profile a block of code, to be used in a with statement.
+
+        with nmv.utilities.profiling_span('Build Arbors', 'builder'):
+            ...
+
+    :param name:
+        The name of the span.
+    :param category:
+        The category of the span, for example 'reader', 'builder' or 'rendering'.
+    :param arguments:
+        Extra values to be reported with the span.
+    :return:
+        A new span if the profiling is enabled, otherwise a span that does nothing.
+    """
+
+    if not _profiling_enabled:
+        return _NULL_SPAN
+    return ProfilingSpan(name, category, arguments if len(arguments) > 0 else None)
+
+
+####################################################################################################
+# @profiled
+####################################################################################################
+def profiled(name=None,
+             category='nmv'):
+    """A decorator that profiles every call of a function in a span.
+
+        @nmv.utilities.profiled(category='reader')
+        def read_swc_morphology(...):
+            ...
+
+    :param name:
+        The name of the span, by default the qualified name of the function.
+    :param category:
+        The category of the span.
+    :return:
+        The decorator.
+    """
+
+    def decorator(function):
+
+        span_name = function.__qualname__ if name is None else name
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+
+            # Call the function directly if the profiling is disabled
+            if not _profiling_enabled:
+                return function(*args, **kwargs)
+
+            with ProfilingSpan(span_name, category):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+####################################################################################################
+# @write_profiling_spans_to_json
+####################################################################################################
+def write_profiling_spans_to_json(output_file):
+    """Writes the recorded spans as a tree to a JSON file.
+
+    :param output_file:
+        The path to the output file.
+    """
+
+    spans = [span.as_dict() for span in get_profiling_spans()]
+    with open(output_file, 'w') as file_handle:
+        json.dump({'pid': os.getpid(), 'spans': spans}, file_handle, indent=1)
+
+
+####################################################################################################
+# @write_profiling_spans_to_chrome_trace
+####################################################################################################
+def write_profiling_spans_to_chrome_trace(output_file):
+    """Writes the recorded spans to a JSON file in the Chrome trace event format, that can be
+    opened in chrome://tracing or in https://ui.perfetto.dev.
+
+    :param output_file:
+        The path to the output file.
+    """
+
+    process_id = os.getpid()
+
+    # A complete event (X) per span, the timestamps are in microseconds
+    events = list()
+    stack = list(reversed(get_profiling_spans()))
+    while len(stack) > 0:
+        span = stack.pop()
+
+        arguments = {'cpu_time': span.cpu_time, 'peak_rss': span.peak_rss}
+        if span.arguments is not None:
+            arguments.update({key: str(value) for key, value in span.arguments.items()})
+
+        events.append({'name': span.name,
+                       'cat': span.category,
+                       'ph': 'X',
+                       'ts': span.starting_time * 1e6,
+                       'dur': span.wall_time * 1e6,
+                       'pid': process_id,
+                       'tid': span.thread_id,
+                       'args': arguments})
+        stack.extend(reversed(span.children))
+
+    with open(output_file, 'w') as file_handle:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, file_handle)
+
+
+####################################################################################################
+# @write_profiling_results
+####################################################################################################
+def write_profiling_results(output_directory,
+                            label):
+    """Writes the recorded spans to a JSON tree (<label>.profile.json) and a Chrome trace
+    (<label>.trace.json) in the output directory.
+
+    :param output_directory:
+        The directory where the files will be written.
+    :param label:
+        The label of the files, normally the morphology label.
+    """
+
+    if not os.path.exists(output_directory):
+        os.makedirs(output_directory, exist_ok=True)
+
+    write_profiling_spans_to_json('%s/%s.profile.json' % (output_directory, label))
+    write_profiling_spans_to_chrome_trace('%s/%s.trace.json' % (output_directory, label))
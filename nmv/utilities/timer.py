@@ -18,6 +18,9 @@
 # System imports
 import time
 
+# Internal imports
+from .profiling import profiling_span
+
 
 ####################################################################################################
 # @Timer
@@ -84,8 +87,9 @@ def profile_function(function, *args):
     # Start the timer
     starting_time = time.time()
 
-    # Run the function
-    function_return = function(*args)
+    # Run the function, in a profiling span if the profiling is enabled
+    with profiling_span(function.__name__, 'builder'):
+        function_return = function(*args)
 
     # Stop the timer
     ending_time = time.time()
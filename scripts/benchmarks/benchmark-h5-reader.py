@@ -0,0 +1,133 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import sys, os
+
+sys.path.append(('%s/../../' %(os.path.dirname(os.path.realpath(__file__)))))
+
+# System imports
+import argparse
+import time
+
+# NeuroMorphoVis imports
+import nmv.file
+
+# Benchmarks imports
+sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+from synthetic_morphology import write_synthetic_h5_morphology
+
+
+####################################################################################################
+# @parse_command_line_arguments
+####################################################################################################
+def parse_command_line_arguments(arguments=None):
+    """Parses the input arguments.
+
+    :param arguments:
+        Command line arguments.
+    :return:
+        Arguments list.
+    """
+
+    # add all the options
+    description = 'Benchmarking the H5 morphology reader with synthetic morphologies'
+    parser = argparse.ArgumentParser(description=description)
+
+    arg_help = 'Output directory where the synthetic morphologies will be written'
+    parser.add_argument('--output-directory',
+                        action='store', dest='output_directory', help=arg_help)
+
+    arg_help = 'A comma-separated list of the numbers of sections of the synthetic morphologies'
+    parser.add_argument('--sizes',
+                        action='store', dest='sizes', default='1000,10000,100000', help=arg_help)
+
+    arg_help = 'Number of samples per section'
+    parser.add_argument('--samples-per-section',
+                        action='store', dest='samples_per_section', type=int, default=4,
+                        help=arg_help)
+
+    # Parse the arguments
+    return parser.parse_args()
+
+
+####################################################################################################
+# @benchmark_h5_reader
+####################################################################################################
+def benchmark_h5_reader(h5_file):
+    """Times the different stages of loading an .H5 morphology.
+
+    :param h5_file:
+        The path to the .H5 file.
+    :return:
+        A list of the stages names and their durations in seconds.
+    """
+
+    stats = list()
+    reader = nmv.file.readers.H5Reader(h5_file=h5_file)
+
+    # Reading the datasets
+    starting_time = time.time()
+    reader.read_points_and_structures()
+    stats.append(['Reading', time.time() - starting_time])
+
+    # Building the samples and the sections
+    starting_time = time.time()
+    sections_list = reader.build_sections_from_points_and_structures()
+    stats.append(['Sections', time.time() - starting_time])
+
+    # Linking the sections into trees
+    starting_time = time.time()
+    axons_sections, basal_dendrites_sections, apical_dendrites_sections = \
+        reader.build_sections_by_type(sections_list)
+    reader.build_tree(axons_sections)
+    reader.build_tree(basal_dendrites_sections)
+    reader.build_tree(apical_dendrites_sections)
+    stats.append(['Linking', time.time() - starting_time])
+
+    # The entire loading
+    starting_time = time.time()
+    nmv.file.readers.H5Reader(h5_file=h5_file).read_file()
+    stats.append(['Total', time.time() - starting_time])
+
+    # Return the stats
+    return stats
+
+
+####################################################################################################
+# @ Main
+####################################################################################################
+if __name__ == "__main__":
+
+    # Get all arguments after the '--'
+    args = sys.argv
+    sys.argv = args[args.index("--") + 0:]
+
+    # Parse the command line arguments
+    args = parse_command_line_arguments()
+
+    for size in [int(size) for size in args.sizes.split(',')]:
+
+        # Create the synthetic morphology
+        h5_file = '%s/synthetic_%d.h5' % (args.output_directory, size)
+        write_synthetic_h5_morphology(h5_file, number_sections=size,
+                                      samples_per_section=args.samples_per_section)
+
+        # Benchmark it
+        stats = benchmark_h5_reader(h5_file)
+        print('* Sections [%d]: %s' % (size, ', '.join(
+            ['%s [%.3f]' % (stage, duration) for stage, duration in stats])))
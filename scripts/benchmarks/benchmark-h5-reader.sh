@@ -0,0 +1,32 @@
+#!/usr/bin/env bash
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# Blender executable
+BLENDER='blender'
+
+# Output directory where the synthetic morphologies will be written
+OUTPUT_DIRECTORY='/tmp/nmv-benchmarks'
+
+# The numbers of sections of the synthetic morphologies
+SIZES='1000,10000,100000'
+
+####################################################################################################
+mkdir -p $OUTPUT_DIRECTORY
+$BLENDER -b --verbose 0 --python benchmark-h5-reader.py --                                         \
+    --output-directory=$OUTPUT_DIRECTORY                                                           \
+    --sizes=$SIZES
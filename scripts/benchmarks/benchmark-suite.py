@@ -0,0 +1,415 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import sys, os
+
+sys.path.append(('%s/../../' %(os.path.dirname(os.path.realpath(__file__)))))
+
+# System imports
+import argparse
+import json
+import platform
+import time
+
+# NeuroMorphoVis imports
+import nmv.analysis
+import nmv.consts
+import nmv.enums
+import nmv.file
+import nmv.skeleton
+
+# Benchmarks imports
+sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+from synthetic_morphology import write_synthetic_morphology
+
+
+####################################################################################################
+# @parse_command_line_arguments
+####################################################################################################
+def parse_command_line_arguments(arguments=None):
+    """Parses the input arguments.
+
+    :param arguments:
+        Command line arguments.
+    :return:
+        Arguments list.
+    """
+
+    # add all the options
+    description = 'Benchmarking the hot paths of NeuroMorphoVis with synthetic morphologies'
+    parser = argparse.ArgumentParser(description=description)
+
+    arg_help = 'Output directory where the synthetic morphologies and the results will be written'
+    parser.add_argument('--output-directory',
+                        action='store', dest='output_directory', help=arg_help)
+
+    arg_help = 'A comma-separated list of the branching depths of the synthetic morphologies'
+    parser.add_argument('--depths',
+                        action='store', dest='depths', default='4,6,8', help=arg_help)
+
+    arg_help = 'Number of arbors of the synthetic morphologies'
+    parser.add_argument('--number-arbors',
+                        action='store', dest='number_arbors', type=int, default=4, help=arg_help)
+
+    arg_help = 'Number of samples per section'
+    parser.add_argument('--samples-per-section',
+                        action='store', dest='samples_per_section', type=int, default=8,
+                        help=arg_help)
+
+    arg_help = 'Number of the repetitions of every benchmark, the minimum time is compared'
+    parser.add_argument('--repeats',
+                        action='store', dest='repeats', type=int, default=3, help=arg_help)
+
+    arg_help = 'A comma-separated list of the benchmarks to run, all of them by default. \n' \
+               'Options: %s' % ', '.join(BENCHMARKS.keys())
+    parser.add_argument('--benchmarks',
+                        action='store', dest='benchmarks', default=None, help=arg_help)
+
+    arg_help = 'A baseline results file to compare the results with'
+    parser.add_argument('--baseline',
+                        action='store', dest='baseline', default=None, help=arg_help)
+
+    arg_help = 'The ratio of the time to the baseline time above which a benchmark is reported ' \
+               'as a regression'
+    parser.add_argument('--tolerance',
+                        action='store', dest='tolerance', type=float, default=1.25, help=arg_help)
+
+    # Parse the arguments
+    return parser.parse_args(arguments)
+
+
+####################################################################################################
+# @read_swc_morphology
+####################################################################################################
+def read_swc_morphology(files):
+    """Reads the .SWC synthetic morphology.
+
+    :param files:
+        A dictionary of the synthetic morphology files per format.
+    :return:
+        The morphology.
+    """
+
+    return nmv.file.readers.SWCReader(swc_file=files['swc']).read_file()
+
+
+####################################################################################################
+# @read_h5_morphology
+####################################################################################################
+def read_h5_morphology(files):
+    """Reads the .H5 synthetic morphology.
+
+    :param files:
+        A dictionary of the synthetic morphology files per format.
+    :return:
+        The morphology.
+    """
+
+    return nmv.file.readers.H5Reader(h5_file=files['h5']).read_file()
+
+
+####################################################################################################
+# @resample_morphology_at_fixed_step
+####################################################################################################
+def resample_morphology_at_fixed_step(morphology):
+    """Resamples all the sections of a morphology at a fixed step.
+
+    :param morphology:
+        The morphology, which is modified.
+    """
+
+    nmv.skeleton.ops.apply_operation_to_morphology(
+        *[morphology, nmv.skeleton.ops.resample_section_at_fixed_step, 0.5], mutates=True)
+
+
+####################################################################################################
+# @resample_morphology_adaptively
+####################################################################################################
+def resample_morphology_adaptively(morphology):
+    """Resamples all the sections of a morphology adaptively.
+
+    :param morphology:
+        The morphology, which is modified.
+    """
+
+    nmv.skeleton.ops.apply_operation_to_morphology(
+        *[morphology, nmv.skeleton.ops.resample_section_adaptively], mutates=True)
+
+
+####################################################################################################
+# @analyze_morphology
+####################################################################################################
+def analyze_morphology(morphology):
+    """Applies all the global and the per-arbor analysis kernels to a morphology, as done by the
+    analysis panel, without updating the user interface.
+
+    :param morphology:
+        The morphology.
+    """
+
+    for item in nmv.analysis.ui_global_analysis_items:
+        item.apply_global_analysis_kernel(morphology=morphology, context=None)
+
+    nmv.analysis.create_arbors_analysis_profiles(morphology)
+    try:
+        for item in nmv.analysis.ui_per_arbor_analysis_items:
+            item.apply_per_arbor_analysis_kernel(morphology=morphology, context=None)
+    finally:
+        nmv.analysis.release_arbors_analysis_profiles(morphology)
+
+
+####################################################################################################
+# @construct_poly_lines
+####################################################################################################
+def construct_poly_lines(morphology):
+    """Constructs the poly-lines of all the arbors of a morphology as connected sections.
+
+    :param morphology:
+        The morphology.
+    """
+
+    for arbors in [morphology.apical_dendrites, morphology.basal_dendrites, morphology.axons]:
+        if arbors is None:
+            continue
+        for arbor in arbors:
+            nmv.skeleton.ops.get_arbor_poly_lines_as_connected_sections(
+                root=arbor, poly_lines_data=list(), poly_line_data=list(),
+                connection_to_soma=nmv.enums.Skeleton.Roots.ALL_CONNECTED,
+                max_branching_order=nmv.consts.Math.INFINITY)
+
+
+####################################################################################################
+# @write_swc_morphology
+####################################################################################################
+def write_swc_morphology(morphology,
+                         output_directory):
+    """Writes a morphology to an .SWC file labeled with the morphology label.
+
+    :param morphology:
+        The morphology.
+    :param output_directory:
+        The directory where the file is written.
+    """
+
+    nmv.file.write_morphology_to_swc_file(morphology, output_directory)
+
+
+# The benchmarks, every benchmark is a pair of functions, the first one creates the inputs of the
+# benchmark from the synthetic morphology files and the output directory without being timed, and
+# the second one takes the inputs and it is timed
+BENCHMARKS = {
+    'swc-reader': [
+        lambda files, output_directory: [files],
+        read_swc_morphology],
+    'h5-reader': [
+        lambda files, output_directory: [files],
+        read_h5_morphology],
+    'resampling-fixed-step': [
+        lambda files, output_directory: [read_swc_morphology(files)],
+        resample_morphology_at_fixed_step],
+    'resampling-adaptive': [
+        lambda files, output_directory: [read_swc_morphology(files)],
+        resample_morphology_adaptively],
+    'analysis': [
+        lambda files, output_directory: [read_swc_morphology(files)],
+        analyze_morphology],
+    'poly-lines': [
+        lambda files, output_directory: [read_swc_morphology(files)],
+        construct_poly_lines],
+    'swc-writer': [
+        lambda files, output_directory: [read_swc_morphology(files),
+                                         '%s/swc-writer' % output_directory],
+        write_swc_morphology],
+}
+
+
+####################################################################################################
+# @run_benchmark
+####################################################################################################
+def run_benchmark(benchmark,
+                  files,
+                  output_directory,
+                  repeats):
+    """Runs a benchmark multiple times, with new inputs every time.
+
+    :param benchmark:
+        The pair of the inputs function and the timed function of the benchmark.
+    :param files:
+        A dictionary of the synthetic morphology files per format.
+    :param output_directory:
+        The output directory.
+    :param repeats:
+        The number of the repetitions.
+    :return:
+        A dictionary of the minimum, median and maximum times in seconds.
+    """
+
+    create_inputs, function = benchmark
+
+    durations = list()
+    for _ in range(repeats):
+        inputs = create_inputs(files, output_directory)
+        starting_time = time.perf_counter()
+        function(*inputs)
+        durations.append(time.perf_counter() - starting_time)
+
+    durations.sort()
+    return {'min': durations[0],
+            'median': durations[len(durations) // 2],
+            'max': durations[-1]}
+
+
+####################################################################################################
+# @get_machine_description
+####################################################################################################
+def get_machine_description():
+    """Gets a description of the machine and the software the benchmarks run on, since the
+    results are only comparable on the same machine.
+
+    :return:
+        A dictionary describing the machine.
+    """
+
+    import numpy
+
+    description = {'platform': platform.platform(),
+                   'processor': platform.processor(),
+                   'cpus': os.cpu_count(),
+                   'python': platform.python_version(),
+                   'numpy': numpy.__version__}
+
+    try:
+        import bpy
+        description['blender'] = str(bpy.app.version_string)
+    except (ImportError, AttributeError):
+        pass
+
+    return description
+
+
+####################################################################################################
+# @compare_with_baseline
+####################################################################################################
+def compare_with_baseline(results,
+                          baseline,
+                          tolerance):
+    """Compares the minimum times of the benchmarks with a baseline.
+
+    :param results:
+        The results of the benchmarks, per benchmark and size.
+    :param baseline:
+        The baseline results, in the same format.
+    :param tolerance:
+        The ratio to the baseline time above which a benchmark is a regression.
+    :return:
+        A list of the regressions, every one is a (benchmark, size, ratio) triplet.
+    """
+
+    regressions = list()
+    for benchmark, sizes in results.items():
+        for size, timing in sizes.items():
+
+            # New benchmarks or sizes are not compared
+            baseline_timing = baseline.get(benchmark, dict()).get(size)
+            if baseline_timing is None or baseline_timing['min'] <= 0.0:
+                continue
+
+            ratio = timing['min'] / baseline_timing['min']
+            print('  %-24s %-10s %10.4f %10.4f  x%.2f%s' % (
+                benchmark, size, baseline_timing['min'], timing['min'], ratio,
+                '  REGRESSION' if ratio > tolerance else ''))
+            if ratio > tolerance:
+                regressions.append([benchmark, size, ratio])
+
+    return regressions
+
+
+####################################################################################################
+# @ Main
+####################################################################################################
+if __name__ == "__main__":
+
+    # Get all arguments after the '--'
+    args = sys.argv
+    sys.argv = args[args.index("--") + 0:] if '--' in args else args
+
+    # Parse the command line arguments
+    args = parse_command_line_arguments()
+
+    # The benchmarks to run
+    if args.benchmarks is None:
+        benchmarks = list(BENCHMARKS.keys())
+    else:
+        benchmarks = args.benchmarks.split(',')
+        for benchmark in benchmarks:
+            if benchmark not in BENCHMARKS:
+                print('ERROR: Unknown benchmark [%s]' % benchmark)
+                exit(1)
+
+    # The written morphologies are not written on top of the synthetic ones
+    if not os.path.exists('%s/swc-writer' % args.output_directory):
+        os.makedirs('%s/swc-writer' % args.output_directory)
+
+    results = {benchmark: dict() for benchmark in benchmarks}
+    morphologies = dict()
+    for depth in [int(depth) for depth in args.depths.split(',')]:
+
+        # Create the synthetic morphologies, the same morphology in both formats
+        parameters = {'number_arbors': args.number_arbors,
+                      'branching_depth': depth,
+                      'samples_per_section': args.samples_per_section}
+        files = dict()
+        for extension in ['swc', 'h5']:
+            files[extension] = '%s/synthetic_depth_%d.%s' % (args.output_directory, depth,
+                                                             extension)
+            write_synthetic_morphology(files[extension], **parameters)
+
+        size = 'depth-%d' % depth
+        morphologies[size] = {
+            'sections': args.number_arbors * (2 ** (depth + 1) - 1),
+            'samples': args.number_arbors * (2 ** (depth + 1) - 1) * args.samples_per_section}
+
+        # Run the benchmarks
+        for benchmark in benchmarks:
+            results[benchmark][size] = run_benchmark(
+                BENCHMARKS[benchmark], files, args.output_directory, args.repeats)
+            print('* %-24s %-10s min [%.4f] median [%.4f] seconds' % (
+                benchmark, size, results[benchmark][size]['min'],
+                results[benchmark][size]['median']))
+
+    # Write the results, to be used as a baseline later
+    results_file = '%s/benchmark-results.json' % args.output_directory
+    with open(results_file, 'w') as file_handle:
+        json.dump({'machine': get_machine_description(),
+                   'parameters': {'number_arbors': args.number_arbors,
+                                  'samples_per_section': args.samples_per_section,
+                                  'repeats': args.repeats},
+                   'morphologies': morphologies,
+                   'results': results}, file_handle, indent=2, sort_keys=True)
+    print('Results written to [%s]' % results_file)
+
+    # Compare with the baseline, if given, and fail if any benchmark regressed
+    if args.baseline is not None:
+        with open(args.baseline, 'r') as file_handle:
+            baseline = json.load(file_handle)
+        print('Baseline [%s] (minimum times in seconds)' % args.baseline)
+        regressions = compare_with_baseline(results, baseline['results'], args.tolerance)
+        if len(regressions) > 0:
+            print('ERROR: [%d] benchmarks regressed by more than x%.2f' % (
+                len(regressions), args.tolerance))
+            exit(1)
@@ -0,0 +1,54 @@
+#!/usr/bin/env bash
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# Blender executable
+BLENDER='blender'
+
+# Output directory where the synthetic morphologies and the results will be written
+OUTPUT_DIRECTORY='/tmp/nmv-benchmarks'
+
+# The branching depths of the synthetic morphologies
+DEPTHS='4,6,8'
+
+# The number of arbors and samples per section of the synthetic morphologies
+NUMBER_ARBORS='4'
+SAMPLES_PER_SECTION='8'
+
+# The number of the repetitions of every benchmark
+REPEATS='3'
+
+# A baseline results file to compare with, the results of an earlier run
+# (benchmark-results.json), leave it empty to skip the comparison
+BASELINE=''
+
+# The ratio of the time to the baseline time above which a benchmark is a regression
+TOLERANCE='1.25'
+
+####################################################################################################
+BASELINE_ARGUMENT=''
+if [ ! -z "$BASELINE" ]; then
+    BASELINE_ARGUMENT="--baseline=$BASELINE --tolerance=$TOLERANCE"
+fi
+
+mkdir -p $OUTPUT_DIRECTORY
+$BLENDER -b --verbose 0 --python benchmark-suite.py --                                             \
+    --output-directory=$OUTPUT_DIRECTORY                                                           \
+    --depths=$DEPTHS                                                                               \
+    --number-arbors=$NUMBER_ARBORS                                                                 \
+    --samples-per-section=$SAMPLES_PER_SECTION                                                     \
+    --repeats=$REPEATS $BASELINE_ARGUMENT
@@ -0,0 +1,205 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import os
+
+# The types of the arbors, in the order they are assigned to the arbors: axon, basal dendrites and
+# apical dendrite, the same in the .H5 and the .SWC files
+SYNTHETIC_ARBORS_TYPES = [2, 3, 3, 4]
+
+# The radius of the soma
+SYNTHETIC_SOMA_RADIUS = 5.0
+
+
+####################################################################################################
+# @create_synthetic_morphology
+####################################################################################################
+def create_synthetic_morphology(number_arbors=4,
+                                branching_depth=6,
+                                samples_per_section=4,
+                                number_sections=None,
+                                seed=0):
+    """Creates a synthetic morphology in the layout of the .H5 files, where every arbor is a
+    balanced binary tree and every section is a random walk starting from the end of its parent.
+    The morphology is deterministic for the same parameters.
+
+    :param number_arbors:
+        The number of arbors, the types of the arbors alternate between axon and dendrites.
+    :param branching_depth:
+        The branching depth of every arbor, an arbor has (2 ^ (depth + 1) - 1) sections.
+    :param samples_per_section:
+        The number of samples per section, at least two.
+    :param number_sections:
+        If given, the total number of the sections of the morphology, distributed on the arbors,
+        overriding the branching depth.
+    :param seed:
+        The seed of the random walks.
+    :return:
+        An (N, 4) array of the points and the diameters of the samples, and an (M, 3) array of the
+        structure, where every row is the index of the first point of a section, its type and the
+        index of its parent section. The first section is the soma.
+    """
+
+    import numpy
+
+    # Random, but reproducible
+    random_generator = numpy.random.RandomState(seed)
+
+    # The number of sections of every arbor
+    if number_sections is None:
+        sections_per_arbor = numpy.full(number_arbors, 2 ** (branching_depth + 1) - 1)
+    else:
+        sections_per_arbor = numpy.full(number_arbors, number_sections // number_arbors)
+        sections_per_arbor[:number_sections % number_arbors] += 1
+
+    # The soma is a section with a profile point per arbor on a circle
+    angles = numpy.linspace(0.0, 2.0 * numpy.pi, max(number_arbors, 3), endpoint=False)
+    soma_points = numpy.zeros((len(angles), 4))
+    soma_points[:, 0] = SYNTHETIC_SOMA_RADIUS * numpy.cos(angles)
+    soma_points[:, 1] = SYNTHETIC_SOMA_RADIUS * numpy.sin(angles)
+    points = [soma_points]
+    number_points = len(soma_points)
+    structure = [[0, 1, -1]]
+
+    for i_arbor in range(number_arbors):
+
+        # The index of the first section of the arbor in the structure
+        first_section = len(structure)
+
+        # The last point of every section in the arbor, used to start its children
+        last_points = list()
+
+        for i_section in range(int(sections_per_arbor[i_arbor])):
+
+            # In a balanced binary tree, the parent of the section k is (k - 1) / 2
+            if i_section == 0:
+                parent = 0
+                start = soma_points[i_arbor % len(soma_points), :3]
+            else:
+                parent = first_section + (i_section - 1) // 2
+                start = last_points[(i_section - 1) // 2]
+
+            # The sections get thinner with the branching order
+            branching_order = int(numpy.log2(i_section + 1))
+            diameter = max(0.2, 2.0 * 0.8 ** branching_order)
+
+            # Add the section
+            structure.append([number_points, SYNTHETIC_ARBORS_TYPES[i_arbor % 4], parent])
+
+            # Add the samples, with a random walk starting from the end of the parent section
+            steps = random_generator.uniform(-1.0, 1.0, (samples_per_section - 1, 3))
+            section_points = numpy.empty((samples_per_section, 4))
+            section_points[0, :3] = start
+            section_points[1:, :3] = start + numpy.cumsum(steps, axis=0)
+            section_points[:, 3] = diameter
+            points.append(section_points)
+            number_points += samples_per_section
+            last_points.append(section_points[-1, :3])
+
+    return numpy.vstack(points), numpy.array(structure, dtype=numpy.int32)
+
+
+####################################################################################################
+# @write_synthetic_h5_morphology
+####################################################################################################
+def write_synthetic_h5_morphology(h5_file,
+                                  **parameters):
+    """Writes a synthetic morphology to an .H5 file.
+
+    :param h5_file:
+        The path to the output .H5 file.
+    :param parameters:
+        The parameters of the morphology, see @create_synthetic_morphology.
+    """
+
+    import numpy
+    import h5py
+
+    points, structure = create_synthetic_morphology(**parameters)
+
+    with h5py.File(h5_file, 'w') as data:
+        data.create_dataset('points', data=points.astype(numpy.float32))
+        data.create_dataset('structure', data=structure)
+
+
+####################################################################################################
+# @write_synthetic_swc_morphology
+####################################################################################################
+def write_synthetic_swc_morphology(swc_file,
+                                   **parameters):
+    """Writes a synthetic morphology to an .SWC file. The soma is a single sample, and the first
+    sample of every section that is not a root is dropped, since it is the last sample of its
+    parent.
+
+    :param swc_file:
+        The path to the output .SWC file.
+    :param parameters:
+        The parameters of the morphology, see @create_synthetic_morphology.
+    """
+
+    points, structure = create_synthetic_morphology(**parameters)
+
+    # The index of the first point of every section, the last one goes till the end of the points
+    sections_offsets = structure[:, 0].tolist() + [len(points)]
+
+    # The soma sample
+    lines = ['1 1 0.0 0.0 0.0 %f -1' % SYNTHETIC_SOMA_RADIUS]
+    number_samples = 1
+
+    # The SWC index of the last sample of every section
+    last_samples = [1]
+    for i_section in range(1, len(structure)):
+        parent = int(structure[i_section, 2])
+        section_type = int(structure[i_section, 1])
+
+        # The roots start from the soma, the other sections from the end of their parents
+        first_point = sections_offsets[i_section] + (0 if parent == 0 else 1)
+        parent_sample = last_samples[parent]
+        for x, y, z, diameter in points[first_point:sections_offsets[i_section + 1]].tolist():
+            number_samples += 1
+            lines.append('%d %d %f %f %f %f %d' % (
+                number_samples, section_type, x, y, z, 0.5 * diameter, parent_sample))
+            parent_sample = number_samples
+        last_samples.append(parent_sample)
+
+    with open(swc_file, 'w') as file_handle:
+        file_handle.write('# Synthetic morphology\n')
+        file_handle.write('\n'.join(lines))
+        file_handle.write('\n')
+
+
+####################################################################################################
+# @write_synthetic_morphology
+####################################################################################################
+def write_synthetic_morphology(morphology_file,
+                               **parameters):
+    """Writes a synthetic morphology to an .H5 or an .SWC file, based on the file extension.
+
+    :param morphology_file:
+        The path to the output file.
+    :param parameters:
+        The parameters of the morphology, see @create_synthetic_morphology.
+    """
+
+    extension = os.path.splitext(morphology_file)[1].lower()
+    if extension == '.h5':
+        write_synthetic_h5_morphology(morphology_file, **parameters)
+    elif extension == '.swc':
+        write_synthetic_swc_morphology(morphology_file, **parameters)
+    else:
+        raise ValueError('Unsupported synthetic morphology format [%s]' % extension)
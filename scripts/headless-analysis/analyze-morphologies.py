@@ -0,0 +1,99 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import sys, os
+
+sys.path.append(('%s/../../' %(os.path.dirname(os.path.realpath(__file__)))))
+
+# System imports
+import argparse
+import time
+
+# NeuroMorphoVis imports, the analysis does not require Blender, only numpy, h5py and mathutils
+import nmv.analysis
+
+
+####################################################################################################
+# @parse_command_line_arguments
+####################################################################################################
+def parse_command_line_arguments(arguments=None):
+    """Parses the input arguments.
+
+    :param arguments:
+        Command line arguments.
+    :return:
+        Arguments list.
+    """
+
+    # add all the options
+    description = 'Analyzes all the morphologies in a directory without Blender, and writes the ' \
+                  'results to a single .csv table with a row per morphology (and per arbor)'
+    parser = argparse.ArgumentParser(description=description)
+
+    arg_help = 'The directory that contains the .h5 and the .swc morphology files'
+    parser.add_argument('--input-directory',
+                        action='store', dest='input_directory', required=True, help=arg_help)
+
+    arg_help = 'The output .csv file'
+    parser.add_argument('--output-file',
+                        action='store', dest='output_file', required=True, help=arg_help)
+
+    arg_help = 'Add a row for every arbor after the row of its morphology'
+    parser.add_argument('--per-arbor',
+                        action='store_true', default=False, dest='per_arbor', help=arg_help)
+
+    arg_help = 'The number of the worker processes, by default the number of the cores'
+    parser.add_argument('--processes',
+                        action='store', type=int, default=None, dest='processes', help=arg_help)
+
+    arg_help = 'The directory of the cached morphologies, to skip parsing the morphologies that ' \
+               'were parsed before. If not given, the morphology files are always parsed'
+    parser.add_argument('--cache-directory',
+                        action='store', default=None, dest='cache_directory', help=arg_help)
+
+    # Parse the arguments
+    return parser.parse_args(arguments)
+
+
+####################################################################################################
+# @ Main
+####################################################################################################
+if __name__ == "__main__":
+
+    # Parse the command line arguments
+    args = parse_command_line_arguments()
+
+    if not os.path.isdir(args.input_directory):
+        print('ERROR: The input directory [%s] does not exist' % args.input_directory)
+        exit(1)
+
+    # Analyze the morphologies
+    starting_time = time.time()
+    number_analyzed, failed_files = nmv.analysis.analyze_morphologies_directory(
+        input_directory=args.input_directory,
+        output_file=args.output_file,
+        per_arbor=args.per_arbor,
+        number_processes=args.processes,
+        cache_directory=args.cache_directory)
+
+    # Report the morphologies that could not be analyzed
+    for morphology_file, error in failed_files:
+        print('ERROR: Cannot analyze [%s]: %s' % (morphology_file, error))
+
+    print('Analyzed [%d] morphologies in [%f] seconds, results written to [%s]' % (
+        number_analyzed, time.time() - starting_time, args.output_file))
@@ -0,0 +1,119 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import sys, os
+
+sys.path.append(('%s/../../' %(os.path.dirname(os.path.realpath(__file__)))))
+
+# System imports
+import argparse
+import time
+
+# NeuroMorphoVis imports, the tubes meshing does not require Blender, only numpy, h5py and mathutils
+import nmv.consts
+import nmv.enums
+import nmv.mesh
+
+
+####################################################################################################
+# @parse_command_line_arguments
+####################################################################################################
+def parse_command_line_arguments(arguments=None):
+    """Parses the input arguments.
+
+    :param arguments:
+        Command line arguments.
+    :return:
+        Arguments list.
+    """
+
+    # add all the options
+    description = 'Creates the tubes meshes of all the morphologies in a directory without ' \
+                  'Blender, and writes a .ply or an .obj mesh per morphology'
+    parser = argparse.ArgumentParser(description=description)
+
+    arg_help = 'The directory that contains the .h5 and the .swc morphology files'
+    parser.add_argument('--input-directory',
+                        action='store', dest='input_directory', required=True, help=arg_help)
+
+    arg_help = 'The directory where the meshes will be written'
+    parser.add_argument('--output-directory',
+                        action='store', dest='output_directory', required=True, help=arg_help)
+
+    arg_help = 'The format of the meshes: (ply) or obj'
+    parser.add_argument('--output-format',
+                        action='store', default='ply', choices=['ply', 'obj'],
+                        dest='output_format', help=arg_help)
+
+    arg_help = 'The number of the vertices of the rings of the tubes, by default %d' % \
+               nmv.consts.Meshing.TUBES_RING_RESOLUTION
+    parser.add_argument('--ring-resolution',
+                        action='store', type=int, default=nmv.consts.Meshing.TUBES_RING_RESOLUTION,
+                        dest='ring_resolution', help=arg_help)
+
+    arg_help = 'The number of the worker processes, by default the number of the cores'
+    parser.add_argument('--processes',
+                        action='store', type=int, default=None, dest='processes', help=arg_help)
+
+    # Parse the arguments
+    return parser.parse_args(arguments)
+
+
+####################################################################################################
+# @ Main
+####################################################################################################
+if __name__ == "__main__":
+
+    # Parse the command line arguments
+    args = parse_command_line_arguments()
+
+    if not os.path.isdir(args.input_directory):
+        print('ERROR: The input directory [%s] does not exist' % args.input_directory)
+        exit(1)
+
+    if not os.path.isdir(args.output_directory):
+        os.makedirs(args.output_directory)
+
+    if args.output_format == 'obj':
+        file_format = nmv.enums.Meshing.ExportFormat.OBJ
+    else:
+        file_format = nmv.enums.Meshing.ExportFormat.PLY
+
+    # Clamp the resolution of the rings to the same range of the CLI, since the rings with less
+    # than three vertices cannot be meshed
+    ring_resolution = min(max(args.ring_resolution, nmv.consts.Meshing.MIN_TUBES_RING_RESOLUTION),
+                          nmv.consts.Meshing.MAX_TUBES_RING_RESOLUTION)
+    if ring_resolution != args.ring_resolution:
+        print('WARNING: The ring resolution [%d] is clamped to [%d]' % (
+            args.ring_resolution, ring_resolution))
+
+    # Mesh the morphologies
+    starting_time = time.time()
+    number_meshed, failed_files = nmv.mesh.mesh_morphologies_directory_to_tubes(
+        input_directory=args.input_directory,
+        output_directory=args.output_directory,
+        file_format=file_format,
+        ring_resolution=ring_resolution,
+        number_processes=args.processes)
+
+    # Report the morphologies that could not be meshed
+    for morphology_file, error in failed_files:
+        print('ERROR: Cannot mesh [%s]: %s' % (morphology_file, error))
+
+    print('Meshed [%d] morphologies in [%f] seconds, meshes written to [%s]' % (
+        number_meshed, time.time() - starting_time, args.output_directory))
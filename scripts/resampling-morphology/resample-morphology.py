@@ -52,6 +52,12 @@ def parse_command_line_arguments(arguments=None):
     arg_help = 'Output directory where the resampled morphology will be written'
     parser.add_argument('--output-directory',
                         action='store', dest='output_directory', help=arg_help)
+
+    arg_help = 'The format of the resampled morphology, swc or h5. The .h5 files are compact and ' \
+               'faster to load'
+    parser.add_argument('--output-format',
+                        action='store', dest='output_format', default='swc',
+                        choices=['swc', 'h5'], help=arg_help)
                         
     # Parse the arguments
     return parser.parse_args()
@@ -80,7 +86,10 @@ if __name__ == "__main__":
 
     # Resample the morphology skeleton
     nmv.skeleton.ops.apply_operation_to_morphology(
-        *[morphology_object, nmv.skeleton.ops.resample_section_adaptively])
+        *[morphology_object, nmv.skeleton.ops.resample_section_adaptively], mutates=True)
 
     # Export the morphology skeleton
-    nmv.file.write_morphology_to_swc_file(morphology_object, args.output_directory)
+    if args.output_format == 'h5':
+        nmv.file.write_morphology_to_h5_file(morphology_object, args.output_directory)
+    else:
+        nmv.file.write_morphology_to_swc_file(morphology_object, args.output_directory)
@@ -25,9 +25,13 @@ INPUT_MORPHOLOGY='/bbp/projects/2019-resampling-morphologies/input/000061cbfa9d8
 # Output directory 
 OUTPUT_DIRECTORY='/bbp/projects/2019-resampling-morphologies/output'
 
+# Output format, swc or h5
+OUTPUT_FORMAT='swc'
+
 ####################################################################################################
 $BLENDER -b --verbose 0 --python resample-morphology.py --                                         \
     --morphology=$INPUT_MORPHOLOGY                                                            	   \
-    --output-directory=$OUTPUT_DIRECTORY                                                           
+    --output-directory=$OUTPUT_DIRECTORY                                                           \
+    --output-format=$OUTPUT_FORMAT
     
 
@@ -0,0 +1,88 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import sys, os, types, unittest
+
+# The bounding boxes of the scene objects require the Python modules that are shipped with Blender
+sys.path.append("%s/.." % os.path.dirname(os.path.realpath(__file__)))
+try:
+    import bpy
+    from mathutils import Vector
+    import nmv.bbox
+    BLENDER_AVAILABLE = True
+except ImportError:
+    BLENDER_AVAILABLE = False
+
+
+####################################################################################################
+# @create_box_object
+####################################################################################################
+def create_box_object(p_min,
+                      p_max,
+                      location):
+    """Creates an object that has the bound box and the location of a scene object.
+
+    :param p_min:
+        The minimum corner of the local bound box of the object.
+    :param p_max:
+        The maximum corner of the local bound box of the object.
+    :param location:
+        The location of the object.
+    :return:
+        The object.
+    """
+
+    bound_box = [(x, y, z) for x in (p_min[0], p_max[0])
+                 for y in (p_min[1], p_max[1]) for z in (p_min[2], p_max[2])]
+    return types.SimpleNamespace(bound_box=bound_box, location=Vector(location))
+
+
+####################################################################################################
+# @BoundingBoxesTests
+####################################################################################################
+@unittest.skipUnless(BLENDER_AVAILABLE, 'Requires the Python modules of Blender')
+class BoundingBoxesTests(unittest.TestCase):
+    """Tests the bounding boxes of the objects in the scene.
+    """
+
+    ################################################################################################
+    # @test_objects_bounding_box
+    ################################################################################################
+    def test_objects_bounding_box(self):
+
+        objects = [create_box_object((-1.0, -1.0, -1.0), (1.0, 1.0, 1.0), (0.0, 0.0, 0.0)),
+                   create_box_object((-1.0, -2.0, -3.0), (1.0, 2.0, 3.0), (5.0, 0.0, 0.0))]
+
+        bounding_box = nmv.bbox.get_objects_bounding_box(objects)
+        self.assertEqual(tuple(bounding_box.p_min), (-1.0, -2.0, -3.0))
+        self.assertEqual(tuple(bounding_box.p_max), (6.0, 2.0, 3.0))
+
+    ################################################################################################
+    # @test_empty_objects_bounding_box
+    ################################################################################################
+    def test_empty_objects_bounding_box(self):
+
+        bounding_box = nmv.bbox.get_objects_bounding_box([])
+        self.assertIsInstance(bounding_box, nmv.bbox.BoundingBox)
+
+
+####################################################################################################
+# @ Run the tests if invoked from the command line.
+####################################################################################################
+if __name__ == "__main__":
+    unittest.main()
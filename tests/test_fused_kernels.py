@@ -0,0 +1,101 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import sys, os, unittest
+
+# The analysis requires the Python modules that are shipped with Blender
+sys.path.append("%s/.." % os.path.dirname(os.path.realpath(__file__)))
+try:
+    import numpy
+    import h5py
+    import nmv.analysis
+    import nmv.file
+
+    # The kernels of the analysis are only exported with the modules of Blender
+    BLENDER_AVAILABLE = nmv.BLENDER_AVAILABLE
+except ImportError:
+    BLENDER_AVAILABLE = False
+
+# The morphologies of the data of the repository
+MORPHOLOGIES_DIRECTORY = '%s/../data/morphologies' % os.path.dirname(os.path.realpath(__file__))
+
+
+####################################################################################################
+# @read_data_morphologies
+####################################################################################################
+def read_data_morphologies():
+    """Reads all the morphologies of the data of the repository.
+
+    :return:
+        A list of (file name, morphology) tuples.
+    """
+
+    morphologies = list()
+    for file_name in sorted(os.listdir('%s/swc' % MORPHOLOGIES_DIRECTORY)):
+        morphologies.append((file_name, nmv.file.read_swc_morphology(
+            '%s/swc/%s' % (MORPHOLOGIES_DIRECTORY, file_name))))
+    for file_name in sorted(os.listdir('%s/h5' % MORPHOLOGIES_DIRECTORY)):
+        morphologies.append((file_name, nmv.file.read_h5_morphology(
+            '%s/h5/%s' % (MORPHOLOGIES_DIRECTORY, file_name))))
+    return morphologies
+
+
+####################################################################################################
+# @FusedKernelsTests
+####################################################################################################
+@unittest.skipUnless(BLENDER_AVAILABLE, 'Requires the Python modules of Blender')
+class FusedKernelsTests(unittest.TestCase):
+    """Tests that the kernels computed from the profiles of the arbors give the same results of the
+    kernels that traverse the arbors.
+    """
+
+    ################################################################################################
+    # @test_fused_kernels_of_data_morphologies
+    ################################################################################################
+    def test_fused_kernels_of_data_morphologies(self):
+
+        for file_name, morphology in read_data_morphologies():
+            nmv.analysis.create_arbors_analysis_profiles(morphology)
+            for kernel_name, fused_kernel in nmv.analysis.FUSED_ARBOR_KERNELS.items():
+                with self.subTest(morphology=file_name, kernel=kernel_name):
+                    kernel = getattr(nmv.analysis, kernel_name)
+                    self.assertIs(nmv.analysis.get_fused_arbor_kernel(kernel), fused_kernel)
+
+                    result = nmv.analysis.apply_analysis_operation_to_morphology(
+                        *[morphology, kernel])
+                    fused_result = nmv.analysis.apply_fused_kernel_to_morphology(
+                        morphology, fused_kernel)
+                    for arbors_result, fused_arbors_result in [
+                            (result.apical_dendrites_result, fused_result.apical_dendrites_result),
+                            (result.basal_dendrites_result, fused_result.basal_dendrites_result),
+                            (result.axons_result, fused_result.axons_result)]:
+                        if arbors_result is None:
+                            self.assertIsNone(fused_arbors_result)
+                            continue
+                        self.assertEqual(len(fused_arbors_result), len(arbors_result))
+                        for value, fused_value in zip(arbors_result, fused_arbors_result):
+                            self.assertAlmostEqual(fused_value, value,
+                                                   delta=1e-9 * max(1.0, abs(value)))
+            nmv.analysis.release_arbors_analysis_profiles(morphology)
+
+
+####################################################################################################
+# @ Run the tests if invoked from the command line.
+####################################################################################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import sys, os, unittest
+
+# The reader requires the Python modules that are shipped with Blender
+sys.path.append("%s/.." % os.path.dirname(os.path.realpath(__file__)))
+try:
+    import h5py
+    import nmv.consts
+    import nmv.file
+    BLENDER_AVAILABLE = True
+except ImportError:
+    BLENDER_AVAILABLE = False
+
+# The H5 morphologies of the data of the repository
+H5_DIRECTORY = '%s/../data/morphologies/h5' % os.path.dirname(os.path.realpath(__file__))
+
+
+####################################################################################################
+# @H5SectionsTests
+####################################################################################################
+@unittest.skipUnless(BLENDER_AVAILABLE, 'Requires the Python modules of Blender')
+class H5SectionsTests(unittest.TestCase):
+    """Tests the construction of the sections of the H5 morphologies.
+    """
+
+    ################################################################################################
+    # @test_sections_of_data_morphologies
+    ################################################################################################
+    def test_sections_of_data_morphologies(self):
+
+        for file_name in sorted(os.listdir(H5_DIRECTORY)):
+            with self.subTest(morphology=file_name):
+                morphology_file = '%s/%s' % (H5_DIRECTORY, file_name)
+                with h5py.File(morphology_file, 'r') as data:
+                    structure = data[nmv.consts.Skeleton.H5_STRUCTURE_DIRECTORY][()]
+                    number_points = len(data[nmv.consts.Skeleton.H5_POINTS_DIRECTORY])
+
+                reader = nmv.file.H5Reader(morphology_file)
+                reader.read_points_and_structures()
+                sections_list = reader.build_sections_from_points_and_structures()
+
+                # All the sections except the soma, including the last one of the file
+                self.assertEqual(len(sections_list), len(structure) - 1)
+                self.assertEqual(len(sections_list[-1][3]), number_points - structure[-1][0])
+
+
+####################################################################################################
+# @ Run the tests if invoked from the command line.
+####################################################################################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import sys, os, unittest
+
+# The meta balls are computed with NumPy only, and the module is imported without Blender
+sys.path.append("%s/../nmv/mesh/ops" % os.path.dirname(os.path.realpath(__file__)))
+try:
+    import numpy
+    import meta_ball_ops
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+####################################################################################################
+# @compute_meta_balls_along_segment_by_stepping
+####################################################################################################
+def compute_meta_balls_along_segment_by_stepping(p1,
+                                                 p2,
+                                                 r1,
+                                                 r2,
+                                                 density=1.0):
+    """Computes the meta balls along a segment by stepping from the first point to the second one,
+    as the meta builder did before the balls were computed at once.
+
+    :param p1:
+        First point coordinate.
+    :param p2:
+        Second point coordinate.
+    :param r1:
+        First point radius.
+    :param r2:
+        Second point radius.
+    :param density:
+        The density of the balls.
+    :return:
+        A list of the centers and a list of the radii of the balls.
+    """
+
+    segment_length = numpy.linalg.norm(p2 - p1)
+    if segment_length < 0.001:
+        return [], []
+
+    r1 = max(r1, 0.001 * segment_length)
+    r2 = max(r2, 0.001 * segment_length)
+
+    centers = list()
+    radii = list()
+    travelled_distance = 0.0
+    r = r1
+    while travelled_distance < segment_length:
+        centers.append(p1 + travelled_distance * (p2 - p1) / segment_length)
+        radii.append(r)
+        travelled_distance += r * 0.5 / density
+        r = r1 + (travelled_distance * (r2 - r1) / segment_length)
+    return centers, radii
+
+
+####################################################################################################
+# @MetaBallsTests
+####################################################################################################
+@unittest.skipUnless(NUMPY_AVAILABLE, 'Requires NumPy')
+class MetaBallsTests(unittest.TestCase):
+    """Tests the meta balls that are computed along the segments at once against stepping along
+    every segment.
+    """
+
+    ################################################################################################
+    # @test_random_segments
+    ################################################################################################
+    def test_random_segments(self):
+
+        random = numpy.random.RandomState(0)
+        number_segments = 2000
+        starts = random.uniform(-10.0, 10.0, (number_segments, 3))
+        ends = starts + random.uniform(-5.0, 5.0, (number_segments, 3))
+        starts_radii = random.uniform(0.0, 3.0, number_segments)
+        ends_radii = random.uniform(0.0, 3.0, number_segments)
+
+        for density in [0.5, 1.0, 2.0]:
+            expected_centers = list()
+            expected_radii = list()
+            for i in range(number_segments):
+                centers, radii = compute_meta_balls_along_segment_by_stepping(
+                    starts[i], ends[i], starts_radii[i], ends_radii[i], density)
+                expected_centers.extend(centers)
+                expected_radii.extend(radii)
+
+            centers, radii = meta_ball_ops.compute_meta_balls_along_segments(
+                starts, ends, starts_radii, ends_radii, density)
+            self.assertEqual(len(radii), len(expected_radii))
+            numpy.testing.assert_allclose(centers, numpy.array(expected_centers), atol=1e-6)
+            numpy.testing.assert_allclose(radii, numpy.array(expected_radii), atol=1e-6)
+
+    ################################################################################################
+    # @test_zero_length_segments
+    ################################################################################################
+    def test_zero_length_segments(self):
+
+        centers, radii = meta_ball_ops.compute_meta_balls_along_segments(
+            starts=[(1.0, 2.0, 3.0), (0.0, 0.0, 0.0)], ends=[(1.0, 2.0, 3.0), (0.0, 0.0, 0.0005)],
+            starts_radii=[1.0, 1.0], ends_radii=[2.0, 2.0])
+        self.assertEqual(centers.shape, (0, 3))
+        self.assertEqual(radii.shape, (0,))
+
+    ################################################################################################
+    # @test_non_positive_ratios
+    ################################################################################################
+    def test_non_positive_ratios(self):
+
+        # The radius shrinks faster than the first stride, so the first ball covers the segment
+        for end_radius in [0.5, 0.001]:
+            centers, radii = meta_ball_ops.compute_meta_balls_along_segments(
+                starts=[(0.0, 0.0, 0.0)], ends=[(1.0, 0.0, 0.0)],
+                starts_radii=[10.0], ends_radii=[end_radius])
+            expected_centers, expected_radii = compute_meta_balls_along_segment_by_stepping(
+                numpy.zeros(3), numpy.array((1.0, 0.0, 0.0)), 10.0, end_radius)
+            self.assertEqual(len(expected_radii), 1)
+            numpy.testing.assert_allclose(centers, numpy.array(expected_centers))
+            numpy.testing.assert_allclose(radii, numpy.array(expected_radii))
+
+    ################################################################################################
+    # @test_contained_meta_balls
+    ################################################################################################
+    def test_contained_meta_balls(self):
+
+        centers = numpy.array([(0.0, 0.0, 0.0), (0.5, 0.0, 0.0), (1.0, 0.0, 0.0), (5.0, 0.0, 0.0),
+                               (5.0, 0.0, 0.0)])
+        radii = numpy.array([1.0, 3.0, 1.0, 1.0, 1.0])
+
+        # The first and the third balls are inside the second one, and of the two identical balls
+        # only the first one is kept
+        remaining_centers, remaining_radii = meta_ball_ops.remove_contained_meta_balls(
+            centers, radii)
+        numpy.testing.assert_allclose(remaining_centers, centers[[1, 3]])
+        numpy.testing.assert_allclose(remaining_radii, radii[[1, 3]])
+
+        # Less than two balls are kept as they are
+        remaining_centers, remaining_radii = meta_ball_ops.remove_contained_meta_balls(
+            centers[:1], radii[:1])
+        numpy.testing.assert_allclose(remaining_radii, radii[:1])
+
+
+####################################################################################################
+# @ Run the tests if invoked from the command line.
+####################################################################################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import sys, os, tempfile, unittest
+
+# The cache requires the Python modules that are shipped with Blender
+sys.path.append("%s/.." % os.path.dirname(os.path.realpath(__file__)))
+try:
+    import numpy
+    import h5py
+    import nmv.file
+    import nmv.skeleton
+    BLENDER_AVAILABLE = True
+except ImportError:
+    BLENDER_AVAILABLE = False
+
+# The morphologies of the data of the repository
+MORPHOLOGIES_DIRECTORY = '%s/../data/morphologies' % os.path.dirname(os.path.realpath(__file__))
+
+
+####################################################################################################
+# @describe_morphology
+####################################################################################################
+def describe_morphology(morphology):
+    """Describes the soma and the sections of all the arbors of a morphology, without creating the
+    samples of the sections that are backed by arrays.
+
+    :param morphology:
+        A given morphology.
+    :return:
+        A list of the description of the soma and the sections in pre-order.
+    """
+
+    soma = morphology.soma
+    description = [(tuple(soma.centroid), soma.mean_radius,
+                    [tuple(point) for point in soma.profile_points],
+                    [tuple(point) for point in (soma.arbors_profile_points or [])])]
+    for arbors_name in nmv.file.MORPHOLOGY_CACHE_ARBORS:
+        arbors = getattr(morphology, arbors_name)
+        if arbors is None:
+            description.append(None)
+            continue
+        for arbor in arbors:
+            sections = [arbor]
+            while len(sections) > 0:
+                section = sections.pop()
+                points, radii = section.get_samples_arrays()
+                samples = None if section._samples is None else \
+                    [(sample.index, sample.morphology_index, sample.type, sample.parent_index)
+                     for sample in section.samples]
+                description.append((
+                    arbors_name, section.index, section.parent_index,
+                    None if section.parent is None else section.parent.index,
+                    list(section.children_ids), [child.index for child in section.children],
+                    section.branching_order, section.type, section.label, section.tag,
+                    points.tolist(), radii.tolist(), samples))
+                sections.extend(reversed(section.children))
+    return description
+
+
+####################################################################################################
+# @MorphologyCacheTests
+####################################################################################################
+@unittest.skipUnless(BLENDER_AVAILABLE, 'Requires the Python modules of Blender')
+class MorphologyCacheTests(unittest.TestCase):
+    """Tests that the morphologies read from the cache are identical to the ones read from the
+    morphology files.
+    """
+
+    ################################################################################################
+    # @test_round_trip_of_data_morphologies
+    ################################################################################################
+    def test_round_trip_of_data_morphologies(self):
+
+        morphologies_files = list()
+        for file_name in sorted(os.listdir('%s/swc' % MORPHOLOGIES_DIRECTORY)):
+            morphologies_files.append(('%s/swc/%s' % (MORPHOLOGIES_DIRECTORY, file_name), False))
+        for file_name in sorted(os.listdir('%s/h5' % MORPHOLOGIES_DIRECTORY)):
+            for lazy_samples in [False, True]:
+                morphologies_files.append(
+                    ('%s/h5/%s' % (MORPHOLOGIES_DIRECTORY, file_name), lazy_samples))
+
+        with tempfile.TemporaryDirectory() as cache_directory:
+            for morphology_file, lazy_samples in morphologies_files:
+                with self.subTest(morphology=os.path.basename(morphology_file),
+                                  lazy_samples=lazy_samples):
+                    # The loaded morphology is cached before its samples are packed
+                    if morphology_file.endswith('.h5'):
+                        morphology = nmv.file.read_h5_morphology(
+                            morphology_file, lazy_samples=lazy_samples)
+                    else:
+                        morphology = nmv.file.read_swc_morphology(morphology_file)
+                    cache_file = nmv.file.get_morphology_cache_file(
+                        morphology_file, cache_directory, lazy_samples=lazy_samples)
+                    self.assertTrue(nmv.file.write_morphology_to_cache(morphology, cache_file))
+                    cached_morphology = nmv.file.read_morphology_from_cache(cache_file)
+
+                    self.assertIsNotNone(cached_morphology)
+                    self.assertEqual(cached_morphology.label, morphology.label)
+                    self.assertEqual(cached_morphology.number_stems, morphology.number_stems)
+                    self.assertEqual(describe_morphology(cached_morphology),
+                                     describe_morphology(morphology))
+
+    ################################################################################################
+    # @test_cache_files_of_lazy_samples
+    ################################################################################################
+    def test_cache_files_of_lazy_samples(self):
+
+        morphology_file = '%s/h5/%s' % (
+            MORPHOLOGIES_DIRECTORY, sorted(os.listdir('%s/h5' % MORPHOLOGIES_DIRECTORY))[0])
+        cache_directory = tempfile.gettempdir()
+
+        # The sections are cached either with their samples or lazily, as loaded by the readers
+        self.assertEqual(
+            nmv.file.get_morphology_cache_file(morphology_file, cache_directory),
+            nmv.file.get_morphology_cache_file(morphology_file, cache_directory,
+                                               lazy_samples=False))
+        self.assertNotEqual(
+            nmv.file.get_morphology_cache_file(morphology_file, cache_directory,
+                                               lazy_samples=False),
+            nmv.file.get_morphology_cache_file(morphology_file, cache_directory,
+                                               lazy_samples=True))
+
+
+####################################################################################################
+# @ Run the tests if invoked from the command line.
+####################################################################################################
+if __name__ == "__main__":
+    unittest.main()
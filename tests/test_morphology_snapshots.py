@@ -0,0 +1,273 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import sys, os, unittest
+
+# The skeleton requires the Python modules that are shipped with Blender
+sys.path.append("%s/.." % os.path.dirname(os.path.realpath(__file__)))
+try:
+    import numpy
+    import nmv.edit
+    import nmv.file
+    import nmv.skeleton
+
+    # The operations of the skeleton are only exported with the modules of Blender
+    BLENDER_AVAILABLE = nmv.BLENDER_AVAILABLE
+except ImportError:
+    BLENDER_AVAILABLE = False
+
+# A morphology from the data of the repository
+SWC_FILE = '%s/../data/morphologies/swc/C031097B-I4.CNG.swc' % \
+           os.path.dirname(os.path.realpath(__file__))
+
+
+####################################################################################################
+# @get_arbors_samples
+####################################################################################################
+def get_arbors_samples(arbors_lists):
+    """Gets the coordinates and the radii of all the samples of the given lists of arbors.
+
+    :param arbors_lists:
+        A list of the lists of the arbors.
+    :return:
+        A list of (x, y, z, radius) tuples in a depth-first order.
+    """
+
+    samples = list()
+    for arbors in arbors_lists:
+        if arbors is None:
+            continue
+        for arbor in arbors:
+            sections = [arbor]
+            while len(sections) > 0:
+                section = sections.pop()
+                samples.extend([(sample.point[0], sample.point[1], sample.point[2],
+                                 sample.radius) for sample in section.samples])
+                sections.extend(reversed(section.children))
+    return samples
+
+
+####################################################################################################
+# @MorphologySnapshotsTests
+####################################################################################################
+@unittest.skipUnless(BLENDER_AVAILABLE, 'Requires the Python modules of Blender')
+class MorphologySnapshotsTests(unittest.TestCase):
+    """Tests that the original arbors of a morphology are kept when its arbors are modified.
+    """
+
+    ################################################################################################
+    # @test_operations_keep_the_original_arbors
+    ################################################################################################
+    def test_operations_keep_the_original_arbors(self,
+                                                 pack_samples=False):
+
+        morphology = nmv.file.read_swc_morphology(SWC_FILE)
+        if pack_samples:
+            morphology.pack_samples()
+        loaded_samples = get_arbors_samples(
+            [morphology.axons, morphology.basal_dendrites, morphology.apical_dendrites])
+
+        # The same in-place operations that are applied by the mesh builders
+        nmv.skeleton.ops.apply_operation_to_morphology(
+            *[morphology, nmv.skeleton.ops.remove_samples_inside_soma], mutates=True)
+        nmv.skeleton.ops.apply_operation_to_morphology(
+            *[morphology, nmv.skeleton.ops.resample_section_at_fixed_step, 5.0], mutates=True)
+        self.assertNotEqual(get_arbors_samples(
+            [morphology.axons, morphology.basal_dendrites, morphology.apical_dendrites]),
+            loaded_samples)
+
+        # The original arbors are the loaded ones
+        self.assertEqual(get_arbors_samples(
+            [morphology.original_axons, morphology.original_basal_dendrites,
+             morphology.origin_apical_dendrites]), loaded_samples)
+
+        # And the restored arbors as well
+        morphology.restore_original_arbors()
+        self.assertEqual(get_arbors_samples(
+            [morphology.axons, morphology.basal_dendrites, morphology.apical_dendrites]),
+            loaded_samples)
+
+
+    ################################################################################################
+    # @test_operations_keep_the_original_packed_arbors
+    ################################################################################################
+    def test_operations_keep_the_original_packed_arbors(self):
+
+        self.test_operations_keep_the_original_arbors(pack_samples=True)
+
+    ################################################################################################
+    # @test_packed_points_are_updated_by_assignment
+    ################################################################################################
+    def test_packed_points_are_updated_by_assignment(self):
+
+        morphology = nmv.file.read_swc_morphology(SWC_FILE)
+        morphology.pack_samples()
+        sample = morphology.basal_dendrites[0].samples[0]
+
+        # An in-place update of a packed point is not silently lost
+        with self.assertRaises(TypeError):
+            sample.point[0] += 1.0
+
+        point = sample.point
+        sample.point = point * 2.0
+        self.assertEqual(tuple(sample.point), tuple(point * 2.0))
+
+    ################################################################################################
+    # @test_packed_arbors_styles
+    ################################################################################################
+    def test_packed_arbors_styles(self):
+
+        morphology = nmv.file.read_swc_morphology(SWC_FILE)
+        morphology.pack_samples()
+        loaded_samples = get_arbors_samples(
+            [morphology.axons, morphology.basal_dendrites, morphology.apical_dendrites])
+
+        # The styles update the points and the radii of the packed samples by assignment
+        for operation in [nmv.skeleton.ops.taper_section, nmv.skeleton.ops.zigzag_section,
+                          nmv.skeleton.ops.project_to_xy_plane]:
+            nmv.skeleton.ops.apply_operation_to_morphology(
+                *[morphology, operation], mutates=True)
+        self.assertNotEqual(get_arbors_samples(
+            [morphology.axons, morphology.basal_dendrites, morphology.apical_dendrites]),
+            loaded_samples)
+
+    ################################################################################################
+    # @test_read_only_operations_do_not_snapshot
+    ################################################################################################
+    def test_read_only_operations_do_not_snapshot(self):
+
+        morphology = nmv.file.read_swc_morphology(SWC_FILE)
+        nmv.skeleton.ops.apply_operation_to_morphology(
+            *[morphology, nmv.skeleton.ops.compute_section_length])
+        self.assertEqual(len(morphology.original_arbors_snapshots), 0)
+
+        # The partial operations take the snapshots as well once they mutate the arbors
+        nmv.skeleton.ops.apply_operation_to_morphology_partially(
+            *[morphology, 2, 2, 2, lambda level, order, section: section.samples.reverse()],
+            mutates=True)
+        self.assertNotEqual(len(morphology.original_arbors_snapshots), 0)
+        self.assertNotEqual(get_arbors_samples(
+            [morphology.axons, morphology.basal_dendrites, morphology.apical_dendrites]),
+            get_arbors_samples([morphology.original_axons, morphology.original_basal_dendrites,
+                                morphology.origin_apical_dendrites]))
+
+    ################################################################################################
+    # @test_branching_labels_are_restored
+    ################################################################################################
+    def test_branching_labels_are_restored(self):
+
+        morphology = nmv.file.read_swc_morphology(SWC_FILE)
+        arbors_lists = [morphology.axons, morphology.basal_dendrites, morphology.apical_dendrites]
+        loaded_samples = get_arbors_samples(arbors_lists)
+        loaded_children = [[child.index for child in section.children]
+                           for arbors in arbors_lists if arbors is not None for arbor in arbors
+                           for section in nmv.skeleton.ops.get_arbor_sections_in_pre_order(arbor)]
+
+        # The labels update the radii at the branching points and reorder the children
+        nmv.skeleton.ops.apply_operation_to_morphology(
+            *[morphology, nmv.skeleton.ops.label_primary_and_secondary_sections_based_on_radii],
+            mutates=True)
+        self.assertNotEqual(len(morphology.original_arbors_snapshots), 0)
+
+        # The radii and the order of the children are restored
+        morphology.restore_original_arbors()
+        arbors_lists = [morphology.axons, morphology.basal_dendrites, morphology.apical_dendrites]
+        self.assertEqual(get_arbors_samples(arbors_lists), loaded_samples)
+        self.assertEqual([[child.index for child in section.children]
+                          for arbors in arbors_lists if arbors is not None for arbor in arbors
+                          for section in nmv.skeleton.ops.get_arbor_sections_in_pre_order(arbor)],
+                         loaded_children)
+
+    ################################################################################################
+    # @test_working_copies_do_not_snapshot
+    ################################################################################################
+    def test_working_copies_do_not_snapshot(self):
+
+        morphology = nmv.file.read_swc_morphology(SWC_FILE)
+        loaded_samples = get_arbors_samples(
+            [morphology.axons, morphology.basal_dendrites, morphology.apical_dendrites])
+
+        # The copies of the builders are modified without snapshots, and the morphology is intact
+        working_copy = morphology.create_working_copy()
+        nmv.skeleton.ops.apply_operation_to_morphology(
+            *[working_copy, nmv.skeleton.ops.resample_section_at_fixed_step, 5.0], mutates=True)
+        self.assertEqual(len(working_copy.original_arbors_snapshots), 0)
+        self.assertEqual(get_arbors_samples(
+            [morphology.axons, morphology.basal_dendrites, morphology.apical_dendrites]),
+            loaded_samples)
+
+    ################################################################################################
+    # @test_edited_coordinates_of_packed_samples
+    ################################################################################################
+    def test_edited_coordinates_of_packed_samples(self):
+
+        morphology = nmv.file.read_swc_morphology(SWC_FILE)
+        morphology.pack_samples()
+        arbors_lists = [morphology.axons, morphology.basal_dendrites, morphology.apical_dendrites]
+        loaded_samples = get_arbors_samples(arbors_lists)
+
+        editor = nmv.edit.MorphologyEditor(morphology=morphology, options=None)
+        editor.update_samples_indices_per_morphology_of_morphology()
+
+        # The positions of the vertices of the skeleton, where all the samples are scaled twice
+        arbors = [arbor for arbors in arbors_lists if arbors is not None for arbor in arbors]
+        positions = numpy.zeros((len(morphology.samples_storage) + 1, 3))
+        for arbor in arbors:
+            for section in nmv.skeleton.ops.get_arbor_sections_in_pre_order(arbor):
+                for sample in section.samples:
+                    positions[sample.morphology_idx] = tuple(sample.point * 2.0)
+
+        # Write the positions back to the packed samples
+        for arbor in arbors:
+            editor.update_arbor_coordinates(root=arbor, positions=positions)
+
+        self.assertEqual(get_arbors_samples(arbors_lists), [
+            (x * 2.0, y * 2.0, z * 2.0, radius) for x, y, z, radius in loaded_samples])
+        self.assertEqual(get_arbors_samples(
+            [morphology.original_axons, morphology.original_basal_dendrites,
+             morphology.origin_apical_dendrites]), loaded_samples)
+
+    ################################################################################################
+    # @test_partial_operations_stop_at_the_branching_orders
+    ################################################################################################
+    def test_partial_operations_stop_at_the_branching_orders(self):
+
+        morphology = nmv.file.read_swc_morphology(SWC_FILE)
+        morphology.update_branching_order()
+
+        # The sections with higher branching orders than the given ones are never visited, and
+        # the axons and the apical dendrites are skipped entirely at the order zero
+        sections = list()
+        nmv.skeleton.ops.apply_operation_to_morphology_partially(
+            *[morphology, 0, 2, 0, lambda level, order, section: sections.append(section)])
+        self.assertNotEqual(len(sections), 0)
+        self.assertLessEqual(max([section.branching_order for section in sections]), 2)
+        for arbors in [morphology.axons, morphology.apical_dendrites]:
+            if arbors is None:
+                continue
+            for arbor in arbors:
+                for section in nmv.skeleton.ops.get_arbor_sections_in_pre_order(arbor):
+                    self.assertNotIn(section, sections)
+        self.assertIn(morphology.basal_dendrites[0], sections)
+
+
+####################################################################################################
+# @ Run the tests if invoked from the command line.
+####################################################################################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import sys, os, unittest
+
+# The tasks require the Python modules that are shipped with Blender
+sys.path.append("%s/.." % os.path.dirname(os.path.realpath(__file__)))
+sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+try:
+    import nmv.file
+    import nmv.interface
+    import nmv.options
+    import nmv.skeleton
+    BLENDER_AVAILABLE = True
+except ImportError:
+    BLENDER_AVAILABLE = False
+
+# Internal imports
+from test_morphology_snapshots import get_arbors_samples, SWC_FILE
+
+
+####################################################################################################
+# @NeuronTasksTests
+####################################################################################################
+@unittest.skipUnless(BLENDER_AVAILABLE, 'Requires the Python modules of Blender')
+class NeuronTasksTests(unittest.TestCase):
+    """Tests running several tasks on the same morphology in a single process.
+    """
+
+    ################################################################################################
+    # @test_every_task_starts_from_the_loaded_morphology
+    ################################################################################################
+    def test_every_task_starts_from_the_loaded_morphology(self):
+
+        morphology = nmv.file.read_swc_morphology(SWC_FILE)
+        loaded_samples = get_arbors_samples(
+            [morphology.axons, morphology.basal_dendrites, morphology.apical_dendrites])
+
+        options = nmv.options.NeuroMorphoVisOptions()
+        options.morphology.label = morphology.label
+
+        # The first task modifies the skeleton in the same way of the mesh builders
+        def update_skeleton(cli_morphology,
+                            cli_options):
+            nmv.skeleton.ops.apply_operation_to_morphology(
+                *[cli_morphology, nmv.skeleton.ops.remove_samples_inside_soma], mutates=True)
+            nmv.skeleton.ops.apply_operation_to_morphology(
+                *[cli_morphology, nmv.skeleton.ops.resample_section_at_fixed_step, 5.0],
+                mutates=True)
+
+        # The second task only gets the samples it sees
+        seen_samples = list()
+
+        def get_samples(cli_morphology,
+                        cli_options):
+            seen_samples.extend(get_arbors_samples(
+                [cli_morphology.axons, cli_morphology.basal_dendrites,
+                 cli_morphology.apical_dendrites]))
+
+        failed_tasks = nmv.interface.cli.run_neuron_tasks(
+            cli_morphology=morphology, cli_options=options,
+            tasks=[['Mesh Reconstruction', 'mesh', update_skeleton],
+                   ['Morphology Analysis', 'analysis', get_samples]])
+        self.assertEqual(failed_tasks, [])
+        self.assertEqual(seen_samples, loaded_samples)
+
+
+####################################################################################################
+# @ Run the tests if invoked from the command line.
+####################################################################################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import sys, os, argparse, shutil, tempfile, time, unittest
+
+# The manifest module has no dependencies, and it is imported in the same way of the launcher
+sys.path.append("%s/../nmv/interface/cli" % os.path.dirname(os.path.realpath(__file__)))
+import resume_manifest
+
+
+####################################################################################################
+# @ResumeManifestTests
+####################################################################################################
+class ResumeManifestTests(unittest.TestCase):
+    """Tests the records of the completed tasks that are used to resume the batch runs.
+    """
+
+    ################################################################################################
+    # @setUp
+    ################################################################################################
+    def setUp(self):
+
+        self.directory = tempfile.mkdtemp()
+        self.output_directory = '%s/output' % self.directory
+        self.meshes_directory = '%s/meshes' % self.output_directory
+        os.makedirs(self.meshes_directory)
+
+        # Morphologies where the label of the first is a prefix of the labels of the others
+        self.morphology_files = dict()
+        for label in ['n1', 'n10', 'n1_2']:
+            self.morphology_files[label] = '%s/%s.swc' % (self.directory, label)
+            with open(self.morphology_files[label], 'w') as file_handle:
+                file_handle.write('1 1 0 0 0 1 -1\n')
+
+    ################################################################################################
+    # @tearDown
+    ################################################################################################
+    def tearDown(self):
+
+        shutil.rmtree(self.directory)
+
+    ################################################################################################
+    # @get_arguments
+    ################################################################################################
+    def get_arguments(self,
+                      label):
+
+        arguments = argparse.Namespace(input='file', morphology_file=self.morphology_files[label],
+                                       gid=None, blue_config=None,
+                                       output_directory=self.output_directory)
+        for task in resume_manifest.RESUMABLE_TASKS:
+            for flag in task.flags:
+                setattr(arguments, flag, False)
+        arguments.export_neuron_mesh_obj = True
+        return arguments
+
+    ################################################################################################
+    # @write_output
+    ################################################################################################
+    def write_output(self,
+                     file_name):
+
+        with open('%s/%s' % (self.meshes_directory, file_name), 'w') as file_handle:
+            file_handle.write('o mesh\n')
+
+    ################################################################################################
+    # @test_labelled_entries
+    ################################################################################################
+    def test_labelled_entries(self):
+
+        for entry in ['n1.obj', 'n1_mesh_front.png', 'MESH_n1__mesh_top.png', 'SOMA_MESH_n1.ply']:
+            self.assertTrue(resume_manifest.is_labelled_entry(entry, 'n1'))
+        for entry in ['n1', 'n1_mesh_360', 'SOMA_MESH_360_n1']:
+            self.assertTrue(resume_manifest.is_labelled_entry(entry, 'n1', is_directory=True))
+
+        # The outputs of the other morphologies whose labels start with the label
+        for entry in ['n10.obj', 'n10_mesh_front.png', 'xn1.obj', 'n1_2.obj', 'n1-b.stats',
+                      'n1.5.obj', 'SOMA_MESH_n1_2.ply']:
+            self.assertFalse(resume_manifest.is_labelled_entry(entry, 'n1'))
+        for entry in ['n10', 'n1_2', 'n1.5']:
+            self.assertFalse(resume_manifest.is_labelled_entry(entry, 'n1', is_directory=True))
+
+    ################################################################################################
+    # @test_outputs_of_prefixed_label_are_ignored
+    ################################################################################################
+    def test_outputs_of_prefixed_label_are_ignored(self):
+
+        mesh_task = resume_manifest.get_resumable_task('mesh')
+        starting_time = time.time()
+
+        # Only the morphology n10 has written its mesh
+        self.write_output('n10.obj')
+        self.assertEqual(resume_manifest.find_task_outputs(
+            self.output_directory, 'n1', mesh_task, starting_time), [])
+
+        # The task of n1 is not recorded, and it must be executed again in the next run
+        arguments = self.get_arguments('n1')
+        self.assertFalse(resume_manifest.record_completed_task(arguments, 'mesh', starting_time))
+        self.assertIsNotNone(resume_manifest.get_arguments_for_stale_tasks(
+            arguments, morphology_file=self.morphology_files['n1']))
+
+    ################################################################################################
+    # @test_outputs_of_suffixed_label_are_ignored
+    ################################################################################################
+    def test_outputs_of_suffixed_label_are_ignored(self):
+
+        mesh_task = resume_manifest.get_resumable_task('mesh')
+        starting_time = time.time()
+
+        # Only the morphology n1_2 has written its mesh, and it is not an output of n1
+        self.write_output('n1_2.obj')
+        self.assertEqual(resume_manifest.find_task_outputs(
+            self.output_directory, 'n1', mesh_task, starting_time), [])
+        self.assertEqual(resume_manifest.find_task_outputs(
+            self.output_directory, 'n1_2', mesh_task, starting_time), ['meshes/n1_2.obj'])
+
+        arguments = self.get_arguments('n1')
+        self.assertFalse(resume_manifest.record_completed_task(arguments, 'mesh', starting_time))
+        self.assertIsNotNone(resume_manifest.get_arguments_for_stale_tasks(
+            arguments, morphology_file=self.morphology_files['n1']))
+
+    ################################################################################################
+    # @test_completed_tasks_are_skipped
+    ################################################################################################
+    def test_completed_tasks_are_skipped(self):
+
+        mesh_task = resume_manifest.get_resumable_task('mesh')
+        starting_time = time.time()
+        for file_name in ['n1.obj', 'n1_mesh_front.png', 'n10.obj']:
+            self.write_output(file_name)
+        self.assertEqual(resume_manifest.find_task_outputs(
+            self.output_directory, 'n1', mesh_task, starting_time), ['meshes/n1.obj',
+                                                                      'meshes/n1_mesh_front.png'])
+
+        arguments = self.get_arguments('n1')
+        self.assertTrue(resume_manifest.record_completed_task(arguments, 'mesh', starting_time))
+        self.assertIsNone(resume_manifest.get_arguments_for_stale_tasks(
+            arguments, morphology_file=self.morphology_files['n1']))
+
+        # The morphology n10 has no record of its own
+        self.assertIsNotNone(resume_manifest.get_arguments_for_stale_tasks(
+            self.get_arguments('n10'), morphology_file=self.morphology_files['n10']))
+
+
+####################################################################################################
+# @ Run the tests if invoked from the command line.
+####################################################################################################
+if __name__ == "__main__":
+    unittest.main()
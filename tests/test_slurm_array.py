@@ -0,0 +1,220 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import sys, os, copy, shutil, stat, subprocess, tempfile, unittest
+
+# The SLURM module has no dependencies, and it is imported in the same way of the launcher
+for import_path in ['nmv/interface/cli', 'nmv/file/ops', 'nmv/slurm']:
+    sys.path.append('%s/../%s' % (os.path.dirname(os.path.realpath(__file__)), import_path))
+import arguments_parser
+import slurm
+
+
+####################################################################################################
+# @write_executable
+####################################################################################################
+def write_executable(path,
+                     script):
+    """Writes a stand-in executable script.
+
+    :param path:
+        The path to the executable.
+    :param script:
+        The contents of the script.
+    """
+
+    with open(path, 'w') as file_handle:
+        file_handle.write('#!/bin/bash\n' + script)
+    os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+
+
+####################################################################################################
+# @SlurmArrayTests
+####################################################################################################
+class SlurmArrayTests(unittest.TestCase):
+    """Tests the submission of the morphologies to the cluster as a single job array, using
+    stand-ins for sbatch, squeue and blender.
+    """
+
+    ################################################################################################
+    # @setUp
+    ################################################################################################
+    def setUp(self):
+
+        self.directory = tempfile.mkdtemp()
+        self.bin_directory = '%s/bin' % self.directory
+        self.morphology_directory = '%s/morphologies' % self.directory
+        self.output_directory = '%s/output' % self.directory
+        for directory in [self.bin_directory, self.morphology_directory,
+                          '%s/slurm/jobs' % self.output_directory,
+                          '%s/slurm/logs' % self.output_directory]:
+            os.makedirs(directory)
+
+        # The stand-ins log their arguments, and blender fails for the items named 'failing'
+        self.sbatch_log = '%s/sbatch.log' % self.directory
+        self.squeue_log = '%s/squeue.log' % self.directory
+        self.blender_log = '%s/blender.log' % self.directory
+        write_executable('%s/sbatch' % self.bin_directory,
+                         'echo "$@" >> %s\necho "1234;cluster"\n' % self.sbatch_log)
+        write_executable('%s/squeue' % self.bin_directory,
+                         'echo "$@" >> %s\n' % self.squeue_log)
+        write_executable('%s/blender' % self.bin_directory,
+                         'for ARGUMENT in "$@"; do\n'
+                         '    case "${ARGUMENT}" in\n'
+                         '        --morphology-file=*) echo "${ARGUMENT}" >> %s ;;\n'
+                         '    esac\n'
+                         '    case "${ARGUMENT}" in\n'
+                         '        *failing*) exit 1 ;;\n'
+                         '    esac\n'
+                         'done\n' % self.blender_log)
+        for command in ['module', 'krenew']:
+            write_executable('%s/%s' % (self.bin_directory, command), 'exit 0\n')
+
+        self.path = os.environ['PATH']
+        os.environ['PATH'] = '%s:%s' % (self.bin_directory, self.path)
+
+    ################################################################################################
+    # @tearDown
+    ################################################################################################
+    def tearDown(self):
+
+        os.environ['PATH'] = self.path
+        shutil.rmtree(self.directory)
+
+    ################################################################################################
+    # @get_arguments
+    ################################################################################################
+    def get_arguments(self):
+
+        argv = sys.argv
+        sys.argv = ['neuromorphovis.py', '--input=directory',
+                    '--morphology-directory=%s' % self.morphology_directory,
+                    '--output-directory=%s' % self.output_directory,
+                    '--blender=%s/blender' % self.bin_directory,
+                    '--export-neuron-mesh-obj', '--execution-node=cluster', '--slurm-array',
+                    '--slurm-array-chunk-size=2', '--slurm-array-throttle=3']
+        try:
+            return arguments_parser.parse_command_line_arguments()
+        finally:
+            sys.argv = argv
+
+    ################################################################################################
+    # @test_array_range
+    ################################################################################################
+    def test_array_range(self):
+
+        self.assertEqual(slurm.compose_array_range(100), '0-99')
+        self.assertEqual(slurm.compose_array_range(100, throttle=10), '0-99%10')
+        with self.assertRaises(ValueError):
+            slurm.compose_array_range(0)
+
+    ################################################################################################
+    # @test_single_submission
+    ################################################################################################
+    def test_single_submission(self):
+
+        morphology_files = ['n%d.swc' % i for i in range(5)]
+        job_id = slurm.run_jobs_array_on_cluster(
+            arguments=self.get_arguments(), items=morphology_files,
+            create_executable_for_item=arguments_parser.create_executable_for_single_morphology_file)
+        self.assertEqual(job_id, '1234')
+
+        # A single call to sbatch, and squeue is never polled
+        with open(self.sbatch_log, 'r') as file_handle:
+            submissions = file_handle.read().splitlines()
+        self.assertEqual(len(submissions), 1)
+        self.assertFalse(os.path.exists(self.squeue_log))
+
+        # Five items in chunks of two are three tasks, with three of them running at most
+        script = submissions[0].split()[-1]
+        with open(script, 'r') as file_handle:
+            self.assertIn('#SBATCH --array=0-2%3\n', file_handle.read())
+
+    ################################################################################################
+    # @test_no_submission_without_items
+    ################################################################################################
+    def test_no_submission_without_items(self):
+
+        job_id = slurm.run_jobs_array_on_cluster(
+            arguments=self.get_arguments(), items=[],
+            create_executable_for_item=arguments_parser.create_executable_for_single_morphology_file)
+        self.assertIsNone(job_id)
+        self.assertFalse(os.path.exists(self.sbatch_log))
+
+    ################################################################################################
+    # @test_submission_per_arguments
+    ################################################################################################
+    def test_submission_per_arguments(self):
+
+        # The second morphology runs a different task, for example when resuming a batch run
+        arguments = self.get_arguments()
+        other_arguments = copy.copy(arguments)
+        other_arguments.export_neuron_mesh_obj = False
+        other_arguments.export_neuron_mesh_ply = True
+        slurm.run_morphology_files_jobs_on_cluster(
+            arguments=arguments, morphology_files=['n0.swc', 'n1.swc', 'n2.swc'],
+            morphology_files_arguments=[arguments, other_arguments, arguments])
+
+        # A job array per group of the morphologies with the same arguments
+        with open(self.sbatch_log, 'r') as file_handle:
+            scripts = [submission.split()[-1] for submission in file_handle.read().splitlines()]
+        self.assertEqual(len(scripts), 2)
+        manifests = list()
+        for script in scripts:
+            with open(script.replace('.sh', '.manifest'), 'r') as file_handle:
+                manifests.append(file_handle.read().splitlines())
+        self.assertEqual(manifests, [['n0.swc', 'n2.swc'], ['n1.swc']])
+
+        with open(scripts[1], 'r') as file_handle:
+            script = file_handle.read()
+        self.assertIn('--export-neuron-mesh-ply', script)
+        self.assertNotIn('--export-neuron-mesh-obj', script)
+
+    ################################################################################################
+    # @test_array_task_status
+    ################################################################################################
+    def test_array_task_status(self):
+
+        morphology_files = ['first neuron.swc', 'second neuron.swc', 'failing neuron.swc']
+        script = slurm.create_batch_job_array_script(
+            arguments=self.get_arguments(), items=morphology_files,
+            create_executable_for_item=arguments_parser.create_executable_for_single_morphology_file,
+            chunk_size=2)
+
+        # The first task processes the items that contain spaces as single arguments
+        environment = dict(os.environ, SLURM_ARRAY_TASK_ID='0')
+        self.assertEqual(subprocess.call(['bash', script], env=environment,
+                                         stdout=subprocess.DEVNULL,
+                                         stderr=subprocess.DEVNULL), 0)
+        with open(self.blender_log, 'r') as file_handle:
+            self.assertEqual(file_handle.read().splitlines(), [
+                '--morphology-file=%s/first neuron.swc' % self.morphology_directory,
+                '--morphology-file=%s/second neuron.swc' % self.morphology_directory])
+
+        # The second task reports the failure of its item
+        environment = dict(os.environ, SLURM_ARRAY_TASK_ID='1')
+        self.assertEqual(subprocess.call(['bash', script], env=environment,
+                                         stdout=subprocess.DEVNULL,
+                                         stderr=subprocess.DEVNULL), 1)
+
+
+####################################################################################################
+# @ Run the tests if invoked from the command line.
+####################################################################################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import sys, os, unittest
+
+# The reader requires the Python modules that are shipped with Blender
+sys.path.append("%s/.." % os.path.dirname(os.path.realpath(__file__)))
+try:
+    import nmv.consts
+    import nmv.file
+    BLENDER_AVAILABLE = True
+except ImportError:
+    BLENDER_AVAILABLE = False
+
+# The SWC morphologies of the data of the repository
+SWC_DIRECTORY = '%s/../data/morphologies/swc' % os.path.dirname(os.path.realpath(__file__))
+
+
+####################################################################################################
+# @build_sections_from_connected_paths
+####################################################################################################
+def build_sections_from_connected_paths(samples_list):
+    """The former construction of the sections of the SWC reader, where the samples list is split
+    into connected paths first, and then the paths are split at the terminals of the sections.
+    It is kept here as the reference of @SWCReader.build_sections_from_samples.
+
+    :param samples_list:
+        The samples list of the reader, see @SWCReader.read_samples.
+    :return:
+        A list of the indices of the samples of every section.
+    """
+
+    soma_sample_type = nmv.consts.Skeleton.SWC_SOMA_SAMPLE_TYPE
+    sample_type_index = nmv.consts.Skeleton.SWC_SAMPLE_TYPE_IDX
+
+    # Build the connected paths, the soma index is equal to 1, then start from index number 2
+    paths = list()
+    path = list()
+    index = 2
+    while True:
+        sample_i = samples_list[index]
+        sample_j = samples_list[index + 1]
+
+        if sample_i is None or sample_j is None:
+            index = index + 1
+            continue
+
+        # Ensure that this is not a soma profile point
+        if sample_i[sample_type_index] == soma_sample_type:
+            index = index + 1
+            continue
+
+        # If the two samples are connected
+        if sample_j[-1] == sample_i[0]:
+            path.append(sample_i[0])
+
+            # Append the last sample in the morphology file
+            if index + 1 == samples_list[-1][0]:
+                path.append(sample_j[0])
+        else:
+            path.append(sample_i[0])
+            if len(path) > 0:
+                paths.append(path)
+            path = list()
+
+        index = index + 1
+        if index > len(samples_list) - 2:
+            if len(path) > 0:
+                paths.append(path)
+            break
+
+    # Add the starting points and mark the terminals
+    terminal_samples_indices = set()
+    for path in paths:
+        path.insert(0, samples_list[path[0]][-1])
+        terminal_samples_indices.add(path[0])
+        terminal_samples_indices.add(path[-1])
+
+    # Split the paths at the terminals
+    sections = list()
+    for path in paths:
+        terminals_positions = sorted(
+            [i for i, sample_index in enumerate(path)
+             if sample_index in terminal_samples_indices], key=lambda i: path[i])
+        for i in range(0, len(terminals_positions) - 1):
+            sections.append(path[terminals_positions[i]:terminals_positions[i + 1] + 1])
+    return sections
+
+
+####################################################################################################
+# @SWCSectionsTests
+####################################################################################################
+@unittest.skipUnless(BLENDER_AVAILABLE, 'Requires the Python modules of Blender')
+class SWCSectionsTests(unittest.TestCase):
+    """Tests the construction of the sections of the SWC morphologies.
+    """
+
+    ################################################################################################
+    # @test_sections_of_data_morphologies
+    ################################################################################################
+    def test_sections_of_data_morphologies(self):
+
+        for file_name in sorted(os.listdir(SWC_DIRECTORY)):
+            with self.subTest(morphology=file_name):
+                reader = nmv.file.SWCReader('%s/%s' % (SWC_DIRECTORY, file_name))
+                reader.read_samples()
+                reader.build_sections_from_samples()
+                self.assertEqual(reader.sections_samples_indices_list,
+                                 build_sections_from_connected_paths(reader.samples_list))
+
+    ################################################################################################
+    # @test_samples_with_mismatched_columns
+    ################################################################################################
+    def test_samples_with_mismatched_columns(self):
+
+        # The extra columns are ignored
+        data = nmv.file.SWCReader.parse_samples_array(
+            ['1 1 0.0 0.0 0.0 1.0 -1', '2 3 1.0 1.0 1.0 0.5 1 0.0', '3 3 2.0 2.0 2.0 0.5 2'])
+        self.assertEqual(data.shape, (3, 7))
+        self.assertEqual(data[2].tolist(), [3.0, 3.0, 2.0, 2.0, 2.0, 0.5, 2.0])
+
+        # A line with missing columns is never shifted into the next samples
+        with self.assertRaises(ValueError):
+            nmv.file.SWCReader.parse_samples_array(
+                ['1 1 0.0 0.0 0.0 1.0 -1', '2 3 1.0 1.0 1.0 0.5 1 0.0', '3 3 2.0 2.0 2.0 0.5'])
+
+
+####################################################################################################
+# @ Run the tests if invoked from the command line.
+####################################################################################################
+if __name__ == "__main__":
+    unittest.main()